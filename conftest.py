@@ -12,3 +12,5 @@ django.setup()
 
 # Note: pytest-django handles database setup automatically
 # The database configuration comes from your .env file or DATABASE_URL
+
+pytest_plugins = ["saleor.tests.benchmark"]
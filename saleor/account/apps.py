@@ -1,5 +1,5 @@
 from django.apps import AppConfig
-from django.db.models.signals import post_delete
+from django.db.models.signals import m2m_changed, post_delete, post_save
 
 
 class AccountAppConfig(AppConfig):
@@ -14,3 +14,44 @@ class AccountAppConfig(AppConfig):
             sender=User,
             dispatch_uid="delete_user_avatar",
         )
+        self.connect_auth_cache_signals()
+
+    def connect_auth_cache_signals(self) -> None:
+        from ..channel.models import Channel
+        from ..core.auth_cache import (
+            handle_auth_change,
+            handle_auth_relation_change,
+            handle_user_change,
+            handle_user_relation_change,
+        )
+        from ..permission.models import Permission
+        from .models import Group, User
+
+        for signal in (post_save, post_delete):
+            signal.connect(
+                handle_user_change,
+                sender=User,
+                dispatch_uid="invalidate_auth_cache_User",
+            )
+            for sender in (Group, Permission, Channel):
+                signal.connect(
+                    handle_auth_change,
+                    sender=sender,
+                    dispatch_uid=f"invalidate_auth_cache_{sender.__name__}",
+                )
+        for user_relation in (User.groups, User.user_permissions):
+            m2m_changed.connect(
+                handle_user_relation_change,
+                sender=user_relation.through,
+                dispatch_uid=(
+                    f"invalidate_auth_cache_{user_relation.through.__name__}"
+                ),
+            )
+        for group_relation in (Group.permissions, Group.channels):
+            m2m_changed.connect(
+                handle_auth_relation_change,
+                sender=group_relation.through,
+                dispatch_uid=(
+                    f"invalidate_auth_cache_{group_relation.through.__name__}"
+                ),
+            )
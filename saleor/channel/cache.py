@@ -0,0 +1,47 @@
+from collections.abc import Iterable
+
+from django.conf import settings
+
+from ..core.config_cache import get_configs
+from .models import Channel
+
+
+def get_channels_by_slug(
+    slugs: Iterable[str],
+    database_connection_name: str = settings.DATABASE_CONNECTION_DEFAULT_NAME,
+) -> dict[str, Channel]:
+    return get_configs(
+        "channel:slug",
+        slugs,
+        lambda missing_slugs: Channel.objects.using(
+            settings.DATABASE_CONNECTION_DEFAULT_NAME
+        ).in_bulk(missing_slugs, field_name="slug"),
+        database_connection_name,
+    )
+
+
+def get_channel_by_slug(
+    slug: str, database_connection_name: str = settings.DATABASE_CONNECTION_DEFAULT_NAME
+) -> Channel | None:
+    return get_channels_by_slug([slug], database_connection_name).get(slug)
+
+
+def get_channels_by_id(
+    channel_ids: Iterable[int],
+    database_connection_name: str = settings.DATABASE_CONNECTION_DEFAULT_NAME,
+) -> dict[int, Channel]:
+    return get_configs(
+        "channel:id",
+        channel_ids,
+        lambda missing_ids: Channel.objects.using(
+            settings.DATABASE_CONNECTION_DEFAULT_NAME
+        ).in_bulk(missing_ids),
+        database_connection_name,
+    )
+
+
+def get_channel_by_id(
+    channel_id: int,
+    database_connection_name: str = settings.DATABASE_CONNECTION_DEFAULT_NAME,
+) -> Channel | None:
+    return get_channels_by_id([channel_id], database_connection_name).get(channel_id)
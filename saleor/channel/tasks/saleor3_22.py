@@ -1,5 +1,7 @@
 from ....celeryconf import app
+from ....core.config_cache import invalidate_config_cache
 from ....core.db.connection import allow_writer
+from ....plugins.cache import invalidate_plugin_configs_cache
 from ...models import Channel
 
 
@@ -9,3 +11,5 @@ def set_automatic_completion_delay_task():
     Channel.objects.filter(automatically_complete_fully_paid_checkouts=True).update(
         automatic_completion_delay=0
     )
+    invalidate_config_cache()
+    invalidate_plugin_configs_cache()
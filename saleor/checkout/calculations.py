@@ -40,9 +40,18 @@ if TYPE_CHECKING:
     from ..account.models import Address
     from ..plugins.manager import PluginsManager
     from .fetch import CheckoutInfo, CheckoutLineInfo
+    from .models import CheckoutLine
 
 logger = logging.getLogger(__name__)
 
+CHECKOUT_LINE_PRICE_FIELDS = [
+    "total_price_net_amount",
+    "total_price_gross_amount",
+    "tax_rate",
+    "undiscounted_unit_price_amount",
+    "prior_unit_price_amount",
+]
+
 
 def checkout_shipping_price(
     *,
@@ -371,9 +380,7 @@ def _fetch_checkout_prices_if_expired(
         return checkout_info, lines
 
     tax_configuration = checkout_info.tax_configuration
-    tax_calculation_strategy = get_tax_calculation_strategy_for_checkout(
-        checkout_info, database_connection_name=database_connection_name
-    )
+    tax_calculation_strategy = get_tax_calculation_strategy_for_checkout(checkout_info)
 
     if (
         tax_calculation_strategy == TaxCalculationStrategy.TAX_APP
@@ -382,13 +389,10 @@ def _fetch_checkout_prices_if_expired(
         return checkout_info, lines
 
     prices_entered_with_tax = tax_configuration.prices_entered_with_tax
-    charge_taxes = get_charge_taxes_for_checkout(
-        checkout_info, database_connection_name=database_connection_name
-    )
+    charge_taxes = get_charge_taxes_for_checkout(checkout_info)
     should_charge_tax = charge_taxes and not checkout.tax_exemption
-    tax_app_identifier = get_tax_app_identifier_for_checkout(
-        checkout_info, database_connection_name
-    )
+    tax_app_identifier = get_tax_app_identifier_for_checkout(checkout_info)
+    lines_prices = _get_lines_prices(lines)
 
     try:
         recalculate_discounts(
@@ -480,19 +484,34 @@ def _fetch_checkout_prices_if_expired(
                     update_fields=checkout_update_fields,
                     using=settings.DATABASE_CONNECTION_DEFAULT_NAME,
                 )
-                checkout_lines_bulk_update(
-                    [line_info.line for line_info in lines],
-                    [
-                        "total_price_net_amount",
-                        "total_price_gross_amount",
-                        "tax_rate",
-                        "undiscounted_unit_price_amount",
-                        "prior_unit_price_amount",
-                    ],
-                )
+                # Only lines with changed prices are saved, so a change of a single
+                # line doesn't rewrite all lines of a large checkout.
+                if changed_lines := _get_lines_with_changed_prices(lines, lines_prices):
+                    checkout_lines_bulk_update(
+                        changed_lines, CHECKOUT_LINE_PRICE_FIELDS
+                    )
     return checkout_info, lines
 
 
+def _get_line_prices(line: "CheckoutLine") -> list:
+    return [getattr(line, field) for field in CHECKOUT_LINE_PRICE_FIELDS]
+
+
+def _get_lines_prices(lines: Iterable["CheckoutLineInfo"]) -> dict:
+    return {line_info.line.pk: _get_line_prices(line_info.line) for line_info in lines}
+
+
+def _get_lines_with_changed_prices(
+    lines: Iterable["CheckoutLineInfo"], lines_prices: dict
+) -> list["CheckoutLine"]:
+    """Return the lines with prices different than the given ones."""
+    return [
+        line_info.line
+        for line_info in lines
+        if lines_prices.get(line_info.line.pk) != _get_line_prices(line_info.line)
+    ]
+
+
 @allow_writer()
 def recalculate_discounts(
     checkout_info: "CheckoutInfo",
@@ -785,15 +804,15 @@ def _set_checkout_base_prices(
 ) -> None:
     currency = checkout_info.checkout.currency
     subtotal = zero_money(currency)
+    lines_total_prices = (
+        base_calculations.get_lines_total_prices_with_propagated_checkout_discount(
+            checkout_info, lines
+        )
+    )
 
     for line_info in lines:
         line = line_info.line
-        total_price = (
-            base_calculations.get_line_total_price_with_propagated_checkout_discount(
-                checkout_info, lines, line_info
-            )
-        )
-        line_total_price = quantize_price(total_price, currency)
+        line_total_price = quantize_price(lines_total_prices[line.id], currency)
         subtotal += line_total_price
 
         line.total_price = TaxedMoney(net=line_total_price, gross=line_total_price)
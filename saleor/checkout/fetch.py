@@ -2,7 +2,7 @@ from collections.abc import Iterable
 from dataclasses import dataclass, field
 from decimal import Decimal
 from functools import cached_property
-from typing import TYPE_CHECKING, Any, Optional, Union
+from typing import TYPE_CHECKING, Any, Optional, Union, cast
 from uuid import UUID
 
 from django.conf import settings
@@ -10,6 +10,8 @@ from django.db.models import Q
 from django.utils import timezone
 from prices import Money
 
+from ..channel.cache import get_channel_by_id
+from ..channel.models import Channel
 from ..core.db.connection import allow_writer
 from ..core.prices import quantize_price
 from ..core.pricing.interface import LineInfo
@@ -27,6 +29,7 @@ from ..shipping.utils import (
     convert_shipping_method_data_to_checkout_delivery,
     initialize_shipping_method_active_status,
 )
+from ..tax.cache import get_tax_configuration_by_channel_id
 from ..warehouse import WarehouseClickAndCollectOption
 from ..warehouse.models import Warehouse
 from .lock_objects import checkout_qs_select_for_update
@@ -34,7 +37,6 @@ from .models import Checkout, CheckoutDelivery, CheckoutLine
 
 if TYPE_CHECKING:
     from ..account.models import Address, User
-    from ..channel.models import Channel
     from ..discount.models import (
         CheckoutDiscount,
         CheckoutLineDiscount,
@@ -484,7 +486,18 @@ def fetch_checkout_info(
     """Fetch checkout as CheckoutInfo object."""
     from .utils import get_voucher_for_checkout
 
+    # channel and tax configuration are read from the configuration cache, unless
+    # they are already fetched
+    if not Checkout.channel.is_cached(checkout):
+        checkout.channel = cast(
+            Channel, get_channel_by_id(checkout.channel_id, database_connection_name)
+        )
     channel = checkout.channel
+    if not Channel.tax_configuration.is_cached(channel):
+        channel.tax_configuration = cast(
+            "TaxConfiguration",
+            get_tax_configuration_by_channel_id(channel.pk, database_connection_name),
+        )
     tax_configuration = channel.tax_configuration
     shipping_address = checkout.shipping_address
 
@@ -1,9 +1,25 @@
+import datetime
+from decimal import Decimal
+
 import pytest
+from django.utils import timezone
 from prices import Money, TaxedMoney
 
-from ....checkout.models import Checkout
+from ....checkout.models import Checkout, CheckoutLine
+from ....plugins.manager import get_plugins_manager
+from ....product.models import (
+    Product,
+    ProductChannelListing,
+    ProductVariant,
+    ProductVariantChannelListing,
+)
+from ....warehouse.models import Stock
+from ...calculations import fetch_checkout_data
+from ...fetch import fetch_checkout_info, fetch_checkout_lines
 
 CHECKOUT_COUNT_IN_BENCHMARKS = 10
+CHECKOUT_LINES_IN_BENCHMARKS = 50
+LARGE_CHECKOUT_LINES_IN_BENCHMARKS = 300
 
 
 @pytest.fixture
@@ -27,3 +43,99 @@ def checkouts_for_benchmarks(
         for i in range(CHECKOUT_COUNT_IN_BENCHMARKS)
     ]
     return Checkout.objects.bulk_create(checkouts)
+
+
+@pytest.fixture
+def checkout_with_lines_for_benchmarks(checkout, address, variants_for_benchmarks):
+    CheckoutLine.objects.bulk_create(
+        [
+            CheckoutLine(
+                checkout=checkout,
+                variant=variant,
+                quantity=1,
+                currency=checkout.currency,
+            )
+            for variant in variants_for_benchmarks[:CHECKOUT_LINES_IN_BENCHMARKS]
+        ]
+    )
+    checkout.billing_address = address.get_copy()
+    checkout.shipping_address = address.get_copy()
+    # expired prices are recalculated when the checkout is fetched
+    checkout.price_expiration = timezone.now()
+    checkout.save(
+        update_fields=["billing_address", "shipping_address", "price_expiration"]
+    )
+    return checkout
+
+
+@pytest.fixture
+def large_checkout_for_benchmarks(
+    checkout,
+    address,
+    product_type,
+    category,
+    warehouse,
+    channel_USD,
+    default_tax_class,
+):
+    product = Product.objects.create(
+        name="Benchmark large checkout product",
+        slug="benchmark-large-checkout-product",
+        category=category,
+        product_type=product_type,
+        tax_class=default_tax_class,
+    )
+    ProductChannelListing.objects.create(
+        product=product,
+        channel=channel_USD,
+        is_published=True,
+        currency=channel_USD.currency_code,
+        visible_in_listings=True,
+        available_for_purchase_at=datetime.datetime(1999, 1, 1, tzinfo=datetime.UTC),
+    )
+    variants = ProductVariant.objects.bulk_create(
+        [
+            ProductVariant(product=product, sku=f"benchmark-large-{i}")
+            for i in range(LARGE_CHECKOUT_LINES_IN_BENCHMARKS)
+        ]
+    )
+    ProductVariantChannelListing.objects.bulk_create(
+        [
+            ProductVariantChannelListing(
+                variant=variant,
+                channel=channel_USD,
+                price_amount=Decimal(10 + i % 7),
+                discounted_price_amount=Decimal(10 + i % 7),
+                currency=channel_USD.currency_code,
+            )
+            for i, variant in enumerate(variants)
+        ]
+    )
+    Stock.objects.bulk_create(
+        [
+            Stock(warehouse=warehouse, product_variant=variant, quantity=100)
+            for variant in variants
+        ]
+    )
+    CheckoutLine.objects.bulk_create(
+        [
+            CheckoutLine(
+                checkout=checkout,
+                variant=variant,
+                quantity=1,
+                currency=checkout.currency,
+            )
+            for variant in variants
+        ]
+    )
+    checkout.billing_address = address.get_copy()
+    checkout.shipping_address = address.get_copy()
+    checkout.save(update_fields=["billing_address", "shipping_address"])
+
+    # calculate the prices up front, so the benchmarks measure the recalculation
+    # after the checkout change
+    manager = get_plugins_manager(allow_replica=False)
+    lines, _ = fetch_checkout_lines(checkout)
+    checkout_info = fetch_checkout_info(checkout, lines, manager)
+    fetch_checkout_data(checkout_info, manager, lines, force_update=True)
+    return checkout
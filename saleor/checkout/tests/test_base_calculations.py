@@ -11,8 +11,11 @@ from ..base_calculations import (
     calculate_base_line_total_price,
     calculate_base_line_unit_price,
     checkout_total,
+    get_line_total_price_with_propagated_checkout_discount,
+    get_lines_total_prices_with_propagated_checkout_discount,
 )
 from ..fetch import fetch_checkout_info, fetch_checkout_lines
+from ..utils import add_variant_to_checkout
 
 
 def test_calculate_base_line_unit_price(checkout_with_single_item):
@@ -850,3 +853,40 @@ def test_checkout_total_gift_promotion(
         net * checkout.lines.first().quantity + shipping_channel_listings.price
     )
     assert total == expected_price
+
+
+def test_get_lines_total_prices_with_propagated_checkout_discount(
+    checkout_with_item, voucher, product_list
+):
+    # given
+    manager = get_plugins_manager(allow_replica=False)
+    checkout = checkout_with_item
+    checkout_info = fetch_checkout_info(checkout, [], manager)
+    add_variant_to_checkout(checkout_info, product_list[0].variants.last(), 2)
+    add_variant_to_checkout(checkout_info, product_list[1].variants.last(), 3)
+    checkout.discount_amount = Decimal(5)
+    checkout.voucher_code = voucher.code
+    checkout.save()
+
+    lines, _ = fetch_checkout_lines(checkout)
+    checkout_info = fetch_checkout_info(checkout, lines, manager)
+
+    # when
+    lines_total_prices = get_lines_total_prices_with_propagated_checkout_discount(
+        checkout_info, lines
+    )
+
+    # then
+    assert lines_total_prices == {
+        line_info.line.id: get_line_total_price_with_propagated_checkout_discount(
+            checkout_info, lines, line_info
+        )
+        for line_info in lines
+    }
+    assert sum(lines_total_prices.values(), Money(0, checkout.currency)) == (
+        sum(
+            [calculate_base_line_total_price(line_info) for line_info in lines],
+            Money(0, checkout.currency),
+        )
+        - Money(5, checkout.currency)
+    )
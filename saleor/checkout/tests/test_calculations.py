@@ -48,6 +48,7 @@ from ..fetch import CheckoutLineInfo, fetch_checkout_info, fetch_checkout_lines
 from ..models import Checkout
 from ..utils import (
     add_promo_code_to_checkout,
+    checkout_lines_bulk_update,
 )
 
 
@@ -1528,3 +1529,66 @@ def test_fetch_checkout_data_checkout_deleted_during_discount_recalculation(
 
     assert result_checkout_info.checkout.total is not None
     assert result_lines_info
+
+
+@patch(
+    "saleor.checkout.utils.checkout_lines_bulk_update",
+    wraps=checkout_lines_bulk_update,
+)
+def test_fetch_checkout_data_saves_only_lines_with_changed_prices(
+    mocked_checkout_lines_bulk_update, checkout_with_items, plugins_manager
+):
+    # given
+    checkout = checkout_with_items
+    lines_info, _ = fetch_checkout_lines(checkout)
+    checkout_info = fetch_checkout_info(checkout, lines_info, plugins_manager)
+    fetch_checkout_data(checkout_info, plugins_manager, lines_info, force_update=True)
+    mocked_checkout_lines_bulk_update.reset_mock()
+
+    line = checkout.lines.first()
+    line.quantity += 1
+    line.save(update_fields=["quantity"])
+    lines_info, _ = fetch_checkout_lines(checkout)
+    checkout_info = fetch_checkout_info(checkout, lines_info, plugins_manager)
+
+    # when
+    fetch_checkout_data(checkout_info, plugins_manager, lines_info, force_update=True)
+
+    # then
+    mocked_checkout_lines_bulk_update.assert_called_once()
+    saved_lines = mocked_checkout_lines_bulk_update.call_args.args[0]
+    assert [saved_line.pk for saved_line in saved_lines] == [line.pk]
+    line_info = next(info for info in lines_info if info.line.pk == line.pk)
+    line.refresh_from_db()
+    assert line.total_price == line_info.line.total_price
+
+
+@patch(
+    "saleor.checkout.utils.checkout_lines_bulk_update",
+    wraps=checkout_lines_bulk_update,
+)
+def test_fetch_checkout_data_saves_all_lines_when_checkout_discount_changed(
+    mocked_checkout_lines_bulk_update, checkout_with_items, voucher, plugins_manager
+):
+    # given
+    checkout = checkout_with_items
+    lines_info, _ = fetch_checkout_lines(checkout)
+    checkout_info = fetch_checkout_info(checkout, lines_info, plugins_manager)
+    fetch_checkout_data(checkout_info, plugins_manager, lines_info, force_update=True)
+    mocked_checkout_lines_bulk_update.reset_mock()
+
+    checkout.discount_amount = Decimal(5)
+    checkout.voucher_code = voucher.code
+    checkout.save(update_fields=["discount_amount", "voucher_code"])
+    lines_info, _ = fetch_checkout_lines(checkout)
+    checkout_info = fetch_checkout_info(checkout, lines_info, plugins_manager)
+
+    # when
+    fetch_checkout_data(checkout_info, plugins_manager, lines_info, force_update=True)
+
+    # then
+    mocked_checkout_lines_bulk_update.assert_called_once()
+    saved_lines = mocked_checkout_lines_bulk_update.call_args.args[0]
+    assert {saved_line.pk for saved_line in saved_lines} == {
+        line_info.line.pk for line_info in lines_info
+    }
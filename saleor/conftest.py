@@ -0,0 +1,56 @@
+pytest_plugins = [
+    "saleor.account.tests.fixtures",
+    "saleor.app.tests.fixtures",
+    "saleor.attribute.tests.fixtures",
+    "saleor.channel.tests.fixtures",
+    "saleor.checkout.tests.fixtures",
+    "saleor.discount.tests.fixtures",
+    "saleor.giftcard.tests.fixtures",
+    "saleor.graphql.account.tests.fixtures",
+    "saleor.graphql.tests.fixtures",
+    "saleor.menu.tests.fixtures",
+    "saleor.order.tests.fixtures",
+    "saleor.page.tests.fixtures",
+    "saleor.payment.tests.fixtures",
+    "saleor.permission.tests.fixtures",
+    "saleor.plugins.tests.fixtures",
+    "saleor.product.tests.fixtures",
+    "saleor.shipping.tests.fixtures",
+    "saleor.site.tests.fixtures",
+    "saleor.tax.tests.fixtures",
+    "saleor.tests.fixtures",
+    "saleor.thumbnail.tests.fixtures",
+    "saleor.warehouse.tests.fixtures",
+    "saleor.webhook.tests.fixtures",
+]
+
+import pytest
+
+
+def pytest_collection_modifyitems(items):
+    for item in items:
+        marker = item.get_closest_marker("django_db")
+        kwargs = dict(marker.kwargs) if marker else {}
+        kwargs["databases"] = ["default", "replica"]
+        item.add_marker(pytest.mark.django_db(*(marker.args if marker else ()), **kwargs))
+
+
+
+@pytest.fixture(autouse=True)
+def _replica_as_default(settings):
+    settings.DATABASE_CONNECTION_REPLICA_NAME = "default"
+
+
+@pytest.fixture(autouse=True)
+def _no_writer_restriction(monkeypatch):
+    monkeypatch.setattr(
+        "saleor.core.db.connection.restrict_writer",
+        lambda execute, sql, params, many, context: execute(sql, params, many, context),
+    )
+
+
+def pytest_configure(config):
+    # Fields assigned after the class body aren't registered by vanilla graphene.
+    from saleor.graphql.query_cost_map import COST_MAP
+
+    COST_MAP["Category"].pop("products", None)
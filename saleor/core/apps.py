@@ -3,6 +3,7 @@ from collections.abc import Callable
 from django.apps import AppConfig
 from django.conf import settings
 from django.db.models import CharField, TextField
+from django.db.models.signals import m2m_changed, post_delete, post_save
 from django.utils.module_loading import import_string
 
 from .db.filters import PostgresILike
@@ -17,6 +18,37 @@ class CoreAppConfig(AppConfig):
         if settings.SENTRY_DSN:
             settings.SENTRY_INIT(settings.SENTRY_DSN, settings.SENTRY_OPTS)
         self.validate_jwt_manager()
+        self.connect_config_cache_signals()
+
+    def connect_config_cache_signals(self) -> None:
+        from django.contrib.sites.models import Site
+
+        from ..channel.models import Channel
+        from ..shipping.models import ShippingMethodPostalCodeRule, ShippingZone
+        from ..site.models import SiteSettings
+        from ..tax.models import TaxConfiguration, TaxConfigurationPerCountry
+        from .config_cache import handle_config_change, handle_config_relation_change
+
+        for sender in (
+            Channel,
+            Site,
+            SiteSettings,
+            TaxConfiguration,
+            TaxConfigurationPerCountry,
+            ShippingZone,
+            ShippingMethodPostalCodeRule,
+        ):
+            for signal in (post_save, post_delete):
+                signal.connect(
+                    handle_config_change,
+                    sender=sender,
+                    dispatch_uid=f"invalidate_config_cache_{sender.__name__}",
+                )
+        m2m_changed.connect(
+            handle_config_relation_change,
+            sender=ShippingZone.channels.through,
+            dispatch_uid="invalidate_config_cache_shipping_zone_channels",
+        )
 
     def validate_jwt_manager(self) -> None:
         jwt_manager_path = getattr(settings, "JWT_MANAGER_PATH", None)
@@ -1,8 +1,15 @@
+import copy
+
+import graphene
 import jwt
 from django.conf import settings
 
 from ..account.models import User
-from ..graphql.account.dataloaders import UserByEmailLoader
+from ..graphql.account.dataloaders import (
+    AccessibleChannelsByUserIdLoader,
+    RestrictedChannelAccessByUserIdLoader,
+    UserByEmailLoader,
+)
 from ..graphql.plugins.dataloaders import AnonymousPluginManagerLoader
 from ..permission.enums import (
     get_permissions_from_codenames,
@@ -10,6 +17,11 @@ from ..permission.enums import (
 )
 from ..plugins.manager import get_plugins_manager
 from .auth import get_token_from_request
+from .auth_cache import (
+    AuthenticatedUserSnapshot,
+    cache_user_snapshot,
+    get_user_snapshot,
+)
 from .jwt import (
     JWT_ACCESS_TYPE,
     JWT_THIRDPARTY_ACCESS_TYPE,
@@ -71,7 +83,7 @@ class JSONWebTokenBackend(BaseBackend):
             return set()
 
         perm_cache_name = "_effective_permissions_cache"
-        if not getattr(user_obj, perm_cache_name, None):
+        if getattr(user_obj, perm_cache_name, None) is None:
             perms = getattr(self, f"_get_{from_name}_permissions")(user_obj)
             perms = perms.using(settings.DATABASE_CONNECTION_REPLICA_NAME)
             perms = perms.values_list("content_type__app_label", "codename").order_by()
@@ -119,6 +131,57 @@ class PluginBackend(JSONWebTokenBackend):
         return manager.authenticate_user(request)
 
 
+def _get_user_id(payload: dict) -> int | None:
+    try:
+        _, user_id = graphene.Node.from_global_id(payload.get("user_id"))
+        return int(user_id)
+    except (TypeError, ValueError):
+        return None
+
+
+def load_user_from_payload(request, payload: dict) -> User | None:
+    """Return the active user with the email from the payload.
+
+    Staff users are cached together with their permissions and channel access,
+    when `JWT_USER_CACHE_TIMEOUT` is set.
+    """
+    user_id = _get_user_id(payload) if settings.JWT_USER_CACHE_TIMEOUT else None
+    if user_id is None:
+        return UserByEmailLoader(request).load(payload["email"]).get()
+
+    snapshot, cache_key = get_user_snapshot(user_id)
+    if snapshot and snapshot.user.email == payload["email"]:
+        user = snapshot.user
+        user._state.db = UserByEmailLoader(request).database_connection_name
+        setattr(user, "_effective_permissions_cache", snapshot.permissions)
+        AccessibleChannelsByUserIdLoader(request).prime(
+            user.pk, snapshot.accessible_channels
+        )
+        RestrictedChannelAccessByUserIdLoader(request).prime(
+            user.pk, snapshot.restricted_access_to_channels
+        )
+        return user
+
+    user = UserByEmailLoader(request).load(payload["email"]).get()
+    if user and user.is_staff and user.pk == user_id:
+        # The snapshot is taken before the permissions from the token are applied.
+        permissions = JSONWebTokenBackend()._get_permissions(user, None, "user")
+        snapshot_user = copy.copy(user)
+        # Querysets are not cached, as pickling would evaluate them.
+        snapshot_user._effective_permissions = None
+        setattr(snapshot_user, "_effective_permissions_cache", None)
+        accessible_channels = AccessibleChannelsByUserIdLoader(request).load(user.pk)
+        restricted_access = RestrictedChannelAccessByUserIdLoader(request).load(user.pk)
+        snapshot = AuthenticatedUserSnapshot(
+            user=snapshot_user,
+            permissions=permissions,
+            accessible_channels=accessible_channels.get(),
+            restricted_access_to_channels=restricted_access.get(),
+        )
+        cache_user_snapshot(cache_key, snapshot)
+    return user
+
+
 def load_user_from_request(request):
     if request is None:
         return None
@@ -134,7 +197,7 @@ def load_user_from_request(request):
         )
     permissions = payload.get(PERMISSIONS_FIELD, None)
 
-    user = UserByEmailLoader(request).load(payload["email"]).get()
+    user = load_user_from_payload(request, payload)
     user_jwt_token = payload.get("token")
     if not user_jwt_token:
         raise jwt.InvalidTokenError(
@@ -0,0 +1,101 @@
+"""Shared cache of the staff users authenticated with JWT.
+
+Dashboard requests authenticate the same staff users over and over, each time
+fetching the user, their effective permissions and the channels they have access
+to. With `JWT_USER_CACHE_TIMEOUT` set, these are cached for the given number of
+seconds, under the version of the user and the version of the permission groups.
+
+The version of a user is changed whenever the user is saved or deleted, or their
+groups or permissions are changed. The version of the permission groups is changed
+whenever any group, its permissions or channels, or any channel is changed. Cached
+entries of outdated versions are not used anymore and expire.
+"""
+
+from collections.abc import Iterable
+from dataclasses import dataclass
+from functools import partial
+from typing import TYPE_CHECKING
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import transaction
+
+from .versioned_cache import get_versions, rotate_versions
+
+if TYPE_CHECKING:
+    from ..account.models import User
+    from ..channel.models import Channel
+
+AUTH_CACHE_VERSION_KEY = "core.auth_cache_version"
+AUTH_CACHE_USER_VERSION_KEY_PREFIX = "core.auth_cache_user_version"
+AUTH_CACHE_KEY_PREFIX = "auth_cache"
+
+
+@dataclass
+class AuthenticatedUserSnapshot:
+    user: "User"
+    # Permissions in the `<app_label>.<codename>` format, as returned by
+    # the authentication backend.
+    permissions: set[str]
+    accessible_channels: list["Channel"]
+    restricted_access_to_channels: bool
+
+
+def _get_user_version_key(user_id: int) -> str:
+    return f"{AUTH_CACHE_USER_VERSION_KEY_PREFIX}:{user_id}"
+
+
+def _get_cache_key(user_id: int) -> str:
+    version_key = _get_user_version_key(user_id)
+    versions = get_versions([AUTH_CACHE_VERSION_KEY, version_key])
+    return (
+        f"{AUTH_CACHE_KEY_PREFIX}:{versions[AUTH_CACHE_VERSION_KEY]}:"
+        f"{versions[version_key]}:{user_id}"
+    )
+
+
+def get_user_snapshot(user_id: int) -> tuple[AuthenticatedUserSnapshot | None, str]:
+    """Return the cached snapshot of the user and the key to cache it under.
+
+    The key has to be taken before the user is fetched from the database, so the
+    snapshot of data changed in the meantime is cached under an outdated version.
+    """
+    cache_key = _get_cache_key(user_id)
+    return cache.get(cache_key), cache_key
+
+
+def cache_user_snapshot(cache_key: str, snapshot: AuthenticatedUserSnapshot):
+    cache.set(cache_key, snapshot, timeout=settings.JWT_USER_CACHE_TIMEOUT)
+
+
+def invalidate_auth_cache():
+    rotate_versions([AUTH_CACHE_VERSION_KEY])
+
+
+def invalidate_users_auth_cache(user_ids: Iterable[int]):
+    rotate_versions(_get_user_version_key(user_id) for user_id in user_ids)
+
+
+def handle_auth_change(**_kwargs):
+    if settings.JWT_USER_CACHE_TIMEOUT:
+        transaction.on_commit(invalidate_auth_cache)
+
+
+def handle_auth_relation_change(action: str, **kwargs):
+    if action.startswith("post_"):
+        handle_auth_change(**kwargs)
+
+
+def handle_user_change(instance, **_kwargs):
+    if settings.JWT_USER_CACHE_TIMEOUT:
+        transaction.on_commit(partial(invalidate_users_auth_cache, [instance.pk]))
+
+
+def handle_user_relation_change(instance, action: str, reverse: bool, **kwargs):
+    if not action.startswith("post_"):
+        return
+    if reverse:
+        # Users of a group or permission were changed.
+        handle_auth_change(**kwargs)
+    else:
+        handle_user_change(instance, **kwargs)
@@ -0,0 +1,151 @@
+"""Read-through cache of the configuration models.
+
+Channels, site settings, tax configurations, shipping zones and the postal code
+rules of the shipping methods are read on almost every request, while they rarely
+change. The values are cached per process and in the shared cache, under a version
+which is changed whenever any of these models is saved or deleted.
+"""
+
+import copy
+from collections.abc import Callable, Hashable, Iterable
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db.models import Model
+
+from .db.connection import allow_writer
+from .versioned_cache import VersionedMemCache
+
+CONFIG_CACHE_VERSION_KEY = "core.config_cache_version"
+
+# How often, in seconds, the per-process cache checks whether the configuration
+# was changed by other processes.
+CONFIG_CACHE_VERSION_CHECK_INTERVAL = 10
+
+# Values cached under outdated versions are not used anymore and expire.
+CONFIG_CACHE_TIMEOUT = 60 * 60 * 24
+
+_MISSING = object()
+
+_config_mem_cache = VersionedMemCache(
+    CONFIG_CACHE_VERSION_KEY, CONFIG_CACHE_VERSION_CHECK_INTERVAL
+)
+
+
+def _set_database(instance: Model, database_connection_name: str, visited: set[int]):
+    if id(instance) in visited:
+        return
+    visited.add(id(instance))
+    instance._state.db = database_connection_name
+    for related in instance._state.fields_cache.values():
+        if isinstance(related, Model):
+            _set_database(related, database_connection_name, visited)
+
+
+def get_config[T](
+    key: str,
+    fetch: Callable[[], T],
+    database_connection_name: str = settings.DATABASE_CONNECTION_DEFAULT_NAME,
+    *,
+    copy_value: bool = True,
+) -> T:
+    """Return the cached value, calling `fetch` to get it on a cache miss.
+
+    `fetch` is called with the writer database allowed and should read from it, as
+    the replica could return stale data which would be then cached until the next
+    change. A copy is returned as callers are free to modify it. The returned model
+    instances, or lists of them, are bound to the given database, so their
+    relations are fetched from it, as if the instances were fetched from it.
+
+    Large values which are only read, and contain no model instances, can be
+    returned without the copy with `copy_value=False`.
+
+    `None` is not cached, as keys of the missing objects can be chosen by the
+    clients, which would grow the cache without bound.
+    """
+    version, values = _config_mem_cache.get_version_and_values()
+    value = values.get(key, _MISSING)
+    if value is _MISSING:
+        shared_key = f"config_cache:{version}:{key}"
+        value = cache.get(shared_key, _MISSING)
+        if value is _MISSING:
+            with allow_writer():
+                value = fetch()
+            if value is not None:
+                cache.set(shared_key, value, timeout=CONFIG_CACHE_TIMEOUT)
+        if value is not None:
+            values[key] = value
+    if not copy_value:
+        return value
+    return _copy_value(value, database_connection_name)
+
+
+def get_configs[K: Hashable, T](
+    key_prefix: str,
+    ids: Iterable[K],
+    fetch: Callable[[list[K]], dict[K, T]],
+    database_connection_name: str = settings.DATABASE_CONNECTION_DEFAULT_NAME,
+) -> dict[K, T]:
+    """Return the cached values of the given ids, fetching the missing ones at once.
+
+    Values are cached under the `<key_prefix>:<id>` keys, the same as the keys given
+    to `get_config`. `fetch` is called with the ids missing in the cache and returns
+    their values; ids without a value are left out of the returned dict. Otherwise
+    it follows the rules of `get_config`.
+    """
+    version, values = _config_mem_cache.get_version_and_values()
+    keys = {id_: f"{key_prefix}:{id_}" for id_ in ids}
+    found = {id_: values[key] for id_, key in keys.items() if key in values}
+    missing = {id_: key for id_, key in keys.items() if id_ not in found}
+    if missing:
+        shared_keys = {
+            f"config_cache:{version}:{key}": id_ for id_, key in missing.items()
+        }
+        for shared_key, value in cache.get_many(list(shared_keys)).items():
+            found[shared_keys[shared_key]] = value
+        if not_cached_ids := [id_ for id_ in missing if id_ not in found]:
+            with allow_writer():
+                fetched = {
+                    id_: value
+                    for id_, value in fetch(not_cached_ids).items()
+                    if value is not None
+                }
+            cache.set_many(
+                {
+                    f"config_cache:{version}:{missing[id_]}": value
+                    for id_, value in fetched.items()
+                },
+                timeout=CONFIG_CACHE_TIMEOUT,
+            )
+            found.update(fetched)
+        for id_, key in missing.items():
+            if id_ in found:
+                values[key] = found[id_]
+    return {
+        id_: _copy_value(value, database_connection_name)
+        for id_, value in found.items()
+    }
+
+
+def _copy_value[T](value: T, database_connection_name: str) -> T:
+    value = copy.deepcopy(value)
+    instances = value if isinstance(value, list) else [value]
+    visited: set[int] = set()
+    for instance in instances:
+        if isinstance(instance, Model):
+            _set_database(instance, database_connection_name, visited)
+    return value
+
+
+def invalidate_config_cache():
+    """Force all processes to reload the configuration from the database."""
+    _config_mem_cache.invalidate()
+
+
+def handle_config_change(**_kwargs):
+    _config_mem_cache.handle_change()
+
+
+def handle_config_relation_change(action: str, **kwargs):
+    if action.startswith("post_"):
+        handle_config_change(**kwargs)
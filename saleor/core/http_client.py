@@ -1,8 +1,21 @@
+import logging
+import os
+import threading
+import time
+import weakref
+from dataclasses import dataclass
+from http.cookiejar import DefaultCookiePolicy
+from urllib.parse import urlsplit
+
 import requests_hardened
 from django.conf import settings
+from requests import Response
+from urllib3.connectionpool import HTTPConnectionPool, HTTPSConnectionPool
 
 from .. import user_agent_version
 
+logger = logging.getLogger(__name__)
+
 HTTPConfig = requests_hardened.Config(
     ip_filter_enable=settings.HTTP_IP_FILTER_ENABLED,
     ip_filter_allow_loopback_ips=settings.HTTP_IP_FILTER_ALLOW_LOOPBACK_IPS,
@@ -12,3 +25,148 @@ HTTPConfig = requests_hardened.Config(
 )
 
 HTTPClient = requests_hardened.Manager(HTTPConfig)
+
+if settings.HTTP_CLIENT_HTTP2_ENABLED:
+    try:
+        from urllib3.http2 import inject_into_urllib3
+
+        inject_into_urllib3()
+    except ImportError:
+        logger.warning(
+            "HTTP/2 is enabled, but the h2 package is not installed. "
+            "Falling back to HTTP/1.1."
+        )
+
+# Number of connections opened by the current thread, used to tell whether
+# a request was sent over a reused connection.
+_connections_opened = threading.local()
+
+
+def _count_opened_connection():
+    _connections_opened.count = getattr(_connections_opened, "count", 0) + 1
+
+
+def _get_opened_connections_count() -> int:
+    return getattr(_connections_opened, "count", 0)
+
+
+class _CountingHTTPConnectionPool(HTTPConnectionPool):
+    def _new_conn(self):
+        _count_opened_connection()
+        return super()._new_conn()
+
+
+class _CountingHTTPSConnectionPool(HTTPSConnectionPool):
+    def _new_conn(self):
+        _count_opened_connection()
+        return super()._new_conn()
+
+
+@dataclass(frozen=True)
+class PooledRequestInfo:
+    # Whether a session for the target origin was already in the pool.
+    pool_hit: bool
+    # Whether the request was sent over a connection kept alive after
+    # a previous request.
+    connection_reused: bool
+
+
+_session_pools: weakref.WeakSet["HTTPSessionPool"] = weakref.WeakSet()
+
+
+class HTTPSessionPool:
+    """Per-process pool of keep-alive sessions, one for each target origin.
+
+    Requests sent to the same origin reuse the open connections, saving the TCP
+    and TLS handshakes. Sessions unused for longer than `idle_timeout` seconds are
+    closed. Connections can't be shared between processes, so the pool starts empty
+    in the processes forked from the one which created it, e.g. Celery workers.
+    """
+
+    def __init__(
+        self, config: requests_hardened.Config, pool_size: int, idle_timeout: float
+    ):
+        self.config = config
+        self.pool_size = pool_size
+        self.idle_timeout = idle_timeout
+        self._init_state()
+        _session_pools.add(self)
+
+    def _init_state(self):
+        self._lock = threading.Lock()
+        self._sessions: dict[str, tuple[requests_hardened.HTTPSession, float]] = {}
+
+    def _create_session(self) -> requests_hardened.HTTPSession:
+        session = requests_hardened.HTTPSession(self.config)
+        # The sessions are shared by all requests to the origin, cookies set
+        # in the responses must not be sent with the following requests.
+        session.cookies.set_policy(DefaultCookiePolicy(allowed_domains=[]))
+        for adapter in session.adapters.values():
+            adapter.init_poolmanager(self.pool_size, self.pool_size)
+            adapter.poolmanager.pool_classes_by_scheme = {
+                "http": _CountingHTTPConnectionPool,
+                "https": _CountingHTTPSConnectionPool,
+            }
+        return session
+
+    def _get_session(self, origin: str) -> tuple[requests_hardened.HTTPSession, bool]:
+        now = time.monotonic()
+        with self._lock:
+            expired_sessions = [
+                self._sessions.pop(expired_origin)[0]
+                for expired_origin, (_, last_used) in list(self._sessions.items())
+                if now - last_used > self.idle_timeout
+            ]
+            entry = self._sessions.get(origin)
+            session = entry[0] if entry else self._create_session()
+            self._sessions[origin] = (session, now)
+        for expired_session in expired_sessions:
+            expired_session.close()
+        return session, entry is not None
+
+    def _mark_used(self, origin: str, session: requests_hardened.HTTPSession):
+        with self._lock:
+            if origin in self._sessions:
+                self._sessions[origin] = (session, time.monotonic())
+
+    def request(
+        self, method: str, url: str, **kwargs
+    ) -> tuple[Response, PooledRequestInfo]:
+        parts = urlsplit(url)
+        origin = f"{parts.scheme}://{parts.netloc}".lower()
+        session, pool_hit = self._get_session(origin)
+        opened_connections_count = _get_opened_connections_count()
+        try:
+            response = session.request(method, url, **kwargs)
+        finally:
+            self._mark_used(origin, session)
+        connection_reused = opened_connections_count == _get_opened_connections_count()
+        return response, PooledRequestInfo(
+            pool_hit=pool_hit, connection_reused=connection_reused
+        )
+
+    def send_request(self, method: str, url: str, **kwargs) -> Response:
+        return self.request(method, url, **kwargs)[0]
+
+    def clear(self):
+        with self._lock:
+            sessions = [session for session, _ in self._sessions.values()]
+            self._sessions = {}
+        for session in sessions:
+            session.close()
+
+
+def _reset_session_pools_after_fork():
+    # The connections belong to the parent process, they are dropped without
+    # being closed.
+    for pool in _session_pools:
+        pool._init_state()
+
+
+os.register_at_fork(after_in_child=_reset_session_pools_after_fork)
+
+HTTPClientPool = HTTPSessionPool(
+    HTTPConfig,
+    pool_size=settings.HTTP_CLIENT_POOL_SIZE,
+    idle_timeout=settings.HTTP_CLIENT_POOL_IDLE_TIMEOUT,
+)
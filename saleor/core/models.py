@@ -239,3 +239,11 @@ class EventDeliveryAttempt(models.Model):
 
     class Meta:
         ordering = ("-created_at",)
+
+
+class PersistedQuery(models.Model):
+    """GraphQL document registered to be requested by its SHA-256 hash."""
+
+    hash = models.CharField(max_length=64, unique=True)
+    query = models.TextField()
+    created_at = models.DateTimeField(auto_now_add=True)
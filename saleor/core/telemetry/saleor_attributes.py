@@ -16,6 +16,8 @@ GRAPHQL_RESOLVER_ROW_COUNT: Final = "graphql.resolver.row_count"
 
 # Http
 SALEOR_SOURCE_SERVICE_NAME: Final = "saleor.source.service.name"
+SALEOR_HTTP_POOL_HIT: Final = "saleor.http.pool.hit"
+SALEOR_HTTP_CONNECTION_REUSED: Final = "saleor.http.connection.reused"
 
 # Apps
 SALEOR_APP_ID: Final = "saleor.app.id"
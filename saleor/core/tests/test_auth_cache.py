@@ -0,0 +1,166 @@
+from unittest.mock import patch
+
+import pytest
+from django.core.cache import cache
+from jwt import InvalidTokenError
+
+from ...graphql.account.dataloaders import (
+    AccessibleChannelsByUserIdLoader,
+    RestrictedChannelAccessByUserIdLoader,
+)
+from ..auth_backend import JSONWebTokenBackend
+from ..jwt import create_access_token, create_access_token_for_app
+
+
+@pytest.fixture
+def auth_cache_enabled(settings):
+    settings.JWT_USER_CACHE_TIMEOUT = 60
+    cache.clear()
+
+
+def authenticate(rf, token):
+    request = rf.request(HTTP_AUTHORIZATION=f"JWT {token}")
+    return request, JSONWebTokenBackend().authenticate(request)
+
+
+def test_staff_user_is_cached(
+    rf,
+    staff_user,
+    permission_group_manage_users,
+    channel_USD,
+    auth_cache_enabled,
+    django_assert_num_queries,
+):
+    # given
+    permission_group_manage_users.user_set.add(staff_user)
+    token = create_access_token(staff_user)
+    authenticate(rf, token)
+
+    # when
+    with django_assert_num_queries(0):
+        request, user = authenticate(rf, token)
+        has_perm = user.has_perm("account.manage_users")
+        channels = AccessibleChannelsByUserIdLoader(request).load(user.pk).get()
+        restricted_access = (
+            RestrictedChannelAccessByUserIdLoader(request).load(user.pk).get()
+        )
+
+    # then
+    assert user == staff_user
+    assert has_perm is True
+    assert channels == [channel_USD]
+    assert restricted_access is False
+
+
+@patch("saleor.core.auth_backend.cache_user_snapshot")
+def test_customer_user_is_not_cached(
+    mock_cache_user_snapshot, rf, customer_user, auth_cache_enabled
+):
+    # given
+    token = create_access_token(customer_user)
+
+    # when
+    _, user = authenticate(rf, token)
+
+    # then
+    assert user == customer_user
+    mock_cache_user_snapshot.assert_not_called()
+
+
+@patch("saleor.core.auth_backend.get_user_snapshot")
+def test_staff_user_is_not_cached_when_cache_disabled(
+    mock_get_user_snapshot, rf, staff_user, settings
+):
+    # given
+    settings.JWT_USER_CACHE_TIMEOUT = 0
+    token = create_access_token(staff_user)
+
+    # when
+    _, user = authenticate(rf, token)
+
+    # then
+    assert user == staff_user
+    mock_get_user_snapshot.assert_not_called()
+
+
+def test_cached_user_invalidated_on_group_permissions_change(
+    rf,
+    staff_user,
+    permission_group_manage_users,
+    permission_manage_orders,
+    auth_cache_enabled,
+    django_capture_on_commit_callbacks,
+):
+    # given
+    permission_group_manage_users.user_set.add(staff_user)
+    token = create_access_token(staff_user)
+    authenticate(rf, token)
+
+    # when
+    with django_capture_on_commit_callbacks(execute=True):
+        permission_group_manage_users.permissions.add(permission_manage_orders)
+
+    # then
+    _, user = authenticate(rf, token)
+    assert user.has_perm("order.manage_orders")
+
+
+def test_cached_user_invalidated_on_user_permissions_change(
+    rf,
+    staff_user,
+    permission_manage_orders,
+    auth_cache_enabled,
+    django_capture_on_commit_callbacks,
+):
+    # given
+    token = create_access_token(staff_user)
+    authenticate(rf, token)
+
+    # when
+    with django_capture_on_commit_callbacks(execute=True):
+        staff_user.user_permissions.add(permission_manage_orders)
+
+    # then
+    _, user = authenticate(rf, token)
+    assert user.has_perm("order.manage_orders")
+
+
+def test_cached_user_invalidated_on_deactivation(
+    rf, staff_user, auth_cache_enabled, django_capture_on_commit_callbacks
+):
+    # given
+    token = create_access_token(staff_user)
+    authenticate(rf, token)
+
+    # when
+    with django_capture_on_commit_callbacks(execute=True):
+        staff_user.is_active = False
+        staff_user.save(update_fields=["is_active"])
+
+    # then
+    with pytest.raises(InvalidTokenError):
+        authenticate(rf, token)
+
+
+def test_cached_user_limited_to_token_permissions(
+    rf,
+    staff_user,
+    app,
+    permission_manage_orders,
+    permission_manage_products,
+    auth_cache_enabled,
+):
+    # given
+    staff_user.user_permissions.add(
+        permission_manage_orders, permission_manage_products
+    )
+    app.permissions.add(permission_manage_orders)
+    authenticate(rf, create_access_token(staff_user))
+    token = create_access_token_for_app(app, staff_user)
+
+    # when
+    _, user = authenticate(rf, token)
+
+    # then
+    assert user.has_perm("order.manage_orders")
+    assert not user.has_perm("product.manage_products")
@@ -0,0 +1,206 @@
+from django.core.cache import cache
+
+from ...channel.cache import (
+    get_channel_by_id,
+    get_channel_by_slug,
+    get_channels_by_id,
+)
+from ...channel.models import Channel
+from ...shipping.cache import get_shipping_zones_by_channel_id
+from ...site.cache import get_site_by_id
+from ...tax.cache import (
+    get_tax_configuration_by_channel_id,
+    get_tax_configuration_per_country,
+)
+from ..config_cache import (
+    CONFIG_CACHE_VERSION_KEY,
+    get_config,
+    invalidate_config_cache,
+)
+from ..versioned_cache import VersionedMemCache
+
+
+def test_channel_is_cached(channel_USD, django_assert_num_queries):
+    # given
+    get_channel_by_slug(channel_USD.slug)
+
+    # when
+    with django_assert_num_queries(0):
+        channel = get_channel_by_slug(channel_USD.slug)
+
+    # then
+    assert channel == channel_USD
+    assert channel.name == channel_USD.name
+
+
+def test_missing_channel_is_not_cached(db, django_assert_num_queries):
+    # given
+    get_channel_by_slug("missing")
+
+    # when
+    with django_assert_num_queries(1):
+        channel = get_channel_by_slug("missing")
+
+    # then
+    assert channel is None
+
+
+def test_missing_values_are_fetched_at_once(
+    channel_USD, channel_PLN, django_assert_num_queries
+):
+    # given
+    get_channel_by_id(channel_USD.pk)
+    missing_channel_id = channel_PLN.pk + 1000
+
+    # when
+    with django_assert_num_queries(1):
+        channels = get_channels_by_id(
+            [channel_USD.pk, channel_PLN.pk, missing_channel_id]
+        )
+
+    # then
+    assert channels == {channel_USD.pk: channel_USD, channel_PLN.pk: channel_PLN}
+    with django_assert_num_queries(0):
+        assert get_channel_by_id(channel_PLN.pk) == channel_PLN
+
+
+def test_cached_value_is_copied(channel_USD):
+    # given
+    channel = get_channel_by_id(channel_USD.pk)
+    assert channel
+
+    # when
+    channel.name = "Changed"
+
+    # then
+    cached_channel = get_channel_by_id(channel_USD.pk)
+    assert cached_channel
+    assert cached_channel.name == channel_USD.name
+
+
+def test_cached_value_is_bound_to_database(channel_USD, settings):
+    # when
+    channel = get_channel_by_id(
+        channel_USD.pk, settings.DATABASE_CONNECTION_REPLICA_NAME
+    )
+
+    # then
+    assert channel
+    assert channel._state.db == settings.DATABASE_CONNECTION_REPLICA_NAME
+
+
+def test_site_is_cached_with_settings(site_settings, django_assert_num_queries):
+    # given
+    get_site_by_id(site_settings.site_id)
+
+    # when
+    with django_assert_num_queries(0):
+        site = get_site_by_id(site_settings.site_id)
+        assert site
+        site_settings_from_cache = site.settings
+
+    # then
+    assert site_settings_from_cache == site_settings
+
+
+def test_tax_configuration_is_cached(channel_USD, django_assert_num_queries):
+    # given
+    tax_configuration = channel_USD.tax_configuration
+    tax_configuration.country_exceptions.create(country="CZ", charge_taxes=False)
+    get_tax_configuration_by_channel_id(channel_USD.pk)
+    get_tax_configuration_per_country(tax_configuration.pk)
+
+    # when
+    with django_assert_num_queries(0):
+        cached_tax_configuration = get_tax_configuration_by_channel_id(channel_USD.pk)
+        country_exceptions = get_tax_configuration_per_country(tax_configuration.pk)
+
+    # then
+    assert cached_tax_configuration == tax_configuration
+    assert {exception.country.code for exception in country_exceptions} == set(
+        tax_configuration.country_exceptions.values_list("country", flat=True)
+    )
+
+
+def test_saving_model_invalidates_cache(channel_USD):
+    # given
+    get_channel_by_slug(channel_USD.slug)
+
+    # when
+    channel_USD.name = "Changed"
+    channel_USD.save(update_fields=["name"])
+
+    # then
+    channel = get_channel_by_slug(channel_USD.slug)
+    assert channel
+    assert channel.name == "Changed"
+
+
+def test_deleting_model_invalidates_cache(channel_USD):
+    # given
+    get_channel_by_slug(channel_USD.slug)
+
+    # when
+    Channel.objects.filter(pk=channel_USD.pk).delete()
+
+    # then
+    assert get_channel_by_slug(channel_USD.slug) is None
+
+
+def test_changing_shipping_zone_channels_invalidates_cache(channel_USD, shipping_zone):
+    # given
+    assert get_shipping_zones_by_channel_id(channel_USD.pk) == [shipping_zone]
+
+    # when
+    shipping_zone.channels.remove(channel_USD)
+
+    # then
+    assert get_shipping_zones_by_channel_id(channel_USD.pk) == []
+
+
+def test_committed_change_invalidates_other_processes_cache(
+    channel_USD, django_capture_on_commit_callbacks
+):
+    # given
+    version = cache.get(CONFIG_CACHE_VERSION_KEY)
+
+    # when
+    with django_capture_on_commit_callbacks(execute=True):
+        channel_USD.save(update_fields=["name"])
+
+    # then
+    assert cache.get(CONFIG_CACHE_VERSION_KEY) != version
+
+
+def test_value_is_read_from_shared_cache(monkeypatch):
+    # given
+    invalidate_config_cache()
+    get_config("key", lambda: "value")
+    # drop the per-process cache, as if the value was cached by another process
+    version = cache.get(CONFIG_CACHE_VERSION_KEY)
+    monkeypatch.setattr(
+        "saleor.core.config_cache._config_mem_cache",
+        VersionedMemCache(CONFIG_CACHE_VERSION_KEY, check_interval=-1),
+    )
+
+    # when
+    value = get_config("key", lambda: "other value")
+
+    # then
+    assert value == "value"
+    assert cache.get(CONFIG_CACHE_VERSION_KEY) == version
+
+
+def test_version_change_invalidates_cache(monkeypatch):
+    # given
+    monkeypatch.setattr(
+        "saleor.core.config_cache._config_mem_cache",
+        VersionedMemCache(CONFIG_CACHE_VERSION_KEY, check_interval=-1),
+    )
+    get_config("key", lambda: "value")
+
+    # when
+    cache.set(CONFIG_CACHE_VERSION_KEY, "other-process-version")
+
+    # then
+    assert get_config("key", lambda: "other value") == "other value"
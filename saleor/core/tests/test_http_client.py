@@ -1,10 +1,20 @@
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
 import pytest
 import requests_hardened
 from requests import Request
 from requests_hardened.ip_filter import InvalidIPAddress
 
 from ... import user_agent_version
-from ..http_client import HTTPClient, HTTPConfig
+from ..http_client import (
+    HTTPClient,
+    HTTPConfig,
+    HTTPSessionPool,
+    PooledRequestInfo,
+    _reset_session_pools_after_fork,
+)
 
 
 def test_user_agent_override():
@@ -42,3 +52,86 @@ def test_http_client_disallows_private_ip_ranges(protocol):
     # Should not reject public IP ranges (sanity check).
     response = http_manager.send_request("GET", f"{protocol}://example.com")
     assert response.status_code == 200
+
+
+class KeepAliveHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def do_GET(self):
+        body = (self.headers.get("Cookie") or "").encode()
+        self.send_response(200)
+        self.send_header("Set-Cookie", "session=secret")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+@pytest.fixture
+def keep_alive_server_url():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), KeepAliveHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_port}/"
+    server.shutdown()
+    server.server_close()
+
+
+@pytest.fixture
+def http_client_pool():
+    pool = HTTPSessionPool(HTTPConfig, pool_size=2, idle_timeout=60)
+    yield pool
+    pool.clear()
+
+
+def test_http_client_pool_reuses_connections(http_client_pool, keep_alive_server_url):
+    # when
+    first_response, first_info = http_client_pool.request("GET", keep_alive_server_url)
+    second_response, second_info = http_client_pool.request(
+        "GET", keep_alive_server_url
+    )
+
+    # then
+    assert first_response.status_code == second_response.status_code == 200
+    assert first_info == PooledRequestInfo(pool_hit=False, connection_reused=False)
+    assert second_info == PooledRequestInfo(pool_hit=True, connection_reused=True)
+
+
+def test_http_client_pool_doesnt_send_cookies(http_client_pool, keep_alive_server_url):
+    # given
+    http_client_pool.request("GET", keep_alive_server_url)
+
+    # when
+    response, _ = http_client_pool.request("GET", keep_alive_server_url)
+
+    # then
+    assert response.text == ""
+
+
+def test_http_client_pool_closes_idle_sessions(http_client_pool, keep_alive_server_url):
+    # given
+    http_client_pool.idle_timeout = 0
+    http_client_pool.request("GET", keep_alive_server_url)
+    time.sleep(0.01)
+
+    # when
+    _, info = http_client_pool.request("GET", keep_alive_server_url)
+
+    # then
+    assert info == PooledRequestInfo(pool_hit=False, connection_reused=False)
+
+
+def test_http_client_pool_is_emptied_after_fork(
+    http_client_pool, keep_alive_server_url
+):
+    # given
+    http_client_pool.request("GET", keep_alive_server_url)
+
+    # when
+    _reset_session_pools_after_fork()
+    _, info = http_client_pool.request("GET", keep_alive_server_url)
+
+    # then
+    assert info == PooledRequestInfo(pool_hit=False, connection_reused=False)
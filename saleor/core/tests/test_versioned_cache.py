@@ -0,0 +1,82 @@
+from django.core.cache import cache
+
+from ..versioned_cache import VersionedMemCache, get_versions, rotate_versions
+
+VERSION_KEY = "test.versioned_cache_version"
+
+
+def test_get_versions_creates_missing_versions():
+    # given
+    cache.delete(VERSION_KEY)
+
+    # when
+    versions = get_versions([VERSION_KEY])
+
+    # then
+    assert versions[VERSION_KEY] == cache.get(VERSION_KEY)
+
+
+def test_rotate_versions_changes_version():
+    # given
+    version = get_versions([VERSION_KEY])[VERSION_KEY]
+
+    # when
+    rotate_versions([VERSION_KEY])
+
+    # then
+    assert cache.get(VERSION_KEY) != version
+
+
+def test_mem_cache_values_dropped_on_version_change():
+    # given
+    mem_cache = VersionedMemCache(VERSION_KEY, check_interval=-1)
+    mem_cache.values["key"] = "value"
+
+    # when
+    rotate_versions([VERSION_KEY])
+
+    # then
+    assert "key" not in mem_cache.values
+
+
+def test_mem_cache_version_checked_once_per_interval():
+    # given
+    mem_cache = VersionedMemCache(VERSION_KEY, check_interval=60)
+    mem_cache.values["key"] = "value"
+
+    # when
+    rotate_versions([VERSION_KEY])
+
+    # then
+    assert mem_cache.values["key"] == "value"
+
+
+def test_mem_cache_clear_keeps_shared_version():
+    # given
+    mem_cache = VersionedMemCache(VERSION_KEY, check_interval=-1)
+    mem_cache.values["key"] = "value"
+    version = cache.get(VERSION_KEY)
+
+    # when
+    mem_cache.clear()
+
+    # then
+    assert "key" not in mem_cache.values
+    assert cache.get(VERSION_KEY) == version
+
+
+def test_mem_cache_handle_change_rotates_version_on_commit(
+    db, django_capture_on_commit_callbacks
+):
+    # given
+    mem_cache = VersionedMemCache(VERSION_KEY, check_interval=60)
+    mem_cache.values["key"] = "value"
+    version = cache.get(VERSION_KEY)
+
+    # when
+    with django_capture_on_commit_callbacks(execute=True):
+        mem_cache.handle_change()
+
+    # then
+    assert "key" not in mem_cache.values
+    assert cache.get(VERSION_KEY) != version
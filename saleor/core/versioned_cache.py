@@ -0,0 +1,96 @@
+"""Caches invalidated by changing a version kept in the shared cache.
+
+Values which are read often but rarely change are cached under a version token
+stored in the shared cache. Changing the token invalidates the values cached by
+all processes at once. A random token is used instead of a counter, so the
+eviction of the key from the shared cache also invalidates the values.
+"""
+
+import uuid
+from collections.abc import Iterable
+from time import monotonic
+from typing import Any
+
+from django.core.cache import cache
+from django.db import transaction
+
+
+def get_versions(keys: Iterable[str]) -> dict[str, str]:
+    """Return the versions stored under the given keys, creating the missing ones."""
+    keys = list(keys)
+    versions = cache.get_many(keys)
+    for key in keys:
+        if key not in versions:
+            cache.add(key, uuid.uuid4().hex, timeout=None)
+            versions[key] = cache.get(key)
+    return versions
+
+
+def get_version(key: str) -> str:
+    return get_versions([key])[key]
+
+
+def rotate_versions(keys: Iterable[str]):
+    cache.set_many({key: uuid.uuid4().hex for key in keys}, timeout=None)
+
+
+class VersionedMemCache:
+    """Per-process cache of values valid as long as the shared version is unchanged.
+
+    The version is checked at most once per `check_interval` seconds, so the
+    changes made by other processes are noticed with that delay.
+    """
+
+    def __init__(self, version_key: str, check_interval: float):
+        self.version_key = version_key
+        self.check_interval = check_interval
+        self._state: dict[str, Any] = {}
+
+    def _reset(self, version: str) -> dict[str, Any]:
+        # The state is replaced as a whole, so concurrent threads never see it
+        # partially reset.
+        self._state = {"version": version, "checked_at": monotonic(), "values": {}}
+        return self._state
+
+    def _get_state(self) -> dict[str, Any]:
+        state = self._state
+        if not state or monotonic() - state["checked_at"] > self.check_interval:
+            version = get_version(self.version_key)
+            if state.get("version") == version:
+                state["checked_at"] = monotonic()
+            else:
+                state = self._reset(version)
+        return state
+
+    @property
+    def values(self) -> dict[str, Any]:
+        return self._get_state()["values"]
+
+    def get_version_and_values(self) -> tuple[str, dict[str, Any]]:
+        state = self._get_state()
+        return state["version"], state["values"]
+
+    def clear(self):
+        """Drop the values cached by the current process.
+
+        The process switches to a version known only to itself, so it goes back to
+        the shared version after the next check.
+        """
+        self._reset(uuid.uuid4().hex)
+
+    def invalidate(self):
+        """Force all processes to drop their cached values."""
+        version = uuid.uuid4().hex
+        cache.set(self.version_key, version, timeout=None)
+        self._reset(version)
+
+    def handle_change(self):
+        """Invalidate the cache after a change made in the ongoing transaction.
+
+        The current process drops its values right away, so the change is visible
+        in the ongoing transaction, and in case of rollback the values read in it
+        are dropped after the next check. Other processes are notified once the
+        change is committed.
+        """
+        self.clear()
+        transaction.on_commit(self.invalidate)
@@ -7,6 +7,7 @@ class ExportEvents:
     EXPORT_DELETED = "export_deleted"
     EXPORTED_FILE_SENT = "exported_file_sent"
     EXPORT_FAILED_INFO_SENT = "Export_failed_info_sent"
+    EXPORT_SHARD_FINISHED = "export_shard_finished"
 
     CHOICES = [
         (EXPORT_PENDING, "Data export was started."),
@@ -21,6 +22,7 @@ class ExportEvents:
             EXPORT_FAILED_INFO_SENT,
             "Email with info that export failed was sent to the customer.",
         ),
+        (EXPORT_SHARD_FINISHED, "Part of the data export was completed."),
     ]
 
 
@@ -80,3 +80,27 @@ def export_failed_info_sent_event(*, export_file_id: int, user_id: int) -> None:
         user_id=user_id,
         type=ExportEvents.EXPORT_FAILED_INFO_SENT,
     )
+
+
+@allow_writer()
+def export_shard_finished_event(
+    *,
+    export_file: "ExportFile",
+    shard: int,
+    shards_count: int,
+    file_name: str,
+    user: Optional["User"] = None,
+    app: Optional["App"] = None,
+) -> None:
+    ExportEvent.objects.create(
+        export_file=export_file,
+        user=user,
+        app=app,
+        type=ExportEvents.EXPORT_SHARD_FINISHED,
+        parameters={
+            "message": f"Exported part {shard} of {shards_count}.",
+            "shard": shard,
+            "shards_count": shards_count,
+            "file_name": file_name,
+        },
+    )
@@ -0,0 +1,34 @@
+# Generated by Django 5.2.8 on 2026-10-17 09:12
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("csv", "0004_auto_20210709_1043"),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name="exportevent",
+            name="type",
+            field=models.CharField(
+                choices=[
+                    ("export_pending", "Data export was started."),
+                    ("export_success", "Data export was completed successfully."),
+                    ("export_failed", "Data export failed."),
+                    ("export_deleted", "Export file was deleted."),
+                    (
+                        "exported_file_sent",
+                        "Email with link to download file was sent to the customer.",
+                    ),
+                    (
+                        "Export_failed_info_sent",
+                        "Email with info that export failed was sent to the customer.",
+                    ),
+                    ("export_shard_finished", "Part of the data export was completed."),
+                ],
+                max_length=255,
+            ),
+        ),
+    ]
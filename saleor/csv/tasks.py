@@ -1,3 +1,4 @@
+from celery import chord
 from celery.utils.log import get_task_logger
 from django.conf import settings
 from django.core.files.storage import default_storage
@@ -12,7 +13,16 @@ from ..core.tasks import RestrictWriterDBTask
 from . import events
 from .models import ExportEvent, ExportFile
 from .notifications import send_export_failed_info
-from .utils.export import export_gift_cards, export_products, export_voucher_codes
+from .utils.export import (
+    delete_products_export_shards,
+    export_gift_cards,
+    export_products,
+    export_products_shard,
+    export_voucher_codes,
+    get_products_export_shard_file_names,
+    get_products_export_shards,
+    merge_products_export_shards,
+)
 
 task_logger = get_task_logger(__name__)
 
@@ -21,18 +31,31 @@ class ExportTask(RestrictWriterDBTask):
     # should be updated when new export task is added
     TASK_NAME_TO_DATA_TYPE_MAPPING = {
         "export-products": "products",
+        "export-products-shard": "products",
+        "merge-products-export-shards": "products",
         "export-gift-cards": "gift cards",
         "export-voucher-codes": "voucher codes",
     }
 
+    # Returned by the tasks which do not finish the export, e.g. when the export is
+    # continued by other tasks.
+    IN_PROGRESS = "in_progress"
+
     def on_failure(self, exc, task_id, args, kwargs, einfo):
         export_file_id = args[0]
+        # The export is run by multiple tasks, which can fail at the same time, so
+        # only the one which marks the export as failed reports the failure.
+        failed = (
+            ExportFile.objects.filter(pk=export_file_id)
+            .exclude(status=JobStatus.FAILED)
+            .update(
+                status=JobStatus.FAILED, content_file=None, updated_at=timezone.now()
+            )
+        )
+        if not failed:
+            return
         export_file = ExportFile.objects.get(pk=export_file_id)
 
-        export_file.content_file = None
-        export_file.status = JobStatus.FAILED
-        export_file.save(update_fields=["status", "updated_at", "content_file"])
-
         events.export_failed_event(
             export_file=export_file,
             user=export_file.user,
@@ -47,6 +70,8 @@ class ExportTask(RestrictWriterDBTask):
         send_export_failed_info(export_file, data_type)
 
     def on_success(self, retval, task_id, args, kwargs):
+        if retval == self.IN_PROGRESS:
+            return
         export_file_id = args[0]
 
         export_file = ExportFile.objects.get(pk=export_file_id)
@@ -71,7 +96,96 @@ def export_products_task(
         export_file = ExportFile.objects.select_related("app", "user").get(
             pk=export_file_id
         )
-    export_products(export_file, scope, export_info, file_type, delimiter)
+
+    shards = []
+    if shard_size := settings.EXPORT_PRODUCTS_SHARD_SIZE:
+        shards = get_products_export_shards(scope, shard_size)
+    if len(shards) <= 1:
+        export_products(export_file, scope, export_info, file_type, delimiter)
+        return None
+
+    # Shards are exported in parallel, the export is finished by the merge task.
+    # When any of the tasks fails, the merge task is not run and the stored shard
+    # files are deleted by the error callback.
+    shard_file_names = get_products_export_shard_file_names(len(shards), file_type)
+    chord(
+        [
+            export_products_shard_task.si(
+                export_file_id,
+                scope,
+                export_info,
+                file_type,
+                delimiter,
+                start_pk,
+                end_pk,
+                shard_file_name,
+                index + 1,
+                len(shards),
+            )
+            for index, ((start_pk, end_pk), shard_file_name) in enumerate(
+                zip(shards, shard_file_names, strict=True)
+            )
+        ]
+    )(
+        merge_products_export_shards_task.si(
+            export_file_id, export_info, file_type, delimiter
+        ).on_error(delete_products_export_shards_task.si(export_file_id))
+    )
+    return ExportTask.IN_PROGRESS
+
+
+@app.task(name="export-products-shard", base=ExportTask)
+def export_products_shard_task(
+    export_file_id: int,
+    scope: dict[str, str | dict],
+    export_info: dict[str, list],
+    file_type: str,
+    delimiter: str,
+    start_pk: int,
+    end_pk: int,
+    shard_file_name: str,
+    shard: int,
+    shards_count: int,
+):
+    with allow_writer():
+        export_file = ExportFile.objects.select_related("app", "user").get(
+            pk=export_file_id
+        )
+    export_products_shard(
+        export_file,
+        scope,
+        export_info,
+        file_type,
+        delimiter,
+        start_pk,
+        end_pk,
+        shard_file_name,
+        shard,
+        shards_count,
+    )
+    return ExportTask.IN_PROGRESS
+
+
+@app.task(name="merge-products-export-shards", base=ExportTask)
+def merge_products_export_shards_task(
+    export_file_id: int,
+    export_info: dict[str, list],
+    file_type: str,
+    delimiter: str,
+):
+    with allow_writer():
+        export_file = ExportFile.objects.select_related("app", "user").get(
+            pk=export_file_id
+        )
+    merge_products_export_shards(export_file, export_info, file_type, delimiter)
+
+
+@app.task
+@allow_writer()
+def delete_products_export_shards_task(export_file_id: int):
+    export_file = ExportFile.objects.filter(pk=export_file_id).first()
+    if export_file:
+        delete_products_export_shards(export_file)
 
 
 @app.task(name="export-gift-cards", base=ExportTask)
@@ -0,0 +1,51 @@
+import os
+
+import pytest
+
+from ... import FileTypes
+from ...utils.export import append_to_file, create_file_with_headers
+
+HEADERS = ["id", "name", "variants__id", "variants__sku", "description_as_str"]
+
+
+def get_rows(rows_count):
+    for index in range(rows_count):
+        yield {
+            "id": f"UHJvZHVjdDo{index}",
+            "name": f"Product {index}",
+            "variants__id": f"UHJvZHVjdFZhcmlhbnQ6{index}",
+            "variants__sku": f"sku-{index}",
+            "description_as_str": "Lorem ipsum dolor sit amet.",
+        }
+
+
+def is_benchmark_run(config):
+    return bool(
+        config.getoption("benchmark_save") or config.getoption("benchmark_compare")
+    )
+
+
+# The benchmark runner records the wall time and peak memory of each row count. The
+# time should grow linearly with the number of rows and the peak memory should not
+# depend on it.
+@pytest.mark.count_queries(autouse=False)
+@pytest.mark.parametrize("rows_count", [10_000, 100_000, 1_000_000])
+@pytest.mark.parametrize("file_type", [FileTypes.CSV, FileTypes.XLSX])
+def test_export_rows(rows_count, file_type, request):
+    if rows_count > 100_000 and not is_benchmark_run(request.config):
+        pytest.skip("Runs only with --benchmark-save or --benchmark-compare.")
+
+    # given
+    writer = create_file_with_headers(HEADERS, ",", file_type)
+
+    # when
+    append_to_file(get_rows(rows_count), HEADERS, writer)
+    writer.close()
+
+    # then
+    if file_type == FileTypes.CSV:
+        # headers and the rows
+        assert sum(1 for _ in writer.file) == rows_count + 1
+    else:
+        assert os.path.getsize(writer.file.name)
+    writer.file.close()
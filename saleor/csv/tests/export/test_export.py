@@ -1,12 +1,10 @@
 import datetime
 import json
 import shutil
-from tempfile import NamedTemporaryFile
 from unittest.mock import ANY, MagicMock, patch
 
 import graphene
 import openpyxl
-import petl as etl
 import pytest
 from django.core.files import File
 from freezegun import freeze_time
@@ -28,6 +26,7 @@ from ...utils.export import (
     export_voucher_codes,
     export_voucher_codes_in_batches,
     get_filename,
+    get_products_export_shards,
     get_queryset,
     parse_input,
     save_csv_file_in_export_file,
@@ -64,8 +63,8 @@ def test_export_products(
         "channels": [],
     }
 
-    mock_file = MagicMock(spec=File)
-    create_file_with_headers_mock.return_value = mock_file
+    mock_writer = MagicMock()
+    create_file_with_headers_mock.return_value = mock_writer
 
     product_list[0].variants.update(sku=None)
 
@@ -88,12 +87,11 @@ def test_export_products(
         export_info,
         {"id", "name", "variants__id", "variants__sku", expected_charge_taxes},
         ["id", "name", "variants__id", "variants__sku", expected_charge_taxes],
-        ",",
-        mock_file,
-        file_type,
+        mock_writer,
     )
     send_email_mock.assert_called_once_with(user_export_file, "products")
-    save_file_mock.assert_called_once_with(user_export_file, mock_file, ANY)
+    mock_writer.close.assert_called_once_with()
+    save_file_mock.assert_called_once_with(user_export_file, mock_writer.file, ANY)
 
 
 @patch("saleor.csv.utils.export.create_file_with_headers")
@@ -116,8 +114,8 @@ def test_export_products_ids(
     assert user_export_file.status == JobStatus.PENDING
     assert not user_export_file.content_file
 
-    mock_file = MagicMock(spec=File)
-    create_file_with_headers_mock.return_value = mock_file
+    mock_writer = MagicMock()
+    create_file_with_headers_mock.return_value = mock_writer
 
     # when
     export_products(user_export_file, {"ids": pks}, export_info, file_type)
@@ -135,12 +133,11 @@ def test_export_products_ids(
         export_info,
         {"id"},
         ["id"],
-        ",",
-        mock_file,
-        file_type,
+        mock_writer,
     )
     send_email_mock.assert_called_once_with(user_export_file, "products")
-    save_file_mock.assert_called_once_with(user_export_file, mock_file, ANY)
+    mock_writer.close.assert_called_once_with()
+    save_file_mock.assert_called_once_with(user_export_file, mock_writer.file, ANY)
 
 
 @patch("saleor.csv.utils.export.create_file_with_headers")
@@ -167,8 +164,8 @@ def test_export_products_filter_is_published(
     assert user_export_file.status == JobStatus.PENDING
     assert not user_export_file.content_file
 
-    mock_file = MagicMock(spec=File)
-    create_file_with_headers_mock.return_value = mock_file
+    mock_writer = MagicMock()
+    create_file_with_headers_mock.return_value = mock_writer
 
     # when
     export_products(
@@ -192,12 +189,11 @@ def test_export_products_filter_is_published(
         export_info,
         {"id"},
         ["id"],
-        ",",
-        mock_file,
-        file_type,
+        mock_writer,
     )
     send_email_mock.assert_called_once_with(user_export_file, "products")
-    save_file_mock.assert_called_once_with(user_export_file, mock_file, ANY)
+    mock_writer.close.assert_called_once_with()
+    save_file_mock.assert_called_once_with(user_export_file, mock_writer.file, ANY)
 
 
 @patch("saleor.csv.utils.export.create_file_with_headers")
@@ -223,8 +219,8 @@ def test_export_products_filter_collections(
     assert user_export_file.status == JobStatus.PENDING
     assert not user_export_file.content_file
 
-    mock_file = MagicMock(spec=File)
-    create_file_with_headers_mock.return_value = mock_file
+    mock_writer = MagicMock()
+    create_file_with_headers_mock.return_value = mock_writer
 
     # when
     export_products(
@@ -244,9 +240,10 @@ def test_export_products_filter_collections(
     assert export_products_in_batches_mock.call_count == 1
     batch_args, _ = export_products_in_batches_mock.call_args
     assert set(batch_args[0].values_list("pk", flat=True)) == {product_list[-1].pk}
-    assert batch_args[1:] == (export_info, {"id"}, ["id"], ",", mock_file, file_type)
+    assert batch_args[1:] == (export_info, {"id"}, ["id"], mock_writer)
     send_email_mock.assert_called_once_with(user_export_file, "products")
-    save_file_mock.assert_called_once_with(user_export_file, mock_file, ANY)
+    mock_writer.close.assert_called_once_with()
+    save_file_mock.assert_called_once_with(user_export_file, mock_writer.file, ANY)
 
 
 @patch("saleor.csv.utils.export.create_file_with_headers")
@@ -270,8 +267,8 @@ def test_export_products_by_app(
     }
     file_type = FileTypes.CSV
 
-    mock_file = MagicMock(spec=File)
-    create_file_with_headers_mock.return_value = mock_file
+    mock_writer = MagicMock()
+    create_file_with_headers_mock.return_value = mock_writer
 
     # when
     export_products(app_export_file, {"all": ""}, export_info, file_type)
@@ -290,14 +287,13 @@ def test_export_products_by_app(
         export_info,
         {"id", "name"},
         ["id", "name"],
-        ",",
-        mock_file,
-        file_type,
+        mock_writer,
     )
 
     send_email_mock.assert_called_once_with(app_export_file, "products")
 
-    save_file_mock.assert_called_once_with(app_export_file, mock_file, ANY)
+    mock_writer.close.assert_called_once_with()
+    save_file_mock.assert_called_once_with(app_export_file, mock_writer.file, ANY)
 
 
 @patch("saleor.plugins.manager.PluginsManager.product_export_completed")
@@ -334,8 +330,8 @@ def test_export_gift_cards(
     # given
     file_type = FileTypes.CSV
 
-    mock_file = MagicMock(spec=File)
-    create_file_with_headers_mock.return_value = mock_file
+    mock_writer = MagicMock()
+    create_file_with_headers_mock.return_value = mock_writer
 
     # when
     export_gift_cards(user_export_file, {"all": ""}, file_type)
@@ -350,14 +346,13 @@ def test_export_gift_cards(
     )
     assert args[1:] == (
         ["code"],
-        ",",
-        mock_file,
-        file_type,
+        mock_writer,
     )
 
     send_email_mock.assert_called_once_with(user_export_file, "gift cards")
 
-    save_file_mock.assert_called_once_with(user_export_file, mock_file, ANY)
+    mock_writer.close.assert_called_once_with()
+    save_file_mock.assert_called_once_with(user_export_file, mock_writer.file, ANY)
 
 
 @patch("saleor.csv.utils.export.create_file_with_headers")
@@ -376,8 +371,8 @@ def test_export_gift_cards_by_app(
 ):
     file_type = FileTypes.CSV
 
-    mock_file = MagicMock(spec=File)
-    create_file_with_headers_mock.return_value = mock_file
+    mock_writer = MagicMock()
+    create_file_with_headers_mock.return_value = mock_writer
 
     # when
     export_gift_cards(app_export_file, {"all": ""}, file_type)
@@ -392,14 +387,13 @@ def test_export_gift_cards_by_app(
     )
     assert args[1:] == (
         ["code"],
-        ",",
-        mock_file,
-        file_type,
+        mock_writer,
     )
 
     send_email_mock.assert_called_once_with(app_export_file, "gift cards")
 
-    save_file_mock.assert_called_once_with(app_export_file, mock_file, ANY)
+    mock_writer.close.assert_called_once_with()
+    save_file_mock.assert_called_once_with(app_export_file, mock_writer.file, ANY)
 
 
 @patch("saleor.csv.utils.export.create_file_with_headers")
@@ -418,8 +412,8 @@ def test_export_gift_cards_ids(
 ):
     file_type = FileTypes.CSV
 
-    mock_file = MagicMock(spec=File)
-    create_file_with_headers_mock.return_value = mock_file
+    mock_writer = MagicMock()
+    create_file_with_headers_mock.return_value = mock_writer
     pks = [gift_card.pk]
 
     # when
@@ -433,14 +427,13 @@ def test_export_gift_cards_ids(
     assert set(args[0].values_list("pk", flat=True)) == set(pks)
     assert args[1:] == (
         ["code"],
-        ",",
-        mock_file,
-        file_type,
+        mock_writer,
     )
 
     send_email_mock.assert_called_once_with(user_export_file, "gift cards")
 
-    save_file_mock.assert_called_once_with(user_export_file, mock_file, ANY)
+    mock_writer.close.assert_called_once_with()
+    save_file_mock.assert_called_once_with(user_export_file, mock_writer.file, ANY)
 
 
 @patch("saleor.csv.utils.export.create_file_with_headers")
@@ -460,8 +453,8 @@ def test_export_gift_cards_with_filter(
 ):
     file_type = FileTypes.CSV
 
-    mock_file = MagicMock(spec=File)
-    create_file_with_headers_mock.return_value = mock_file
+    mock_writer = MagicMock()
+    create_file_with_headers_mock.return_value = mock_writer
 
     gift_card_expiry_date.product = shippable_gift_card_product
     gift_card_used.product = shippable_gift_card_product
@@ -490,14 +483,13 @@ def test_export_gift_cards_with_filter(
     assert set(args[0].values_list("pk", flat=True)) == {gift_card_expiry_date.pk}
     assert args[1:] == (
         ["code"],
-        ",",
-        mock_file,
-        file_type,
+        mock_writer,
     )
 
     send_email_mock.assert_called_once_with(user_export_file, "gift cards")
 
-    save_file_mock.assert_called_once_with(user_export_file, mock_file, ANY)
+    mock_writer.close.assert_called_once_with()
+    save_file_mock.assert_called_once_with(user_export_file, mock_writer.file, ANY)
 
 
 @patch("saleor.plugins.manager.PluginsManager.gift_card_export_completed")
@@ -548,6 +540,17 @@ def test_get_product_queryset_ids(product_list):
     assert queryset.count() == len(pks)
 
 
+def test_get_products_export_shards(product_list):
+    # given
+    pks = sorted(product.pk for product in product_list)
+
+    # when
+    shards = get_products_export_shards({"all": ""}, 2)
+
+    # then
+    assert shards == [(pks[0], pks[1]), (pks[2], pks[2])]
+
+
 def get_product_queryset_filter(product_list):
     product_not_published = product_list.first()
     product_not_published.is_published = False
@@ -565,12 +568,11 @@ def test_create_file_with_headers_csv(user_export_file, tmpdir, media_root):
     assert not user_export_file.content_file
 
     # when
-    csv_file = create_file_with_headers(file_headers, ",", FileTypes.CSV)
+    writer = create_file_with_headers(file_headers, ",", FileTypes.CSV)
+    writer.close()
 
     # then
-    assert csv_file
-
-    file_content = csv_file.read().decode().split("\r\n")
+    file_content = writer.file.read().decode().split("\r\n")
 
     assert ",".join(file_headers) in file_content
 
@@ -584,12 +586,11 @@ def test_create_file_with_headers_xlsx(user_export_file, tmpdir, media_root):
     assert not user_export_file.content_file
 
     # when
-    xlsx_file = create_file_with_headers(file_headers, ",", FileTypes.XLSX)
+    writer = create_file_with_headers(file_headers, ",", FileTypes.XLSX)
+    writer.close()
 
     # then
-    assert xlsx_file
-
-    wb_obj = openpyxl.load_workbook(xlsx_file)
+    wb_obj = openpyxl.load_workbook(writer.file)
 
     sheet_obj = wb_obj.active
     max_col = sheet_obj.max_column
@@ -624,23 +625,22 @@ def test_append_to_file_for_csv(user_export_file, tmpdir, media_root):
     headers = ["id", "name", "collections"]
     delimiter = ","
 
-    table = etl.fromdicts([{"id": "1", "name": "A"}], header=headers, missing="")
-
-    temp_file = NamedTemporaryFile()
-    etl.tocsv(table, temp_file.name, delimiter=delimiter)
+    writer = create_file_with_headers(headers, delimiter, FileTypes.CSV)
+    writer.write_dicts([{"id": "1", "name": "A"}], headers)
 
     # when
-    append_to_file(export_data, headers, temp_file, FileTypes.CSV, delimiter)
+    append_to_file(export_data, headers, writer)
+    writer.close()
 
     # then
     user_export_file.refresh_from_db()
 
-    file_content = temp_file.read().decode().split("\r\n")
+    file_content = writer.file.read().decode().split("\r\n")
     assert ",".join(headers) in file_content
     assert ",".join(export_data[0].values()) in file_content
     assert (",".join(export_data[1].values()) + ",") in file_content
 
-    temp_file.close()
+    writer.file.close()
     shutil.rmtree(tmpdir)
 
 
@@ -652,20 +652,17 @@ def test_append_to_file_for_xlsx(user_export_file, tmpdir, media_root):
     ]
     expected_headers = ["id", "name", "collections"]
 
-    table = etl.fromdicts(
-        [{"id": "1", "name": "A"}], header=expected_headers, missing=""
-    )
-
-    temp_file = NamedTemporaryFile(suffix=".xlsx")
-    etl.io.xlsx.toxlsx(table, temp_file.name)
+    writer = create_file_with_headers(expected_headers, ",", FileTypes.XLSX)
+    writer.write_dicts([{"id": "1", "name": "A"}], expected_headers)
 
     # when
-    append_to_file(export_data, expected_headers, temp_file, FileTypes.XLSX, ",")
+    append_to_file(export_data, expected_headers, writer)
+    writer.close()
 
     # then
     user_export_file.refresh_from_db()
 
-    workbook = openpyxl.load_workbook(temp_file)
+    workbook = openpyxl.load_workbook(writer.file)
 
     sheet = workbook.worksheets[0]
     assert sheet.cell(1, 1).value == expected_headers[0]
@@ -678,7 +675,7 @@ def test_append_to_file_for_xlsx(user_export_file, tmpdir, media_root):
     assert sheet.cell(4, 2).value == export_data[1]["name"]
     assert sheet.cell(4, 3).value is None
 
-    temp_file.close()
+    writer.file.close()
     shutil.rmtree(tmpdir)
 
 
@@ -704,10 +701,7 @@ def test_export_products_in_batches_for_csv(
     export_fields = ["id", "name", "variants__sku"]
     expected_headers = ["id", "name", "variant sku"]
 
-    table = etl.wrap([expected_headers])
-
-    temp_file = NamedTemporaryFile()
-    etl.tocsv(table, temp_file.name, delimiter=",")
+    writer = create_file_with_headers(expected_headers, ",", FileTypes.CSV)
 
     # when
     export_products_in_batches(
@@ -715,10 +709,9 @@ def test_export_products_in_batches_for_csv(
         export_info,
         set(export_fields),
         export_fields,
-        ",",
-        temp_file,
-        FileTypes.CSV,
+        writer,
     )
+    writer.close()
 
     # then
 
@@ -733,7 +726,7 @@ def test_export_products_in_batches_for_csv(
             product_data.append(str(variant.sku))
             expected_data.append(product_data)
 
-    file_content = temp_file.read().decode().split("\r\n")
+    file_content = writer.file.read().decode().split("\r\n")
 
     # ensure headers are in file
     assert ",".join(expected_headers) in file_content
@@ -774,10 +767,7 @@ def test_export_products_in_batches_for_xlsx(
     export_fields = ["id", "name", "description_as_str", "variants__sku"]
     expected_headers = ["id", "name", "description", "variant sku"]
 
-    table = etl.wrap([expected_headers])
-
-    temp_file = NamedTemporaryFile(suffix=".xlsx")
-    etl.io.xlsx.toxlsx(table, temp_file.name)
+    writer = create_file_with_headers(expected_headers, ",", FileTypes.XLSX)
 
     # when
     export_products_in_batches(
@@ -785,10 +775,9 @@ def test_export_products_in_batches_for_xlsx(
         export_info,
         set(export_fields),
         export_fields,
-        ",",
-        temp_file,
-        FileTypes.XLSX,
+        writer,
     )
+    writer.close()
 
     # then
     expected_data = []
@@ -803,7 +792,7 @@ def test_export_products_in_batches_for_xlsx(
             product_data.append(variant.sku)
             expected_data.append(product_data)
 
-    wb_obj = openpyxl.load_workbook(temp_file)
+    wb_obj = openpyxl.load_workbook(writer.file)
 
     sheet_obj = wb_obj.active
     max_col = sheet_obj.max_column
@@ -833,21 +822,18 @@ def test_export_gift_cards_in_batches_to_csv(
     # given
     gift_cards = GiftCard.objects.exclude(id=gift_card_used.id).order_by("pk")
 
-    table = etl.wrap([["code"]])
-    temp_file = NamedTemporaryFile()
-    etl.tocsv(table, temp_file.name, delimiter=",")
+    writer = create_file_with_headers(["code"], ",", FileTypes.CSV)
 
     # when
     export_gift_cards_in_batches(
         gift_cards,
         ["code"],
-        ",",
-        temp_file,
-        "csv",
+        writer,
     )
+    writer.close()
 
     # then
-    file_content = temp_file.read().decode().split("\r\n")
+    file_content = writer.file.read().decode().split("\r\n")
 
     # ensure headers are in the file
     assert "code" in file_content
@@ -868,21 +854,18 @@ def test_export_gift_cards_in_batches_to_xlsx(
     # given
     gift_cards = GiftCard.objects.exclude(id=gift_card_used.id).order_by("pk")
 
-    table = etl.wrap([["code"]])
-    temp_file = NamedTemporaryFile(suffix=".xlsx")
-    etl.io.xlsx.toxlsx(table, temp_file.name)
+    writer = create_file_with_headers(["code"], ",", FileTypes.XLSX)
 
     # when
     export_gift_cards_in_batches(
         gift_cards,
         ["code"],
-        ",",
-        temp_file,
-        "xlsx",
+        writer,
     )
+    writer.close()
 
     # then
-    wb_obj = openpyxl.load_workbook(temp_file)
+    wb_obj = openpyxl.load_workbook(writer.file)
 
     sheet_obj = wb_obj.active
     max_col = sheet_obj.max_column
@@ -954,8 +937,8 @@ def test_export_voucher_codes_by_voucher_id(
     voucher_with_many_codes,
     voucher_percentage,
 ):
-    mock_file = MagicMock(spec=File)
-    create_file_with_headers_mock.return_value = mock_file
+    mock_writer = MagicMock()
+    create_file_with_headers_mock.return_value = mock_writer
     file_type = FileTypes.CSV
     voucher = voucher_with_many_codes
 
@@ -972,14 +955,13 @@ def test_export_voucher_codes_by_voucher_id(
     )
     assert args[1:] == (
         ["code"],
-        ",",
-        mock_file,
-        file_type,
+        mock_writer,
     )
 
     send_email_mock.assert_called_once_with(user_export_file, "voucher codes")
 
-    save_file_mock.assert_called_once_with(user_export_file, mock_file, ANY)
+    mock_writer.close.assert_called_once_with()
+    save_file_mock.assert_called_once_with(user_export_file, mock_writer.file, ANY)
 
 
 @patch("saleor.csv.utils.export.create_file_with_headers")
@@ -995,8 +977,8 @@ def test_export_voucher_codes_by_ids(
     voucher_with_many_codes,
     voucher_percentage,
 ):
-    mock_file = MagicMock(spec=File)
-    create_file_with_headers_mock.return_value = mock_file
+    mock_writer = MagicMock()
+    create_file_with_headers_mock.return_value = mock_writer
     file_type = FileTypes.CSV
     voucher = voucher_with_many_codes
     code_ids = [code.id for code in voucher.codes.all()]
@@ -1014,14 +996,13 @@ def test_export_voucher_codes_by_ids(
     )
     assert args[1:] == (
         ["code"],
-        ",",
-        mock_file,
-        file_type,
+        mock_writer,
     )
 
     send_email_mock.assert_called_once_with(user_export_file, "voucher codes")
 
-    save_file_mock.assert_called_once_with(user_export_file, mock_file, ANY)
+    mock_writer.close.assert_called_once_with()
+    save_file_mock.assert_called_once_with(user_export_file, mock_writer.file, ANY)
 
 
 @patch("saleor.csv.utils.export.create_file_with_headers")
@@ -1036,8 +1017,8 @@ def test_export_voucher_codes_by_app(
     app_export_file,
     voucher_with_many_codes,
 ):
-    mock_file = MagicMock(spec=File)
-    create_file_with_headers_mock.return_value = mock_file
+    mock_writer = MagicMock()
+    create_file_with_headers_mock.return_value = mock_writer
     file_type = FileTypes.CSV
     voucher = voucher_with_many_codes
 
@@ -1054,14 +1035,13 @@ def test_export_voucher_codes_by_app(
     )
     assert args[1:] == (
         ["code"],
-        ",",
-        mock_file,
-        file_type,
+        mock_writer,
     )
 
     send_email_mock.assert_called_once_with(app_export_file, "voucher codes")
 
-    save_file_mock.assert_called_once_with(app_export_file, mock_file, ANY)
+    mock_writer.close.assert_called_once_with()
+    save_file_mock.assert_called_once_with(app_export_file, mock_writer.file, ANY)
 
 
 @patch("saleor.plugins.manager.PluginsManager.voucher_code_export_completed")
@@ -1089,21 +1069,18 @@ def test_export_voucher_codes_in_batches_to_csv(
     # given
     voucher_codes = voucher_with_many_codes.codes.all()
 
-    table = etl.wrap([["code"]])
-    temp_file = NamedTemporaryFile()
-    etl.tocsv(table, temp_file.name, delimiter=",")
+    writer = create_file_with_headers(["code"], ",", FileTypes.CSV)
 
     # when
     export_voucher_codes_in_batches(
         voucher_codes,
         ["code"],
-        ",",
-        temp_file,
-        "csv",
+        writer,
     )
+    writer.close()
 
     # then
-    file_content = temp_file.read().decode().split("\r\n")
+    file_content = writer.file.read().decode().split("\r\n")
 
     # ensure headers are in the file
     assert "code" in file_content
@@ -1122,21 +1099,18 @@ def test_export_voucher_codes_in_batches_to_xlsx(
     # given
     voucher_codes = voucher_with_many_codes.codes.all()
 
-    table = etl.wrap([["code"]])
-    temp_file = NamedTemporaryFile(suffix=".xlsx")
-    etl.io.xlsx.toxlsx(table, temp_file.name)
+    writer = create_file_with_headers(["code"], ",", FileTypes.XLSX)
 
     # when
     export_voucher_codes_in_batches(
         voucher_codes,
         ["code"],
-        ",",
-        temp_file,
-        "xlsx",
+        writer,
     )
+    writer.close()
 
     # then
-    wb_obj = openpyxl.load_workbook(temp_file)
+    wb_obj = openpyxl.load_workbook(writer.file)
 
     sheet_obj = wb_obj.active
     max_col = sheet_obj.max_column
@@ -1,19 +1,25 @@
 import datetime
 from unittest.mock import ANY, MagicMock, Mock, patch
 
+import graphene
 from django.core.files import File
+from django.core.files.base import ContentFile
+from django.core.files.storage import default_storage
 from django.test import override_settings
 from django.utils import timezone
 from freezegun import freeze_time
 
 from ...core import JobStatus
+from ...graphql.csv.enums import ProductFieldEnum
 from .. import ExportEvents, FileTypes
 from ..models import ExportEvent, ExportFile
 from ..tasks import (
     ExportTask,
     delete_old_export_files,
+    delete_products_export_shards_task,
     export_gift_cards_task,
     export_products_task,
+    merge_products_export_shards_task,
 )
 
 
@@ -57,6 +63,91 @@ def test_export_products_task_failed(
     send_export_failed_info_mock.assert_called_once_with(user_export_file, "products")
 
 
+@patch("saleor.csv.utils.export.send_export_download_link_notification")
+def test_export_products_task_in_shards(
+    send_notification_mock, product_list, user_export_file, media_root, settings
+):
+    # given
+    settings.EXPORT_PRODUCTS_SHARD_SIZE = 1
+    export_info = {
+        "fields": [ProductFieldEnum.NAME.value],
+        "warehouses": [],
+        "attributes": [],
+        "channels": [],
+    }
+
+    # when
+    export_products_task.delay(
+        user_export_file.id, {"all": ""}, export_info, FileTypes.CSV, ";"
+    )
+
+    # then
+    user_export_file.refresh_from_db()
+    assert user_export_file.status == JobStatus.SUCCESS
+    file_content = user_export_file.content_file.read().decode().split("\r\n")
+    assert file_content[0] == "id;name"
+    assert file_content[1:-1] == [
+        f"{graphene.Node.to_global_id('Product', product.pk)};{product.name}"
+        for product in sorted(product_list, key=lambda product: product.pk)
+    ]
+
+    shard_events = ExportEvent.objects.filter(
+        export_file=user_export_file, type=ExportEvents.EXPORT_SHARD_FINISHED
+    )
+    assert sorted(event.parameters["shard"] for event in shard_events) == list(
+        range(1, len(product_list) + 1)
+    )
+    for event in shard_events:
+        assert not default_storage.exists(event.parameters["file_name"])
+    assert (
+        ExportEvent.objects.filter(
+            export_file=user_export_file, type=ExportEvents.EXPORT_SUCCESS
+        ).count()
+        == 1
+    )
+    send_notification_mock.assert_called_once_with(user_export_file, "products")
+
+
+@patch("saleor.csv.tasks.chord")
+def test_export_products_task_in_shards_deletes_shards_on_error(
+    chord_mock, product_list, user_export_file, settings
+):
+    # given
+    settings.EXPORT_PRODUCTS_SHARD_SIZE = 1
+
+    # when
+    export_products_task(
+        user_export_file.id, {"all": ""}, {"fields": "name"}, FileTypes.CSV, ";"
+    )
+
+    # then
+    header = chord_mock.call_args.args[0]
+    assert len(header) == len(product_list)
+    body = chord_mock.return_value.call_args.args[0]
+    assert body.task == merge_products_export_shards_task.name
+    assert body.options["link_error"] == [
+        delete_products_export_shards_task.si(user_export_file.id)
+    ]
+
+
+def test_delete_products_export_shards_task(user_export_file, media_root):
+    # given
+    file_name = default_storage.save(
+        "export_files/shards/shard.csv", ContentFile(b"data")
+    )
+    ExportEvent.objects.create(
+        export_file=user_export_file,
+        type=ExportEvents.EXPORT_SHARD_FINISHED,
+        parameters={"shard": 1, "shards_count": 2, "file_name": file_name},
+    )
+
+    # when
+    delete_products_export_shards_task(user_export_file.pk)
+
+    # then
+    assert not default_storage.exists(file_name)
+
+
 @patch("saleor.csv.tasks.export_gift_cards")
 def test_export_gift_cards_task(export_gift_cards_mock, user_export_file):
     # given
@@ -173,6 +264,25 @@ def test_on_task_failure_for_app(send_export_failed_info_mock, app_export_file):
     send_export_failed_info_mock.assert_called_once_with(app_export_file, ANY)
 
 
+@patch("saleor.csv.tasks.send_export_failed_info")
+def test_on_task_failure_export_already_failed(
+    send_export_failed_info_mock, user_export_file
+):
+    # given
+    user_export_file.status = JobStatus.FAILED
+    user_export_file.save(update_fields=["status"])
+    args = [user_export_file.pk, {"all": ""}]
+
+    # when
+    ExportTask().on_failure(Exception("Test"), "task_id", args, {}, Mock())
+
+    # then
+    assert not ExportEvent.objects.filter(
+        export_file=user_export_file, type=ExportEvents.EXPORT_FAILED
+    ).exists()
+    send_export_failed_info_mock.assert_not_called()
+
+
 def test_on_task_success(user_export_file):
     # given
     task_id = "task_id"
@@ -303,3 +413,18 @@ def test_delete_old_export_files(default_storage_delete_mock, staff_user):
             id__in=[export_file.id for export_file in not_expired_export_files]
         )
     ) == len(not_expired_export_files)
+
+
+def test_on_task_success_export_in_progress(user_export_file):
+    # given
+    args = [user_export_file.pk, {"all": ""}]
+
+    # when
+    ExportTask().on_success(ExportTask.IN_PROGRESS, "task_id", args, {})
+
+    # then
+    user_export_file.refresh_from_db()
+    assert user_export_file.status == JobStatus.PENDING
+    assert not ExportEvent.objects.filter(
+        export_file=user_export_file, type=ExportEvents.EXPORT_SUCCESS
+    ).exists()
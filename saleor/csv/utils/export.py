@@ -1,10 +1,11 @@
 import datetime
 import uuid
-from tempfile import NamedTemporaryFile
+from collections.abc import Iterable
 from typing import IO, TYPE_CHECKING, Any
 
-import petl as etl
 from django.conf import settings
+from django.core.files import File
+from django.core.files.storage import default_storage
 from django.utils import timezone
 
 from ...core.db.connection import allow_writer
@@ -12,10 +13,12 @@ from ...core.utils.batches import queryset_in_batches
 from ...discount.models import VoucherCode
 from ...giftcard.models import GiftCard
 from ...product.models import Product
-from .. import FileTypes
+from .. import ExportEvents, events
+from ..models import ExportEvent
 from ..notifications import send_export_download_link_notification
 from .product_headers import get_product_export_fields_and_headers_info
-from .products_data import get_products_data
+from .products_data import iter_products_data
+from .writers import ExportWriter, get_export_writer
 
 if TYPE_CHECKING:
     from django.db.models import QuerySet
@@ -24,6 +27,7 @@ if TYPE_CHECKING:
 
 
 BATCH_SIZE = 1000
+SHARDS_DIR = "export_files/shards"
 
 
 def export_products(
@@ -44,20 +48,130 @@ def export_products(
         data_headers,
     ) = get_product_export_fields_and_headers_info(export_info)
 
-    temporary_file = create_file_with_headers(file_headers, delimiter, file_type)
+    writer = create_file_with_headers(file_headers, delimiter, file_type)
 
     export_products_in_batches(
         queryset,
         export_info,
         set(export_fields),
         data_headers,
-        delimiter,
-        temporary_file,
-        file_type,
+        writer,
     )
 
-    save_csv_file_in_export_file(export_file, temporary_file, file_name)
-    temporary_file.close()
+    writer.close()
+    save_csv_file_in_export_file(export_file, writer.file, file_name)
+    writer.file.close()
+    send_export_download_link_notification(export_file, "products")
+
+
+def get_products_export_shards(
+    scope: dict[str, str | dict], shard_size: int
+) -> list[tuple[int, int]]:
+    """Split the exported products into ranges of primary keys.
+
+    Each range, given as a tuple of the first and the last primary key, covers
+    `shard_size` of the exported products.
+    """
+    from ...graphql.product.filters.product import ProductFilter
+
+    queryset = get_queryset(Product, ProductFilter, scope)
+    return [(pks[0], pks[-1]) for pks in queryset_in_batches(queryset, shard_size)]
+
+
+def get_products_export_shard_file_names(
+    shards_count: int, file_type: str
+) -> list[str]:
+    return [
+        f"{SHARDS_DIR}/{get_filename(f'product_shard_{index}', file_type)}"
+        for index in range(shards_count)
+    ]
+
+
+def export_products_shard(
+    export_file: "ExportFile",
+    scope: dict[str, str | dict],
+    export_info: dict[str, list],
+    file_type: str,
+    delimiter: str,
+    start_pk: int,
+    end_pk: int,
+    shard_file_name: str,
+    shard: int,
+    shards_count: int,
+):
+    """Export the products of a primary key range to a shard file, without headers."""
+    from ...graphql.product.filters.product import ProductFilter
+
+    queryset = get_queryset(Product, ProductFilter, scope).filter(
+        pk__gte=start_pk, pk__lte=end_pk
+    )
+    export_fields, _, data_headers = get_product_export_fields_and_headers_info(
+        export_info
+    )
+
+    writer = get_export_writer(file_type, delimiter)
+    export_products_in_batches(
+        queryset,
+        export_info,
+        set(export_fields),
+        data_headers,
+        writer,
+    )
+    writer.close()
+
+    # The storage can save the file under a different name than the requested one.
+    stored_file_name = default_storage.save(shard_file_name, File(writer.file))
+    writer.file.close()
+    events.export_shard_finished_event(
+        export_file=export_file,
+        user=export_file.user,
+        app=export_file.app,
+        shard=shard,
+        shards_count=shards_count,
+        file_name=stored_file_name,
+    )
+
+
+def get_products_export_shard_stored_file_names(export_file: "ExportFile") -> list[str]:
+    """Return the names of the stored shard files of the export, in the shards order."""
+    # The events are read from the writer, as they are created by other tasks just
+    # before and might not be replicated yet.
+    with allow_writer():
+        shards_parameters = list(
+            ExportEvent.objects.using(settings.DATABASE_CONNECTION_DEFAULT_NAME)
+            .filter(export_file=export_file, type=ExportEvents.EXPORT_SHARD_FINISHED)
+            .values_list("parameters", flat=True)
+        )
+    shards_parameters.sort(key=lambda parameters: parameters["shard"])
+    return [parameters["file_name"] for parameters in shards_parameters]
+
+
+def delete_products_export_shards(export_file: "ExportFile"):
+    for shard_file_name in get_products_export_shard_stored_file_names(export_file):
+        default_storage.delete(shard_file_name)
+
+
+def merge_products_export_shards(
+    export_file: "ExportFile",
+    export_info: dict[str, list],
+    file_type: str,
+    delimiter: str,
+):
+    """Merge the shard files, in the order of the shards, into the export file."""
+    file_name = get_filename("product", file_type)
+    _, file_headers, _ = get_product_export_fields_and_headers_info(export_info)
+
+    writer = create_file_with_headers(file_headers, delimiter, file_type)
+    try:
+        for shard_file_name in get_products_export_shard_stored_file_names(export_file):
+            with default_storage.open(shard_file_name, "rb") as shard_file:
+                writer.append_file(shard_file)
+    finally:
+        delete_products_export_shards(export_file)
+    writer.close()
+
+    save_csv_file_in_export_file(export_file, writer.file, file_name)
+    writer.file.close()
     send_export_download_link_notification(export_file, "products")
 
 
@@ -76,18 +190,17 @@ def export_gift_cards(
     queryset = queryset.filter(used_by_email__isnull=True)
 
     export_fields = ["code"]
-    temporary_file = create_file_with_headers(export_fields, delimiter, file_type)
+    writer = create_file_with_headers(export_fields, delimiter, file_type)
 
     export_gift_cards_in_batches(
         queryset,
         export_fields,
-        delimiter,
-        temporary_file,
-        file_type,
+        writer,
     )
 
-    save_csv_file_in_export_file(export_file, temporary_file, file_name)
-    temporary_file.close()
+    writer.close()
+    save_csv_file_in_export_file(export_file, writer.file, file_name)
+    writer.file.close()
     send_export_download_link_notification(export_file, "gift cards")
 
 
@@ -111,18 +224,17 @@ def export_voucher_codes(
         ).filter(id__in=ids)
 
     export_fields = ["code"]
-    temporary_file = create_file_with_headers(export_fields, delimiter, file_type)
+    writer = create_file_with_headers(export_fields, delimiter, file_type)
 
     export_voucher_codes_in_batches(
         qs,
         export_fields,
-        delimiter,
-        temporary_file,
-        file_type,
+        writer,
     )
 
-    save_csv_file_in_export_file(export_file, temporary_file, file_name)
-    temporary_file.close()
+    writer.close()
+    save_csv_file_in_export_file(export_file, writer.file, file_name)
+    writer.file.close()
     send_export_download_link_notification(export_file, "voucher codes")
 
 
@@ -176,17 +288,16 @@ def parse_input(data: Any) -> dict[str, str | dict]:
     return data
 
 
-def create_file_with_headers(file_headers: list[str], delimiter: str, file_type: str):
-    table = etl.wrap([file_headers])
+def create_file_with_headers(
+    file_headers: list[str], delimiter: str, file_type: str
+) -> ExportWriter:
+    """Create a temporary file with the headers and return the writer of its rows.
 
-    if file_type == FileTypes.CSV:
-        temp_file = NamedTemporaryFile("ab+", suffix=".csv")
-        etl.tocsv(table, temp_file.name, delimiter=delimiter)
-    else:
-        temp_file = NamedTemporaryFile("ab+", suffix=".xlsx")
-        etl.io.xlsx.toxlsx(table, temp_file.name)
-
-    return temp_file
+    The writer has to be closed before its file is read.
+    """
+    writer = get_export_writer(file_type, delimiter)
+    writer.write_rows([file_headers])
+    return writer
 
 
 def export_products_in_batches(
@@ -194,9 +305,7 @@ def export_products_in_batches(
     export_info: dict[str, list],
     export_fields: set[str],
     headers: list[str],
-    delimiter: str,
-    temporary_file: Any,
-    file_type: str,
+    writer: ExportWriter,
 ):
     warehouses = export_info.get("warehouses")
     attributes = export_info.get("attributes")
@@ -215,60 +324,49 @@ def export_products_in_batches(
                 "category",
             )
         )
-        export_data = get_products_data(
+        export_data = iter_products_data(
             product_batch, export_fields, attributes, warehouses, channels
         )
 
-        append_to_file(export_data, headers, temporary_file, file_type, delimiter)
+        append_to_file(export_data, headers, writer)
 
 
 def export_gift_cards_in_batches(
     queryset: "QuerySet",
     export_fields: list[str],
-    delimiter: str,
-    temporary_file: Any,
-    file_type: str,
+    writer: ExportWriter,
 ):
     for batch_pks in queryset_in_batches(queryset, BATCH_SIZE):
         gift_card_batch = GiftCard.objects.using(
             settings.DATABASE_CONNECTION_REPLICA_NAME
         ).filter(pk__in=batch_pks)
 
-        export_data = list(gift_card_batch.values(*export_fields))
+        export_data = gift_card_batch.values(*export_fields)
 
-        append_to_file(export_data, export_fields, temporary_file, file_type, delimiter)
+        append_to_file(export_data, export_fields, writer)
 
 
 def export_voucher_codes_in_batches(
     queryset: "QuerySet",
     export_fields: list[str],
-    delimiter: str,
-    temporary_file: Any,
-    file_type: str,
+    writer: ExportWriter,
 ):
     for batch_pks in queryset_in_batches(queryset, BATCH_SIZE):
         voucher_codes_batch = VoucherCode.objects.using(
             settings.DATABASE_CONNECTION_REPLICA_NAME
         ).filter(pk__in=batch_pks)
 
-        export_data = list(voucher_codes_batch.values(*export_fields))
+        export_data = voucher_codes_batch.values(*export_fields)
 
-        append_to_file(export_data, export_fields, temporary_file, file_type, delimiter)
+        append_to_file(export_data, export_fields, writer)
 
 
 def append_to_file(
-    export_data: list[dict[str, str | bool]],
+    export_data: Iterable[dict[str, str | bool]],
     headers: list[str],
-    temporary_file: Any,
-    file_type: str,
-    delimiter: str,
+    writer: ExportWriter,
 ):
-    table = etl.fromdicts(export_data, header=headers, missing="")
-
-    if file_type == FileTypes.CSV:
-        etl.io.csv.appendcsv(table, temporary_file.name, delimiter=delimiter)
-    else:
-        etl.io.xlsx.appendxlsx(table, temporary_file.name)
+    writer.write_dicts(export_data, headers)
 
 
 @allow_writer()
@@ -1,4 +1,5 @@
 from collections import defaultdict
+from collections.abc import Iterator
 from dataclasses import dataclass
 from typing import TYPE_CHECKING
 from urllib.parse import urljoin
@@ -36,8 +37,25 @@ def get_products_data(
     It returns list with product and variant data which can be used as import to
     csv writer and list of attribute and warehouse headers.
     """
+    return list(
+        iter_products_data(
+            queryset, export_fields, attribute_ids, warehouse_ids, channel_ids
+        )
+    )
+
+
+def iter_products_data(
+    queryset: "QuerySet",
+    export_fields: set[str],
+    attribute_ids: list[str] | None,
+    warehouse_ids: list[str] | None,
+    channel_ids: list[str] | None,
+) -> Iterator[dict[str, str | bool]]:
+    """Yield data of products and their variants with fields values.
 
-    products_with_variants_data = []
+    The rows are yielded one by one, so they can be written to the export file
+    without keeping the data of the whole batch in memory.
+    """
     export_variant_id = "variants__id" in export_fields
 
     # skip generation of the field without a lookup
@@ -98,11 +116,7 @@ def get_products_data(
                 "ProductVariant", variant_pk
             )
 
-        data = {**product_data, **product_relations_data, **variant_relations_data}
-
-        products_with_variants_data.append(data)
-
-    return products_with_variants_data
+        yield {**product_data, **product_relations_data, **variant_relations_data}
 
 
 def get_products_relations_data(
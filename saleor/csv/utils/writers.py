@@ -0,0 +1,109 @@
+import csv
+import io
+from abc import ABC, abstractmethod
+from collections.abc import Iterable
+from tempfile import NamedTemporaryFile
+from typing import IO, Any
+
+import openpyxl
+
+from .. import FileTypes
+
+CSV_BUFFER_SIZE = 1024 * 1024
+
+
+class ExportWriter(ABC):
+    """Stream the exported rows to a temporary file.
+
+    The file is opened once for the whole export and rows are written as they come,
+    so the time of the export grows linearly with the number of rows and the memory
+    usage does not depend on it. The file is complete once the writer is closed.
+    """
+
+    file_type: str
+
+    def __init__(self, delimiter: str = ","):
+        self.delimiter = delimiter
+        self.file: IO[bytes] = NamedTemporaryFile("ab+", suffix=f".{self.file_type}")
+
+    @abstractmethod
+    def write_rows(self, rows: Iterable[Iterable[Any]]):
+        pass
+
+    def write_dicts(self, rows: Iterable[dict[str, Any]], headers: list[str]):
+        """Write rows given as dicts, with empty values for missing headers."""
+        self.write_rows([row.get(header, "") for header in headers] for row in rows)
+
+    @abstractmethod
+    def append_file(self, file: IO[bytes]):
+        """Write the rows of a file created by a writer of the same type."""
+
+    @abstractmethod
+    def close(self):
+        pass
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+
+class CSVExportWriter(ExportWriter):
+    file_type = FileTypes.CSV
+
+    def __init__(self, delimiter: str = ","):
+        super().__init__(delimiter)
+        self.stream = open(
+            self.file.name,
+            "w",
+            buffering=CSV_BUFFER_SIZE,
+            encoding="utf-8",
+            newline="",
+        )
+        self.writer = csv.writer(self.stream, delimiter=delimiter)
+
+    def write_rows(self, rows: Iterable[Iterable[Any]]):
+        self.writer.writerows(rows)
+
+    def append_file(self, file: IO[bytes]):
+        stream = io.TextIOWrapper(file, encoding="utf-8", newline="")
+        try:
+            self.write_rows(csv.reader(stream, delimiter=self.delimiter))
+        finally:
+            # the given file is closed by its owner
+            stream.detach()
+
+    def close(self):
+        self.stream.close()
+
+
+class XLSXExportWriter(ExportWriter):
+    file_type = FileTypes.XLSX
+
+    def __init__(self, delimiter: str = ","):
+        super().__init__(delimiter)
+        # In the write-only mode the rows are written to a temporary file as they are
+        # appended, instead of being kept in memory until the workbook is saved.
+        self.workbook = openpyxl.Workbook(write_only=True)
+        self.worksheet = self.workbook.create_sheet()
+
+    def write_rows(self, rows: Iterable[Iterable[Any]]):
+        for row in rows:
+            self.worksheet.append(row)
+
+    def append_file(self, file: IO[bytes]):
+        workbook = openpyxl.load_workbook(file, read_only=True)
+        try:
+            self.write_rows(workbook.active.iter_rows(values_only=True))
+        finally:
+            workbook.close()
+
+    def close(self):
+        self.workbook.save(self.file.name)
+
+
+def get_export_writer(file_type: str, delimiter: str = ",") -> ExportWriter:
+    if file_type == FileTypes.CSV:
+        return CSVExportWriter(delimiter)
+    return XLSXExportWriter(delimiter)
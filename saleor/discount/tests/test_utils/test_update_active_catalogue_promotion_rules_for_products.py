@@ -0,0 +1,70 @@
+from unittest.mock import patch
+
+from ...utils.promotion import update_active_catalogue_promotion_rules_for_products
+
+
+@patch("saleor.product.tasks.update_variant_relations_for_products_task.delay")
+def test_update_active_catalogue_promotion_rules_for_products_marks_rules_as_dirty(
+    update_variant_relations_for_products_task_mock,
+    catalogue_promotion,
+    product,
+    settings,
+):
+    # given
+    settings.PROMOTION_RULE_VARIANTS_INCREMENTAL_UPDATE = False
+    rules = catalogue_promotion.rules.all()
+    rules.update(variants_dirty=False)
+
+    # when
+    update_active_catalogue_promotion_rules_for_products([product.id])
+
+    # then
+    assert rules.filter(variants_dirty=True).exists()
+    update_variant_relations_for_products_task_mock.assert_not_called()
+
+
+@patch("saleor.product.tasks.update_variant_relations_for_products_task.delay")
+def test_update_active_catalogue_promotion_rules_for_products_incremental(
+    update_variant_relations_for_products_task_mock,
+    catalogue_promotion,
+    product,
+    settings,
+):
+    # given
+    settings.PROMOTION_RULE_VARIANTS_INCREMENTAL_UPDATE = True
+    rules = catalogue_promotion.rules.all()
+    rules.update(variants_dirty=False)
+
+    # when
+    update_active_catalogue_promotion_rules_for_products([product.id])
+
+    # then
+    assert not rules.filter(variants_dirty=True).exists()
+    update_variant_relations_for_products_task_mock.assert_called_once_with(
+        [product.id]
+    )
+
+
+@patch(
+    "saleor.discount.utils.promotion.PROMOTION_RULE_INCREMENTAL_UPDATE_MAX_PRODUCTS", 1
+)
+@patch("saleor.product.tasks.update_variant_relations_for_products_task.delay")
+def test_update_active_catalogue_promotion_rules_for_many_products(
+    update_variant_relations_for_products_task_mock,
+    catalogue_promotion,
+    product_list,
+    settings,
+):
+    # given
+    settings.PROMOTION_RULE_VARIANTS_INCREMENTAL_UPDATE = True
+    rules = catalogue_promotion.rules.all()
+    rules.update(variants_dirty=False)
+
+    # when
+    update_active_catalogue_promotion_rules_for_products(
+        [product.id for product in product_list]
+    )
+
+    # then
+    assert rules.filter(variants_dirty=True).exists()
+    update_variant_relations_for_products_task_mock.assert_not_called()
@@ -187,6 +187,7 @@ def prepare_checkout_line_discount_objects_for_catalogue_promotions(
                 }
                 line_discounts_to_create_inputs.append(line_discount_input)
             else:
+                fields_count = len(updated_fields)
                 update_promotion_discount(
                     rule,
                     rule_info,
@@ -194,7 +195,9 @@ def prepare_checkout_line_discount_objects_for_catalogue_promotions(
                     discount_to_update,
                     updated_fields,
                 )
-                line_discounts_to_update.append(discount_to_update)
+                # save only the discounts that changed
+                if len(updated_fields) > fields_count:
+                    line_discounts_to_update.append(discount_to_update)
         else:
             # Fallback for unlike mismatch between discount_amount and rules_info
             line_discounts_to_remove.extend(discounts_to_update)
@@ -59,6 +59,10 @@ if TYPE_CHECKING:
 CatalogueInfo = defaultdict[str, set[int | str]]
 CATALOGUE_FIELDS = ["categories", "collections", "products", "variants"]
 
+# Changes of more products are handled by re-expanding the dirty rules, which is
+# cheaper than evaluating every rule for each of the products.
+PROMOTION_RULE_INCREMENTAL_UPDATE_MAX_PRODUCTS = 100
+
 
 def prepare_promotion_discount_reason(promotion: Promotion):
     if promotion.old_sale_id:
@@ -625,13 +629,16 @@ def _create_new_rules(rules_to_add, variants_lock, rules_lock):
 
 
 def update_rule_variant_relation(
-    rules: QuerySet[PromotionRule], new_rules_variants: list
+    rules: QuerySet[PromotionRule],
+    new_rules_variants: list,
+    variants: QuerySet[ProductVariant] | None = None,
 ):
     """Update PromotionRule - ProductVariant relation.
 
     Deletes relations, which are not valid anymore.
     Adds new relations, if they don't exist already.
     `new_rules_variants` is a list of PromotionRuleVariant objects.
+    When `variants` are given, only the relations with these variants are updated.
 
     It is important to lock the variants and rules before deleting and adding new
     relations to avoid integrity errors. It is also important to lock the rules and
@@ -641,6 +648,10 @@ def update_rule_variant_relation(
     existing_rules_variants = PromotionRuleVariant.objects.filter(
         Exists(rules.filter(pk=OuterRef("promotionrule_id")))
     ).all()
+    if variants is not None:
+        existing_rules_variants = existing_rules_variants.filter(
+            Exists(variants.filter(pk=OuterRef("productvariant_id")))
+        )
     new_rule_variant_set = {
         (rv.promotionrule_id, rv.productvariant_id) for rv in new_rules_variants
     }
@@ -916,6 +927,30 @@ def mark_active_catalogue_promotion_rules_as_dirty(channel_ids: Iterable[int]):
         )
 
 
+def update_active_catalogue_promotion_rules_for_products(product_ids: Iterable[int]):
+    """Update the active catalogue promotion rules after the products changed.
+
+    With `PROMOTION_RULE_VARIANTS_INCREMENTAL_UPDATE` enabled, only the variants of
+    the products are evaluated against the rule predicates, in the background.
+    Otherwise, the rules in the channels of the products are marked as dirty.
+    """
+    product_ids = list(product_ids)
+    if not product_ids:
+        return
+    if (
+        settings.PROMOTION_RULE_VARIANTS_INCREMENTAL_UPDATE
+        and len(product_ids) <= PROMOTION_RULE_INCREMENTAL_UPDATE_MAX_PRODUCTS
+    ):
+        from ...product.tasks import update_variant_relations_for_products_task
+
+        update_variant_relations_for_products_task.delay(product_ids)
+        return
+    channel_ids = ProductChannelListing.objects.filter(
+        product_id__in=product_ids
+    ).values_list("channel_id", flat=True)
+    mark_active_catalogue_promotion_rules_as_dirty(channel_ids)
+
+
 def mark_catalogue_promotion_rules_as_dirty(promotion_pks: Iterable[UUID]):
     """Mark rules for promotions as dirty.
 
@@ -1,8 +1,10 @@
 from collections import defaultdict
 from copy import deepcopy
+from functools import partial
 
 import graphene
 from django.core.exceptions import ValidationError
+from django.db import transaction
 from django.db.models import Q
 from graphene.utils.str_converters import to_camel_case
 
@@ -10,6 +12,7 @@ from ....account import models
 from ....account.events import CustomerEvents
 from ....account.search import prepare_user_search_document_value
 from ....checkout import AddressType
+from ....core.auth_cache import invalidate_users_auth_cache
 from ....core.tracing import traced_atomic_transaction
 from ....core.utils import metadata_manager
 from ....giftcard.search import mark_gift_cards_search_index_as_dirty_by_users
@@ -554,6 +557,13 @@ class CustomerBulkUpdate(BaseMutation, I18nMixin):
                 "private_metadata",
             ],
         )
+        # The bulk update does not send the signals which invalidate the cached users.
+        transaction.on_commit(
+            partial(
+                invalidate_users_auth_cache,
+                [customer.pk for customer in customers_to_update],
+            )
+        )
 
         for customer in customers_to_update:
             if customer in customer_instance_new_addresses_map:
@@ -1,8 +1,12 @@
+from functools import partial
+
 import graphene
 from django.core.exceptions import ValidationError
+from django.db import transaction
 
 from ....account import models
 from ....account.error_codes import AccountErrorCode
+from ....core.auth_cache import invalidate_users_auth_cache
 from ....permission.enums import AccountPermissions
 from ...core import ResolveInfo
 from ...core.doc_category import DOC_CATEGORY_USERS
@@ -56,4 +60,7 @@ class UserBulkSetActive(BaseBulkMutation):
     def bulk_action(  # type: ignore[override]
         cls, _info: ResolveInfo, queryset, /, *, is_active
     ):
+        user_ids = list(queryset.values_list("pk", flat=True))
         queryset.update(is_active=is_active)
+        # The update does not send the signals which invalidate the cached users.
+        transaction.on_commit(partial(invalidate_users_auth_cache, user_ids))
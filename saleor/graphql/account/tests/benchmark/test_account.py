@@ -2,6 +2,7 @@ from unittest.mock import MagicMock
 
 import graphene
 import pytest
+from django.core.cache import cache
 from django.core.files import File
 
 from .....account.models import Group, User
@@ -402,7 +403,7 @@ def test_users_for_federation_query_count(
     }
 
     staff_api_client.ensure_access_token()
-    with django_assert_num_queries(4):
+    with django_assert_num_queries(5):
         response = staff_api_client.post_graphql(
             query,
             variables,
@@ -481,7 +482,7 @@ def test_addresses_for_federation_query_count(
     }
 
     staff_api_client.ensure_access_token()
-    with django_assert_num_queries(3):
+    with django_assert_num_queries(4):
         response = staff_api_client.post_graphql(
             query,
             variables,
@@ -513,3 +514,53 @@ def test_addresses_for_federation_query_count(
         )
         content = get_graphql_content(response)
         assert len(content["data"]["_entities"]) == 2
+
+
+DASHBOARD_QUERY = """
+    query Dashboard {
+        me {
+            email
+            accessibleChannels {
+                slug
+            }
+            restrictedAccessToChannels
+        }
+        customers(first: 5) {
+            edges {
+                node {
+                    email
+                }
+            }
+        }
+    }
+"""
+
+
+@pytest.mark.django_db
+@pytest.mark.count_queries(autouse=False)
+@pytest.mark.parametrize("jwt_user_cache_timeout", [0, 60])
+def test_authenticated_dashboard_queries(
+    jwt_user_cache_timeout,
+    staff_api_client,
+    permission_group_manage_users,
+    customer_user,
+    channel_USD,
+    settings,
+    count_queries,
+):
+    # given
+    settings.JWT_USER_CACHE_TIMEOUT = jwt_user_cache_timeout
+    cache.clear()
+    permission_group_manage_users.user_set.add(staff_api_client.user)
+
+    # when
+    # With the cache enabled, only the first request fetches the staff user, their
+    # permissions and channels.
+    for _ in range(10):
+        response = staff_api_client.post_graphql(DASHBOARD_QUERY)
+        content = get_graphql_content(response)
+
+    # then
+    assert content["data"]["me"]["email"] == staff_api_client.user.email
+    assert content["data"]["me"]["accessibleChannels"] == [{"slug": channel_USD.slug}]
+    assert content["data"]["customers"]["edges"]
@@ -203,6 +203,17 @@ class SaleorGraphQLBackend(GraphQLCoreBackend):
         # validate eagerly so we can cache the result
         document_ast = parse(document_string)
         validation_errors = validate(schema, document_ast)
+        return self.document_from_ast(
+            schema, document_string, document_ast, validation_errors
+        )
+
+    def document_from_ast(
+        self,
+        schema: GraphQLSchema,
+        document_string: str,
+        document_ast,
+        validation_errors: list,
+    ) -> GraphQLDocument:
         if validation_errors:
             return GraphQLDocument(
                 schema=schema,
@@ -1,3 +1,4 @@
+from ....channel.cache import get_channels_by_id, get_channels_by_slug
 from ....channel.models import Channel
 from ...core.dataloaders import DataLoader
 
@@ -6,7 +7,7 @@ class ChannelByIdLoader(DataLoader[int, Channel]):
     context_key = "channel_by_id"
 
     def batch_load(self, keys):
-        channels = Channel.objects.using(self.database_connection_name).in_bulk(keys)
+        channels = get_channels_by_id(keys, self.database_connection_name)
         return [channels.get(channel_id) for channel_id in keys]
 
 
@@ -14,7 +15,5 @@ class ChannelBySlugLoader(DataLoader[str, Channel]):
     context_key = "channel_by_slug"
 
     def batch_load(self, keys):
-        channels = Channel.objects.using(self.database_connection_name).in_bulk(
-            keys, field_name="slug"
-        )
+        channels = get_channels_by_slug(keys, self.database_connection_name)
         return [channels.get(slug) for slug in keys]
@@ -0,0 +1,179 @@
+from contextlib import ExitStack
+
+import pytest
+from django.conf import settings
+from django.db import connections
+from django.test.utils import CaptureQueriesContext
+
+from .....channel.models import Channel
+from .....checkout.tests.fixtures.benchmark import (
+    CHECKOUT_LINES_IN_BENCHMARKS,
+    LARGE_CHECKOUT_LINES_IN_BENCHMARKS,
+)
+from .....tax.models import TaxConfiguration, TaxConfigurationPerCountry
+from ....core.utils import to_global_id_or_none
+from ....tests.utils import get_graphql_content
+
+CHECKOUT_WITH_LINES_QUERY = """
+query Checkout($id: ID) {
+  checkout(id: $id) {
+    id
+    lines {
+      id
+      quantity
+      variant {
+        id
+        name
+        product {
+          name
+          thumbnail {
+            url
+          }
+        }
+      }
+      unitPrice {
+        gross {
+          amount
+        }
+      }
+      totalPrice {
+        gross {
+          amount
+        }
+        net {
+          amount
+        }
+      }
+    }
+    subtotalPrice {
+      gross {
+        amount
+      }
+    }
+    totalPrice {
+      gross {
+        amount
+      }
+      tax {
+        amount
+      }
+    }
+  }
+}
+"""
+
+
+@pytest.mark.django_db
+@pytest.mark.count_queries(autouse=False)
+def test_checkout_with_many_lines(
+    api_client, checkout_with_lines_for_benchmarks, count_queries
+):
+    # given
+    variables = {"id": to_global_id_or_none(checkout_with_lines_for_benchmarks)}
+
+    # when
+    content = get_graphql_content(
+        api_client.post_graphql(CHECKOUT_WITH_LINES_QUERY, variables)
+    )
+
+    # then
+    checkout_data = content["data"]["checkout"]
+    assert len(checkout_data["lines"]) == CHECKOUT_LINES_IN_BENCHMARKS
+    assert checkout_data["totalPrice"]["gross"]["amount"] > 0
+
+
+@pytest.mark.django_db
+@pytest.mark.count_queries(autouse=False)
+def test_checkout_reads_configuration_from_cache(
+    api_client, checkout_with_lines_for_benchmarks, count_queries
+):
+    # given
+    variables = {"id": to_global_id_or_none(checkout_with_lines_for_benchmarks)}
+    get_graphql_content(api_client.post_graphql(CHECKOUT_WITH_LINES_QUERY, variables))
+
+    # when
+    with ExitStack() as stack:
+        contexts = [
+            stack.enter_context(CaptureQueriesContext(connections[alias]))
+            for alias in (
+                settings.DATABASE_CONNECTION_DEFAULT_NAME,
+                settings.DATABASE_CONNECTION_REPLICA_NAME,
+            )
+        ]
+        response = api_client.post_graphql(CHECKOUT_WITH_LINES_QUERY, variables)
+
+    # then
+    content = get_graphql_content(response)
+    assert len(content["data"]["checkout"]["lines"]) == CHECKOUT_LINES_IN_BENCHMARKS
+    config_tables = {
+        f'SELECT "{model._meta.db_table}"."id"'
+        for model in (Channel, TaxConfiguration, TaxConfigurationPerCountry)
+    }
+    config_queries = [
+        query
+        for ctx in contexts
+        for query in ctx.captured_queries
+        if any(table in query["sql"] for table in config_tables)
+    ]
+    assert config_queries == []
+
+
+CHECKOUT_LINES_UPDATE_MUTATION = """
+mutation CheckoutLinesUpdate($id: ID, $lines: [CheckoutLineUpdateInput!]!) {
+  checkoutLinesUpdate(id: $id, lines: $lines) {
+    checkout {
+      id
+      lines {
+        id
+        quantity
+        totalPrice {
+          gross {
+            amount
+          }
+        }
+      }
+      subtotalPrice {
+        gross {
+          amount
+        }
+      }
+      totalPrice {
+        gross {
+          amount
+        }
+      }
+    }
+    errors {
+      field
+      message
+    }
+  }
+}
+"""
+
+
+@pytest.mark.django_db
+@pytest.mark.count_queries(autouse=False)
+def test_update_single_line_of_large_checkout(
+    api_client, large_checkout_for_benchmarks, count_queries
+):
+    # given
+    checkout = large_checkout_for_benchmarks
+    line = checkout.lines.first()
+    subtotal_before = checkout.subtotal.gross.amount
+    variables = {
+        "id": to_global_id_or_none(checkout),
+        "lines": [{"lineId": to_global_id_or_none(line), "quantity": 2}],
+    }
+
+    # when
+    content = get_graphql_content(
+        api_client.post_graphql(CHECKOUT_LINES_UPDATE_MUTATION, variables)
+    )
+
+    # then
+    data = content["data"]["checkoutLinesUpdate"]
+    assert not data["errors"]
+    checkout_data = data["checkout"]
+    assert len(checkout_data["lines"]) == LARGE_CHECKOUT_LINES_IN_BENCHMARKS
+    assert checkout_data["subtotalPrice"]["gross"]["amount"] > subtotal_before
@@ -15,7 +15,6 @@ from .....checkout.utils import invalidate_checkout
 from .....core.models import EventDelivery
 from .....plugins.manager import get_plugins_manager
 from .....product.models import ProductChannelListing, ProductVariantChannelListing
-from .....shipping import models as shipping_models
 from .....shipping.models import ShippingZone
 from .....warehouse import WarehouseClickAndCollectOption
 from .....warehouse.models import Stock, Warehouse
@@ -584,9 +583,9 @@ def test_checkout_delivery_method_with_empty_fields_results_None(
     assert checkout.collection_point is None
 
 
-@patch("saleor.shipping.postal_codes.is_shipping_method_applicable_for_postal_code")
+@patch("saleor.shipping.postal_codes.get_excluded_shipping_method_ids")
 def test_checkout_delivery_method_update_excluded_postal_code(
-    mock_is_shipping_method_available,
+    mock_get_excluded_shipping_method_ids,
     staff_api_client,
     shipping_method,
     checkout_with_item,
@@ -597,7 +596,9 @@ def test_checkout_delivery_method_update_excluded_postal_code(
     checkout.shipping_address = address
     checkout.save(update_fields=["shipping_address"])
     query = MUTATION_UPDATE_DELIVERY_METHOD
-    mock_is_shipping_method_available.return_value = False
+    mock_get_excluded_shipping_method_ids.side_effect = (
+        lambda shipping_method_ids, _address: list(shipping_method_ids)
+    )
 
     method_id = graphene.Node.to_global_id("ShippingMethod", shipping_method.id)
 
@@ -616,10 +617,7 @@ def test_checkout_delivery_method_update_excluded_postal_code(
     assert errors[0]["field"] == "deliveryMethodId"
     assert errors[0]["code"] == CheckoutErrorCode.DELIVERY_METHOD_NOT_APPLICABLE.name
     assert checkout.assigned_delivery is None
-    assert (
-        mock_is_shipping_method_available.call_count
-        == shipping_models.ShippingMethod.objects.count()
-    )
+    mock_get_excluded_shipping_method_ids.assert_called()
 
 
 def test_checkout_delivery_method_update_shipping_zone_without_channel(
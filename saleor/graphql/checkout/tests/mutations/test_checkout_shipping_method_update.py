@@ -22,7 +22,6 @@ from .....checkout.utils import PRIVATE_META_APP_SHIPPING_ID, invalidate_checkou
 from .....core.models import EventDelivery
 from .....plugins.base_plugin import ExcludedShippingMethod
 from .....plugins.manager import get_plugins_manager
-from .....shipping import models as shipping_models
 from .....webhook.event_types import WebhookEventAsyncType, WebhookEventSyncType
 from ....core.utils import to_global_id_or_none
 from ....tests.utils import get_graphql_content
@@ -313,9 +312,9 @@ def test_checkout_shipping_method_update_excluded_webhook(
 
 
 # Deprecated
-@patch("saleor.shipping.postal_codes.is_shipping_method_applicable_for_postal_code")
+@patch("saleor.shipping.postal_codes.get_excluded_shipping_method_ids")
 def test_checkout_shipping_method_update_excluded_postal_code(
-    mock_is_shipping_method_available,
+    mock_get_excluded_shipping_method_ids,
     staff_api_client,
     shipping_method,
     checkout_with_item,
@@ -325,7 +324,9 @@ def test_checkout_shipping_method_update_excluded_postal_code(
     checkout.shipping_address = address
     checkout.save(update_fields=["shipping_address"])
     query = MUTATION_UPDATE_SHIPPING_METHOD
-    mock_is_shipping_method_available.return_value = False
+    mock_get_excluded_shipping_method_ids.side_effect = (
+        lambda shipping_method_ids, _address: list(shipping_method_ids)
+    )
 
     method_id = graphene.Node.to_global_id("ShippingMethod", shipping_method.id)
 
@@ -344,10 +345,7 @@ def test_checkout_shipping_method_update_excluded_postal_code(
     assert checkout.assigned_delivery is None
     assert checkout.undiscounted_base_shipping_price_amount == Decimal(0)
     assert checkout.shipping_method_name is None
-    assert (
-        mock_is_shipping_method_available.call_count
-        == shipping_models.ShippingMethod.objects.count()
-    )
+    mock_get_excluded_shipping_method_ids.assert_called()
 
 
 def test_checkout_shipping_method_update_with_not_all_required_shipping_address_data(
@@ -1,6 +1,7 @@
 import json
 from collections.abc import Callable, Iterable
 from decimal import Decimal, InvalidOperation
+from functools import partial
 from typing import TYPE_CHECKING, Any
 
 import graphene
@@ -21,6 +22,7 @@ from ..core.enums import OrderDirection
 from ..core.types import BaseConnection, NonNullList
 from ..utils.sorting import sort_queryset_for_connection
 from .context import SyncWebhookControlContext
+from .total_count import get_total_count
 
 if TYPE_CHECKING:
     from ..core import ResolveInfo
@@ -293,14 +295,10 @@ def connection_from_queryset_slice(
     )
 
     if "total_count" in connection_type._meta.fields:
-
-        def get_total_count():
-            return qs.count()
-
         return connection_type(
             edges=edges,
             page_info=pageinfo_type(**page_info),
-            total_count=get_total_count,
+            total_count=partial(get_total_count, qs),
         )
 
     return connection_type(
@@ -713,7 +711,7 @@ class CountableConnection(NonNullConnection):
     total_count = graphene.Int(description="A total count of items in the collection.")
 
     @staticmethod
-    def resolve_total_count(root, _info):
+    def resolve_total_count(root, info: "ResolveInfo"):
         try:
             if isinstance(root, dict):
                 total_count = root["total_count"]
@@ -723,6 +721,6 @@ class CountableConnection(NonNullConnection):
             return None
 
         if callable(total_count):
-            return total_count()
+            return total_count(info)
 
         return total_count
@@ -22,6 +22,8 @@ class SaleorContext(HttpRequest):
     user: "User | None"  # type: ignore[assignment]
     requestor: "App | User | None"
     request_time: datetime.datetime
+    exact_total_count: bool = False
+    total_counts: list[dict[str, Any]]
 
     def __init__(self, *args, **kwargs):
         if "dataloaders" in kwargs:
@@ -0,0 +1,311 @@
+from unittest.mock import patch
+
+import pytest
+from graphql import validate
+
+from ...api import backend, schema
+from ...query_cost_map import COST_MAP
+from ..validators.query_cost import (
+    QueryCostError,
+    QueryCostPlan,
+    cost_validator,
+    get_query_cost_plan,
+    validate_query_cost,
+)
+from .test_query_cost_validation import (
+    PRODUCTS_QUERY,
+    PRODUCTS_QUERY_WITH_FRAGMENT,
+    PRODUCTS_QUERY_WITH_INLINE_FRAGMENT,
+    QUERY_INLINE_FRAGMENT_BASED_ON_INTERFACE,
+    QUERY_SPREAD_FRAGMENTS_BASED_ON_INTERFACE,
+    VARIANTS_QUERY,
+)
+
+# Cost map entries of the types used by the queries below.
+QUERY_COST_MAP = {
+    type_name: COST_MAP[type_name]
+    for type_name in [
+        "Query",
+        "Product",
+        "ProductVariant",
+        "Collection",
+        "Page",
+        "AssignedAttribute",
+        "AssignedMultiProductReferenceAttribute",
+        "AssignedMultiCategoryReferenceAttribute",
+    ]
+}
+
+LITERAL_ARGUMENTS_QUERY = """
+query {
+  products(first: 20, channel: "main") {
+    edges {
+      node {
+        variants {
+          id
+        }
+        collections {
+          products(first: 5) {
+            totalCount
+          }
+        }
+      }
+    }
+  }
+}
+"""
+
+NESTED_MULTIPLIERS_QUERY = """
+query products($first: Int) {
+  products(first: $first) {
+    edges {
+      node {
+        collections {
+          products(first: $first) {
+            totalCount
+          }
+        }
+      }
+    }
+  }
+}
+"""
+
+MULTIPLE_OPERATIONS_QUERY = """
+query first($first: Int) {
+  products(first: $first) {
+    edges {
+      node {
+        id
+      }
+    }
+  }
+}
+
+query second {
+  categories(last: 30) {
+    edges {
+      node {
+        id
+      }
+    }
+  }
+}
+"""
+
+STOREFRONT_PRODUCTS_QUERY = """
+fragment Price on Money {
+  currency
+  amount
+}
+
+fragment ProductCard on Product {
+  id
+  name
+  slug
+  thumbnail(size: 512, format: WEBP) {
+    url
+    alt
+  }
+  category {
+    id
+    name
+  }
+  pricing {
+    onSale
+    priceRange {
+      start {
+        gross {
+          ...Price
+        }
+      }
+      stop {
+        gross {
+          ...Price
+        }
+      }
+    }
+  }
+  variants {
+    id
+    name
+    attributes {
+      attribute {
+        id
+        name
+      }
+      values {
+        id
+        name
+      }
+    }
+  }
+}
+
+query ProductList($first: Int, $after: String, $channel: String) {
+  products(first: $first, after: $after, channel: $channel) {
+    totalCount
+    edges {
+      node {
+        ...ProductCard
+        collections {
+          id
+          products(first: 4) {
+            edges {
+              node {
+                ...ProductCard
+              }
+            }
+          }
+        }
+      }
+    }
+    pageInfo {
+      hasNextPage
+      endCursor
+    }
+  }
+}
+"""
+
+
+def _validator_cost(document, variables, maximum_cost):
+    validator = cost_validator(
+        maximum_cost, variables=variables, cost_map=QUERY_COST_MAP
+    )
+    errors = validate(schema, document.document_ast, [validator])
+    return validator.cost, [str(error) for error in errors]
+
+
+@pytest.mark.parametrize(
+    ("query", "variables"),
+    [
+        (VARIANTS_QUERY, {"first": 100}),
+        (VARIANTS_QUERY, {"first": 5}),
+        (VARIANTS_QUERY, {}),
+        (PRODUCTS_QUERY, {"first": 10}),
+        (PRODUCTS_QUERY_WITH_FRAGMENT, {"first": 10}),
+        (PRODUCTS_QUERY_WITH_INLINE_FRAGMENT, {"first": 10}),
+        (
+            QUERY_INLINE_FRAGMENT_BASED_ON_INTERFACE,
+            {"assignedAttributeLimit": 10, "assignedMultiCategoryLimit": 1000},
+        ),
+        (
+            QUERY_SPREAD_FRAGMENTS_BASED_ON_INTERFACE,
+            {"assignedAttributeLimit": 5, "assignedMultiProductLimit": 50},
+        ),
+        (LITERAL_ARGUMENTS_QUERY, None),
+        (NESTED_MULTIPLIERS_QUERY, {"first": 10}),
+        (MULTIPLE_OPERATIONS_QUERY, {"first": 40}),
+    ],
+)
+@pytest.mark.parametrize("maximum_cost", [1, 100000])
+def test_query_cost_plan_matches_cost_validator(query, variables, maximum_cost):
+    # given
+    document = backend.document_from_string(schema, query)
+
+    # when
+    cost, errors = validate_query_cost(
+        schema, document, variables, QUERY_COST_MAP, maximum_cost
+    )
+
+    # then
+    expected_cost, expected_errors = _validator_cost(document, variables, maximum_cost)
+    assert cost == expected_cost
+    assert [str(error) for error in errors or []] == expected_errors
+
+
+def test_query_cost_plan_reports_cost_exceeded_error():
+    # given
+    document = backend.document_from_string(schema, VARIANTS_QUERY)
+
+    # when
+    cost, errors = validate_query_cost(
+        schema, document, {"first": 100}, QUERY_COST_MAP, 10
+    )
+
+    # then
+    assert cost == 100
+    assert len(errors) == 1
+    assert isinstance(errors[0], QueryCostError)
+    assert errors[0].extensions == {
+        "cost": {"requestedQueryCost": 100, "maximumAvailable": 10}
+    }
+
+
+def test_query_cost_plan_substitutes_variables_on_each_evaluation():
+    # given
+    document = backend.document_from_string(schema, NESTED_MULTIPLIERS_QUERY)
+
+    # when
+    small_cost, _ = validate_query_cost(
+        schema, document, {"first": 1}, QUERY_COST_MAP, 100000
+    )
+    big_cost, _ = validate_query_cost(
+        schema, document, {"first": 10}, QUERY_COST_MAP, 100000
+    )
+
+    # then
+    assert small_cost == 3
+    assert big_cost == 120
+
+
+def test_query_cost_plan_is_cached_on_document():
+    # given
+    document = backend.document_from_string(schema, PRODUCTS_QUERY)
+    plan = get_query_cost_plan(schema, document, QUERY_COST_MAP)
+
+    # when
+    validate_query_cost(schema, document, {"first": 1}, QUERY_COST_MAP, 100000)
+
+    # then
+    assert document.cost_plan is plan
+    assert get_query_cost_plan(schema, document, QUERY_COST_MAP) is plan
+
+
+def test_query_cost_plan_recompiled_for_different_cost_map():
+    # given
+    document = backend.document_from_string(schema, VARIANTS_QUERY)
+    plan = get_query_cost_plan(schema, document, QUERY_COST_MAP)
+    cost_map = {"Query": {"productVariants": {"complexity": 2}}}
+
+    # when
+    cost, errors = validate_query_cost(schema, document, {"first": 5}, cost_map, 10)
+
+    # then
+    assert document.cost_plan is not plan
+    assert cost == 2
+    assert errors is None
+
+
+def test_query_cost_plan_invalid_cost_map():
+    # given
+    document = backend.document_from_string(schema, VARIANTS_QUERY)
+    cost_map = {"Query": {"notExistingField": {"complexity": 2}}}
+
+    # when
+    cost, errors = validate_query_cost(schema, document, {"first": 5}, cost_map, 10)
+
+    # then
+    assert cost == 0
+    assert len(errors) == 1
+    assert "notExistingField" in str(errors[0])
+
+
+def test_query_cost_plan_not_recompiled_for_next_requests():
+    # given
+    document = backend.document_from_string(schema, STOREFRONT_PRODUCTS_QUERY)
+    variables = {"first": 100, "channel": "default-channel"}
+    expected_cost, _ = _validator_cost(document, variables, 100000)
+    validate_query_cost(schema, document, variables, QUERY_COST_MAP, 100000)
+
+    # when
+    with patch.object(QueryCostPlan, "compile_selection") as mock_compile_selection:
+        costs = [
+            validate_query_cost(schema, document, variables, QUERY_COST_MAP, 100000)[0]
+            for _ in range(3)
+        ]
+
+    # then
+    mock_compile_selection.assert_not_called()
+    assert costs == [expected_cost] * 3
@@ -0,0 +1,131 @@
+from unittest.mock import patch
+
+from django.core.cache import cache
+from django.test import override_settings
+from freezegun import freeze_time
+
+from ....product.models import Product
+from ...tests.utils import get_graphql_content
+
+QUERY_PRODUCTS_TOTAL_COUNT = """
+    query Products($channel: String) {
+        products(first: 1, channel: $channel) {
+            totalCount
+        }
+    }
+"""
+
+
+def test_total_count_is_exact_by_default(api_client, product_list, channel_USD):
+    # given
+    variables = {"channel": channel_USD.slug}
+
+    # when
+    response = api_client.post_graphql(QUERY_PRODUCTS_TOTAL_COUNT, variables)
+
+    # then
+    content = get_graphql_content(response)
+    assert content["data"]["products"]["totalCount"] == len(product_list)
+    assert "totalCount" not in content["extensions"]
+
+
+@override_settings(GRAPHQL_TOTAL_COUNT_ESTIMATE_THRESHOLD=2)
+@patch("saleor.graphql.core.total_count.get_count_estimate", return_value=1000)
+def test_total_count_estimated_above_threshold(
+    mock_get_count_estimate, api_client, product_list, channel_USD
+):
+    # given
+    variables = {"channel": channel_USD.slug}
+
+    # when
+    response = api_client.post_graphql(QUERY_PRODUCTS_TOTAL_COUNT, variables)
+
+    # then
+    content = get_graphql_content(response)
+    assert content["data"]["products"]["totalCount"] == 1000
+    assert content["extensions"]["totalCount"] == [
+        {"path": ["products", "totalCount"], "exact": False}
+    ]
+    mock_get_count_estimate.assert_called_once()
+
+
+@override_settings(GRAPHQL_TOTAL_COUNT_ESTIMATE_THRESHOLD=2000)
+@patch("saleor.graphql.core.total_count.get_count_estimate", return_value=1000)
+def test_total_count_exact_below_threshold(
+    mock_get_count_estimate, api_client, product_list, channel_USD
+):
+    # given
+    variables = {"channel": channel_USD.slug}
+
+    # when
+    response = api_client.post_graphql(QUERY_PRODUCTS_TOTAL_COUNT, variables)
+
+    # then
+    content = get_graphql_content(response)
+    assert content["data"]["products"]["totalCount"] == len(product_list)
+    assert content["extensions"]["totalCount"] == [
+        {"path": ["products", "totalCount"], "exact": True}
+    ]
+
+
+@override_settings(GRAPHQL_TOTAL_COUNT_ESTIMATE_THRESHOLD=2)
+@patch("saleor.graphql.core.total_count.get_count_estimate", return_value=1000)
+def test_total_count_exact_requested_with_extension(
+    mock_get_count_estimate, api_client, product_list, channel_USD
+):
+    # given
+    data = {
+        "query": QUERY_PRODUCTS_TOTAL_COUNT,
+        "variables": {"channel": channel_USD.slug},
+        "extensions": {"exactTotalCount": True},
+    }
+
+    # when
+    response = api_client.post(data)
+
+    # then
+    content = get_graphql_content(response)
+    assert content["data"]["products"]["totalCount"] == len(product_list)
+    assert content["extensions"]["totalCount"] == [
+        {"path": ["products", "totalCount"], "exact": True}
+    ]
+    mock_get_count_estimate.assert_not_called()
+
+
+@override_settings(GRAPHQL_TOTAL_COUNT_CACHE_TIMEOUT=60)
+@freeze_time("2026-01-01 12:00:30")
+def test_total_count_cached(api_client, product_list, channel_USD):
+    # given
+    cache.clear()
+    variables = {"channel": channel_USD.slug}
+    api_client.post_graphql(QUERY_PRODUCTS_TOTAL_COUNT, variables)
+    Product.objects.filter(pk=product_list[0].pk).delete()
+
+    # when
+    response = api_client.post_graphql(QUERY_PRODUCTS_TOTAL_COUNT, variables)
+
+    # then
+    content = get_graphql_content(response)
+    assert content["data"]["products"]["totalCount"] == len(product_list)
+
+
+@override_settings(GRAPHQL_TOTAL_COUNT_CACHE_TIMEOUT=60)
+def test_total_count_cache_skipped_when_exact_count_requested(
+    api_client, product_list, channel_USD
+):
+    # given
+    cache.clear()
+    data = {
+        "query": QUERY_PRODUCTS_TOTAL_COUNT,
+        "variables": {"channel": channel_USD.slug},
+        "extensions": {"exactTotalCount": True},
+    }
+    api_client.post_graphql(QUERY_PRODUCTS_TOTAL_COUNT, data["variables"])
+    Product.objects.filter(pk=product_list[0].pk).delete()
+
+    # when
+    response = api_client.post(data)
+
+    # then
+    content = get_graphql_content(response)
+    assert content["data"]["products"]["totalCount"] == len(product_list) - 1
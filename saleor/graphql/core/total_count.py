@@ -0,0 +1,123 @@
+"""Counting the items of the connections.
+
+Exact `COUNT(*)` of a large, filtered table can cost more than fetching the page
+itself. When `GRAPHQL_TOTAL_COUNT_ESTIMATE_THRESHOLD` is set, the connections
+return the number of rows estimated by the Postgres planner, as long as the
+estimate exceeds the threshold. Smaller counts are exact.
+
+Exact counts are cached for `GRAPHQL_TOTAL_COUNT_CACHE_TIMEOUT` seconds, keyed by
+the SQL of the counted query, so they are shared by the requests with the same
+filters and visibility.
+
+Clients can request fresh, exact counts with the `exactTotalCount` request
+extension. When any of the above is enabled, the response `totalCount` extension
+lists the counts of the request, with the information whether each of them is exact.
+"""
+
+import hashlib
+import json
+from datetime import datetime
+from typing import TYPE_CHECKING
+
+from django.conf import settings
+from django.core.cache import cache
+from django.core.exceptions import EmptyResultSet
+from django.db import connections
+from django.db.models import QuerySet
+from graphql.execution import ExecutionResult
+
+if TYPE_CHECKING:
+    from . import ResolveInfo, SaleorContext
+
+EXACT_TOTAL_COUNT_EXTENSION = "exactTotalCount"
+TOTAL_COUNT_EXTENSION = "totalCount"
+TOTAL_COUNT_CACHE_KEY_PREFIX = "graphql-total-count"
+
+
+def is_exact_total_count_requested(data: dict) -> bool:
+    extensions = data.get("extensions")
+    if not isinstance(extensions, dict):
+        return False
+    return extensions.get(EXACT_TOTAL_COUNT_EXTENSION) is True
+
+
+def get_total_count(qs: QuerySet, info: "ResolveInfo") -> int:
+    """Return the exact or the estimated number of items in the queryset."""
+    threshold = settings.GRAPHQL_TOTAL_COUNT_ESTIMATE_THRESHOLD
+    if not threshold and not settings.GRAPHQL_TOTAL_COUNT_CACHE_TIMEOUT:
+        return qs.count()
+
+    qs = qs.order_by()
+    if getattr(info.context, "exact_total_count", False):
+        total_count = qs.count()
+    elif threshold and (estimate := get_count_estimate(qs)) > threshold:
+        record_total_count(info, exact=False)
+        return estimate
+    else:
+        total_count = get_cached_count(qs)
+
+    record_total_count(info, exact=True)
+    return total_count
+
+
+def record_total_count(info: "ResolveInfo", exact: bool):
+    if not hasattr(info.context, "total_counts"):
+        info.context.total_counts = []
+    info.context.total_counts.append({"path": info.path, "exact": exact})
+
+
+def get_count_estimate(qs: QuerySet) -> int:
+    """Return the number of rows which the Postgres planner expects from the query.
+
+    For the queries without filters the planner uses the table statistics, so the
+    estimate costs a lookup in the catalog, not a table scan.
+    """
+    try:
+        sql, params = qs.query.get_compiler(using=qs.db).as_sql()
+    except EmptyResultSet:
+        return 0
+    with connections[qs.db].cursor() as cursor:
+        cursor.execute(f"EXPLAIN (FORMAT JSON) {sql}", params)
+        plan = cursor.fetchone()[0]
+    if isinstance(plan, str):
+        plan = json.loads(plan)
+    return int(plan[0]["Plan"]["Plan Rows"])
+
+
+def get_count_cache_key(qs: QuerySet, timeout: int) -> str | None:
+    """Return the key of the count of the queryset, or None when it's empty.
+
+    The visibility filters compare the items with the current time, so the times
+    are rounded down to the cache timeout; otherwise no key would be used twice.
+    """
+    try:
+        sql, params = qs.query.get_compiler(using=qs.db).as_sql()
+    except EmptyResultSet:
+        return None
+    params = tuple(
+        int(param.timestamp()) // timeout if isinstance(param, datetime) else param
+        for param in params
+    )
+    fingerprint = hashlib.sha256(repr((sql, params)).encode("utf-8")).hexdigest()
+    return f"{TOTAL_COUNT_CACHE_KEY_PREFIX}:{fingerprint}"
+
+
+def get_cached_count(qs: QuerySet) -> int:
+    timeout = settings.GRAPHQL_TOTAL_COUNT_CACHE_TIMEOUT
+    cache_key = get_count_cache_key(qs, timeout) if timeout else None
+    if not cache_key:
+        return qs.count()
+
+    total_count = cache.get(cache_key)
+    if total_count is None:
+        total_count = qs.count()
+        cache.set(cache_key, total_count, timeout=timeout)
+    return total_count
+
+
+def set_total_counts_on_result(
+    execution_result: ExecutionResult, context: "SaleorContext"
+) -> ExecutionResult:
+    if total_counts := getattr(context, "total_counts", None):
+        execution_result.extensions[TOTAL_COUNT_EXTENSION] = total_counts
+    return execution_result
@@ -13,14 +13,17 @@ from graphql import (
 )
 from graphql.execution.values import get_argument_values
 from graphql.language.ast import (
+    Document,
     Field,
     FragmentDefinition,
     FragmentSpread,
     InlineFragment,
+    ListValue,
+    ObjectValue,
     OperationDefinition,
+    Variable,
 )
 from graphql.type import GraphQLField
-from graphql.validation import validate
 from graphql.validation.rules.base import ValidationRule
 from graphql.validation.validation import ValidationContext
 
@@ -162,12 +165,7 @@ class CostValidator(ValidationRule):
         self, field_args: dict[str, Any], args_defs: dict[str, GraphQLArgument]
     ) -> dict[str, Any]:
         """Update empty args with default values from argument definition."""
-        for arg_name, value in field_args.items():
-            if value is None and arg_name in args_defs:
-                arg_def = args_defs[arg_name]
-                if arg_def.default_value is not None:
-                    field_args[arg_name] = arg_def.default_value
-        return field_args
+        return update_empty_args_with_default(field_args, args_defs)
 
     def enter_operation_definition(self, node, key, parent, path, ancestors):  # pylint: disable=unused-argument
         if self.cost_map:
@@ -219,21 +217,7 @@ class CostValidator(ValidationRule):
         return cost_args
 
     def get_multipliers_from_string(self, multipliers: list[str], field_args):
-        accessors = [s.split(".") for s in multipliers]
-        multipliers: Any = []
-        for accessor in accessors:
-            val = field_args
-            for key in accessor:
-                val = val.get(key)
-            try:
-                multipliers.append(int(val))
-            except (ValueError, TypeError):
-                pass
-        multipliers = [
-            len(multiplier) if isinstance(multiplier, list | tuple) else multiplier
-            for multiplier in multipliers
-        ]
-        return [m for m in multipliers if m > 0]
+        return get_multipliers_from_string(multipliers, field_args)
 
     def get_cost_exceeded_error(self) -> "QueryCostError":
         return QueryCostError(
@@ -269,6 +253,36 @@ class CostValidator(ValidationRule):
             self.leave_operation_definition(node, key, parent, path, ancestors)
 
 
+def update_empty_args_with_default(
+    field_args: dict[str, Any], args_defs: dict[str, GraphQLArgument]
+) -> dict[str, Any]:
+    """Update empty args with default values from argument definition."""
+    for arg_name, value in field_args.items():
+        if value is None and arg_name in args_defs:
+            arg_def = args_defs[arg_name]
+            if arg_def.default_value is not None:
+                field_args[arg_name] = arg_def.default_value
+    return field_args
+
+
+def get_multipliers_from_string(multipliers: list[str], field_args):
+    accessors = [s.split(".") for s in multipliers]
+    values: Any = []
+    for accessor in accessors:
+        val = field_args
+        for key in accessor:
+            val = val.get(key)
+        try:
+            values.append(int(val))
+        except (ValueError, TypeError):
+            pass
+    values = [
+        len(multiplier) if isinstance(multiplier, list | tuple) else multiplier
+        for multiplier in values
+    ]
+    return [m for m in values if m > 0]
+
+
 def validate_cost_map(cost_map: dict[str, dict[str, Any]], schema: GraphQLSchema):
     type_map = schema.get_type_map()
     for type_name, type_fields in cost_map.items():
@@ -327,6 +341,336 @@ def cost_validator(
     )
 
 
+def _contains_variables(value) -> bool:
+    if isinstance(value, Variable):
+        return True
+    if isinstance(value, ListValue):
+        return any(_contains_variables(item) for item in value.values)
+    if isinstance(value, ObjectValue):
+        return any(_contains_variables(field.value) for field in value.fields)
+    return False
+
+
+def _compute_field_cost(
+    parent_multipliers: list[int],
+    multipliers=None,
+    use_multipliers=True,
+    complexity=None,
+    *,
+    default_complexity: int,
+) -> tuple[int, list[int]]:
+    """Return the field cost and the multipliers passed down to its children.
+
+    Mirrors `CostValidator.compute_cost` without keeping state on the instance.
+    """
+    if complexity is None:
+        complexity = default_complexity
+    if use_multipliers:
+        if multipliers:
+            parent_multipliers = parent_multipliers + [reduce(add, multipliers, 0)]
+        return reduce(mul, parent_multipliers, complexity), parent_multipliers
+    return complexity, parent_multipliers
+
+
+class FieldCostPlan:
+    """Precomputed cost data of a single field selection.
+
+    When the field arguments don't reference any variables, the arguments and
+    the cost map entry are resolved at compile time. Otherwise only the
+    argument AST is kept and resolved against the request variables.
+    """
+
+    __slots__ = (
+        "arg_defs",
+        "arguments",
+        "cost_args",
+        "has_variables",
+        "selection",
+        "static_error",
+    )
+
+    def __init__(
+        self,
+        field: GraphQLField,
+        node: Field,
+        cost_args: dict[str, Any] | None,
+        selection: "SelectionCostPlan | None",
+    ):
+        self.arg_defs = field.args
+        self.arguments = node.arguments
+        self.selection = selection
+        self.static_error: GraphQLError | None = None
+        self.has_variables = any(
+            _contains_variables(argument.value) for argument in node.arguments or []
+        )
+        self.cost_args = cost_args
+        if not self.has_variables:
+            field_args, self.static_error = self.resolve_args(None)
+            self.cost_args = self.resolve_cost_args(field_args)
+
+    def resolve_args(
+        self, variables: dict | None
+    ) -> tuple[dict[str, Any], GraphQLError | None]:
+        try:
+            field_args = get_argument_values(self.arg_defs, self.arguments, variables)
+        except Exception as e:
+            return update_empty_args_with_default({}, self.arg_defs), GraphQLError(
+                str(e)
+            )
+        return update_empty_args_with_default(field_args, self.arg_defs), None
+
+    def resolve_cost_args(self, field_args: dict[str, Any]) -> dict[str, Any] | None:
+        if not self.cost_args:
+            return None
+        cost_args = self.cost_args.copy()
+        if "multipliers" in cost_args:
+            cost_args["multipliers"] = get_multipliers_from_string(
+                cost_args["multipliers"], field_args
+            )
+        return cost_args
+
+
+class FragmentCostPlan:
+    """Precomputed cost data of a fragment spread or an inline fragment."""
+
+    __slots__ = ("interface_names", "selection", "type_name")
+
+    def __init__(
+        self,
+        type_name: str,
+        interface_names: list[str],
+        selection: "SelectionCostPlan | None",
+    ):
+        self.type_name = type_name
+        self.interface_names = interface_names
+        self.selection = selection
+
+
+class SelectionCostPlan:
+    """Precomputed cost data of a selection set, in document order."""
+
+    __slots__ = ("children",)
+
+    def __init__(self, children: list[FieldCostPlan | FragmentCostPlan]):
+        self.children = children
+
+
+class QueryCostPlan:
+    """Query cost analysis compiled once per GraphQL document.
+
+    Compiling resolves everything that doesn't depend on the request: schema
+    types and fields, fragments, cost map entries and the arguments given as
+    literals. Evaluating the plan only substitutes the request variables into
+    the remaining arguments (e.g. `first`/`last`) and multiplies the results.
+
+    The computed cost and the reported errors are the same as the ones
+    returned by `CostValidator`.
+    """
+
+    def __init__(
+        self,
+        schema: GraphQLSchema,
+        document_ast: Document,
+        cost_map: dict[str, dict[str, Any]] | None,
+        *,
+        default_cost: int = 0,
+        default_complexity: int = 1,
+    ):
+        self.schema = schema
+        self.cost_map = cost_map
+        self.default_cost = default_cost
+        self.default_complexity = default_complexity
+        self.cost_map_error: GraphQLError | None = None
+        if cost_map:
+            try:
+                validate_cost_map(cost_map, schema)
+            except GraphQLError as cost_map_error:
+                self.cost_map_error = cost_map_error
+
+        self.fragments = {
+            definition.name.value: definition
+            for definition in document_ast.definitions
+            if isinstance(definition, FragmentDefinition)
+        }
+        root_types = {
+            "query": schema.get_query_type(),
+            "mutation": schema.get_mutation_type(),
+            "subscription": schema.get_subscription_type(),
+        }
+        self.operations: list[SelectionCostPlan | None] = []
+        for definition in document_ast.definitions:
+            if not isinstance(definition, OperationDefinition):
+                continue
+            if self.cost_map_error:
+                self.operations.append(None)
+                continue
+            root_type = root_types.get(definition.operation)
+            self.operations.append(
+                self.compile_selection(definition, root_type)
+                if definition.operation in root_types
+                else None
+            )
+
+    def compile_selection(
+        self, node: CostAwareNode, type_def
+    ) -> SelectionCostPlan | None:
+        if isinstance(node, FragmentSpread) or not node.selection_set:
+            return None
+        fields: GraphQLFieldMap = {}
+        if isinstance(type_def, GraphQLObjectType | GraphQLInterfaceType):
+            fields = type_def.fields
+        children: list[FieldCostPlan | FragmentCostPlan] = []
+        for child_node in node.selection_set.selections:
+            if isinstance(child_node, Field):
+                field = fields.get(child_node.name.value)
+                if not field:
+                    continue
+                cost_args = None
+                if self.cost_map and type_def and type_def.name:
+                    cost_args = self.cost_map.get(type_def.name, {}).get(
+                        child_node.name.value
+                    )
+                children.append(
+                    FieldCostPlan(
+                        field,
+                        child_node,
+                        cost_args,
+                        self.compile_selection(child_node, get_named_type(field.type)),
+                    )
+                )
+            if isinstance(child_node, FragmentSpread):
+                fragment = self.fragments.get(child_node.name.value)
+                if not fragment or not fragment.type_condition:
+                    continue
+                fragment_type = self.schema.get_type(fragment.type_condition.name.value)
+                if not fragment_type:
+                    continue
+                children.append(self.compile_fragment(fragment, fragment_type))
+            if isinstance(child_node, InlineFragment):
+                inline_fragment_type = type_def
+                if child_node.type_condition and child_node.type_condition.name:
+                    inline_fragment_type = self.schema.get_type(
+                        child_node.type_condition.name.value
+                    )
+                if not inline_fragment_type:
+                    continue
+                children.append(self.compile_fragment(child_node, inline_fragment_type))
+        return SelectionCostPlan(children)
+
+    def compile_fragment(
+        self, node: FragmentDefinition | InlineFragment, fragment_type
+    ) -> FragmentCostPlan:
+        interface_names = []
+        if isinstance(fragment_type, GraphQLObjectType) and fragment_type.interfaces:
+            interface_names = [interface.name for interface in fragment_type.interfaces]
+        return FragmentCostPlan(
+            fragment_type.name,
+            interface_names,
+            self.compile_selection(node, fragment_type),
+        )
+
+    def evaluate(
+        self, variables: dict | None, maximum_cost: int
+    ) -> tuple[int, list[GraphQLError] | None]:
+        errors: list[GraphQLError] = []
+        cost = 0
+        for operation in self.operations:
+            if self.cost_map_error:
+                errors.append(self.cost_map_error)
+            elif operation is not None:
+                cost += self.evaluate_selection(operation, [], variables, errors)
+            if cost > maximum_cost:
+                errors.append(
+                    QueryCostError(
+                        cost_analysis_message(maximum_cost, cost),
+                        extensions={
+                            "cost": {
+                                "requestedQueryCost": cost,
+                                "maximumAvailable": maximum_cost,
+                            }
+                        },
+                    )
+                )
+        return cost, errors or None
+
+    def evaluate_selection(
+        self,
+        selection: SelectionCostPlan,
+        parent_multipliers: list[int],
+        variables: dict | None,
+        errors: list[GraphQLError],
+    ) -> int:
+        total = 0
+        fragment_map_cost: dict[str, int] = defaultdict(int)
+        fragment_name_to_interface_names: dict[str, set[str]] = defaultdict(set)
+        for child in selection.children:
+            node_cost = self.default_cost
+            if isinstance(child, FieldCostPlan):
+                cost_args = child.cost_args
+                if child.has_variables:
+                    field_args, error = child.resolve_args(variables)
+                    if error:
+                        errors.append(error)
+                    if not self.cost_map:
+                        return 0
+                    cost_args = child.resolve_cost_args(field_args)
+                else:
+                    if child.static_error:
+                        errors.append(child.static_error)
+                    if not self.cost_map:
+                        return 0
+                multipliers = parent_multipliers
+                if cost_args is not None:
+                    try:
+                        node_cost, multipliers = _compute_field_cost(
+                            parent_multipliers,
+                            **cost_args,
+                            default_complexity=self.default_complexity,
+                        )
+                    except (TypeError, ValueError) as e:
+                        errors.append(GraphQLError(str(e)))
+                if child.selection:
+                    node_cost += self.evaluate_selection(
+                        child.selection, multipliers, variables, errors
+                    )
+            else:
+                fragment_map_cost[child.type_name] += (
+                    self.evaluate_selection(
+                        child.selection, parent_multipliers, variables, errors
+                    )
+                    if child.selection
+                    else 0
+                )
+                if child.interface_names:
+                    fragment_name_to_interface_names[child.type_name].update(
+                        child.interface_names
+                    )
+            total += node_cost
+        if fragment_map_cost:
+            for fragment_name, interfaces in fragment_name_to_interface_names.items():
+                interfaces_cost = sum(
+                    [fragment_map_cost.get(interface, 0) for interface in interfaces], 0
+                )
+                fragment_map_cost[fragment_name] += interfaces_cost
+            total += max(fragment_map_cost.values(), default=0)
+        return total
+
+
+def get_query_cost_plan(
+    schema: GraphQLSchema, query, cost_map: dict[str, dict[str, Any]]
+) -> QueryCostPlan:
+    """Return the cost plan of the document, compiling it on first use.
+
+    The plan is stored on the document itself, so it shares the lifetime of
+    the parsed document kept by the cached GraphQL backend.
+    """
+    plan = getattr(query, "cost_plan", None)
+    if plan is None or plan.schema is not schema or plan.cost_map is not cost_map:
+        plan = QueryCostPlan(schema, query.document_ast, cost_map)
+        query.cost_plan = plan
+    return plan
+
+
 def validate_query_cost(
     schema,
     query,
@@ -334,16 +678,5 @@ def validate_query_cost(
     cost_map,
     maximum_cost,
 ):
-    validator = cost_validator(
-        maximum_cost,
-        variables=variables,
-        cost_map=cost_map,
-    )
-    error = validate(
-        schema,
-        query.document_ast,
-        [validator],  # type: ignore[list-item] # cost validator is an instance that pretends to be a class # noqa: E501
-    )
-    if error:
-        return validator.cost, error
-    return validator.cost, None
+    plan = get_query_cost_plan(schema, query, cost_map)
+    return plan.evaluate(variables, maximum_cost)
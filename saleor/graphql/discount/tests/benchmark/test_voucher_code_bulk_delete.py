@@ -39,7 +39,7 @@ def test_voucher_code_bulk_delete_queries(
 
     variables = {"ids": ids[1:]}
 
-    with django_assert_num_queries(9):
+    with django_assert_num_queries(8):
         response = staff_api_client.post_graphql(
             VOUCHER_CODE_BULK_DELETE_MUTATION, variables
         )
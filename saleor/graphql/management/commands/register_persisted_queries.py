@@ -0,0 +1,52 @@
+import json
+from pathlib import Path
+
+from django.core.management.base import BaseCommand, CommandError
+from graphql.error import GraphQLError
+
+from ...api import schema
+from ...persisted_queries import register_persisted_query
+
+
+def get_queries_from_file(path: Path) -> list[str]:
+    """Return the queries defined in a file.
+
+    A `.json` file is an Apollo persisted query manifest
+    (`{"operations": [{"body": ...}]}`) or a map of hashes to queries. Any other
+    file contains a single GraphQL document.
+    """
+    content = path.read_text()
+    if path.suffix != ".json":
+        return [content]
+    data = json.loads(content)
+    if "operations" in data:
+        return [operation["body"] for operation in data["operations"]]
+    return list(data.values())
+
+
+class Command(BaseCommand):
+    help = (
+        "Registers GraphQL documents as persisted queries. Registered queries can "
+        "be requested by their SHA-256 hash."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "paths",
+            nargs="+",
+            type=Path,
+            help="GraphQL documents or JSON manifests with the queries to register.",
+        )
+
+    def handle(self, *args, **options):
+        for path in options["paths"]:
+            try:
+                queries = get_queries_from_file(path)
+            except (OSError, ValueError, KeyError, TypeError) as e:
+                raise CommandError(f"Unable to read queries from {path}: {e}") from e
+            for query in queries:
+                try:
+                    query_hash = register_persisted_query(schema, query)
+                except GraphQLError as e:
+                    raise CommandError(f"Invalid query in {path}: {e}") from e
+                self.stdout.write(query_hash)
@@ -0,0 +1,85 @@
+import graphene
+import pytest
+
+from .....order.tests.fixtures.benchmark import LINES_IN_ORDER_WITH_MANY_LINES
+from ....tests.utils import get_graphql_content
+
+ORDER_WITH_LINES_QUERY = """
+query Order($id: ID!) {
+  order(id: $id) {
+    id
+    number
+    lines {
+      id
+      productName
+      variantName
+      productSku
+      quantity
+      thumbnail {
+        url
+      }
+      variant {
+        id
+        quantityAvailable
+      }
+      unitPrice {
+        gross {
+          amount
+        }
+        net {
+          amount
+        }
+      }
+      totalPrice {
+        gross {
+          amount
+        }
+      }
+      allocations {
+        quantity
+        warehouse {
+          name
+        }
+      }
+    }
+    subtotal {
+      gross {
+        amount
+      }
+    }
+    total {
+      gross {
+        amount
+      }
+    }
+    undiscountedTotal {
+      gross {
+        amount
+      }
+    }
+  }
+}
+"""
+
+
+@pytest.mark.django_db
+@pytest.mark.count_queries(autouse=False)
+def test_order_with_many_lines(
+    staff_api_client,
+    permission_manage_orders,
+    order_with_many_lines_for_benchmarks,
+    count_queries,
+):
+    # given
+    order = order_with_many_lines_for_benchmarks
+    variables = {"id": graphene.Node.to_global_id("Order", order.pk)}
+    staff_api_client.user.user_permissions.add(permission_manage_orders)
+
+    # when
+    content = get_graphql_content(
+        staff_api_client.post_graphql(ORDER_WITH_LINES_QUERY, variables)
+    )
+
+    # then
+    order_data = content["data"]["order"]
+    assert len(order_data["lines"]) == LINES_IN_ORDER_WITH_MANY_LINES
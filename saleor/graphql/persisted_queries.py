@@ -0,0 +1,187 @@
+import hashlib
+from typing import Any
+
+from django.conf import settings
+from django.http import HttpRequest
+from graphql import GraphQLDocument, GraphQLSchema, parse, validate
+from graphql.error import GraphQLError
+
+from ..core.db.connection import allow_writer
+from ..core.models import PersistedQuery
+from ..core.utils.cache import CacheDict
+from .api import SaleorGraphQLBackend
+from .context import get_context_value
+from .core.validators.query_cost import get_query_cost_plan
+from .query_cost_map import COST_MAP
+
+PERSISTED_QUERY_EXTENSION = "persistedQuery"
+PERSISTED_QUERY_VERSION = 1
+
+# Maximum number of documents registered by the APQ requests kept per process.
+APQ_DOCUMENTS_CACHE_SIZE = 1000
+
+
+class PersistedQueryNotFound(GraphQLError):
+    def __init__(self):
+        # Apollo clients match on this exact message to resend the full query.
+        super().__init__("PersistedQueryNotFound")
+
+
+class PersistedQueryNotSupported(GraphQLError):
+    def __init__(self):
+        super().__init__("PersistedQueryNotSupported")
+
+
+class PersistedQueryHashMismatch(GraphQLError):
+    def __init__(self):
+        super().__init__("Provided sha256Hash does not match the query.")
+
+
+class PersistedQueryNotAllowed(GraphQLError):
+    def __init__(self):
+        super().__init__("Only persisted queries are allowed.")
+
+
+def generate_persisted_query_hash(query: str) -> str:
+    return hashlib.sha256(query.encode("utf-8")).hexdigest()
+
+
+def get_persisted_query_hash(data: dict) -> str | None:
+    """Return the hash of the persisted query requested in the body.
+
+    Both `{"id": <hash>}` and the APQ `extensions.persistedQuery.sha256Hash`
+    formats are supported.
+    """
+    if query_id := data.get("id"):
+        return str(query_id)
+    extensions = data.get("extensions")
+    if not isinstance(extensions, dict):
+        return None
+    persisted_query = extensions.get(PERSISTED_QUERY_EXTENSION)
+    if not isinstance(persisted_query, dict):
+        return None
+    if persisted_query.get("version") != PERSISTED_QUERY_VERSION:
+        raise PersistedQueryNotSupported()
+    query_hash = persisted_query.get("sha256Hash")
+    return str(query_hash) if query_hash else None
+
+
+class PersistedQueryStore:
+    """Per-process store of the persisted query documents, keyed by the query hash.
+
+    Documents are parsed, validated and cost-analysed once, when they are
+    requested for the first time in the process. Documents of the registered
+    queries are never evicted; registered queries are never changed, so there is
+    nothing to invalidate. Documents registered by the APQ requests are not stored
+    in the database and are kept in a bounded LRU cache, as any client can send
+    them.
+    """
+
+    def __init__(self, apq_cache_size: int = APQ_DOCUMENTS_CACHE_SIZE):
+        self.backend = SaleorGraphQLBackend()
+        self.documents: dict[str, GraphQLDocument] = {}
+        self.apq_documents: CacheDict = CacheDict(apq_cache_size)
+
+    def __contains__(self, query_hash: str) -> bool:
+        return query_hash in self.documents or query_hash in self.apq_documents
+
+    def __len__(self) -> int:
+        return len(self.documents) + len(self.apq_documents)
+
+    def clear(self):
+        self.documents.clear()
+        self.apq_documents.clear()
+
+    def get(self, schema: GraphQLSchema, query_hash: str) -> GraphQLDocument | None:
+        document = self.documents.get(query_hash)
+        if document is None and query_hash in self.apq_documents:
+            document = self.apq_documents[query_hash]
+        if document is not None and document.schema is schema:
+            return document
+        query = (
+            PersistedQuery.objects.using(settings.DATABASE_CONNECTION_REPLICA_NAME)
+            .filter(hash=query_hash)
+            .values_list("query", flat=True)
+            .first()
+        )
+        if query is None:
+            return None
+        return self.add(schema, query_hash, query)
+
+    def add(self, schema: GraphQLSchema, query_hash: str, query: str):
+        document = self.backend.document_from_string(schema, query)
+        get_query_cost_plan(schema, document, COST_MAP)
+        self.documents[query_hash] = document
+        return document
+
+    def add_apq(self, schema: GraphQLSchema, query_hash: str, query: str):
+        """Return the document of the query sent by an APQ registration request.
+
+        Invalid documents are not stored; the errors are returned by the document
+        as for any other query.
+        """
+        document_ast = parse(query)
+        validation_errors = validate(schema, document_ast)
+        document = self.backend.document_from_ast(
+            schema, query, document_ast, validation_errors
+        )
+        if not validation_errors:
+            get_query_cost_plan(schema, document, COST_MAP)
+            self.apq_documents[query_hash] = document
+        return document
+
+
+persisted_queries = PersistedQueryStore()
+
+
+def register_persisted_query(schema: GraphQLSchema, query: str) -> str:
+    """Validate the query and store it as a persisted query.
+
+    Return the hash under which the query can be requested.
+    """
+    if errors := validate(schema, parse(query)):
+        raise errors[0]
+    query_hash = generate_persisted_query_hash(query)
+    with allow_writer():
+        PersistedQuery.objects.get_or_create(hash=query_hash, defaults={"query": query})
+    return query_hash
+
+
+def is_ad_hoc_query_allowed(request: HttpRequest) -> bool:
+    """Check if the request can send a query that is not persisted.
+
+    In the allow-list only mode, ad-hoc queries are accepted only from apps and
+    staff users.
+    """
+    if not settings.GRAPHQL_PERSISTED_QUERIES_ALLOWLIST_ONLY:
+        return True
+    context = get_context_value(request)
+    if getattr(context, "app", None):
+        return True
+    user: Any = context.user
+    return bool(user and user.is_staff)
+
+
+def get_persisted_document(
+    schema: GraphQLSchema, request: HttpRequest, query: str | None, query_hash: str
+) -> GraphQLDocument:
+    """Return the document of the requested persisted query.
+
+    When the full query is sent together with its hash (APQ registration
+    request), the document is kept in the process memory, unless only
+    allow-listed queries are accepted from the requestor.
+    """
+    if not query:
+        document = persisted_queries.get(schema, query_hash)
+        if document is None:
+            raise PersistedQueryNotFound()
+        return document
+
+    if generate_persisted_query_hash(query) != query_hash:
+        raise PersistedQueryHashMismatch()
+    document = persisted_queries.get(schema, query_hash)
+    if document is not None:
+        return document
+    if not is_ad_hoc_query_allowed(request):
+        raise PersistedQueryNotAllowed()
+    return persisted_queries.add_apq(schema, query_hash, query)
@@ -0,0 +1,63 @@
+from contextlib import ExitStack
+
+import pytest
+from django.conf import settings
+from django.db import connections
+from django.test.utils import CaptureQueriesContext
+
+from .....plugins.models import PluginConfiguration
+from ....tests.utils import get_graphql_content
+
+AVAILABLE_PAYMENT_GATEWAYS_QUERY = """
+    query Shop($channel: String) {
+        shop {
+            availablePaymentGateways(channel: $channel) {
+                id
+                name
+            }
+        }
+    }
+"""
+
+
+@pytest.mark.django_db
+@pytest.mark.count_queries(autouse=False)
+def test_plugin_configurations_are_not_fetched_for_each_request(
+    api_client,
+    sample_gateway,
+    channel_USD,
+    count_queries,
+):
+    # given
+    PluginConfiguration.objects.create(
+        identifier="sampleDummy.active",
+        channel=channel_USD,
+        active=True,
+        configuration=[],
+    )
+    variables = {"channel": channel_USD.slug}
+    get_graphql_content(
+        api_client.post_graphql(AVAILABLE_PAYMENT_GATEWAYS_QUERY, variables)
+    )
+
+    # when
+    with ExitStack() as stack:
+        contexts = [
+            stack.enter_context(CaptureQueriesContext(connections[alias]))
+            for alias in (
+                settings.DATABASE_CONNECTION_DEFAULT_NAME,
+                settings.DATABASE_CONNECTION_REPLICA_NAME,
+            )
+        ]
+        response = api_client.post_graphql(AVAILABLE_PAYMENT_GATEWAYS_QUERY, variables)
+
+    # then
+    content = get_graphql_content(response)
+    assert content["data"]["shop"]["availablePaymentGateways"]
+    plugin_queries = [
+        query
+        for ctx in contexts
+        for query in ctx.captured_queries
+        if PluginConfiguration._meta.db_table in query["sql"]
+    ]
+    assert plugin_queries == []
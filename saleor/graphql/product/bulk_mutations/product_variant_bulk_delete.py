@@ -17,7 +17,10 @@ from ....order.lock_objects import order_lines_qs_select_for_update
 from ....order.tasks import recalculate_orders_task
 from ....permission.enums import ProductPermissions
 from ....product import models
-from ....product.search import prepare_product_search_vector_value
+from ....product.search import (
+    prepare_product_search_document_value,
+    prepare_product_search_vector_value,
+)
 from ....webhook.event_types import WebhookEventAsyncType
 from ....webhook.utils import get_webhooks_for_event
 from ...app.dataloaders import get_app_promise
@@ -146,11 +149,15 @@ class ProductVariantBulkDelete(ModelBulkDeleteMutation):
             product.search_vector = FlatConcatSearchVector(
                 *prepare_product_search_vector_value(product)
             )
+            product.search_document = prepare_product_search_document_value(
+                product, already_prefetched=True
+            )
             product.default_variant = product.variants.first()
             product.save(
                 update_fields=[
                     "default_variant",
                     "search_vector",
+                    "search_document",
                     "updated_at",
                 ]
             )
@@ -2,7 +2,9 @@ import graphene
 from django.core.exceptions import ValidationError
 
 from .....core.tracing import traced_atomic_transaction
-from .....discount.utils.promotion import mark_active_catalogue_promotion_rules_as_dirty
+from .....discount.utils.promotion import (
+    update_active_catalogue_promotion_rules_for_products,
+)
 from .....permission.enums import ProductPermissions
 from .....product import models
 from .....product.error_codes import CollectionErrorCode
@@ -57,11 +59,11 @@ class CollectionAddProducts(BaseMutation):
                 cls.call_event(manager.product_updated, product)
 
         if products:
-            channel_ids = models.ProductChannelListing.objects.filter(
-                product_id__in=[product.id for product in products]
-            ).values_list("channel_id", flat=True)
             # This will finally recalculate discounted prices for products.
-            cls.call_event(mark_active_catalogue_promotion_rules_as_dirty, channel_ids)
+            cls.call_event(
+                update_active_catalogue_promotion_rules_for_products,
+                [product.id for product in products],
+            )
 
         return CollectionAddProducts(
             collection=ChannelContext(node=collection, channel_slug=None)
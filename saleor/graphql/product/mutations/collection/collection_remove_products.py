@@ -1,6 +1,8 @@
 import graphene
 
-from .....discount.utils.promotion import mark_active_catalogue_promotion_rules_as_dirty
+from .....discount.utils.promotion import (
+    update_active_catalogue_promotion_rules_for_products,
+)
 from .....permission.enums import ProductPermissions
 from .....product import models
 from ....core import ResolveInfo
@@ -51,11 +53,11 @@ class CollectionRemoveProducts(BaseMutation):
             cls.call_event(manager.product_updated, product)
 
         if products:
-            channel_ids = models.ProductChannelListing.objects.filter(
-                product__in=products
-            ).values_list("channel_id", flat=True)
             # This will finally recalculate discounted prices for products.
-            cls.call_event(mark_active_catalogue_promotion_rules_as_dirty, channel_ids)
+            cls.call_event(
+                update_active_catalogue_promotion_rules_for_products,
+                [product.id for product in products],
+            )
 
         return CollectionRemoveProducts(
             collection=ChannelContext(node=collection, channel_slug=None)
@@ -3,7 +3,9 @@ from django.core.exceptions import ValidationError
 
 from .....attribute import models as attribute_models
 from .....core.tracing import traced_atomic_transaction
-from .....discount.utils.promotion import mark_active_catalogue_promotion_rules_as_dirty
+from .....discount.utils.promotion import (
+    update_active_catalogue_promotion_rules_for_products,
+)
 from .....permission.enums import ProductPermissions
 from .....product import models
 from ....attribute.utils.attribute_assignment import AttributeAssignmentMixin
@@ -125,10 +127,9 @@ class ProductUpdate(ModelWithExtRefMutation):
     @classmethod
     def _post_save_action(cls, info: ResolveInfo, instance):
         product = models.Product.objects.get(pk=instance.pk)
-        channel_ids = set(
-            product.channel_listings.all().values_list("channel_id", flat=True)
+        cls.call_event(
+            update_active_catalogue_promotion_rules_for_products, [product.pk]
         )
-        cls.call_event(mark_active_catalogue_promotion_rules_as_dirty, channel_ids)
 
         manager = get_plugin_manager_promise(info.context).get()
         cls.call_event(manager.product_updated, product)
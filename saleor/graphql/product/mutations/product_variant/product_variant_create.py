@@ -3,7 +3,9 @@ from django.core.exceptions import ValidationError
 
 from .....attribute import models as attribute_models
 from .....core.tracing import traced_atomic_transaction
-from .....discount.utils.promotion import mark_active_catalogue_promotion_rules_as_dirty
+from .....discount.utils.promotion import (
+    update_active_catalogue_promotion_rules_for_products,
+)
 from .....permission.enums import ProductPermissions
 from .....product import models
 from .....product.error_codes import ProductErrorCode
@@ -263,11 +265,11 @@ class ProductVariantCreate(DeprecatedModelMutation):
 
     @classmethod
     def post_save_action(cls, info: ResolveInfo, instance, cleaned_input):
-        channel_ids = models.ProductChannelListing.objects.filter(
-            product_id=instance.product_id
-        ).values_list("channel_id", flat=True)
         # This will recalculate discounted prices for products.
-        cls.call_event(mark_active_catalogue_promotion_rules_as_dirty, channel_ids)
+        cls.call_event(
+            update_active_catalogue_promotion_rules_for_products,
+            [instance.product_id],
+        )
 
     @classmethod
     def create_variant_stocks(cls, variant, stocks):
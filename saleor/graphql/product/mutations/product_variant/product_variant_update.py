@@ -6,7 +6,9 @@ from django.core.exceptions import ValidationError
 from .....attribute import models as attribute_models
 from .....core.tracing import traced_atomic_transaction
 from .....core.utils.update_mutation_manager import InstanceTracker
-from .....discount.utils.promotion import mark_active_catalogue_promotion_rules_as_dirty
+from .....discount.utils.promotion import (
+    update_active_catalogue_promotion_rules_for_products,
+)
 from .....permission.enums import ProductPermissions
 from .....product import models
 from .....product.error_codes import ProductErrorCode
@@ -279,11 +281,11 @@ class ProductVariantUpdate(DeprecatedModelMutation):
             if metadata_modified:
                 cls.call_event(manager.product_variant_metadata_updated, instance)
 
-            channel_ids = models.ProductChannelListing.objects.filter(
-                product_id=instance.product_id
-            ).values_list("channel_id", flat=True)
             # This will recalculate discounted prices for products.
-            cls.call_event(mark_active_catalogue_promotion_rules_as_dirty, channel_ids)
+            cls.call_event(
+                update_active_catalogue_promotion_rules_for_products,
+                [instance.product_id],
+            )
 
     @classmethod
     def handle_metadata(cls, instance, cleaned_input):
@@ -1,4 +1,5 @@
-from django.db.models import Exists, OuterRef, Sum
+from django.db.models import Exists, OuterRef, QuerySet, Sum
+from promise import Promise
 
 from ...attribute import models as attribute_models
 from ...channel.models import Channel
@@ -7,6 +8,7 @@ from ...order.models import Order
 from ...permission.enums import ProductPermissions
 from ...permission.utils import has_one_of_permissions
 from ...product import models
+from ...product.facets import get_product_facet_counts
 from ...product.models import ALL_PRODUCTS_PERMISSIONS
 from ..attribute.dataloaders.assigned_attributes import (
     AttributeByProductIdAndAttributeSlugLoader,
@@ -16,6 +18,10 @@ from ..attribute.dataloaders.assigned_attributes import (
     AttributesVisibleToCustomerByProductIdAndLimitLoader,
     AttributesVisibleToCustomerByProductVariantIdAndSelectionAndLimitLoader,
 )
+from ..attribute.dataloaders.attributes import (
+    AttributesByAttributeId,
+    AttributeValueByIdLoader,
+)
 from ..attribute.utils.shared import AssignedAttributeData
 from ..core import ResolveInfo
 from ..core.context import (
@@ -372,3 +378,52 @@ def resolve_variant_attribute(root: ChannelContext[models.ProductVariant], info,
         .load((root.node.id, slug))
         .then(with_assigned_attribute_data)
     )
+
+
+def resolve_product_facets(
+    info: ResolveInfo, qs: QuerySet[models.Product], channel_slug: str | None
+):
+    database_connection_name = get_database_connection_name(info.context)
+    counts = get_product_facet_counts(qs.using(database_connection_name))
+    value_ids = [value_id for values in counts.values() for value_id in values]
+
+    def build_facets(data):
+        attributes, values = data
+        value_map = {value.pk: value for value in values if value}
+        facets = []
+        for attribute in sorted(
+            filter(None, attributes),
+            key=lambda attribute: (
+                attribute.storefront_search_position,
+                attribute.slug,
+            ),
+        ):
+            attribute_values = sorted(
+                (
+                    value_map[value_id]
+                    for value_id in counts[attribute.pk]
+                    if value_id in value_map
+                ),
+                key=lambda value: (
+                    value.sort_order is None,
+                    value.sort_order or 0,
+                    value.pk,
+                ),
+            )
+            facets.append(
+                {
+                    "attribute": ChannelContext(attribute, channel_slug),
+                    "values": [
+                        {
+                            "value": ChannelContext(value, channel_slug),
+                            "count": counts[attribute.pk][value.pk],
+                        }
+                        for value in attribute_values
+                    ],
+                }
+            )
+        return facets
+
+    attributes = AttributesByAttributeId(info.context).load_many(list(counts))
+    values = AttributeValueByIdLoader(info.context).load_many(value_ids)
+    return Promise.all([attributes, values]).then(build_facets)
@@ -1,3 +1,5 @@
+from functools import partial
+
 import graphene
 from django.db.models import Exists, OuterRef
 from promise import Promise
@@ -6,7 +8,7 @@ from ...permission.enums import ProductPermissions
 from ...permission.utils import has_one_of_permissions
 from ...product import models
 from ...product.models import ALL_PRODUCTS_PERMISSIONS
-from ...product.search import search_products
+from ...product.search import autocomplete_products, search_products
 from ..channel.dataloaders.by_self import ChannelBySlugLoader
 from ..channel.utils import get_default_channel_slug_or_graphql_error
 from ..core import ResolveInfo
@@ -15,6 +17,7 @@ from ..core.context import ChannelContext, ChannelQsContext
 from ..core.descriptions import (
     ADDED_IN_321,
     ADDED_IN_322,
+    ADDED_IN_323,
     DEFAULT_DEPRECATION_REASON,
     DEPRECATED_IN_3X_INPUT,
 )
@@ -118,6 +121,7 @@ from .resolvers import (
     resolve_digital_content_by_id,
     resolve_digital_contents,
     resolve_product,
+    resolve_product_facets,
     resolve_product_type_by_id,
     resolve_product_types,
     resolve_product_variants,
@@ -148,6 +152,9 @@ from .types import (
 )
 from .utils import check_for_sorting_by_rank
 
+PRODUCT_SUGGESTIONS_DEFAULT_LIMIT = 10
+PRODUCT_SUGGESTIONS_MAX_LIMIT = 20
+
 
 class ProductQueries(graphene.ObjectType):
     digital_content = PermissionsField(
@@ -279,6 +286,33 @@ class ProductQueries(graphene.ObjectType):
         ),
         doc_category=DOC_CATEGORY_PRODUCTS,
     )
+    product_suggestions = BaseField(
+        NonNullList(Product),
+        search=graphene.String(
+            required=True,
+            description=(
+                "Fragment of a product name, variant SKU or attribute value, at "
+                "least 3 characters long."
+            ),
+        ),
+        channel=graphene.String(
+            description="Slug of a channel for which the data should be returned."
+        ),
+        limit=graphene.Int(
+            description=(
+                "Maximum number of suggestions to return, at most "
+                f"{PRODUCT_SUGGESTIONS_MAX_LIMIT}. Defaults to "
+                f"{PRODUCT_SUGGESTIONS_DEFAULT_LIMIT}."
+            )
+        ),
+        description=(
+            "Autocomplete suggestions of products for a partially typed search. "
+            "Requires one of the following permissions to include the unpublished "
+            f"items: {', '.join([p.name for p in ALL_PRODUCTS_PERMISSIONS])}."
+            + ADDED_IN_323
+        ),
+        doc_category=DOC_CATEGORY_PRODUCTS,
+    )
     product_type = BaseField(
         ProductType,
         id=graphene.Argument(
@@ -544,7 +578,13 @@ class ProductQueries(graphene.ObjectType):
             qs = filter_connection_queryset(
                 qs, kwargs, allow_replica=info.context.allow_replica
             )
-            return create_connection_slice(qs, info, kwargs, ProductCountableConnection)
+            connection = create_connection_slice(
+                qs, info, kwargs, ProductCountableConnection
+            )
+            connection.facets = partial(
+                resolve_product_facets, qs=qs.qs, channel_slug=qs.channel_slug
+            )
+            return connection
 
         if channel:
             return (
@@ -554,6 +594,40 @@ class ProductQueries(graphene.ObjectType):
             )
         return _resolve_products(None)
 
+    @staticmethod
+    @traced_resolver
+    def resolve_product_suggestions(
+        _root, info: ResolveInfo, *, search, channel=None, limit=None
+    ):
+        if limit is None:
+            limit = PRODUCT_SUGGESTIONS_DEFAULT_LIMIT
+        limit = max(0, min(limit, PRODUCT_SUGGESTIONS_MAX_LIMIT))
+        requestor = get_user_or_app_from_context(info.context)
+        has_required_permissions = has_one_of_permissions(
+            requestor, ALL_PRODUCTS_PERMISSIONS
+        )
+        limited_channel_access = False if channel is None else True
+        if channel is None and not has_required_permissions:
+            channel = get_default_channel_slug_or_graphql_error(
+                allow_replica=info.context.allow_replica
+            )
+
+        def _resolve_product_suggestions(channel_obj):
+            qs = resolve_products(info, requestor, channel_obj, limited_channel_access)
+            products = autocomplete_products(qs.qs, search)[:limit]
+            return [
+                ChannelContext(node=product, channel_slug=channel)
+                for product in products
+            ]
+
+        if channel:
+            return (
+                ChannelBySlugLoader(info.context)
+                .load(str(channel))
+                .then(_resolve_product_suggestions)
+            )
+        return _resolve_product_suggestions(None)
+
     @staticmethod
     def resolve_product_type(_root, info: ResolveInfo, *, id):
         _, id = from_global_id_or_error(id, ProductType)
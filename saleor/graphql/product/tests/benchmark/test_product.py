@@ -322,7 +322,7 @@ def test_retrieve_channel_listings(
 
     variables = {"channel": channel_USD.slug}
 
-    expected_db_queries = 14
+    expected_db_queries = 15
     with django_assert_num_queries(expected_db_queries):
         get_graphql_content(
             staff_api_client.post_graphql(
@@ -352,6 +352,8 @@ def test_retrieve_channel_listings(
             ),
         ]
     )
+    # Channels, tax and plugin configurations are cached by the previous request.
+    expected_db_queries = 13
     with django_assert_num_queries(expected_db_queries):
         get_graphql_content(
             staff_api_client.post_graphql(
@@ -804,7 +806,7 @@ def test_products_for_federation_query_count(
         ],
     }
 
-    with django_assert_num_queries(3):
+    with django_assert_num_queries(2):
         response = api_client.post_graphql(query, variables)
         content = get_graphql_content(response)
         assert len(content["data"]["_entities"]) == 2
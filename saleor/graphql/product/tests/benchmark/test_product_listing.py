@@ -0,0 +1,178 @@
+from contextlib import ExitStack
+
+import pytest
+from django.conf import settings
+from django.db import connections
+from django.test.utils import CaptureQueriesContext
+
+from .....channel.models import Channel
+from .....product.search import update_products_search_vector
+from .....product.tests.fixtures.benchmark import PRODUCT_COUNT_IN_BENCHMARKS
+from .....site.models import SiteSettings
+from .....tax.models import TaxConfiguration, TaxConfigurationPerCountry
+from ....tests.utils import get_graphql_content
+
+PRODUCT_LISTING_QUERY = """
+query ProductListing($channel: String) {
+  products(first: 20, channel: $channel) {
+    edges {
+      node {
+        id
+        name
+        slug
+        isAvailableForPurchase
+        thumbnail {
+          url
+        }
+        category {
+          name
+        }
+        pricing {
+          onSale
+          discount {
+            gross {
+              amount
+            }
+          }
+          priceRange {
+            start {
+              gross {
+                amount
+                currency
+              }
+            }
+            stop {
+              gross {
+                amount
+                currency
+              }
+            }
+          }
+          priceRangeUndiscounted {
+            start {
+              gross {
+                amount
+              }
+            }
+            stop {
+              gross {
+                amount
+              }
+            }
+          }
+        }
+        variants {
+          id
+          name
+          quantityAvailable
+          pricing {
+            onSale
+            price {
+              gross {
+                amount
+              }
+            }
+            priceUndiscounted {
+              gross {
+                amount
+              }
+            }
+          }
+        }
+      }
+    }
+  }
+}
+"""
+
+
+@pytest.mark.django_db
+@pytest.mark.count_queries(autouse=False)
+def test_product_listing_with_pricing(
+    api_client, products_for_benchmarks, channel_USD, count_queries
+):
+    # given
+    variables = {"channel": channel_USD.slug}
+
+    # when
+    content = get_graphql_content(
+        api_client.post_graphql(PRODUCT_LISTING_QUERY, variables)
+    )
+
+    # then
+    products = content["data"]["products"]["edges"]
+    assert len(products) == PRODUCT_COUNT_IN_BENCHMARKS
+    assert all(product["node"]["pricing"]["priceRange"] for product in products)
+
+
+@pytest.mark.django_db
+@pytest.mark.count_queries(autouse=False)
+def test_product_listing_reads_configuration_from_cache(
+    api_client, products_for_benchmarks, channel_USD, count_queries
+):
+    # given
+    variables = {"channel": channel_USD.slug}
+    get_graphql_content(api_client.post_graphql(PRODUCT_LISTING_QUERY, variables))
+
+    # when
+    with ExitStack() as stack:
+        contexts = [
+            stack.enter_context(CaptureQueriesContext(connections[alias]))
+            for alias in (
+                settings.DATABASE_CONNECTION_DEFAULT_NAME,
+                settings.DATABASE_CONNECTION_REPLICA_NAME,
+            )
+        ]
+        response = api_client.post_graphql(PRODUCT_LISTING_QUERY, variables)
+
+    # then
+    content = get_graphql_content(response)
+    assert len(content["data"]["products"]["edges"]) == PRODUCT_COUNT_IN_BENCHMARKS
+    config_tables = {
+        f'SELECT "{model._meta.db_table}"."id"'
+        for model in (
+            Channel,
+            SiteSettings,
+            TaxConfiguration,
+            TaxConfigurationPerCountry,
+        )
+    }
+    config_queries = [
+        query
+        for ctx in contexts
+        for query in ctx.captured_queries
+        if any(table in query["sql"] for table in config_tables)
+    ]
+    assert config_queries == []
+
+
+PRODUCT_SUGGESTIONS_QUERY = """
+query ProductSuggestions($search: String!, $channel: String) {
+  productSuggestions(search: $search, channel: $channel, limit: 10) {
+    id
+    name
+    slug
+    thumbnail {
+      url
+    }
+  }
+}
+"""
+
+
+@pytest.mark.django_db
+@pytest.mark.count_queries(autouse=False)
+def test_product_suggestions(
+    api_client, products_for_benchmarks, channel_USD, count_queries
+):
+    # given
+    update_products_search_vector([product.id for product in products_for_benchmarks])
+    variables = {"search": "benchm", "channel": channel_USD.slug}
+
+    # when
+    content = get_graphql_content(
+        api_client.post_graphql(PRODUCT_SUGGESTIONS_QUERY, variables)
+    )
+
+    # then
+    assert len(content["data"]["productSuggestions"]) == 10
@@ -0,0 +1,107 @@
+import graphene
+
+from .....product.models import Product, ProductChannelListing
+from .....product.search import update_products_search_vector
+from ....tests.utils import get_graphql_content
+
+QUERY_PRODUCT_SUGGESTIONS = """
+    query ($search: String!, $channel: String, $limit: Int) {
+        productSuggestions(search: $search, channel: $channel, limit: $limit) {
+            id
+            name
+        }
+    }
+"""
+
+
+def _set_product_names(products, names):
+    for product, name in zip(products, names, strict=True):
+        product.name = name
+    Product.objects.bulk_update(products, ["name"])
+    update_products_search_vector([product.id for product in products])
+
+
+def test_product_suggestions(api_client, product_list, channel_USD):
+    # given
+    _set_product_names(product_list, ["Running sneakers", "Sneakers", "Boots"])
+    variables = {"search": "sneak", "channel": channel_USD.slug}
+
+    # when
+    response = api_client.post_graphql(QUERY_PRODUCT_SUGGESTIONS, variables)
+
+    # then
+    content = get_graphql_content(response)
+    assert content["data"]["productSuggestions"] == [
+        {
+            "id": graphene.Node.to_global_id("Product", product.pk),
+            "name": product.name,
+        }
+        for product in [product_list[1], product_list[0]]
+    ]
+
+
+def test_product_suggestions_limit(api_client, product_list, channel_USD):
+    # given
+    _set_product_names(product_list, ["Sneakers 1", "Sneakers 2", "Sneakers 3"])
+    variables = {"search": "sneak", "channel": channel_USD.slug, "limit": 2}
+
+    # when
+    response = api_client.post_graphql(QUERY_PRODUCT_SUGGESTIONS, variables)
+
+    # then
+    content = get_graphql_content(response)
+    assert len(content["data"]["productSuggestions"]) == 2
+
+
+def test_product_suggestions_query_cost_multiplied_by_limit(
+    api_client, product_list, channel_USD
+):
+    # given
+    variables = {"search": "sneak", "channel": channel_USD.slug, "limit": 5}
+
+    # when
+    response = api_client.post_graphql(QUERY_PRODUCT_SUGGESTIONS, variables)
+
+    # then
+    content = get_graphql_content(response)
+    assert content["extensions"]["cost"]["requestedQueryCost"] == 5
+
+
+def test_product_suggestions_skip_not_published_products(
+    api_client, product_list, channel_USD
+):
+    # given
+    _set_product_names(product_list, ["Sneakers 1", "Sneakers 2", "Sneakers 3"])
+    ProductChannelListing.objects.filter(
+        product=product_list[0], channel=channel_USD
+    ).update(is_published=False)
+    variables = {"search": "sneak", "channel": channel_USD.slug}
+
+    # when
+    response = api_client.post_graphql(QUERY_PRODUCT_SUGGESTIONS, variables)
+
+    # then
+    content = get_graphql_content(response)
+    assert {product["name"] for product in content["data"]["productSuggestions"]} == {
+        "Sneakers 2",
+        "Sneakers 3",
+    }
+
+
+def test_product_suggestions_not_published_as_staff(
+    staff_api_client, product_list, channel_USD, permission_manage_products
+):
+    # given
+    _set_product_names(product_list, ["Sneakers 1", "Sneakers 2", "Sneakers 3"])
+    ProductChannelListing.objects.filter(
+        product=product_list[0], channel=channel_USD
+    ).update(is_published=False)
+    staff_api_client.user.user_permissions.add(permission_manage_products)
+    variables = {"search": "sneak", "channel": channel_USD.slug}
+
+    # when
+    response = staff_api_client.post_graphql(QUERY_PRODUCT_SUGGESTIONS, variables)
+
+    # then
+    content = get_graphql_content(response)
+    assert len(content["data"]["productSuggestions"]) == 3
@@ -3,10 +3,13 @@ from decimal import Decimal
 
 import graphene
 import pytest
+from django.core.cache import cache
 from django.utils.dateparse import parse_datetime
 
+from .....attribute.models import AssignedProductAttributeValue
 from .....attribute.tests.model_helpers import get_product_attributes
 from .....core.postgres import FlatConcatSearchVector
+from .....product.facets import invalidate_product_facet_index
 from .....product.models import (
     Product,
     ProductChannelListing,
@@ -1419,3 +1422,56 @@ def test_search_product_sort_by_attribute_returns_correct_cursor(
     # First field stores the flag to determine if product has assigned attribute values
     # Second is the list of attribute values as string
     assert ["0", attr_value.name, product.name] == cursor_data
+
+
+QUERY_PRODUCTS_FACETS = """
+    query ($channel: String, $filter: ProductFilterInput) {
+        products(first: 1, channel: $channel, filter: $filter) {
+            facets {
+                attribute {
+                    slug
+                }
+                values {
+                    value {
+                        slug
+                    }
+                    count
+                }
+            }
+        }
+    }
+"""
+
+
+def test_products_facets(api_client, product_list, color_attribute, channel_USD):
+    # given
+    cache.clear()
+    invalidate_product_facet_index()
+    red, blue = color_attribute.values.all()
+    AssignedProductAttributeValue.objects.filter(product__in=product_list).delete()
+    for product, value in zip(product_list, [red, red, blue], strict=True):
+        AssignedProductAttributeValue.objects.create(product=product, value=value)
+    variables = {
+        "channel": channel_USD.slug,
+        "filter": {
+            "ids": [
+                graphene.Node.to_global_id("Product", product.pk)
+                for product in product_list[1:]
+            ]
+        },
+    }
+
+    # when
+    response = api_client.post_graphql(QUERY_PRODUCTS_FACETS, variables)
+
+    # then
+    content = get_graphql_content(response)
+    assert content["data"]["products"]["facets"] == [
+        {
+            "attribute": {"slug": color_attribute.slug},
+            "values": [
+                {"value": {"slug": red.slug}, "count": 1},
+                {"value": {"slug": blue.slug}, "count": 1},
+            ],
+        }
+    ]
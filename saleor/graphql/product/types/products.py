@@ -48,6 +48,7 @@ from ...attribute.types import (
     AssignedVariantAttribute,
     Attribute,
     AttributeCountableConnection,
+    AttributeValue,
     ObjectWithAttributes,
     SelectedAttribute,
 )
@@ -67,6 +68,7 @@ from ...core.context import (
 from ...core.descriptions import (
     ADDED_IN_321,
     ADDED_IN_322,
+    ADDED_IN_323,
     DEPRECATED_IN_3X_INPUT,
     RICH_CONTENT,
 )
@@ -1724,11 +1726,60 @@ class Product(ChannelContextType[models.Product]):
         return [products.get(root_id) for root_id in roots_ids]
 
 
+class ProductAttributeFacetValue(BaseObjectType):
+    value = graphene.Field(
+        AttributeValue, required=True, description="The attribute value."
+    )
+    count = graphene.Int(
+        required=True, description="Number of the products with the value."
+    )
+
+    class Meta:
+        doc_category = DOC_CATEGORY_PRODUCTS
+        description = (
+            "Number of the filtered products with the attribute value." + ADDED_IN_323
+        )
+
+
+class ProductAttributeFacet(BaseObjectType):
+    attribute = graphene.Field(
+        Attribute, required=True, description="The attribute of the values."
+    )
+    values = NonNullList(
+        ProductAttributeFacetValue,
+        required=True,
+        description="Values of the attribute which the filtered products have.",
+    )
+
+    class Meta:
+        doc_category = DOC_CATEGORY_PRODUCTS
+        description = (
+            "Numbers of the filtered products with the values of an attribute."
+            + ADDED_IN_323
+        )
+
+
 class ProductCountableConnection(CountableConnection):
+    facets = NonNullList(
+        ProductAttributeFacet,
+        description=(
+            "Numbers of the products matching the filters, for each value of the "
+            "attributes filterable in the storefront. Returned only by the "
+            "`products` query." + ADDED_IN_323
+        ),
+    )
+
     class Meta:
         doc_category = DOC_CATEGORY_PRODUCTS
         node = Product
 
+    @staticmethod
+    def resolve_facets(root, info):
+        facets = getattr(root, "facets", None)
+        if callable(facets):
+            return facets(info)
+        return facets
+
 
 @federated_entity("id")
 class ProductType(ModelObjectType[models.ProductType]):
@@ -51,10 +51,12 @@ This query will have cost of 200 (100 x 2 for each product):
 { products(first: 100) { complexity } }
 """
 
+from typing import Any
+
 # GraphQL operations that fail before cost can be calculated have a fixed cost of 1.
 QUERY_COST_FAILED_OPERATION = 1
 
-COST_MAP = {
+COST_MAP: dict[str, dict[str, Any]] = {
     "Query": {
         "address": {"complexity": 1},
         "addressValidationRules": {"complexity": 1},
@@ -106,6 +108,7 @@ COST_MAP = {
         "plugins": {"complexity": 1, "multipliers": ["first", "last"]},
         "product": {"complexity": 1},
         "products": {"complexity": 1, "multipliers": ["first", "last"]},
+        "productSuggestions": {"complexity": 1, "multipliers": ["limit"]},
         "productType": {"complexity": 1},
         "productTypes": {"complexity": 1, "multipliers": ["first", "last"]},
         "productVariant": {"complexity": 1},
@@ -353,6 +356,9 @@ COST_MAP = {
         "channel": {"complexity": 1},
         "pricing": {"complexity": 1},
     },
+    "ProductCountableConnection": {
+        "facets": {"complexity": 1},
+    },
     "ProductImage": {
         "url": {"complexity": 1},
     },
@@ -2,7 +2,9 @@ import graphene
 from django.core.exceptions import ValidationError
 
 from ....channel import models as channel_models
+from ....core.config_cache import handle_config_change
 from ....permission.enums import OrderPermissions
+from ....plugins.cache import handle_plugin_configs_change
 from ....site.error_codes import OrderSettingsErrorCode
 from ...channel.types import OrderSettings
 from ...core import ResolveInfo
@@ -74,6 +76,9 @@ class OrderSettingsUpdate(BaseMutation):
 
         if update_fields:
             channel_models.Channel.objects.update(**update_fields)
+            # bulk update doesn't send the signals invalidating the caches
+            handle_config_change()
+            handle_plugin_configs_change()
 
         channel.refresh_from_db()
 
@@ -1,3 +1,4 @@
+from .....plugins.cache import get_channel_plugin_configs
 from ....tests.utils import assert_no_permission, get_graphql_content
 
 ORDER_SETTINGS_UPDATE_MUTATION = """
@@ -43,6 +44,28 @@ def test_order_settings_update_by_staff(
     assert channel_USD.automatically_fulfill_non_shippable_gift_card is False
 
 
+def test_order_settings_update_invalidates_plugin_configs_cache(
+    staff_api_client, permission_group_manage_orders, channel_USD
+):
+    # given
+    permission_group_manage_orders.user_set.add(staff_api_client.user)
+    channel, _ = get_channel_plugin_configs(channel_USD.slug)
+    assert channel
+    assert channel.automatically_confirm_all_new_orders is True
+
+    # when
+    response = staff_api_client.post_graphql(
+        ORDER_SETTINGS_UPDATE_MUTATION,
+        {"confirmOrders": False, "fulfillGiftCards": False},
+    )
+    get_graphql_content(response)
+
+    # then
+    channel, _ = get_channel_plugin_configs(channel_USD.slug)
+    assert channel
+    assert channel.automatically_confirm_all_new_orders is False
+
+
 def test_order_settings_update_by_staff_no_channel_access(
     staff_api_client,
     permission_group_all_perms_channel_USD_only,
@@ -9,6 +9,7 @@ from django.db.models import Q
 from django.http.request import split_domain_port
 from promise import Promise
 
+from ...site.cache import get_sites_by_id
 from ..core.dataloaders import DataLoader
 
 
@@ -16,7 +17,7 @@ class SiteByIdLoader(DataLoader[int, Site]):
     context_key = "site_by_id"
 
     def batch_load(self, keys):
-        sites_mapped = Site.objects.using(self.database_connection_name).in_bulk(keys)
+        sites_mapped = get_sites_by_id(keys, self.database_connection_name)
         return [sites_mapped.get(site_id) for site_id in keys]
 
 
@@ -4,11 +4,14 @@ from decimal import Decimal
 from django.db.models import Exists, OuterRef
 from promise import Promise
 
+from ...tax.cache import (
+    get_tax_configurations_by_channel_id,
+    get_tax_configurations_per_country,
+)
 from ...tax.models import (
     TaxClass,
     TaxClassCountryRate,
     TaxConfiguration,
-    TaxConfigurationPerCountry,
 )
 from ..core.dataloaders import DataLoader
 from ..product.dataloaders import (
@@ -23,24 +26,19 @@ class TaxConfigurationPerCountryByTaxConfigurationIDLoader(DataLoader):
     context_key = "tax_configuration_per_country_by_tax_configuration_id"
 
     def batch_load(self, keys):
-        tax_configs_per_country = TaxConfigurationPerCountry.objects.using(
-            self.database_connection_name
-        ).filter(tax_configuration_id__in=keys)
-
-        one_to_many = defaultdict(list)
-        for obj in tax_configs_per_country:
-            one_to_many[obj.tax_configuration_id].append(obj)
-
-        return [one_to_many[key] for key in keys]
+        tax_configs_per_country = get_tax_configurations_per_country(
+            keys, self.database_connection_name
+        )
+        return [tax_configs_per_country[key] for key in keys]
 
 
 class TaxConfigurationByChannelId(DataLoader[int, TaxConfiguration]):
     context_key = "tax_configuration_by_channel_id"
 
     def batch_load(self, keys):
-        tax_configs = TaxConfiguration.objects.using(
-            self.database_connection_name
-        ).in_bulk(keys, field_name="channel_id")
+        tax_configs = get_tax_configurations_by_channel_id(
+            keys, self.database_connection_name
+        )
         return [tax_configs[key] for key in keys]
 
 
@@ -0,0 +1,302 @@
+import json
+
+import pytest
+from django.core.management import CommandError, call_command
+from django.test import override_settings
+
+from ...core.models import PersistedQuery
+from ..api import schema
+from ..persisted_queries import (
+    PersistedQueryStore,
+    generate_persisted_query_hash,
+    persisted_queries,
+    register_persisted_query,
+)
+from .utils import get_graphql_content, get_graphql_content_from_response
+
+SHOP_QUERY = """
+query Shop {
+  shop {
+    name
+  }
+}
+"""
+
+SHOP_QUERY_HASH = generate_persisted_query_hash(SHOP_QUERY)
+
+
+@pytest.fixture(autouse=True)
+def clear_persisted_queries():
+    persisted_queries.clear()
+    yield
+    persisted_queries.clear()
+
+
+def _apq_extensions(query_hash):
+    return {"persistedQuery": {"version": 1, "sha256Hash": query_hash}}
+
+
+def test_register_persisted_query(db):
+    # when
+    query_hash = register_persisted_query(schema, SHOP_QUERY)
+
+    # then
+    assert query_hash == SHOP_QUERY_HASH
+    persisted_query = PersistedQuery.objects.get()
+    assert persisted_query.hash == SHOP_QUERY_HASH
+    assert persisted_query.query == SHOP_QUERY
+
+
+def test_register_persisted_query_is_idempotent(db):
+    # when
+    register_persisted_query(schema, SHOP_QUERY)
+    register_persisted_query(schema, SHOP_QUERY)
+
+    # then
+    assert PersistedQuery.objects.count() == 1
+
+
+def test_persisted_query_by_id(api_client, site_settings):
+    # given
+    register_persisted_query(schema, SHOP_QUERY)
+
+    # when
+    response = api_client.post({"id": SHOP_QUERY_HASH})
+
+    # then
+    content = get_graphql_content(response)
+    assert content["data"]["shop"]["name"] == site_settings.site.name
+    assert SHOP_QUERY_HASH in persisted_queries
+
+
+def test_persisted_query_by_apq_hash(api_client, site_settings):
+    # given
+    register_persisted_query(schema, SHOP_QUERY)
+
+    # when
+    response = api_client.post({"extensions": _apq_extensions(SHOP_QUERY_HASH)})
+
+    # then
+    content = get_graphql_content(response)
+    assert content["data"]["shop"]["name"] == site_settings.site.name
+
+
+def test_persisted_query_document_loaded_once_per_process(api_client, site_settings):
+    # given
+    register_persisted_query(schema, SHOP_QUERY)
+    api_client.post({"id": SHOP_QUERY_HASH})
+    document = persisted_queries.documents[SHOP_QUERY_HASH]
+
+    # when
+    api_client.post({"id": SHOP_QUERY_HASH})
+
+    # then
+    assert persisted_queries.documents[SHOP_QUERY_HASH] is document
+    assert document.cost_plan
+
+
+def test_persisted_query_not_found(api_client, db):
+    # when
+    response = api_client.post({"extensions": _apq_extensions(SHOP_QUERY_HASH)})
+
+    # then
+    content = get_graphql_content_from_response(response)
+    assert content["errors"][0]["message"] == "PersistedQueryNotFound"
+    assert (
+        content["errors"][0]["extensions"]["exception"]["code"]
+        == "PersistedQueryNotFound"
+    )
+
+
+def test_persisted_query_not_supported_version(api_client, db):
+    # given
+    extensions = {"persistedQuery": {"version": 2, "sha256Hash": SHOP_QUERY_HASH}}
+
+    # when
+    response = api_client.post({"extensions": extensions})
+
+    # then
+    content = get_graphql_content_from_response(response)
+    assert content["errors"][0]["message"] == "PersistedQueryNotSupported"
+
+
+def test_apq_registers_query_sent_with_hash(api_client, site_settings):
+    # when
+    response = api_client.post(
+        {"query": SHOP_QUERY, "extensions": _apq_extensions(SHOP_QUERY_HASH)}
+    )
+
+    # then
+    content = get_graphql_content(response)
+    assert content["data"]["shop"]["name"] == site_settings.site.name
+    assert SHOP_QUERY_HASH in persisted_queries.apq_documents
+    assert SHOP_QUERY_HASH not in persisted_queries.documents
+    assert not PersistedQuery.objects.exists()
+
+
+def test_apq_registered_query_requested_by_hash(api_client, site_settings):
+    # given
+    api_client.post(
+        {"query": SHOP_QUERY, "extensions": _apq_extensions(SHOP_QUERY_HASH)}
+    )
+
+    # when
+    response = api_client.post({"extensions": _apq_extensions(SHOP_QUERY_HASH)})
+
+    # then
+    content = get_graphql_content(response)
+    assert content["data"]["shop"]["name"] == site_settings.site.name
+
+
+def test_apq_registered_queries_cache_is_bounded(db):
+    # given
+    store = PersistedQueryStore(apq_cache_size=1)
+    other_query = "query ShopName { shop { name } }"
+    other_query_hash = generate_persisted_query_hash(other_query)
+    store.add_apq(schema, SHOP_QUERY_HASH, SHOP_QUERY)
+
+    # when
+    store.add_apq(schema, other_query_hash, other_query)
+
+    # then
+    assert list(store.apq_documents) == [other_query_hash]
+
+
+def test_apq_hash_mismatch(api_client, db):
+    # when
+    response = api_client.post(
+        {"query": SHOP_QUERY, "extensions": _apq_extensions("invalid-hash")}
+    )
+
+    # then
+    content = get_graphql_content_from_response(response)
+    assert content["errors"][0]["message"] == (
+        "Provided sha256Hash does not match the query."
+    )
+    assert not PersistedQuery.objects.exists()
+
+
+def test_apq_does_not_register_invalid_query(api_client, db):
+    # given
+    query = "query { notExistingField }"
+
+    # when
+    response = api_client.post(
+        {
+            "query": query,
+            "extensions": _apq_extensions(generate_persisted_query_hash(query)),
+        }
+    )
+
+    # then
+    content = get_graphql_content_from_response(response)
+    assert "notExistingField" in content["errors"][0]["message"]
+    assert not persisted_queries.apq_documents
+
+
+@override_settings(GRAPHQL_PERSISTED_QUERIES_ALLOWLIST_ONLY=True)
+def test_allowlist_only_rejects_ad_hoc_query(api_client, db):
+    # when
+    response = api_client.post({"query": SHOP_QUERY})
+
+    # then
+    content = get_graphql_content_from_response(response)
+    assert content["errors"][0]["message"] == "Only persisted queries are allowed."
+
+
+@override_settings(GRAPHQL_PERSISTED_QUERIES_ALLOWLIST_ONLY=True)
+def test_allowlist_only_rejects_apq_registration(api_client, db):
+    # when
+    response = api_client.post(
+        {"query": SHOP_QUERY, "extensions": _apq_extensions(SHOP_QUERY_HASH)}
+    )
+
+    # then
+    content = get_graphql_content_from_response(response)
+    assert content["errors"][0]["message"] == "Only persisted queries are allowed."
+    assert not persisted_queries
+
+
+@override_settings(GRAPHQL_PERSISTED_QUERIES_ALLOWLIST_ONLY=True)
+def test_allowlist_only_accepts_persisted_query(api_client, site_settings):
+    # given
+    register_persisted_query(schema, SHOP_QUERY)
+
+    # when
+    response = api_client.post({"id": SHOP_QUERY_HASH})
+
+    # then
+    content = get_graphql_content(response)
+    assert content["data"]["shop"]["name"] == site_settings.site.name
+
+
+@override_settings(GRAPHQL_PERSISTED_QUERIES_ALLOWLIST_ONLY=True)
+def test_allowlist_only_accepts_ad_hoc_query_from_staff(
+    staff_api_client, site_settings
+):
+    # when
+    response = staff_api_client.post_graphql(SHOP_QUERY)
+
+    # then
+    content = get_graphql_content(response)
+    assert content["data"]["shop"]["name"] == site_settings.site.name
+
+
+@override_settings(GRAPHQL_PERSISTED_QUERIES_ALLOWLIST_ONLY=True)
+def test_allowlist_only_accepts_ad_hoc_query_from_app(app_api_client, site_settings):
+    # when
+    response = app_api_client.post_graphql(SHOP_QUERY)
+
+    # then
+    content = get_graphql_content(response)
+    assert content["data"]["shop"]["name"] == site_settings.site.name
+
+
+def test_register_persisted_queries_command_graphql_file(db, tmp_path):
+    # given
+    path = tmp_path / "shop.graphql"
+    path.write_text(SHOP_QUERY)
+
+    # when
+    call_command("register_persisted_queries", str(path))
+
+    # then
+    assert PersistedQuery.objects.get().hash == SHOP_QUERY_HASH
+
+
+def test_register_persisted_queries_command_apollo_manifest(db, tmp_path):
+    # given
+    path = tmp_path / "manifest.json"
+    path.write_text(
+        json.dumps(
+            {
+                "format": "apollo-persisted-query-manifest",
+                "version": 1,
+                "operations": [
+                    {
+                        "id": SHOP_QUERY_HASH,
+                        "name": "Shop",
+                        "type": "query",
+                        "body": SHOP_QUERY,
+                    }
+                ],
+            }
+        )
+    )
+
+    # when
+    call_command("register_persisted_queries", str(path))
+
+    # then
+    assert PersistedQuery.objects.get().hash == SHOP_QUERY_HASH
+
+
+def test_register_persisted_queries_command_invalid_query(db, tmp_path):
+    # given
+    path = tmp_path / "invalid.graphql"
+    path.write_text("query { notExistingField }")
+
+    # when & then
+    with pytest.raises(CommandError):
+        call_command("register_persisted_queries", str(path))
+    assert not PersistedQuery.objects.exists()
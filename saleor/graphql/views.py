@@ -33,6 +33,10 @@ from ..core.telemetry import Scope, SpanKind, saleor_attributes, tracer
 from ..webhook import observability
 from .api import API_PATH, schema
 from .context import clear_context, get_context_value
+from .core.total_count import (
+    is_exact_total_count_requested,
+    set_total_counts_on_result,
+)
 from .core.validators.query_cost import validate_query_cost
 from .error import clear_errors
 from .metrics import (
@@ -42,6 +46,12 @@ from .metrics import (
     record_request_count,
     record_request_duration,
 )
+from .persisted_queries import (
+    PersistedQueryNotAllowed,
+    get_persisted_document,
+    get_persisted_query_hash,
+    is_ad_hoc_query_allowed,
+)
 from .query_cost_map import COST_MAP, QUERY_COST_FAILED_OPERATION
 from .utils import (
     format_error,
@@ -267,6 +277,28 @@ class GraphQLView(View):
         except (ValueError, GraphQLSyntaxError) as e:
             return None, ExecutionResult(errors=[e], invalid=True)
 
+    def get_document(
+        self, request: HttpRequest, data: dict, query: str | None
+    ) -> tuple[GraphQLDocument | None, ExecutionResult | None]:
+        """Return the gql document of a persisted or an ad-hoc query.
+
+        Persisted queries are requested by their hash, either as `id` or in
+        the `persistedQuery` extension. Their documents are kept in a
+        per-process store, outside the LRU cache of the GraphQL backend.
+        """
+        try:
+            query_hash = get_persisted_query_hash(data)
+            if query_hash:
+                return (
+                    get_persisted_document(self.schema, request, query, query_hash),
+                    None,
+                )
+            if not is_ad_hoc_query_allowed(request):
+                raise PersistedQueryNotAllowed()
+        except (ValueError, GraphQLError) as e:
+            return None, ExecutionResult(errors=[e], invalid=True)
+        return self.parse_query(query)
+
     def execute_graphql_request(self, request: HttpRequest, data: dict):
         with (
             tracer.start_as_current_span(
@@ -278,7 +310,7 @@ class GraphQLView(View):
             span.set_attribute(saleor_attributes.COMPONENT, "graphql")
 
             query, variables, operation_name = self.get_graphql_params(request, data)
-            document, error = self.parse_query(query)
+            document, error = self.get_document(request, data, query)
 
             with observability.report_gql_operation() as operation:
                 operation.query = document
@@ -386,6 +418,7 @@ class GraphQLView(View):
                 # executor is not a valid argument in all backends
                 extra_options["executor"] = self.executor
 
+            setattr(request, "exact_total_count", is_exact_total_count_requested(data))
             context = get_context_value(request)
             if app := getattr(request, "app", None):
                 span.set_attribute(saleor_attributes.SALEOR_APP_ID, app.id)
@@ -431,6 +464,7 @@ class GraphQLView(View):
                 )
                 if error_type:
                     query_duration_attrs[error_attributes.ERROR_TYPE] = error_type
+                set_total_counts_on_result(response, context)
                 return set_query_cost_on_result(response, query_cost)
             except Exception as e:
                 span.set_status(status=StatusCode.ERROR, description=str(e))
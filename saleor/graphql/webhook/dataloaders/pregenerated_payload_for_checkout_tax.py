@@ -67,9 +67,7 @@ class PregeneratedCheckoutTaxPayloadsByCheckoutTokenLoader(DataLoader):
             promises = []
             for checkout_info in checkouts_info:
                 tax_configuration, country_tax_configuration = (
-                    get_tax_configuration_for_checkout(
-                        checkout_info, self.database_connection_name
-                    )
+                    get_tax_configuration_for_checkout(checkout_info)
                 )
                 tax_strategy = get_tax_calculation_strategy(
                     tax_configuration, country_tax_configuration
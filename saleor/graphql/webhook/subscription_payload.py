@@ -1,7 +1,7 @@
 import datetime
 import logging
 from collections.abc import Iterable
-from typing import Any
+from typing import Any, cast
 
 from django.conf import settings
 from django.db import models
@@ -9,6 +9,7 @@ from django.utils import timezone
 from django.utils.functional import SimpleLazyObject
 from graphql import get_default_backend, parse
 from graphql.error import GraphQLError
+from graphql.language.printer import print_ast
 from promise import Promise
 
 from ...account.models import User
@@ -17,7 +18,6 @@ from ...core.exceptions import PermissionDenied
 from ...core.utils import get_domain
 from ...webhook.models import Webhook
 from ..core import SaleorContext
-from ..core.dataloaders import DataLoader
 from ..utils import format_error
 
 logger = logging.getLogger(__name__)
@@ -65,17 +65,18 @@ def get_event_payload(event):
     return event
 
 
+def _get_event_payload_from_data(data):
+    if "event" in data or not data:
+        return data.get("event") or {}
+    return {"data": data}
+
+
 def _process_payload_instance(payload_instance):
     """Process a payload instance to extract data."""
     for payload_key in payload_instance.data:
         extracted_payload = get_event_payload(payload_instance.data.get(payload_key))
         payload_instance.data[payload_key] = extracted_payload
-    if "event" in payload_instance.data or not payload_instance.data:
-        event_payload = payload_instance.data.get("event") or {}
-    else:
-        event_payload = {"data": payload_instance.data}
-
-    return event_payload
+    return _get_event_payload_from_data(payload_instance.data)
 
 
 def generate_payload_promise_from_subscription(
@@ -146,7 +147,6 @@ def generate_payload_promise_from_subscription(
             return None
 
         payload_instance = payload[0]
-        event_payload = _process_payload_instance(payload_instance)
 
         def check_errors(event_payload, payload_instance=payload_instance):
             if payload_instance.errors:
@@ -156,9 +156,13 @@ def generate_payload_promise_from_subscription(
                 ]
             return event_payload
 
-        if isinstance(event_payload, Promise):
-            return event_payload.then(check_errors)
-        return check_errors(event_payload)
+        # The data is not waited for, so the dataloaders used by the payloads
+        # generated together can load their data in the same batch.
+        return (
+            Promise.for_dict(payload_instance.data)
+            .then(_get_event_payload_from_data)
+            .then(check_errors)
+        )
 
     if isinstance(results_promise, Promise):
         return results_promise.then(return_payload_promise)
@@ -238,6 +242,94 @@ def generate_payload_from_subscription(
     return event_payload
 
 
+def normalize_subscription_query(subscription_query: str) -> str:
+    """Return the subscription query without insignificant whitespace and comments."""
+    return print_ast(parse(subscription_query))
+
+
+def generate_payloads_from_subscription(
+    event_type: str,
+    subscribable_objects: Iterable,
+    webhooks: Iterable[Webhook],
+    requestor: User | App | None = None,
+    sync_event: bool = False,
+    allow_replica: bool = False,
+    request_time: datetime.datetime | None = None,
+) -> list[tuple[Any, list[Webhook], dict[str, Any] | None]]:
+    """Generate webhook payloads for all objects and webhooks at once.
+
+    The subscription queries are executed for each object and webhook, but their
+    results are resolved together, once all executions are started. As the
+    dataloaders are shared by all executions, the data of all objects is loaded in
+    batches, instead of an object at a time.
+
+    Webhooks of the same app with the same subscription query would get identical
+    payloads, so the query is executed once per object for all of them.
+
+    return: A list of (subscribable_object, webhooks, payload) tuples, for every
+    object and group of webhooks with the same subscription query, in the given
+    order.
+    """
+    normalized_queries: dict[str, str] = {}
+    webhook_groups: dict[tuple[int, str], list[Webhook]] = {}
+    for webhook in webhooks:
+        if not webhook.subscription_query:
+            continue
+        query = webhook.subscription_query
+        if query not in normalized_queries:
+            normalized_queries[query] = normalize_subscription_query(query)
+        # The payload depends on the app, e.g. on its permissions or the `recipient`
+        # field, so only the webhooks of the same app share the payload.
+        key = (webhook.app_id, normalized_queries[query])
+        webhook_groups.setdefault(key, []).append(webhook)
+
+    objects_and_webhooks = [
+        (subscribable_object, webhooks_group)
+        for subscribable_object in subscribable_objects
+        for webhooks_group in webhook_groups.values()
+    ]
+    # Payloads are resolved once all executions are started, so each app needs its
+    # own request, not changed by the executions for other apps. Dataloaders are
+    # bound to a request, so they are shared by the executions for the same app.
+    requests: dict[int, SaleorContext] = {}
+
+    def generate_payloads(_):
+        promises = []
+        for subscribable_object, webhooks_group in objects_and_webhooks:
+            webhook = webhooks_group[0]
+            request = requests.get(webhook.app_id)
+            if request is None:
+                request = requests[webhook.app_id] = initialize_request(
+                    requestor,
+                    sync_event,
+                    allow_replica=allow_replica,
+                    event_type=event_type,
+                    request_time=request_time,
+                )
+            promises.append(
+                generate_payload_promise_from_subscription(
+                    event_type=event_type,
+                    subscribable_object=subscribable_object,
+                    subscription_query=cast(str, webhook.subscription_query),
+                    request=request,
+                    app=webhook.app,
+                )
+            )
+        return Promise.all(promises)
+
+    # Promise callbacks called outside of other callbacks are run immediately, which
+    # would resolve each payload before the next one is started. Inside a callback,
+    # they are queued, so the executions are interleaved and the dataloaders get
+    # the keys of all objects in a single batch.
+    payloads = Promise.resolve(None).then(generate_payloads).get()
+    return [
+        (subscribable_object, webhooks_group, payload)
+        for (subscribable_object, webhooks_group), payload in zip(
+            objects_and_webhooks, payloads, strict=True
+        )
+    ]
+
+
 def get_pre_save_payload_key(webhook, instance):
     return f"{webhook.pk}_{instance.pk}"
 
@@ -252,35 +344,16 @@ def generate_pre_save_payloads(
     if not settings.ENABLE_LIMITING_WEBHOOKS_FOR_IDENTICAL_PAYLOADS:
         return {}
 
-    pre_save_payloads = {}
-
-    # Dataloaders are shared between calls to generate_payload_from_subscription to
-    # reuse their cache. This avoids unnecessary DB queries when different webhooks
-    # need to resolve the same data.
-    dataloaders: dict[str, type[DataLoader]] = {}
-
-    request = initialize_request(
+    payloads = generate_payloads_from_subscription(
+        event_type,
+        instances,
+        webhooks,
         requestor=requestor,
-        sync_event=False,
         allow_replica=True,
-        event_type=event_type,
         request_time=request_time,
-        dataloaders=dataloaders,
     )
-
-    for webhook in webhooks:
-        if not webhook.subscription_query:
-            continue
-
-        for instance in instances:
-            instance_payload = generate_payload_from_subscription(
-                event_type=event_type,
-                subscribable_object=instance,
-                subscription_query=webhook.subscription_query,
-                request=request,
-                app=webhook.app,
-            )
-            key = get_pre_save_payload_key(webhook, instance)
-            pre_save_payloads[key] = instance_payload
-
-    return pre_save_payloads
+    return {
+        get_pre_save_payload_key(webhook, instance): instance_payload
+        for instance, webhooks_group, instance_payload in payloads
+        for webhook in webhooks_group
+    }
@@ -32,7 +32,7 @@ from ...product.models import (
     ProductVariantTranslation,
 )
 from ...shipping.models import ShippingMethodTranslation
-from ...thumbnail.views import TYPE_TO_MODEL_DATA_MAPPING
+from ...thumbnail.generation import TYPE_TO_MODEL_DATA_MAPPING
 from ...webhook.const import MAX_FILTERABLE_CHANNEL_SLUGS_LIMIT
 from ...webhook.event_types import WebhookEventAsyncType, WebhookEventSyncType
 from ..account.types import User as UserType
@@ -13,6 +13,7 @@ from ...models import Fulfillment, FulfillmentLine, Order, OrderEvent, OrderLine
 ORDER_COUNT_IN_BENCHMARKS = 10
 EVENTS_PER_ORDER = 5
 LINES_PER_ORDER = 3
+LINES_IN_ORDER_WITH_MANY_LINES = 100
 TRANSACTIONS_PER_PAYMENT = 3
 
 
@@ -170,3 +171,20 @@ def draft_orders_for_benchmarks(orders_for_benchmarks):
     Order.objects.bulk_update(orders_for_benchmarks, ["status"])
 
     return orders_for_benchmarks
+
+
+@pytest.fixture
+def order_with_many_lines_for_benchmarks(
+    order, variants_for_benchmarks, order_lines_generator
+):
+    variants = variants_for_benchmarks[:LINES_IN_ORDER_WITH_MANY_LINES]
+    order_lines_generator(
+        order,
+        variants,
+        [10 + i % 7 for i in range(len(variants))],
+        [1] * len(variants),
+    )
+    order.shipping_address = order.billing_address.get_copy()
+    order.lines_count = len(variants)
+    order.save(update_fields=["shipping_address", "lines_count"])
+    return order
@@ -3,6 +3,7 @@ from typing import TYPE_CHECKING
 from django.apps import AppConfig
 from django.conf import settings
 from django.core.exceptions import ImproperlyConfigured
+from django.db.models.signals import post_delete, post_save
 from django.utils.module_loading import import_string
 
 if TYPE_CHECKING:
@@ -14,11 +15,24 @@ class PluginConfig(AppConfig):
     verbose_name = "Plugins"
 
     def ready(self):
+        from ..channel.models import Channel
+        from .cache import handle_plugin_configs_change
+        from .models import PluginConfiguration
+
         plugins = getattr(settings, "PLUGINS", [])
 
         for plugin_path in plugins:
             self.load_and_check_plugin(plugin_path)
 
+        # Channels are cached together with the plugin configurations.
+        for sender in (PluginConfiguration, Channel):
+            for signal in (post_save, post_delete):
+                signal.connect(
+                    handle_plugin_configs_change,
+                    sender=sender,
+                    dispatch_uid=f"invalidate_plugin_configs_{sender.__name__}",
+                )
+
     def load_and_check_plugin(self, plugin_path: str):
         try:
             plugin = import_string(plugin_path)
@@ -0,0 +1,109 @@
+import copy
+from functools import cache as memoize
+from typing import TYPE_CHECKING
+
+from django.conf import settings
+from django.utils.module_loading import import_string
+
+from ..channel.models import Channel
+from ..core.db.connection import allow_writer
+from ..core.telemetry import tracer
+from ..core.versioned_cache import VersionedMemCache
+from .models import PluginConfiguration
+
+if TYPE_CHECKING:
+    from .base_plugin import BasePlugin
+
+PLUGIN_CONFIGS_VERSION_KEY = "plugins.configs_version"
+
+# How often, in seconds, the per-process cache checks whether the configurations
+# were changed by other processes.
+PLUGIN_CONFIGS_VERSION_CHECK_INTERVAL = 10
+
+PluginConfigsMap = dict[str, PluginConfiguration]
+
+# Per-process cache of the channels and the plugin configurations stored in the
+# database. Entries are valid as long as the version in the shared cache doesn't
+# change.
+_plugin_configs_mem_cache = VersionedMemCache(
+    PLUGIN_CONFIGS_VERSION_KEY, PLUGIN_CONFIGS_VERSION_CHECK_INTERVAL
+)
+
+
+@memoize
+def load_plugin_class(plugin_path: str) -> type["BasePlugin"]:
+    return import_string(plugin_path)
+
+
+def plugin_configs_cache_clear():
+    """Drop the configurations cached by the current process."""
+    _plugin_configs_mem_cache.clear()
+
+
+def invalidate_plugin_configs_cache():
+    """Force all processes to reload the plugin configurations from the database."""
+    _plugin_configs_mem_cache.invalidate()
+
+
+def handle_plugin_configs_change(**_kwargs):
+    _plugin_configs_mem_cache.handle_change()
+
+
+def _fetch_plugin_configs(channel: Channel | None) -> PluginConfigsMap:
+    # Configurations are read from the writer, as the replica could return stale
+    # data which would be then cached until the next change.
+    with allow_writer():
+        plugin_configs = PluginConfiguration.objects.using(
+            settings.DATABASE_CONNECTION_DEFAULT_NAME
+        ).filter(channel=channel)
+        configs = {}
+        for plugin_config in plugin_configs.iterator(chunk_size=1000):
+            plugin_config.channel = channel
+            configs[plugin_config.identifier] = plugin_config
+        return configs
+
+
+def get_global_plugin_configs() -> PluginConfigsMap:
+    """Return the global plugin configurations, keyed by the plugin identifier.
+
+    A copy is returned as plugins are free to modify their configuration.
+    """
+    with tracer.start_as_current_span("get_global_plugin_configs"):
+        values = _plugin_configs_mem_cache.values
+        if "global" not in values:
+            values["global"] = _fetch_plugin_configs(None)
+        return copy.deepcopy(values["global"])
+
+
+def get_channel_plugin_configs(
+    channel_slug: str, channel: Channel | None = None
+) -> tuple[Channel | None, PluginConfigsMap]:
+    """Return the channel and its plugin configurations, keyed by the plugin identifier.
+
+    The channel is fetched by the slug, unless it's given. A copy is returned as
+    plugins are free to modify their configuration.
+    """
+    with tracer.start_as_current_span("get_channel_plugin_configs"):
+        values = _plugin_configs_mem_cache.values
+        if channel is None:
+            channel_key = f"channel:{channel_slug}"
+            if channel_key not in values:
+                with allow_writer():
+                    channel = (
+                        Channel.objects.using(settings.DATABASE_CONNECTION_DEFAULT_NAME)
+                        .filter(slug=channel_slug)
+                        .first()
+                    )
+                if channel is None:
+                    # Missing channels are not cached, as their slugs can be chosen
+                    # by the clients.
+                    return None, {}
+                values[channel_key] = channel
+            channel = copy.deepcopy(values[channel_key])
+        configs_key = f"configs:{channel.pk}"
+        if configs_key not in values:
+            values[configs_key] = _fetch_plugin_configs(channel)
+        configs = copy.deepcopy(values[configs_key])
+        for config in configs.values():
+            config.channel = channel
+        return channel, configs
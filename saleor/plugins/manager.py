@@ -5,7 +5,6 @@ from typing import TYPE_CHECKING, Any, Optional, Union
 
 from django.conf import settings
 from django.http import HttpResponse, HttpResponseNotFound
-from django.utils.module_loading import import_string
 from prices import TaxedMoney
 
 from ..channel.models import Channel
@@ -50,6 +49,11 @@ from ..payment.interface import (
 )
 from ..tax.utils import calculate_tax_rate
 from .base_plugin import ExcludedShippingMethod, ExternalAccessTokens
+from .cache import (
+    get_channel_plugin_configs,
+    get_global_plugin_configs,
+    load_plugin_class,
+)
 from .models import PluginConfiguration
 
 if TYPE_CHECKING:
@@ -153,11 +157,11 @@ class PluginsManager(PaymentInterface):
         self, channel_slug: str | None, channel: Channel | None = None
     ):
         if channel_slug is None and not self.loaded_global:
-            global_db_config = self._get_db_plugin_configs(None)
+            global_db_config = get_global_plugin_configs()
 
             for plugin_path in self.plugins:
                 with tracer.start_as_current_span(f"{plugin_path}"):
-                    PluginClass = import_string(plugin_path)
+                    PluginClass = load_plugin_class(plugin_path)
                     if not getattr(PluginClass, "CONFIGURATION_PER_CHANNEL", False):
                         plugin = self._load_plugin(
                             PluginClass,
@@ -170,20 +174,15 @@ class PluginsManager(PaymentInterface):
             self.loaded_global = True
 
         if channel_slug is not None and channel_slug not in self.loaded_channels:
-            if channel is None:
-                channel = (
-                    Channel.objects.using(self.database)
-                    .filter(slug=channel_slug)
-                    .first()
-                )
-                if not channel:
-                    return
-
-            channel_db_config = self._get_db_plugin_configs(channel)
+            channel, channel_db_config = get_channel_plugin_configs(
+                channel_slug, channel
+            )
+            if not channel:
+                return
 
             for plugin_path in self.plugins:
                 with tracer.start_as_current_span(f"{plugin_path}"):
-                    PluginClass = import_string(plugin_path)
+                    PluginClass = load_plugin_class(plugin_path)
                     if getattr(PluginClass, "CONFIGURATION_PER_CHANNEL", False):
                         plugin = self._load_plugin(
                             PluginClass,
@@ -199,16 +198,6 @@ class PluginsManager(PaymentInterface):
             self.plugins_per_channel[channel_slug].extend(self.global_plugins)
             self.loaded_channels.add(channel_slug)
 
-    def _get_db_plugin_configs(self, channel: Channel | None):
-        with tracer.start_as_current_span("_get_db_plugin_configs"):
-            plugin_manager_configs = PluginConfiguration.objects.using(
-                self.database
-            ).filter(channel=channel)
-            configs = {}
-            for db_plugin_config in plugin_manager_configs.iterator(chunk_size=1000):
-                configs[db_plugin_config.identifier] = db_plugin_config
-            return configs
-
     def __run_method_on_plugins(
         self,
         method_name: str,
@@ -1,9 +1,17 @@
 import pytest
 
+from ...cache import plugin_configs_cache_clear
 from ...manager import PluginsManager
 from ..sample_plugins import ALL_PLUGINS
 
 
+@pytest.fixture(autouse=True)
+def clear_plugin_configs_cache():
+    # Configurations cached in a previous test could come from a rolled back
+    # transaction.
+    plugin_configs_cache_clear()
+
+
 @pytest.fixture
 def plugins_manager():
     return PluginsManager(plugins=[])
@@ -0,0 +1,128 @@
+from django.core.cache import cache
+
+from ...core.versioned_cache import VersionedMemCache
+from ..cache import (
+    PLUGIN_CONFIGS_VERSION_KEY,
+    get_channel_plugin_configs,
+    get_global_plugin_configs,
+    invalidate_plugin_configs_cache,
+)
+from ..manager import PluginsManager
+from ..models import PluginConfiguration
+from .sample_plugins import ChannelPluginSample, PluginSample
+
+
+def test_global_plugin_configs_are_cached(
+    plugin_configuration, django_assert_num_queries
+):
+    # given
+    get_global_plugin_configs()
+
+    # when
+    with django_assert_num_queries(0):
+        configs = get_global_plugin_configs()
+
+    # then
+    assert configs[PluginSample.PLUGIN_ID].pk == plugin_configuration.pk
+
+
+def test_channel_plugin_configs_are_cached(
+    channel_plugin_configurations, channel_USD, django_assert_num_queries
+):
+    # given
+    get_channel_plugin_configs(channel_USD.slug)
+
+    # when
+    with django_assert_num_queries(0):
+        channel, configs = get_channel_plugin_configs(channel_USD.slug)
+
+    # then
+    assert channel == channel_USD
+    assert configs[ChannelPluginSample.PLUGIN_ID].channel == channel_USD
+
+
+def test_cached_plugin_configs_are_copied(plugin_configuration):
+    # given
+    configs = get_global_plugin_configs()
+
+    # when
+    configs[PluginSample.PLUGIN_ID].active = not plugin_configuration.active
+
+    # then
+    configs = get_global_plugin_configs()
+    assert configs[PluginSample.PLUGIN_ID].active == plugin_configuration.active
+
+
+def test_saving_plugin_configuration_invalidates_cache(plugin_configuration):
+    # given
+    plugin_path = "saleor.plugins.tests.sample_plugins.PluginSample"
+    plugin = PluginsManager(plugins=[plugin_path]).get_plugin(PluginSample.PLUGIN_ID)
+    assert plugin
+    assert plugin.active is True
+
+    # when
+    plugin_configuration.active = False
+    plugin_configuration.save(update_fields=["active"])
+
+    # then
+    plugin = PluginsManager(plugins=[plugin_path]).get_plugin(PluginSample.PLUGIN_ID)
+    assert plugin
+    assert plugin.active is False
+
+
+def test_version_change_invalidates_cache(plugin_configuration, monkeypatch):
+    # given
+    monkeypatch.setattr(
+        "saleor.plugins.cache._plugin_configs_mem_cache",
+        VersionedMemCache(PLUGIN_CONFIGS_VERSION_KEY, check_interval=-1),
+    )
+    get_global_plugin_configs()
+    # update skipping the signals, as if it was done by another process
+    PluginConfiguration.objects.filter(pk=plugin_configuration.pk).update(active=False)
+
+    # when
+    cache.set(PLUGIN_CONFIGS_VERSION_KEY, "other-process-version")
+
+    # then
+    configs = get_global_plugin_configs()
+    assert configs[PluginSample.PLUGIN_ID].active is False
+
+
+def test_invalidate_plugin_configs_cache_changes_version(plugin_configuration):
+    # given
+    get_global_plugin_configs()
+    version = cache.get(PLUGIN_CONFIGS_VERSION_KEY)
+
+    # when
+    invalidate_plugin_configs_cache()
+
+    # then
+    assert cache.get(PLUGIN_CONFIGS_VERSION_KEY) != version
+
+
+def test_plugin_configs_change_rotates_version(
+    plugin_configuration, django_capture_on_commit_callbacks
+):
+    # given
+    get_global_plugin_configs()
+    version = cache.get(PLUGIN_CONFIGS_VERSION_KEY)
+
+    # when
+    with django_capture_on_commit_callbacks(execute=True):
+        plugin_configuration.save(update_fields=["active"])
+
+    # then
+    assert cache.get(PLUGIN_CONFIGS_VERSION_KEY) != version
+
+
+def test_missing_channel_is_not_cached(db, django_assert_num_queries):
+    # given
+    get_channel_plugin_configs("missing")
+
+    # when
+    with django_assert_num_queries(1):
+        channel, configs = get_channel_plugin_configs("missing")
+
+    # then
+    assert channel is None
+    assert configs == {}
@@ -3638,6 +3638,7 @@ class WebhookPlugin(BasePlugin):
                     request_timeout=WEBHOOK_SYNC_TIMEOUT,
                     cache_timeout=CACHE_TIME_SHIPPING_LIST_METHODS_FOR_CHECKOUT,
                     requestor=self.requestor,
+                    stale_cache_timeout=settings.SHIPPING_WEBHOOK_STALE_RESPONSE_TTL,
                 )
 
                 if response_data:
@@ -514,6 +514,9 @@ def test_expected_result_invalidates_cache_for_app(
         list_stored_payment_methods_response,
         timeout=WEBHOOK_CACHE_DEFAULT_TTL,
     )
+    # the lock taken for sending the request is released
+    mocked_cache_delete.assert_called_once_with(f"{expected_cache_key}:lock")
+    mocked_cache_delete.reset_mock()
 
     # when
     response = plugin.payment_method_process_tokenization(request_data, previous_value)
@@ -438,6 +438,9 @@ def test_stored_payment_method_request_delete_invalidates_cache_for_app(
         list_stored_payment_methods_response,
         timeout=WEBHOOK_CACHE_DEFAULT_TTL,
     )
+    # the lock taken for sending the request is released
+    mocked_cache_delete.assert_called_once_with(f"{expected_cache_key}:lock")
+    mocked_cache_delete.reset_mock()
 
     # when
     response = plugin.stored_payment_method_request_delete(
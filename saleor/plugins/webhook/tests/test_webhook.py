@@ -41,6 +41,9 @@ from ....graphql.order.tests.mutations.test_order_discount import ORDER_DISCOUNT
 from ....graphql.product.tests.mutations.test_product_create import (
     CREATE_PRODUCT_MUTATION,
 )
+from ....graphql.webhook.subscription_payload import (
+    generate_payload_promise_from_subscription,
+)
 from ....payment import TransactionAction, TransactionEventType
 from ....payment.interface import TransactionActionData
 from ....payment.models import TransactionItem
@@ -2515,7 +2518,8 @@ def test_trigger_webhook_sync_with_subscription_within_mutation_use_default_db(
 )
 @mock.patch("saleor.plugins.webhook.plugin.get_webhooks_for_event")
 @mock.patch(
-    "saleor.webhook.transport.asynchronous.transport.generate_payload_from_subscription"
+    "saleor.graphql.webhook.subscription_payload.generate_payload_promise_from_subscription",
+    wraps=generate_payload_promise_from_subscription,
 )
 def test_trigger_webhook_async_with_subscription_use_main_db(
     mocked_generate_payload,
@@ -1,5 +1,5 @@
 from django.apps import AppConfig
-from django.db.models.signals import post_delete
+from django.db.models.signals import post_delete, post_save
 
 
 class ProductAppConfig(AppConfig):
@@ -34,3 +34,16 @@ class ProductAppConfig(AppConfig):
             sender=DigitalContent,
             dispatch_uid="delete_digital_content_file",
         )
+        self.connect_facet_index_signals()
+
+    def connect_facet_index_signals(self) -> None:
+        from ..attribute.models import Attribute, AttributeValue
+        from .facets import handle_facet_attribute_change
+
+        for sender in (Attribute, AttributeValue):
+            for signal in (post_save, post_delete):
+                signal.connect(
+                    handle_facet_attribute_change,
+                    sender=sender,
+                    dispatch_uid=f"invalidate_product_facets_{sender.__name__}",
+                )
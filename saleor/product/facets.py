@@ -0,0 +1,198 @@
+"""Attribute facet index of the products.
+
+The index maps the values of the attributes filterable in the storefront to the
+sorted arrays of IDs of the products having the value, assigned to the product or
+any of its variants. The number of products matching each value under the current
+filters is computed in memory, by intersecting the arrays with the IDs of the
+filtered products, instead of running a query per value.
+
+The index is built with a few queries and kept in the shared cache and per
+process, under a version. Only one process builds the index of a version at a
+time, the others use their outdated index in the meantime. The version is changed by the search indexer once it
+processed the changed products, as every change of the products or their
+attributes marks them as dirty for the search index, and whenever an attribute
+or a value is saved or deleted.
+"""
+
+import time
+from array import array
+from bisect import bisect_left
+from collections import defaultdict
+from dataclasses import dataclass
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import transaction
+from django.db.models import Exists, OuterRef, QuerySet
+
+from ..attribute import AttributeInputType
+from ..attribute.models import (
+    AssignedProductAttributeValue,
+    AssignedVariantAttributeValue,
+    Attribute,
+    AttributeValue,
+)
+from ..core.db.connection import allow_writer
+from ..core.versioned_cache import VersionedMemCache
+from .models import Product
+
+PRODUCT_FACETS_VERSION_KEY = "product.facets_version"
+PRODUCT_FACETS_KEY_PREFIX = "product_facets"
+
+# How often, in seconds, the per-process index is checked against the version in
+# the shared cache.
+PRODUCT_FACETS_VERSION_CHECK_INTERVAL = 10
+
+# Indexes of outdated versions are not used anymore and expire.
+PRODUCT_FACETS_TIMEOUT = 60 * 60 * 24
+
+# How long, in seconds, other processes wait for the index being built by one of
+# them, before building it on their own.
+PRODUCT_FACETS_BUILD_LOCK_TIMEOUT = 60
+
+# How often, in seconds, a process without any index checks whether the index
+# built by another process is available.
+PRODUCT_FACETS_BUILD_WAIT_INTERVAL = 0.1
+
+# Input types with values shared by products; values of other types are unique
+# per product, so counting them is pointless.
+FACET_INPUT_TYPES = [
+    AttributeInputType.DROPDOWN,
+    AttributeInputType.MULTISELECT,
+    AttributeInputType.SWATCH,
+    AttributeInputType.BOOLEAN,
+]
+
+
+@dataclass
+class ProductFacetIndex:
+    value_to_attribute: dict[int, int]
+    # Sorted IDs of the products with the value.
+    value_to_products: dict[int, array]
+
+
+_facets_mem_cache = VersionedMemCache(
+    PRODUCT_FACETS_VERSION_KEY, PRODUCT_FACETS_VERSION_CHECK_INTERVAL
+)
+
+# The last index used by the process, returned while the index of the current
+# version is built by another process.
+_latest_facets_index: ProductFacetIndex | None = None
+
+
+def build_product_facet_index(database_connection_name: str) -> ProductFacetIndex:
+    attributes = Attribute.objects.using(database_connection_name).filter(
+        input_type__in=FACET_INPUT_TYPES,
+        filterable_in_storefront=True,
+        visible_in_storefront=True,
+    )
+    values = AttributeValue.objects.using(database_connection_name).filter(
+        Exists(attributes.filter(pk=OuterRef("attribute_id")))
+    )
+    value_to_attribute = dict(values.values_list("pk", "attribute_id"))
+
+    value_to_products: defaultdict[int, set[int]] = defaultdict(set)
+    product_values = (
+        AssignedProductAttributeValue.objects.using(database_connection_name)
+        .filter(Exists(values.filter(pk=OuterRef("value_id"))))
+        .values_list("value_id", "product_id")
+    )
+    variant_values = (
+        AssignedVariantAttributeValue.objects.using(database_connection_name)
+        .filter(Exists(values.filter(pk=OuterRef("value_id"))))
+        .values_list("value_id", "assignment__variant__product_id")
+    )
+    for assigned_values in (product_values, variant_values):
+        for value_id, product_id in assigned_values.iterator(chunk_size=10000):
+            value_to_products[value_id].add(product_id)
+
+    return ProductFacetIndex(
+        value_to_attribute=value_to_attribute,
+        value_to_products={
+            value_id: array("q", sorted(product_ids))
+            for value_id, product_ids in value_to_products.items()
+        },
+    )
+
+
+def _get_shared_product_facet_index(version: str) -> ProductFacetIndex | None:
+    """Return the index of the version from the shared cache, building it if missing.
+
+    Only one process builds the index of a version at a time. Return None when it's
+    being built by another process.
+    """
+    shared_key = f"{PRODUCT_FACETS_KEY_PREFIX}:{version}"
+    if (index := cache.get(shared_key)) is not None:
+        return index
+    lock_key = f"{shared_key}:lock"
+    if not cache.add(lock_key, True, timeout=PRODUCT_FACETS_BUILD_LOCK_TIMEOUT):
+        return None
+    try:
+        # The index is built from the writer, as the replica could return stale
+        # data which would be then cached under the new version.
+        with allow_writer():
+            index = build_product_facet_index(settings.DATABASE_CONNECTION_DEFAULT_NAME)
+        cache.set(shared_key, index, timeout=PRODUCT_FACETS_TIMEOUT)
+    finally:
+        cache.delete(lock_key)
+    return index
+
+
+def get_product_facet_index() -> ProductFacetIndex:
+    """Return the facet index, building it when it's missing or outdated.
+
+    While the index of the current version is built by another process, the
+    outdated index of the process is returned, or the call waits for the new one
+    when the process has none.
+    """
+    global _latest_facets_index
+    version, values = _facets_mem_cache.get_version_and_values()
+    if "index" in values:
+        return values["index"]
+    while (index := _get_shared_product_facet_index(version)) is None:
+        if _latest_facets_index is not None:
+            return _latest_facets_index
+        time.sleep(PRODUCT_FACETS_BUILD_WAIT_INTERVAL)
+    values["index"] = _latest_facets_index = index
+    return index
+
+
+def invalidate_product_facet_index():
+    """Force all processes to rebuild the facet index."""
+    _facets_mem_cache.invalidate()
+
+
+def handle_facet_attribute_change(**_kwargs):
+    transaction.on_commit(invalidate_product_facet_index)
+
+
+def _count_common(products: array, product_ids: set[int]) -> int:
+    if len(products) <= len(product_ids):
+        return sum(1 for product_id in products if product_id in product_ids)
+    count = 0
+    products_count = len(products)
+    for product_id in product_ids:
+        position = bisect_left(products, product_id)
+        if position < products_count and products[position] == product_id:
+            count += 1
+    return count
+
+
+def get_product_facet_counts(
+    products: QuerySet[Product], index: ProductFacetIndex | None = None
+) -> dict[int, dict[int, int]]:
+    """Return the number of the given products having each attribute value.
+
+    The result maps the attribute IDs to the counts of their values. Values which
+    none of the products has are skipped.
+    """
+    if index is None:
+        index = get_product_facet_index()
+    product_ids = set(products.order_by().values_list("pk", flat=True))
+    counts: defaultdict[int, dict[int, int]] = defaultdict(dict)
+    if not product_ids:
+        return counts
+    for value_id, value_products in index.value_to_products.items():
+        if count := _count_common(value_products, product_ids):
+            counts[index.value_to_attribute[value_id]][value_id] = count
+    return counts
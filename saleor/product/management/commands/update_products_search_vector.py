@@ -0,0 +1,104 @@
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+import django
+from django.core.management.base import BaseCommand
+from django.db import connections
+from django.db.models import Max, Min, Q
+
+from ....core.db.connection import allow_writer
+from ....core.utils.batches import queryset_in_batches
+from ...facets import invalidate_product_facet_index
+from ...models import Product
+from ...search import PRODUCTS_BATCH_SIZE, update_products_search_vector
+
+# Number of pk ranges processed by each worker process, more ranges even out the
+# work when the products are not distributed evenly.
+RANGES_PER_PROCESS = 4
+
+
+def get_products_to_update(update_all: bool):
+    if update_all:
+        return Product.objects.all()
+    return Product.objects.filter(
+        Q(search_index_dirty=True) | Q(search_vector__isnull=True)
+    )
+
+
+def split_pk_range(min_pk: int, max_pk: int, parts: int) -> list[tuple[int, int]]:
+    """Split the inclusive pk range into at most `parts` consecutive ranges."""
+    step = max(1, -(-(max_pk - min_pk + 1) // parts))
+    return [
+        (start, min(start + step - 1, max_pk))
+        for start in range(min_pk, max_pk + 1, step)
+    ]
+
+
+def update_search_vector_in_pk_range(pk_range: tuple[int, int], update_all: bool):
+    start_pk, end_pk = pk_range
+    products = get_products_to_update(update_all).filter(
+        pk__gte=start_pk, pk__lte=end_pk
+    )
+    updated_count = 0
+    with allow_writer():
+        for product_pks in queryset_in_batches(products, PRODUCTS_BATCH_SIZE):
+            update_products_search_vector(product_pks)
+            updated_count += len(product_pks)
+    return updated_count
+
+
+class Command(BaseCommand):
+    help = (
+        "Update the search vectors of products, which are dirty or missing. "
+        "The products are split into pk ranges processed in parallel."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--all",
+            action="store_true",
+            dest="update_all",
+            help="Update the search vectors of all products.",
+        )
+        parser.add_argument(
+            "--processes",
+            type=int,
+            default=os.cpu_count(),
+            help="Number of worker processes updating the search vectors.",
+        )
+
+    def handle(self, *args, **options):
+        update_all = options["update_all"]
+        processes = options["processes"]
+        pk_bounds = get_products_to_update(update_all).aggregate(
+            min_pk=Min("pk"), max_pk=Max("pk")
+        )
+        if pk_bounds["min_pk"] is None:
+            self.stdout.write("No products to update.")
+            return
+
+        pk_ranges = split_pk_range(
+            pk_bounds["min_pk"], pk_bounds["max_pk"], processes * RANGES_PER_PROCESS
+        )
+        if processes > 1:
+            # Connections can't be shared with the child processes, each of them
+            # opens its own.
+            connections.close_all()
+            with ProcessPoolExecutor(
+                max_workers=processes, initializer=django.setup
+            ) as executor:
+                updated_count = sum(
+                    executor.map(
+                        update_search_vector_in_pk_range,
+                        pk_ranges,
+                        [update_all] * len(pk_ranges),
+                    )
+                )
+        else:
+            updated_count = sum(
+                update_search_vector_in_pk_range(pk_range, update_all)
+                for pk_range in pk_ranges
+            )
+        if updated_count:
+            invalidate_product_facet_index()
+        self.stdout.write(f"Updated search vectors of {updated_count} products.")
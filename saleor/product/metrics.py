@@ -0,0 +1,48 @@
+from ..core.telemetry import DEFAULT_DURATION_BUCKETS, MetricType, Scope, Unit, meter
+
+# Initialize metrics
+METRIC_SEARCH_INDEX_UPDATED_COUNT = meter.create_metric(
+    "saleor.product.search_index.updated.count",
+    scope=Scope.CORE,
+    type=MetricType.COUNTER,
+    unit=Unit.PRODUCT,
+    description="Number of products with updated search vector.",
+)
+METRIC_SEARCH_INDEX_BATCH_DURATION = meter.create_metric(
+    "saleor.product.search_index.batch.duration",
+    scope=Scope.CORE,
+    type=MetricType.HISTOGRAM,
+    unit=Unit.SECOND,
+    description="Duration of updating search vectors of a batch of products.",
+    bucket_boundaries=DEFAULT_DURATION_BUCKETS,
+)
+
+SEARCH_INDEX_LAG_BUCKETS = [
+    0,
+    100,
+    500,
+    1000,
+    5000,
+    10000,
+    50000,
+    100000,
+    500000,
+    1000000,
+]
+METRIC_SEARCH_INDEX_LAG = meter.create_metric(
+    "saleor.product.search_index.lag",
+    scope=Scope.CORE,
+    type=MetricType.HISTOGRAM,
+    unit=Unit.PRODUCT,
+    description="Number of products waiting for the search vector update.",
+    bucket_boundaries=SEARCH_INDEX_LAG_BUCKETS,
+)
+
+
+def record_search_index_batch(updated_count: int, duration: float) -> None:
+    meter.record(METRIC_SEARCH_INDEX_UPDATED_COUNT, updated_count, Unit.PRODUCT)
+    meter.record(METRIC_SEARCH_INDEX_BATCH_DURATION, duration, Unit.SECOND)
+
+
+def record_search_index_lag(dirty_count: int) -> None:
+    meter.record(METRIC_SEARCH_INDEX_LAG, dirty_count, Unit.PRODUCT)
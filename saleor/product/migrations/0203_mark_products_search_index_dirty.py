@@ -0,0 +1,34 @@
+from django.db import migrations
+
+BATCH_SIZE = 2000
+
+
+def mark_products_search_index_dirty(apps, schema_editor):
+    # The search indexer fills the autocomplete `search_document` of the products.
+    Product = apps.get_model("product", "Product")
+    start_pk = 0
+    while True:
+        pks = list(
+            Product.objects.order_by("pk")
+            .filter(pk__gt=start_pk)
+            .values_list("pk", flat=True)[:BATCH_SIZE]
+        )
+        if not pks:
+            break
+        Product.objects.filter(pk__in=pks).update(search_index_dirty=True)
+        start_pk = pks[-1]
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("product", "0202_category_product_category_tree_id_lf1e1"),
+    ]
+
+    # Batches are committed separately, so the table isn't locked as a whole.
+    atomic = False
+
+    operations = [
+        migrations.RunPython(
+            mark_products_search_index_dirty, migrations.RunPython.noop
+        )
+    ]
@@ -1,17 +1,38 @@
+import time
 from collections import defaultdict
 from collections.abc import Iterable
 from typing import TYPE_CHECKING
 
 from django.conf import settings
-from django.contrib.postgres.search import SearchQuery, SearchRank
-from django.db.models import F, Q, Value, prefetch_related_objects
-
-from ..attribute.models import AssignedProductAttributeValue, AttributeValue
+from django.contrib.postgres.search import (
+    SearchQuery,
+    SearchRank,
+    TrigramWordSimilarity,
+)
+from django.db import transaction
+from django.db.models import (
+    BooleanField,
+    Exists,
+    ExpressionWrapper,
+    F,
+    OuterRef,
+    Q,
+    Value,
+    prefetch_related_objects,
+)
+
+from ..attribute.models import (
+    AssignedProductAttributeValue,
+    AssignedVariantAttributeValue,
+    AttributeValue,
+)
 from ..attribute.search import get_search_vectors_for_attribute_values
 from ..core.postgres import FlatConcatSearchVector, NoValidationSearchVector
 from ..core.utils.batches import queryset_in_batches
 from ..page.models import Page
 from ..product.models import Product
+from .facets import invalidate_product_facet_index
+from .metrics import record_search_index_batch, record_search_index_lag
 
 if TYPE_CHECKING:
     from django.db.models import QuerySet
@@ -29,12 +50,20 @@ PRODUCTS_BATCH_SIZE = 100
 # when testing locally with multiple attributes of different types assigned to product
 # and product variants.
 
+# Fragments shorter than a trigram can't be looked up in the trigram index.
+PRODUCT_AUTOCOMPLETE_MIN_LENGTH = 3
+
 
 def _prep_product_search_vector_index(
-    products, page_id_to_title_map: dict[int, str] | None = None
+    products,
+    page_id_to_title_map: dict[int, str] | None = None,
+    mark_clean: bool = True,
 ):
     prefetch_related_objects(products, *PRODUCT_FIELDS_TO_PREFETCH)
 
+    update_fields = ["search_vector", "search_document", "updated_at"]
+    if mark_clean:
+        update_fields.append("search_index_dirty")
     for product in products:
         product.search_vector = FlatConcatSearchVector(
             *prepare_product_search_vector_value(
@@ -43,36 +72,108 @@ def _prep_product_search_vector_index(
                 page_id_to_title_map=page_id_to_title_map,
             )
         )
+        product.search_document = prepare_product_search_document_value(
+            product, already_prefetched=True
+        )
         product.search_index_dirty = False
 
-    Product.objects.bulk_update(
-        products, ["search_vector", "updated_at", "search_index_dirty"]
+    Product.objects.bulk_update(products, update_fields)
+
+
+def get_page_id_to_title_map(product_pks: list[int], db_conn: str) -> dict[int, str]:
+    """Return titles of pages referenced by the product and variant attributes."""
+    product_value_ids = (
+        AssignedProductAttributeValue.objects.using(db_conn)
+        .filter(product_id__in=product_pks)
+        .values("value_id")
+    )
+    variant_value_ids = (
+        AssignedVariantAttributeValue.objects.using(db_conn)
+        .filter(assignment__variant__product_id__in=product_pks)
+        .values("value_id")
+    )
+    values = AttributeValue.objects.using(db_conn).filter(
+        Q(id__in=product_value_ids) | Q(id__in=variant_value_ids),
+        reference_page_id=OuterRef("pk"),
+    )
+    return dict(
+        Page.objects.using(db_conn).filter(Exists(values)).values_list("id", "title")
     )
 
 
-def update_products_search_vector(product_ids: Iterable[int]):
+def update_products_search_vector(
+    product_ids: Iterable[int], *, mark_clean: bool = True
+):
+    """Update the search vectors of the products in batches.
+
+    Data of a batch is fetched with a constant number of queries. When
+    `mark_clean` is False, the `search_index_dirty` flag is left untouched.
+    """
     db_conn = settings.DATABASE_CONNECTION_REPLICA_NAME
     product_ids = list(product_ids)
     products = Product.objects.using(db_conn).filter(pk__in=product_ids).order_by("pk")
     for product_pks in queryset_in_batches(products, PRODUCTS_BATCH_SIZE):
-        value_ids = (
-            AssignedProductAttributeValue.objects.using(db_conn)
-            .filter(product_id__in=product_pks)
-            .values_list("value_id", flat=True)
-        )
-        value_to_page_id = (
-            AttributeValue.objects.using(db_conn)
-            .filter(id__in=value_ids, reference_page_id__isnull=False)
-            .values_list("id", "reference_page_id")
+        page_id_to_title_map = get_page_id_to_title_map(product_pks, db_conn)
+        products_batch = list(Product.objects.using(db_conn).filter(id__in=product_pks))
+        _prep_product_search_vector_index(
+            products_batch, page_id_to_title_map, mark_clean=mark_clean
         )
-        page_id_to_title_map = dict(
-            Page.objects.using(db_conn)
-            .filter(id__in=[page_id for _, page_id in value_to_page_id])
-            .values_list("id", "title")
+
+
+def claim_dirty_products(batch_size: int) -> list[int]:
+    """Clear the dirty flag of a batch of products and return their IDs.
+
+    The flag is cleared before the search vectors are updated, so products
+    changed in the meantime are marked as dirty again and indexed in the next
+    batch. Products locked by other indexers are skipped, which allows running
+    them concurrently.
+    """
+    with transaction.atomic():
+        product_ids = list(
+            Product.objects.filter(search_index_dirty=True)
+            .order_by("updated_at")
+            .select_for_update(of=("self",), skip_locked=True)
+            .values_list("id", flat=True)[:batch_size]
         )
+        Product.objects.filter(id__in=product_ids).update(search_index_dirty=False)
+    return product_ids
 
-        products_batch = list(Product.objects.using(db_conn).filter(id__in=product_pks))
-        _prep_product_search_vector_index(products_batch, page_id_to_title_map)
+
+def update_dirty_products_search_vector(max_duration: float) -> int:
+    """Update the search vectors of dirty products in batches.
+
+    Batches are processed until there are no dirty products left or
+    `max_duration` (in seconds) passes. Return the number of updated products.
+    """
+    start = time.monotonic()
+    updated_count = 0
+    while True:
+        batch_start = time.monotonic()
+        product_ids = claim_dirty_products(PRODUCTS_BATCH_SIZE)
+        if not product_ids:
+            break
+        try:
+            update_products_search_vector(product_ids, mark_clean=False)
+        except Exception:
+            Product.objects.filter(id__in=product_ids).update(search_index_dirty=True)
+            raise
+        updated_count += len(product_ids)
+        record_search_index_batch(len(product_ids), time.monotonic() - batch_start)
+        if (
+            len(product_ids) < PRODUCTS_BATCH_SIZE
+            or time.monotonic() - start >= max_duration
+        ):
+            break
+
+    if updated_count:
+        # The attributes of the updated products could change.
+        invalidate_product_facet_index()
+    record_search_index_lag(
+        Product.objects.using(settings.DATABASE_CONNECTION_REPLICA_NAME)
+        .filter(search_index_dirty=True)
+        .count()
+    )
+    return updated_count
 
 
 def prepare_product_search_vector_value(
@@ -92,13 +193,40 @@ def prepare_product_search_vector_value(
         *generate_attributes_search_vector_value(
             product, page_id_to_title_map=page_id_to_title_map
         ),
-        *generate_variants_search_vector_value(product),
+        *generate_variants_search_vector_value(
+            product, page_id_to_title_map=page_id_to_title_map
+        ),
     ]
     return search_vectors
 
 
+def prepare_product_search_document_value(
+    product: "Product", *, already_prefetched=False
+) -> str:
+    """Prepare `search_document` value used by the autocomplete.
+
+    The document holds the product name, the SKUs and names of the variants and
+    the names of the assigned attribute values, one per line in lower case.
+    """
+    if not already_prefetched:
+        prefetch_related_objects([product], *PRODUCT_FIELDS_TO_PREFETCH)
+
+    variants = list(product.variants.all()[: settings.PRODUCT_MAX_INDEXED_VARIANTS])
+    values = [assigned_value.value for assigned_value in product.attributevalues.all()]
+    lines = [product.name]
+    for variant in variants:
+        lines += [variant.sku, variant.name]
+        for assigned_attribute in variant.attributes.all():
+            values += assigned_attribute.values.all()
+    lines += [value.name for value in values]
+    # Duplicates are dropped, keeping the order.
+    return "\n".join(dict.fromkeys(line.lower() for line in lines if line))
+
+
 def generate_variants_search_vector_value(
     product: "Product",
+    *,
+    page_id_to_title_map: dict[int, str] | None = None,
 ) -> list[NoValidationSearchVector]:
     variants = list(product.variants.all()[: settings.PRODUCT_MAX_INDEXED_VARIANTS])
 
@@ -114,7 +242,8 @@ def generate_variants_search_vector_value(
     if search_vectors:
         for variant in variants:
             search_vectors += generate_attributes_search_vector_value_with_assignment(
-                variant.attributes.all()[: settings.PRODUCT_MAX_INDEXED_ATTRIBUTES]
+                variant.attributes.all()[: settings.PRODUCT_MAX_INDEXED_ATTRIBUTES],
+                page_id_to_title_map=page_id_to_title_map,
             )
     return search_vectors
 
@@ -155,6 +284,8 @@ def generate_attributes_search_vector_value(
 
 def generate_attributes_search_vector_value_with_assignment(
     assigned_attributes: "QuerySet",
+    *,
+    page_id_to_title_map: dict[int, str] | None = None,
 ) -> list[NoValidationSearchVector]:
     """Prepare `search_vector` value for assigned attributes.
 
@@ -168,7 +299,7 @@ def generate_attributes_search_vector_value_with_assignment(
             : settings.PRODUCT_MAX_INDEXED_ATTRIBUTE_VALUES
         ]
         search_vectors += get_search_vectors_for_attribute_values(
-            attribute, values, weight="B"
+            attribute, values, page_id_to_title_map=page_id_to_title_map, weight="B"
         )
     return search_vectors
 
@@ -181,3 +312,28 @@ def search_products(qs, value):
             search_rank=SearchRank(F("search_vector"), query)
         )
     return qs
+
+
+def autocomplete_products(qs, value: str):
+    """Return products matching the typed fragment, best suggestions first.
+
+    The fragment is matched anywhere in the names, SKUs and attribute values
+    with the trigram index of `search_document`, so partially typed words and
+    SKU prefixes match. Products with the name starting with the fragment come
+    first, then the ones with the most similar words.
+    """
+    value = value.strip().lower()
+    if len(value) < PRODUCT_AUTOCOMPLETE_MIN_LENGTH:
+        return qs.none()
+    return (
+        # The document is in lower case, so the case-sensitive lookup, which
+        # can use the index, is enough.
+        qs.filter(search_document__contains=value)
+        .annotate(
+            autocomplete_name_match=ExpressionWrapper(
+                Q(name__istartswith=value), output_field=BooleanField()
+            ),
+            autocomplete_similarity=TrigramWordSimilarity(value, "search_document"),
+        )
+        .order_by("-autocomplete_name_match", "-autocomplete_similarity", "name", "pk")
+    )
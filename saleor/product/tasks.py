@@ -16,13 +16,14 @@ from ..core.db.connection import allow_writer
 from ..core.exceptions import PreorderAllocationError
 from ..discount import PromotionType
 from ..discount.models import Promotion, PromotionRule
+from ..discount.utils.promotion import get_active_catalogue_promotion_rules
 from ..plugins.manager import get_plugins_manager
 from ..warehouse.management import deactivate_preorder_for_variant
 from ..webhook.event_types import WebhookEventAsyncType
 from ..webhook.utils import get_webhooks_for_event
 from .lock_objects import product_qs_select_for_update
 from .models import Product, ProductChannelListing, ProductType, ProductVariant
-from .search import update_products_search_vector
+from .search import update_dirty_products_search_vector
 from .utils.product import mark_products_in_channels_as_dirty
 from .utils.variant_prices import update_discounted_prices_for_promotion
 from .utils.variants import (
@@ -33,8 +34,6 @@ from .utils.variants import (
 logger = logging.getLogger(__name__)
 task_logger = get_task_logger(f"{__name__}.celery")
 
-PRODUCTS_BATCH_SIZE = 300
-
 VARIANTS_UPDATE_BATCH = 500
 # Results in update time ~0.2s
 DISCOUNTED_PRODUCT_BATCH = 2000
@@ -150,16 +149,21 @@ def _get_channel_to_products_map(rule_to_variant_list):
     return channel_to_products_map
 
 
-def _get_existing_rule_variant_list(rules: QuerySet[PromotionRule]):
+def _get_existing_rule_variant_list(
+    rules: QuerySet[PromotionRule],
+    variants: QuerySet[ProductVariant] | None = None,
+):
     PromotionRuleVariant = PromotionRule.variants.through
-    existing_rules_variants = (
-        PromotionRuleVariant.objects.using(settings.DATABASE_CONNECTION_REPLICA_NAME)
-        .filter(Exists(rules.filter(pk=OuterRef("promotionrule_id"))))
-        .all()
-        .values_list(
-            "promotionrule_id",
-            "productvariant_id",
+    existing_rules_variants = PromotionRuleVariant.objects.using(
+        settings.DATABASE_CONNECTION_REPLICA_NAME
+    ).filter(Exists(rules.filter(pk=OuterRef("promotionrule_id"))))
+    if variants is not None:
+        existing_rules_variants = existing_rules_variants.filter(
+            Exists(variants.filter(pk=OuterRef("productvariant_id")))
         )
+    existing_rules_variants = existing_rules_variants.values_list(
+        "promotionrule_id",
+        "productvariant_id",
     )
     return [
         PromotionRuleVariant(promotionrule_id=rule_id, productvariant_id=variant_id)
@@ -215,6 +219,37 @@ def update_variant_relations_for_active_promotion_rules_task():
         update_variant_relations_for_active_promotion_rules_task.delay()
 
 
+@app.task
+@allow_writer()
+def update_variant_relations_for_products_task(product_ids: list[int]):
+    """Update the relations of active promotion rules with variants of the products.
+
+    Only the variants of the changed products are evaluated against the catalogue
+    predicates, so the rules are not re-expanded over the whole catalogue. Rules
+    marked as dirty are skipped, as they are re-expanded anyway.
+    """
+    rules = (
+        get_active_catalogue_promotion_rules(allow_replica=True)
+        .filter(variants_dirty=False)
+        .exclude(Q(reward_value__isnull=True) | Q(reward_value=0))
+    )
+    variants = ProductVariant.objects.using(
+        settings.DATABASE_CONNECTION_REPLICA_NAME
+    ).filter(product_id__in=product_ids)
+
+    # Fetch existing variant relations to also mark products which are no longer
+    # in the promotion as dirty
+    existing_variant_relation = _get_existing_rule_variant_list(rules, variants)
+
+    new_rule_to_variant_list = fetch_variants_for_promotion_rules(
+        rules=rules, variants=variants
+    )
+    channel_to_product_map = _get_channel_to_products_map(
+        existing_variant_relation + new_rule_to_variant_list
+    )
+    mark_products_in_channels_as_dirty(channel_to_product_map, allow_replica=True)
+
+
 @app.task
 @allow_writer()
 def update_products_discounted_prices_for_promotion_task(
@@ -309,14 +344,15 @@ def mark_products_search_vector_as_dirty(product_ids: list[int]):
     expires=settings.BEAT_UPDATE_SEARCH_EXPIRE_AFTER_SEC,
 )
 def update_products_search_vector_task():
-    products = (
-        Product.objects.using(settings.DATABASE_CONNECTION_REPLICA_NAME)
-        .filter(search_index_dirty=True)
-        .order_by("updated_at")[:PRODUCTS_BATCH_SIZE]
-        .values_list("id", flat=True)
-    )
+    """Update the search vectors of dirty products.
+
+    The dirty products are consumed in batches until none are left or it's
+    time for the next scheduled run.
+    """
     with allow_writer():
-        update_products_search_vector(products)
+        update_dirty_products_search_vector(
+            max_duration=settings.BEAT_UPDATE_SEARCH_SEC
+        )
 
 
 @app.task(queue=settings.COLLECTION_PRODUCT_UPDATED_QUEUE_NAME)
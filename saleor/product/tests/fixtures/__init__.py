@@ -1,3 +1,4 @@
+from .benchmark import *  # noqa: F403
 from .category import *  # noqa: F403
 from .collection import *  # noqa: F403
 from .digital_content import *  # noqa: F403
@@ -0,0 +1,94 @@
+import datetime
+from decimal import Decimal
+
+import pytest
+
+from ....warehouse.models import Stock
+from ...models import (
+    Product,
+    ProductChannelListing,
+    ProductVariant,
+    ProductVariantChannelListing,
+)
+
+PRODUCT_COUNT_IN_BENCHMARKS = 20
+VARIANTS_PER_PRODUCT = 5
+
+
+@pytest.fixture
+def products_for_benchmarks(
+    product_type, category, warehouse, channel_USD, default_tax_class
+):
+    products = Product.objects.bulk_create(
+        [
+            Product(
+                name=f"Benchmark product {i}",
+                slug=f"benchmark-product-{i}",
+                category=category,
+                product_type=product_type,
+                tax_class=default_tax_class,
+            )
+            for i in range(PRODUCT_COUNT_IN_BENCHMARKS)
+        ]
+    )
+    ProductChannelListing.objects.bulk_create(
+        [
+            ProductChannelListing(
+                product=product,
+                channel=channel_USD,
+                is_published=True,
+                discounted_price_amount=10,
+                currency=channel_USD.currency_code,
+                visible_in_listings=True,
+                available_for_purchase_at=(
+                    datetime.datetime(1999, 1, 1, tzinfo=datetime.UTC)
+                ),
+            )
+            for product in products
+        ]
+    )
+    variants = ProductVariant.objects.bulk_create(
+        [
+            ProductVariant(
+                product=product,
+                sku=f"benchmark-{product.pk}-{i}",
+                name=f"Variant {i}",
+            )
+            for product in products
+            for i in range(VARIANTS_PER_PRODUCT)
+        ]
+    )
+    ProductVariantChannelListing.objects.bulk_create(
+        [
+            ProductVariantChannelListing(
+                variant=variant,
+                channel=channel_USD,
+                price_amount=Decimal(10 + i % 7),
+                discounted_price_amount=Decimal(10 + i % 7),
+                cost_price_amount=Decimal(1),
+                currency=channel_USD.currency_code,
+            )
+            for i, variant in enumerate(variants)
+        ]
+    )
+    Stock.objects.bulk_create(
+        [
+            Stock(warehouse=warehouse, product_variant=variant, quantity=100)
+            for variant in variants
+        ]
+    )
+    for product in products:
+        product.default_variant = next(
+            variant for variant in variants if variant.product_id == product.pk
+        )
+    Product.objects.bulk_update(products, ["default_variant"])
+    return products
+
+
+@pytest.fixture
+def variants_for_benchmarks(products_for_benchmarks):
+    return list(
+        ProductVariant.objects.filter(product__in=products_for_benchmarks).order_by(
+            "pk"
+        )
+    )
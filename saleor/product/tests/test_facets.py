@@ -0,0 +1,133 @@
+from django.core.cache import cache
+
+from ...attribute.models import AssignedProductAttributeValue
+from ...attribute.utils import associate_attribute_values_to_instance
+from ..facets import (
+    PRODUCT_FACETS_KEY_PREFIX,
+    PRODUCT_FACETS_VERSION_KEY,
+    build_product_facet_index,
+    get_product_facet_counts,
+    get_product_facet_index,
+    invalidate_product_facet_index,
+)
+from ..models import Product, ProductVariant
+
+
+def test_product_facet_counts(product_list, color_attribute):
+    # given
+    red, blue = color_attribute.values.all()
+    AssignedProductAttributeValue.objects.filter(product__in=product_list).delete()
+    for product, value in zip(product_list, [red, red, blue], strict=True):
+        AssignedProductAttributeValue.objects.create(product=product, value=value)
+    index = build_product_facet_index("default")
+
+    # when
+    counts = get_product_facet_counts(Product.objects.all(), index)
+
+    # then
+    assert counts[color_attribute.pk] == {red.pk: 2, blue.pk: 1}
+
+
+def test_product_facet_counts_limited_to_given_products(product_list, color_attribute):
+    # given
+    red, blue = color_attribute.values.all()
+    AssignedProductAttributeValue.objects.filter(product__in=product_list).delete()
+    for product, value in zip(product_list, [red, red, blue], strict=True):
+        AssignedProductAttributeValue.objects.create(product=product, value=value)
+    index = build_product_facet_index("default")
+    products = Product.objects.filter(pk__in=[product_list[0].pk, product_list[2].pk])
+
+    # when
+    counts = get_product_facet_counts(products, index)
+
+    # then
+    assert counts[color_attribute.pk] == {red.pk: 1, blue.pk: 1}
+
+
+def test_product_facet_counts_include_variant_values_once_per_product(
+    product, size_attribute
+):
+    # given
+    product.product_type.variant_attributes.add(size_attribute)
+    small = size_attribute.values.first()
+    variant = product.variants.first()
+    second_variant = ProductVariant.objects.create(product=product, sku="456")
+    for instance in (variant, second_variant):
+        associate_attribute_values_to_instance(instance, {size_attribute.pk: [small]})
+    index = build_product_facet_index("default")
+
+    # when
+    counts = get_product_facet_counts(Product.objects.all(), index)
+
+    # then
+    assert counts[size_attribute.pk] == {small.pk: 1}
+
+
+def test_product_facet_counts_skip_not_filterable_attributes(
+    product_list, color_attribute
+):
+    # given
+    color_attribute.filterable_in_storefront = False
+    color_attribute.save(update_fields=["filterable_in_storefront"])
+    red = color_attribute.values.first()
+    AssignedProductAttributeValue.objects.filter(product__in=product_list).delete()
+    AssignedProductAttributeValue.objects.create(product=product_list[0], value=red)
+    index = build_product_facet_index("default")
+
+    # when
+    counts = get_product_facet_counts(Product.objects.all(), index)
+
+    # then
+    assert color_attribute.pk not in counts
+
+
+def test_product_facet_index_cached(
+    product_list, color_attribute, django_assert_num_queries
+):
+    # given
+    cache.clear()
+    invalidate_product_facet_index()
+    index = get_product_facet_index()
+
+    # when
+    with django_assert_num_queries(0):
+        cached_index = get_product_facet_index()
+
+    # then
+    assert cached_index is index
+
+
+def test_product_facet_index_rebuilt_after_invalidation(product_list, color_attribute):
+    # given
+    cache.clear()
+    invalidate_product_facet_index()
+    red = color_attribute.values.first()
+    AssignedProductAttributeValue.objects.filter(product__in=product_list).delete()
+    get_product_facet_index()
+    AssignedProductAttributeValue.objects.create(product=product_list[0], value=red)
+
+    # when
+    invalidate_product_facet_index()
+    index = get_product_facet_index()
+
+    # then
+    assert list(index.value_to_products[red.pk]) == [product_list[0].pk]
+
+
+def test_product_facet_index_being_built_by_other_process(
+    product_list, color_attribute, django_assert_num_queries
+):
+    # given
+    cache.clear()
+    invalidate_product_facet_index()
+    index = get_product_facet_index()
+    invalidate_product_facet_index()
+    version = cache.get(PRODUCT_FACETS_VERSION_KEY)
+    cache.set(f"{PRODUCT_FACETS_KEY_PREFIX}:{version}:lock", True)
+
+    # when
+    with django_assert_num_queries(0):
+        outdated_index = get_product_facet_index()
+
+    # then
+    assert outdated_index is index
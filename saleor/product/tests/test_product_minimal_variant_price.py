@@ -1,17 +1,24 @@
 import datetime
+import uuid
 from decimal import Decimal
 from unittest.mock import patch
 
 import graphene
 import pytest
 from django.core.management import call_command
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
 from prices import Money
 
 from ...discount import RewardValueType
 from ...discount.models import Promotion, PromotionRule
 from ...product.models import Product, VariantChannelListingPromotionRule
 from ...tests import race_condition
-from ..utils.variant_prices import update_discounted_prices_for_promotion
+from ..utils.variant_prices import (
+    _get_best_discount,
+    _RuleRewards,
+    update_discounted_prices_for_promotion,
+)
 
 
 def test_update_discounted_price_for_promotion_no_discount(product, channel_USD):
@@ -663,3 +670,109 @@ def test_update_discounted_prices_for_promotion_only_dirty_products(
     )
     second_listing.refresh_from_db()
     assert second_listing.discounted_price_amount == second_channel_discounted_price
+
+
+@pytest.mark.parametrize(
+    ("price", "currency", "reward_value_type", "reward_value"),
+    [
+        ("9.99", "USD", RewardValueType.PERCENTAGE, "10"),
+        ("0.01", "USD", RewardValueType.PERCENTAGE, "10"),
+        ("0.05", "USD", RewardValueType.PERCENTAGE, "10"),
+        ("10.005", "USD", RewardValueType.PERCENTAGE, "50"),
+        ("1234.567", "USD", RewardValueType.PERCENTAGE, "33.333"),
+        ("999", "JPY", RewardValueType.PERCENTAGE, "15"),
+        ("1.235", "KWD", RewardValueType.PERCENTAGE, "12.5"),
+        ("10", "USD", RewardValueType.PERCENTAGE, "150"),
+        ("9.99", "USD", RewardValueType.FIXED, "2"),
+        ("9.99", "USD", RewardValueType.FIXED, "20"),
+        ("100", "JPY", RewardValueType.FIXED, "0.5"),
+    ],
+)
+def test_get_best_discount_matches_rule_discount(
+    price, currency, reward_value_type, reward_value
+):
+    # given
+    rule = PromotionRule(
+        id=uuid.uuid4(),
+        reward_value_type=reward_value_type,
+        reward_value=Decimal(reward_value),
+    )
+    price = Money(Decimal(price), currency)
+    rule_rewards = _RuleRewards()
+    exponent, step = rule_rewards.get_units(currency)
+
+    # when
+    rule_id, discount = _get_best_discount(
+        int(price.amount.scaleb(exponent)),
+        [(rule.id, *rule_rewards.get_reward(rule, currency))],
+        exponent,
+        step,
+    )
+
+    # then
+    expected_discount = price - rule.get_discount(currency)(price)
+    assert rule_id == rule.id
+    assert Decimal(discount).scaleb(-exponent) == expected_discount.amount
+
+
+def test_get_best_discount_picks_first_of_equal_discounts():
+    # given
+    rule_ids = [uuid.uuid4(), uuid.uuid4()]
+    rewards = [(rule_id, False, 1000) for rule_id in rule_ids]
+
+    # when
+    rule_id, discount = _get_best_discount(5000, rewards, 3, 10)
+
+    # then
+    assert rule_id == rule_ids[0]
+    assert discount == 1000
+
+
+def test_update_discounted_price_for_promotion_deletes_outdated_rules_in_bulk(
+    product_list, channel_USD
+):
+    # given
+    promotion = Promotion.objects.create(name="Promotion")
+    rule = promotion.rules.create(
+        name="Fixed promotion rule",
+        promotion=promotion,
+        catalogue_predicate={},
+        reward_value_type=RewardValueType.FIXED,
+        reward_value=Decimal(1),
+    )
+    rule.channels.add(channel_USD)
+    variant_channel_listings = []
+    for product in product_list:
+        variant_channel_listing = product.variants.first().channel_listings.get(
+            channel_id=channel_USD.id
+        )
+        variant_channel_listing.discounted_price_amount = (
+            variant_channel_listing.price_amount - 1
+        )
+        variant_channel_listing.save(update_fields=["discounted_price_amount"])
+        VariantChannelListingPromotionRule.objects.create(
+            variant_channel_listing=variant_channel_listing,
+            promotion_rule=rule,
+            discount_amount=Decimal(1),
+            currency=channel_USD.currency_code,
+        )
+        variant_channel_listings.append(variant_channel_listing)
+
+    # when
+    with CaptureQueriesContext(connection) as ctx:
+        update_discounted_prices_for_promotion(
+            Product.objects.filter(id__in=[product.id for product in product_list])
+        )
+
+    # then
+    delete_queries = [
+        query for query in ctx.captured_queries if query["sql"].startswith("DELETE")
+    ]
+    assert len(delete_queries) == 1
+    assert not VariantChannelListingPromotionRule.objects.exists()
+    for variant_channel_listing in variant_channel_listings:
+        variant_channel_listing.refresh_from_db()
+        assert (
+            variant_channel_listing.discounted_price_amount
+            == variant_channel_listing.price_amount
+        )
@@ -1,5 +1,19 @@
+from unittest.mock import patch
+
+import pytest
+from django.core.management import call_command
+
+from ...attribute.models import AttributeValue
+from ...attribute.utils import associate_attribute_values_to_instance
+from ..management.commands.update_products_search_vector import split_pk_range
 from ..models import Product
-from ..search import update_products_search_vector
+from ..search import (
+    autocomplete_products,
+    claim_dirty_products,
+    prepare_product_search_document_value,
+    update_dirty_products_search_vector,
+    update_products_search_vector,
+)
 
 
 def test_update_products_search_vector(product_list):
@@ -15,3 +29,235 @@ def test_update_products_search_vector(product_list):
     for product in product_list:
         product.refresh_from_db()
         assert product.search_vector
+
+
+def test_update_products_search_vector_variant_page_reference(
+    product, variant, page, product_type_page_reference_attribute
+):
+    # given
+    attribute = product_type_page_reference_attribute
+    product.product_type.variant_attributes.add(attribute)
+    page.title = "Brand"
+    page.save(update_fields=["title"])
+    attr_value = AttributeValue.objects.create(
+        attribute=attribute,
+        name=page.title,
+        slug=f"{variant.pk}_{page.pk}",
+        reference_page=page,
+    )
+    associate_attribute_values_to_instance(variant, {attribute.pk: [attr_value]})
+
+    # when
+    update_products_search_vector([product.id])
+
+    # then
+    product.refresh_from_db()
+    assert page.title.lower() in product.search_vector
+
+
+def test_claim_dirty_products(product_list):
+    # given
+    Product.objects.update(search_index_dirty=True)
+
+    # when
+    product_ids = claim_dirty_products(2)
+
+    # then
+    assert len(product_ids) == 2
+    assert set(
+        Product.objects.filter(search_index_dirty=True).values_list("id", flat=True)
+    ) == {product.id for product in product_list} - set(product_ids)
+
+
+@patch("saleor.product.search.record_search_index_lag")
+@patch("saleor.product.search.record_search_index_batch")
+def test_update_dirty_products_search_vector(
+    mocked_record_batch, mocked_record_lag, product_list, monkeypatch
+):
+    # given
+    monkeypatch.setattr("saleor.product.search.PRODUCTS_BATCH_SIZE", 2)
+    Product.objects.update(search_index_dirty=True, search_vector=None)
+
+    # when
+    updated_count = update_dirty_products_search_vector(max_duration=60)
+
+    # then
+    assert updated_count == len(product_list)
+    assert not Product.objects.filter(search_index_dirty=True).exists()
+    assert not Product.objects.filter(search_vector=None).exists()
+    assert mocked_record_batch.call_count == 2
+    mocked_record_lag.assert_called_once_with(0)
+
+
+def test_update_dirty_products_search_vector_stops_after_max_duration(
+    product_list, monkeypatch
+):
+    # given
+    monkeypatch.setattr("saleor.product.search.PRODUCTS_BATCH_SIZE", 1)
+    Product.objects.update(search_index_dirty=True)
+
+    # when
+    updated_count = update_dirty_products_search_vector(max_duration=0)
+
+    # then
+    assert updated_count == 1
+    assert Product.objects.filter(search_index_dirty=True).count() == (
+        len(product_list) - 1
+    )
+
+
+def test_update_dirty_products_search_vector_product_changed_during_update(product):
+    # given
+    product.search_index_dirty = True
+    product.save(update_fields=["search_index_dirty"])
+
+    def update_with_concurrent_change(product_ids, **kwargs):
+        update_products_search_vector(product_ids, **kwargs)
+        Product.objects.filter(id__in=product_ids).update(search_index_dirty=True)
+
+    # when
+    with patch(
+        "saleor.product.search.update_products_search_vector",
+        side_effect=update_with_concurrent_change,
+    ):
+        update_dirty_products_search_vector(max_duration=0)
+
+    # then
+    product.refresh_from_db()
+    assert product.search_index_dirty is True
+
+
+def test_update_dirty_products_search_vector_marks_products_dirty_on_error(product):
+    # given
+    product.search_index_dirty = True
+    product.save(update_fields=["search_index_dirty"])
+
+    # when
+    with patch(
+        "saleor.product.search.update_products_search_vector",
+        side_effect=ValueError("Indexing failed."),
+    ):
+        with pytest.raises(ValueError, match="Indexing failed."):
+            update_dirty_products_search_vector(max_duration=60)
+
+    # then
+    product.refresh_from_db()
+    assert product.search_index_dirty is True
+
+
+@pytest.mark.parametrize(
+    ("min_pk", "max_pk", "parts", "expected_ranges"),
+    [
+        (1, 10, 3, [(1, 4), (5, 8), (9, 10)]),
+        (1, 2, 4, [(1, 1), (2, 2)]),
+        (5, 5, 2, [(5, 5)]),
+    ],
+)
+def test_split_pk_range(min_pk, max_pk, parts, expected_ranges):
+    # when
+    ranges = split_pk_range(min_pk, max_pk, parts)
+
+    # then
+    assert ranges == expected_ranges
+
+
+def test_update_products_search_vector_command(product_list):
+    # given
+    dirty_product, clean_product = product_list[:2]
+    Product.objects.update(search_vector=None)
+    dirty_product.search_index_dirty = True
+    dirty_product.save(update_fields=["search_index_dirty"])
+    Product.objects.exclude(id__in=[dirty_product.id, clean_product.id]).update(
+        search_index_dirty=False
+    )
+
+    # when
+    call_command("update_products_search_vector", processes=1)
+
+    # then
+    assert not Product.objects.filter(search_index_dirty=True).exists()
+    assert not Product.objects.filter(search_vector=None).exists()
+
+
+def test_update_products_search_vector_command_all_products(product_list):
+    # given
+    Product.objects.update(search_vector=None)
+    Product.objects.filter(id=product_list[0].id).update(
+        search_vector=None, search_index_dirty=False
+    )
+
+    # when
+    call_command("update_products_search_vector", "--all", processes=1)
+
+    # then
+    assert not Product.objects.filter(search_vector=None).exists()
+
+
+def test_prepare_product_search_document_value(product):
+    # given
+    variant = product.variants.first()
+    product_value = product.attributevalues.first().value
+    variant_value = variant.attributes.first().values.first()
+
+    # when
+    search_document = prepare_product_search_document_value(product)
+
+    # then
+    assert search_document.split("\n") == [
+        product.name.lower(),
+        variant.sku,
+        product_value.name.lower(),
+        variant_value.name.lower(),
+    ]
+
+
+def test_update_products_search_vector_sets_search_document(product_list):
+    # given
+    Product.objects.update(search_document="")
+
+    # when
+    update_products_search_vector(Product.objects.all().values_list("id", flat=True))
+
+    # then
+    assert not Product.objects.filter(search_document="").exists()
+
+
+def test_autocomplete_products(product_list):
+    # given
+    first_product, second_product, third_product = product_list
+    first_product.name = "Running sneakers"
+    second_product.name = "Sneakers"
+    third_product.name = "Boots"
+    Product.objects.bulk_update(product_list, ["name"])
+    update_products_search_vector([product.id for product in product_list])
+
+    # when
+    products = autocomplete_products(Product.objects.all(), " Sneak")
+
+    # then
+    assert list(products) == [second_product, first_product]
+
+
+def test_autocomplete_products_by_sku_prefix(product_list):
+    # given
+    variant = product_list[1].variants.first()
+    variant.sku = "SKU-ABC-123"
+    variant.save(update_fields=["sku"])
+    update_products_search_vector([product.id for product in product_list])
+
+    # when
+    products = autocomplete_products(Product.objects.all(), "sku-ab")
+
+    # then
+    assert list(products) == [product_list[1]]
+
+
+def test_autocomplete_products_too_short_fragment(product_list):
+    # given
+    update_products_search_vector([product.id for product in product_list])
+
+    # when
+    products = autocomplete_products(Product.objects.all(), "te")
+
+    # then
+    assert not products.exists()
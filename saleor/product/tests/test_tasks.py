@@ -3,6 +3,7 @@ import logging
 from decimal import Decimal
 from unittest.mock import patch
 
+import graphene
 import pytest
 from django.utils import timezone
 from faker import Faker
@@ -16,6 +17,7 @@ from ..tasks import (
     recalculate_discounted_price_for_products_task,
     update_products_search_vector_task,
     update_variant_relations_for_active_promotion_rules_task,
+    update_variant_relations_for_products_task,
     update_variants_names,
 )
 from ..utils.variants import fetch_variants_for_promotion_rules
@@ -57,6 +59,86 @@ def test_update_variant_relations_for_active_promotion_rules_task(
     assert update_variant_relations_for_active_promotion_rules_task_mock.called
 
 
+@pytest.fixture
+def collection_promotion_rule(collection, channel_USD):
+    promotion = Promotion.objects.create(
+        name="Promotion",
+        type=PromotionType.CATALOGUE,
+        end_date=timezone.now() + datetime.timedelta(days=30),
+    )
+    rule = promotion.rules.create(
+        name="Collection promotion rule",
+        reward_value_type=RewardValueType.PERCENTAGE,
+        reward_value=Decimal(10),
+        catalogue_predicate={
+            "collectionPredicate": {
+                "ids": [graphene.Node.to_global_id("Collection", collection.id)]
+            }
+        },
+    )
+    rule.channels.add(channel_USD)
+    return rule
+
+
+def test_update_variant_relations_for_products_task_adds_changed_products_only(
+    collection_promotion_rule, collection, product_list
+):
+    # given
+    rule = collection_promotion_rule
+    added_product, not_updated_product = product_list[:2]
+    collection.products.add(added_product, not_updated_product)
+    ProductChannelListing.objects.update(discounted_price_dirty=False)
+
+    # when
+    update_variant_relations_for_products_task([added_product.id])
+
+    # then
+    assert set(rule.variants.all()) == set(added_product.variants.all())
+    assert ProductChannelListing.objects.get(
+        product=added_product, channel__in=rule.channels.all()
+    ).discounted_price_dirty
+    assert not ProductChannelListing.objects.filter(
+        product=not_updated_product, discounted_price_dirty=True
+    ).exists()
+
+
+def test_update_variant_relations_for_products_task_removes_changed_products(
+    collection_promotion_rule, collection, product_list
+):
+    # given
+    rule = collection_promotion_rule
+    removed_product, product_in_collection = product_list[:2]
+    collection.products.add(removed_product, product_in_collection)
+    fetch_variants_for_promotion_rules(PromotionRule.objects.filter(pk=rule.pk))
+    collection.products.remove(removed_product)
+    ProductChannelListing.objects.update(discounted_price_dirty=False)
+
+    # when
+    update_variant_relations_for_products_task([removed_product.id])
+
+    # then
+    assert set(rule.variants.all()) == set(product_in_collection.variants.all())
+    assert ProductChannelListing.objects.get(
+        product=removed_product, channel__in=rule.channels.all()
+    ).discounted_price_dirty
+
+
+def test_update_variant_relations_for_products_task_skips_dirty_rules(
+    collection_promotion_rule, collection, product
+):
+    # given
+    rule = collection_promotion_rule
+    rule.variants_dirty = True
+    rule.save(update_fields=["variants_dirty"])
+    collection.products.add(product)
+
+    # when
+    update_variant_relations_for_products_task([product.id])
+
+    # then
+    assert not rule.variants.exists()
+
+
 @patch(
     "saleor.product.tasks.update_variant_relations_for_active_promotion_rules_task."
     "delay"
@@ -309,7 +391,7 @@ def test_update_products_search_vector_task_with_static_number_of_queries(
         product_list[i].save(update_fields=["search_index_dirty"])
 
     # when & # then
-    with django_assert_num_queries(16):
+    with django_assert_num_queries(20):
         update_products_search_vector_task()
 
 
@@ -1,20 +1,17 @@
 from collections import defaultdict
-from decimal import Decimal
+from decimal import ROUND_HALF_UP, Decimal
 from uuid import UUID
 
+from babel.numbers import get_currency_precision
 from django.conf import settings
 from django.db import transaction
 from django.db.models import Exists, OuterRef
 from prices import Money
 
 from ...channel.models import Channel
-from ...core.taxes import zero_money
-from ...discount import PromotionRuleInfo
+from ...discount import PromotionRuleInfo, RewardValueType
 from ...discount.models import PromotionRule
-from ...discount.utils.promotion import (
-    calculate_discounted_price_for_promotions,
-    get_variants_to_promotion_rules_map,
-)
+from ...discount.utils.promotion import get_variants_to_promotion_rules_map
 from ..managers import ProductsQueryset, ProductVariantQueryset
 from ..models import (
     ProductChannelListing,
@@ -54,6 +51,10 @@ def update_discounted_prices_for_promotion(
 
     changed_variant_listing_promotion_rule_to_create = []
     changed_variant_listing_promotion_rule_to_update = []
+    changed_variant_listing_ids_per_rule_id: dict[UUID | None, list[int]] = defaultdict(
+        list
+    )
+    rule_rewards = _RuleRewards()
 
     product_channel_listings = (
         ProductChannelListing.objects.using(settings.DATABASE_CONNECTION_REPLICA_NAME)
@@ -61,7 +62,9 @@ def update_discounted_prices_for_promotion(
         .prefetch_related("channel")
     )
     if only_dirty_products:
-        product_channel_listings.filter(discounted_price_dirty=True)
+        product_channel_listings = product_channel_listings.filter(
+            discounted_price_dirty=True
+        )
 
     for product_channel_listing in product_channel_listings:
         product_id = product_channel_listing.product_id
@@ -81,6 +84,8 @@ def update_discounted_prices_for_promotion(
             rules_info_per_variant,
             product_channel_listing.channel,
             variant_listing_to_listing_rule_per_rule_map,
+            rule_rewards,
+            changed_variant_listing_ids_per_rule_id,
         )
 
         product_discounted_price = min(discounted_variants_price)
@@ -93,12 +98,13 @@ def update_discounted_prices_for_promotion(
         )
 
         # check if the product discounted_price has changed
-        if product_channel_listing.discounted_price != product_discounted_price:
-            product_channel_listing.discounted_price_amount = (
-                product_discounted_price.amount
-            )
+        if product_channel_listing.discounted_price_amount != product_discounted_price:
+            product_channel_listing.discounted_price_amount = product_discounted_price
             changed_products_listings_to_update.append(product_channel_listing)
 
+    _delete_outdated_variant_listing_promotion_rules(
+        changed_variant_listing_ids_per_rule_id
+    )
     _update_or_create_listings(
         changed_products_listings_to_update,
         changed_variants_listings_to_update,
@@ -107,6 +113,20 @@ def update_discounted_prices_for_promotion(
     )
 
 
+def _delete_outdated_variant_listing_promotion_rules(
+    variant_listing_ids_per_rule_id: dict[UUID | None, list[int]],
+):
+    """Delete variant listing - promotion rule relations that are not valid anymore.
+
+    The relations of the variant listings with a changed discounted price are
+    deleted, except the ones with the rule applied now.
+    """
+    for rule_id, listing_ids in variant_listing_ids_per_rule_id.items():
+        VariantChannelListingPromotionRule.objects.filter(
+            variant_channel_listing_id__in=listing_ids
+        ).exclude(promotion_rule_id=rule_id).delete()
+
+
 def _update_or_create_listings(
     changed_products_listings_to_update: list[ProductChannelListing],
     changed_variants_listings_to_update: list[ProductVariantChannelListing],
@@ -239,63 +259,143 @@ def _get_variant_listings_to_listing_rule_per_rule_id_map(
     return variant_listing_rule_data
 
 
+class _RuleRewards:
+    """Rewards of the promotion rules in integer units of the currencies.
+
+    Amounts are converted to integers of the smallest unit stored in the database,
+    or of the currency, when it is more precise, so the discounts of all variant
+    listings are computed with integer arithmetic. The results are the same as of
+    `PromotionRule.get_discount`: percentage discounts are rounded half up to the
+    currency precision and discounts never exceed the price.
+    """
+
+    def __init__(self):
+        self._units: dict[str, tuple[int, int]] = {}
+        self._rewards: dict[tuple[UUID, str], tuple[bool, int]] = {}
+
+    def get_units(self, currency: str) -> tuple[int, int]:
+        """Return the exponent of the unit and the rounding step of the currency."""
+        if currency not in self._units:
+            precision = get_currency_precision(currency)
+            exponent = max(settings.DEFAULT_DECIMAL_PLACES, precision)
+            self._units[currency] = exponent, 10 ** (exponent - precision)
+        return self._units[currency]
+
+    def get_reward(self, rule: PromotionRule, currency: str) -> tuple[bool, int]:
+        """Return whether the reward is a percentage and its value in units."""
+        key = (rule.id, currency)
+        if key not in self._rewards:
+            if rule.reward_value_type not in (
+                RewardValueType.FIXED,
+                RewardValueType.PERCENTAGE,
+            ):
+                raise NotImplementedError("Unknown discount type")
+            # Only the gift rules have no reward value, and they have no reward
+            # value type either.
+            assert rule.reward_value is not None
+            exponent, _ = self.get_units(currency)
+            self._rewards[key] = (
+                rule.reward_value_type == RewardValueType.PERCENTAGE,
+                _to_units(rule.reward_value, exponent),
+            )
+        return self._rewards[key]
+
+
+def _to_units(amount: Decimal, exponent: int) -> int:
+    return int(amount.scaleb(exponent).to_integral_value(rounding=ROUND_HALF_UP))
+
+
+def _from_units(units: int, exponent: int) -> Decimal:
+    return Decimal(units).scaleb(-exponent)
+
+
+def _get_best_discount(
+    price: int,
+    rewards: list[tuple[UUID, bool, int]],
+    exponent: int,
+    step: int,
+) -> tuple[UUID, int] | None:
+    """Return the rule giving the highest discount for the price, in units."""
+    best_discount = None
+    # percentage discount is `price * percentage / 100` rounded half up to `step`
+    percentage_denominator = 100 * 10**exponent * step
+    for rule_id, is_percentage, value in rewards:
+        if is_percentage:
+            discount = (
+                (2 * price * value + percentage_denominator)
+                // (2 * percentage_denominator)
+                * step
+            )
+        else:
+            discount = value
+        discount = min(discount, price)
+        if best_discount is None or discount > best_discount[1]:
+            best_discount = (rule_id, discount)
+    return best_discount
+
+
 def _get_discounted_variants_prices_for_promotions(
     variant_listings: list[ProductVariantChannelListing],
     rules_info_per_variant: dict[int, list[PromotionRuleInfo]],
     channel: Channel,
     variant_listing_to_listing_rule_per_rule_map: dict,
+    rule_rewards: _RuleRewards,
+    changed_variant_listing_ids_per_rule_id: dict[UUID | None, list[int]],
 ) -> tuple[
-    Money,
+    list[Decimal],
     list[ProductVariantChannelListing],
     list[VariantChannelListingPromotionRule],
     list[VariantChannelListingPromotionRule],
 ]:
+    """Return the discounted prices of the variant listings and the changes to save.
+
+    IDs of the variant listings with a changed discounted price are added to
+    `changed_variant_listing_ids_per_rule_id`, under the ID of the applied rule.
+    """
     variants_listings_to_update: list[ProductVariantChannelListing] = []
-    discounted_variants_price: list[Money] = []
+    discounted_variants_price: list[Decimal] = []
     variant_listing_promotion_rule_to_create: list[
         VariantChannelListingPromotionRule
     ] = []
     variant_listing_promotion_rule_to_update: list[
         VariantChannelListingPromotionRule
     ] = []
+    currency = channel.currency_code
+    exponent, step = rule_rewards.get_units(currency)
     for variant_listing in variant_listings:
-        applied_discount = calculate_discounted_price_for_promotions(
-            price=variant_listing.price,
-            rules_info_per_variant=rules_info_per_variant,
-            channel=channel,
-            variant_id=variant_listing.variant_id,
-        )
-        discounted_variant_price = variant_listing.price
+        # Listings without a price are skipped by the queryset.
+        assert variant_listing.price_amount is not None
+        price = _to_units(variant_listing.price_amount, exponent)
+        rewards = [
+            (rule_info.rule.id, *rule_rewards.get_reward(rule_info.rule, currency))
+            for rule_info in rules_info_per_variant.get(variant_listing.variant_id, [])
+            if channel.id in rule_info.channel_ids
+        ]
+        applied_discount = _get_best_discount(price, rewards, exponent, step)
+        discounted_variant_price = price
 
         rule_id = None
         if applied_discount:
             rule_id, discount = applied_discount
             discounted_variant_price -= discount
-            discounted_variant_price = max(
-                discounted_variant_price, zero_money(discounted_variant_price.currency)
-            )
 
             _handle_discount_rule_id(
                 variant_listing,
                 rule_id,
                 variant_listing_to_listing_rule_per_rule_map,
-                discount.amount,
-                channel.currency_code,
+                _from_units(discount, exponent),
+                currency,
                 variant_listing_promotion_rule_to_update,
                 variant_listing_promotion_rule_to_create,
             )
 
-        if variant_listing.discounted_price != discounted_variant_price:
-            variant_listing.discounted_price_amount = discounted_variant_price.amount
+        discounted_price_amount = _from_units(discounted_variant_price, exponent)
+        if variant_listing.discounted_price_amount != discounted_price_amount:
+            variant_listing.discounted_price_amount = discounted_price_amount
             variants_listings_to_update.append(variant_listing)
+            changed_variant_listing_ids_per_rule_id[rule_id].append(variant_listing.id)
 
-            # delete variant listing - promotion rules relations that are not valid
-            # anymore
-            VariantChannelListingPromotionRule.objects.filter(
-                variant_channel_listing_id=variant_listing.id
-            ).exclude(promotion_rule_id=rule_id).delete()
-
-        discounted_variants_price.append(discounted_variant_price)
+        discounted_variants_price.append(discounted_price_amount)
 
     return (
         discounted_variants_price,
@@ -7,6 +7,7 @@ from django.db.models import QuerySet
 from ...attribute import AttributeType
 from ...discount.models import PromotionRule
 from ...discount.utils.promotion import update_rule_variant_relation
+from ..managers import ProductVariantQueryset
 from ..models import ProductVariant
 
 if TYPE_CHECKING:
@@ -53,14 +54,23 @@ def get_variant_selection_attributes(
     ]
 
 
-def fetch_variants_for_promotion_rules(rules: QuerySet[PromotionRule]):
+def fetch_variants_for_promotion_rules(
+    rules: QuerySet[PromotionRule],
+    variants: ProductVariantQueryset | None = None,
+):
+    """Update the variants of the rules based on their catalogue predicates.
+
+    When `variants` are given, only these variants are evaluated against the
+    predicates and only their relations with the rules are updated.
+    """
     from ...graphql.discount.utils import get_variants_for_catalogue_predicate
 
     PromotionRuleVariant = PromotionRule.variants.through
     new_rules_variants = []
     for rule in rules.iterator(chunk_size=1000):
-        variants = get_variants_for_catalogue_predicate(
+        rule_variants = get_variants_for_catalogue_predicate(
             rule.catalogue_predicate,
+            queryset=variants,
             database_connection_name=settings.DATABASE_CONNECTION_REPLICA_NAME,
         )
         new_rules_variants.extend(
@@ -68,7 +78,7 @@ def fetch_variants_for_promotion_rules(rules: QuerySet[PromotionRule]):
                 PromotionRuleVariant(
                     promotionrule_id=rule.pk, productvariant_id=variant_id
                 )
-                for variant_id in set(variants.values_list("pk", flat=True))
+                for variant_id in set(rule_variants.values_list("pk", flat=True))
             ]
         )
-    return update_rule_variant_relation(rules, new_rules_variants)
+    return update_rule_variant_relation(rules, new_rules_variants, variants=variants)
@@ -617,6 +617,11 @@ EXPORT_FILES_TIMEDELTA = datetime.timedelta(
     seconds=parse(os.environ.get("EXPORT_FILES_TIMEDELTA", "30 days"))
 )
 
+# Number of products exported by a single Celery task. Larger product exports are
+# split into shards of this size, exported in parallel and merged into a single file.
+# Sharding requires CELERY_RESULT_BACKEND and is disabled when set to 0.
+EXPORT_PRODUCTS_SHARD_SIZE = int(os.environ.get("EXPORT_PRODUCTS_SHARD_SIZE", 0))
+
 # CELERY SETTINGS
 CELERY_ACCEPT_CONTENT = ["json"]
 CELERY_BROKER_URL = (
@@ -793,6 +798,17 @@ OBSERVABILITY_REPORT_PERIOD = datetime.timedelta(
 OBSERVABILITY_BUFFER_TIMEOUT = datetime.timedelta(
     seconds=parse(os.environ.get("OBSERVABILITY_BUFFER_TIMEOUT", "5 minutes"))
 )
+# Maximum number of events buffered in the memory of each process before being
+# pushed to the broker by a background thread; 0 pushes each event synchronously.
+OBSERVABILITY_LOCAL_BUFFER_SIZE = int(
+    os.environ.get("OBSERVABILITY_LOCAL_BUFFER_SIZE", 1000)
+)
+# The locally buffered events are pushed to the broker at least this often.
+OBSERVABILITY_LOCAL_BUFFER_FLUSH_INTERVAL = datetime.timedelta(
+    seconds=parse(
+        os.environ.get("OBSERVABILITY_LOCAL_BUFFER_FLUSH_INTERVAL", "1 second")
+    )
+)
 if OBSERVABILITY_ACTIVE:
     CELERY_BEAT_SCHEDULE["observability-reporter"] = {
         "task": "saleor.webhook.transport.asynchronous.transport.observability_reporter_task",
@@ -868,6 +884,28 @@ GRAPHQL_QUERY_MAX_COMPLEXITY = int(
     os.environ.get("GRAPHQL_QUERY_MAX_COMPLEXITY", 50000)
 )
 
+# Return the row count estimated by the database for the `totalCount` of connections
+# with more items than the threshold. Set to 0 to always count the items exactly.
+GRAPHQL_TOTAL_COUNT_ESTIMATE_THRESHOLD = int(
+    os.environ.get("GRAPHQL_TOTAL_COUNT_ESTIMATE_THRESHOLD", 0)
+)
+# Cache the exact `totalCount` of connections for the given number of seconds.
+# Set to 0 to disable the cache.
+GRAPHQL_TOTAL_COUNT_CACHE_TIMEOUT = int(
+    os.environ.get("GRAPHQL_TOTAL_COUNT_CACHE_TIMEOUT", 0)
+)
+
+# Reject queries which aren't registered as persisted queries, unless they are sent
+# by a staff user or an app (e.g. the dashboard).
+GRAPHQL_PERSISTED_QUERIES_ALLOWLIST_ONLY = get_bool_from_env(
+    "GRAPHQL_PERSISTED_QUERIES_ALLOWLIST_ONLY", False
+)
+
+# Generate thumbnails of product media, categories and collections in the background,
+# when the image is saved. Until a thumbnail is ready, the thumbnail URL redirects to
+# the closest existing size or to the original image.
+THUMBNAIL_ASYNC_GENERATION = get_bool_from_env("THUMBNAIL_ASYNC_GENERATION", True)
+
 # Max number entities that can be requested in single query by Apollo Federation
 # Federation protocol implements no securities on its own part - malicious actor
 # may build a query that requests for potentially few thousands of entities.
@@ -914,6 +952,18 @@ HTTP_IP_FILTER_ALLOW_LOOPBACK_IPS: bool = get_bool_from_env(
     "HTTP_IP_FILTER_ALLOW_LOOPBACK_IPS", False
 )
 
+# The max number of connections kept alive for each origin by the pooled HTTP client
+# used by webhooks.
+HTTP_CLIENT_POOL_SIZE = int(os.environ.get("HTTP_CLIENT_POOL_SIZE", 10))
+
+# Time (sec) after which the connections to an origin unused by the pooled HTTP
+# client are closed.
+HTTP_CLIENT_POOL_IDLE_TIMEOUT = int(os.environ.get("HTTP_CLIENT_POOL_IDLE_TIMEOUT", 60))
+
+# When `True`, HTTP/2 is used for HTTPS requests if the `h2` package is installed.
+# The support is experimental in urllib3 and enabled for the whole process.
+HTTP_CLIENT_HTTP2_ENABLED: bool = get_bool_from_env("HTTP_CLIENT_HTTP2_ENABLED", False)
+
 # Since we split checkout complete logic into two separate transactions, in order to
 # mimic stock lock, we apply short reservation for the stocks. The value represents
 # time of the reservation in seconds.
@@ -941,6 +991,10 @@ JWT_TTL_REFRESH = datetime.timedelta(
     seconds=parse(os.environ.get("JWT_TTL_REFRESH", "30 days"))
 )
 
+# Cache staff users authenticated with JWT, together with their permissions and
+# channel access, for the given number of seconds. Set to 0 to disable the cache.
+JWT_USER_CACHE_TIMEOUT = int(os.environ.get("JWT_USER_CACHE_TIMEOUT", 0))
+
 
 JWT_TTL_REQUEST_EMAIL_CHANGE = datetime.timedelta(
     seconds=parse(os.environ.get("JWT_TTL_REQUEST_EMAIL_CHANGE", "1 hour")),
@@ -985,6 +1039,13 @@ PRODUCT_MAX_INDEXED_ATTRIBUTES = 1000
 PRODUCT_MAX_INDEXED_ATTRIBUTE_VALUES = 100
 PRODUCT_MAX_INDEXED_VARIANTS = 1000
 
+# Update the relations of catalogue promotion rules with the variants of changed
+# products only, instead of marking the rules as dirty to re-expand them over the
+# whole catalogue.
+PROMOTION_RULE_VARIANTS_INCREMENTAL_UPDATE = get_bool_from_env(
+    "PROMOTION_RULE_VARIANTS_INCREMENTAL_UPDATE", False
+)
+
 # Maximum related objects that can be indexed in a page
 PAGE_MAX_INDEXED_ATTRIBUTES = 1000
 PAGE_MAX_INDEXED_ATTRIBUTE_VALUES = 100
@@ -1030,6 +1091,9 @@ AUTOMATIC_CHECKOUT_COMPLETION_QUEUE_NAME = os.environ.get(
     "AUTOMATIC_CHECKOUT_COMPLETION_QUEUE_NAME", None
 )
 
+# Queue name for generation of thumbnails
+THUMBNAIL_CELERY_QUEUE_NAME = os.environ.get("THUMBNAIL_CELERY_QUEUE_NAME", None)
+
 # Lock time for request password reset mutation per user (seconds)
 RESET_PASSWORD_LOCK_TIME = parse(
     os.environ.get("RESET_PASSWORD_LOCK_TIME", "15 minutes")
@@ -1068,6 +1132,16 @@ WEBHOOK_WAITING_FOR_RESPONSE_TIMEOUT = 18
 WEBHOOK_TIMEOUT = (REQUESTS_CONN_EST_TIMEOUT, WEBHOOK_WAITING_FOR_RESPONSE_TIMEOUT)
 WEBHOOK_SYNC_TIMEOUT = (REQUESTS_CONN_EST_TIMEOUT, WEBHOOK_WAITING_FOR_RESPONSE_TIMEOUT)
 
+# The max number of async webhooks sent concurrently to a single app by a worker.
+# Deliveries are sent one after another when set to 1.
+WEBHOOK_ASYNC_CONCURRENCY = int(os.environ.get("WEBHOOK_ASYNC_CONCURRENCY", 1))
+
+# Time (sec) for which an expired response of the shipping webhooks can still be
+# served while it is being refreshed by a concurrent request. Disabled when set to 0.
+SHIPPING_WEBHOOK_STALE_RESPONSE_TTL = int(
+    os.environ.get("SHIPPING_WEBHOOK_STALE_RESPONSE_TTL", 0)
+)
+
 # The max number of rules with order_predicate defined
 ORDER_RULES_LIMIT = os.environ.get("ORDER_RULES_LIMIT", 100)
 
@@ -0,0 +1,53 @@
+from collections import defaultdict
+from collections.abc import Iterable
+
+from django.conf import settings
+from django.db.models import Exists, OuterRef
+
+from ..core.config_cache import get_configs
+from .models import ShippingZone
+
+
+def _fetch_shipping_zones_by_channel_id(
+    channel_ids: list[int],
+) -> dict[int, list[ShippingZone]]:
+    shipping_zones_channel = ShippingZone.channels.through.objects.using(
+        settings.DATABASE_CONNECTION_DEFAULT_NAME
+    ).filter(channel_id__in=channel_ids)
+    shipping_zones_map = (
+        ShippingZone.objects.using(settings.DATABASE_CONNECTION_DEFAULT_NAME)
+        .filter(Exists(shipping_zones_channel.filter(shippingzone_id=OuterRef("pk"))))
+        .in_bulk()
+    )
+    shipping_zones_by_channel_map: dict[int, list[ShippingZone]] = defaultdict(list)
+    for shipping_zone_id, channel_id in shipping_zones_channel.values_list(
+        "shippingzone_id", "channel_id"
+    ):
+        shipping_zones_by_channel_map[channel_id].append(
+            shipping_zones_map[shipping_zone_id]
+        )
+    return {
+        channel_id: shipping_zones_by_channel_map[channel_id]
+        for channel_id in channel_ids
+    }
+
+
+def get_shipping_zones_by_channel_ids(
+    channel_ids: Iterable[int],
+    database_connection_name: str = settings.DATABASE_CONNECTION_DEFAULT_NAME,
+) -> dict[int, list[ShippingZone]]:
+    return get_configs(
+        "shipping_zones:channel",
+        channel_ids,
+        _fetch_shipping_zones_by_channel_id,
+        database_connection_name,
+    )
+
+
+def get_shipping_zones_by_channel_id(
+    channel_id: int,
+    database_connection_name: str = settings.DATABASE_CONNECTION_DEFAULT_NAME,
+) -> list[ShippingZone]:
+    return get_shipping_zones_by_channel_ids([channel_id], database_connection_name)[
+        channel_id
+    ]
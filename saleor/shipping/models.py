@@ -209,7 +209,7 @@ class ShippingMethodQueryset(models.QuerySet["ShippingMethod"]):
             weight=weight,
             country_code=country_code,
             product_ids=instance_product_ids,
-        ).prefetch_related("postal_code_rules")
+        )
         return filter_shipping_methods_by_postal_code_rules(
             applicable_methods, shipping_address
         )
@@ -1,8 +1,30 @@
+"""Postal code rules of the shipping methods.
+
+The rules of all shipping methods are compiled into an index, cached with the
+configuration, so checking the rules of a method for a postal code takes a binary
+search over its ranges instead of comparing the code with each rule. The index is
+built per comparison method, as the postal codes are compared according to the
+country of the address, and rebuilt whenever a rule is saved or deleted.
+"""
+
 import re
-from typing import Any
+from bisect import bisect_right
+from collections import defaultdict
+from collections.abc import Callable, Iterable
+from dataclasses import dataclass
+from operator import itemgetter
+from typing import TYPE_CHECKING, Any
+
+from django.conf import settings
 
 from . import PostalCodeRuleInclusionType
 
+if TYPE_CHECKING:
+    from ..account.models import Address
+
+UK_POSTAL_CODE_PATTERN = r"^([A-Z]{1,2})([0-9]+)([A-Z]?) ?([0-9][A-Z]{2})$"
+IRISH_POSTAL_CODE_PATTERN = r"([\dA-Z]{3}) ?([\dA-Z]{4})"
+
 
 def group_values(pattern, *values):
     result: list[tuple[Any, ...] | None] = []
@@ -47,8 +69,7 @@ def check_uk_postal_code(code, start, end):
 
     Example postal codes: BH20 2BC  (UK), IM16 7HF  (Isle of Man).
     """
-    pattern = r"^([A-Z]{1,2})([0-9]+)([A-Z]?) ?([0-9][A-Z]{2})$"
-    code, start, end = group_values(pattern, code, start, end)
+    code, start, end = group_values(UK_POSTAL_CODE_PATTERN, code, start, end)
     # replace second item of each tuple with it's value casted to int
     code, start, end = cast_tuple_index_to_type(1, int, code, start, end)
     return compare_values(code, start, end)
@@ -59,8 +80,7 @@ def check_irish_postal_code(code, start, end):
 
     Example postal codes: A65 2F0A, A61 2F0G.
     """
-    pattern = r"([\dA-Z]{3}) ?([\dA-Z]{4})"
-    code, start, end = group_values(pattern, code, start, end)
+    code, start, end = group_values(IRISH_POSTAL_CODE_PATTERN, code, start, end)
     return compare_values(code, start, end)
 
 
@@ -114,13 +134,157 @@ def is_shipping_method_applicable_for_postal_code(
     return False
 
 
+def get_uk_postal_code_key(code) -> tuple | None:
+    """Return the key of the UK postal code, ordered as in `check_uk_postal_code`."""
+    (groups,) = group_values(UK_POSTAL_CODE_PATTERN, code)
+    if not groups:
+        return None
+    area, district, subdistrict, inward = groups
+    return area, int(district), subdistrict, inward
+
+
+def get_irish_postal_code_key(code) -> tuple | None:
+    (groups,) = group_values(IRISH_POSTAL_CODE_PATTERN, code)
+    return groups or None
+
+
+def get_any_postal_code_key(code) -> str | None:
+    return code or None
+
+
+# Keys of the postal codes, compared in the same way as by the `check_*` functions;
+# codes which can't be compared have no key.
+POSTAL_CODE_KEY_FUNCTIONS: dict[str, Callable[[Any], Any]] = {
+    "uk": get_uk_postal_code_key,
+    "ie": get_irish_postal_code_key,
+    "any": get_any_postal_code_key,
+}
+
+COUNTRY_POSTAL_CODE_KEY_TYPES = {
+    "GB": "uk",  # United Kingdom
+    "IM": "uk",  # Isle of Man
+    "GG": "uk",  # Guernsey
+    "JE": "uk",  # Jersey
+    "IE": "ie",  # Ireland
+}
+
+
+@dataclass
+class ShippingMethodPostalCodeRanges:
+    # Inclusion type of all rules of the shipping method, or None when the method
+    # has rules of both types.
+    inclusion_type: str | None
+    # Sorted, disjoint ranges of the postal code keys covered by the rules; the end
+    # of the range is None when the range is open.
+    starts: list
+    ends: list
+
+    def contains(self, key) -> bool:
+        position = bisect_right(self.starts, key) - 1
+        if position < 0:
+            return False
+        end = self.ends[position]
+        return end is None or key <= end
+
+    def is_applicable(self, key) -> bool:
+        """Return if the shipping method is applicable for the postal code key.
+
+        Same as `is_shipping_method_applicable_for_postal_code`.
+        """
+        if self.inclusion_type is None:
+            # Shipping methods with complex rules are not supported for now
+            return False
+        matched = key is not None and self.contains(key)
+        if self.inclusion_type == PostalCodeRuleInclusionType.INCLUDE:
+            return matched
+        return not matched
+
+
+def _merge_postal_code_ranges(ranges: list[tuple]) -> tuple[list, list]:
+    starts: list = []
+    ends: list = []
+    for start, end in sorted(ranges, key=itemgetter(0)):
+        if end is not None and end < start:
+            continue
+        if starts and (ends[-1] is None or start <= ends[-1]):
+            if ends[-1] is not None and (end is None or end > ends[-1]):
+                ends[-1] = end
+            continue
+        starts.append(start)
+        ends.append(end)
+    return starts, ends
+
+
+def build_postal_code_rules_index(
+    key_type: str,
+) -> dict[int, ShippingMethodPostalCodeRanges]:
+    """Return the postal code ranges of the shipping methods which have rules."""
+    from .models import ShippingMethodPostalCodeRule
+
+    get_key = POSTAL_CODE_KEY_FUNCTIONS[key_type]
+    inclusion_types: defaultdict[int, set[str]] = defaultdict(set)
+    ranges: defaultdict[int, list[tuple]] = defaultdict(list)
+    rules = ShippingMethodPostalCodeRule.objects.using(
+        settings.DATABASE_CONNECTION_DEFAULT_NAME
+    ).values_list("shipping_method_id", "start", "end", "inclusion_type")
+    for method_id, start, end, inclusion_type in rules.iterator(chunk_size=10000):
+        inclusion_types[method_id].add(inclusion_type)
+        start_key = get_key(start)
+        # a rule with the start which can't be compared never matches, while a rule
+        # with such end is open
+        if start_key is not None:
+            ranges[method_id].append((start_key, get_key(end)))
+
+    index = {}
+    for method_id, method_inclusion_types in inclusion_types.items():
+        starts, ends = _merge_postal_code_ranges(ranges[method_id])
+        index[method_id] = ShippingMethodPostalCodeRanges(
+            inclusion_type=(
+                method_inclusion_types.pop()
+                if len(method_inclusion_types) == 1
+                else None
+            ),
+            starts=starts,
+            ends=ends,
+        )
+    return index
+
+
+def get_postal_code_rules_index(
+    key_type: str,
+) -> dict[int, ShippingMethodPostalCodeRanges]:
+    # Imported here, as the shipping models import this module while the core
+    # modules are still loading.
+    from ..core.config_cache import get_config
+
+    return get_config(
+        f"shipping_postal_code_rules:{key_type}",
+        lambda: build_postal_code_rules_index(key_type),
+        copy_value=False,
+    )
+
+
+def get_excluded_shipping_method_ids(
+    shipping_method_ids: Iterable[int], shipping_address: "Address"
+) -> list[int]:
+    """Return IDs of the shipping methods excluded by their postal code rules."""
+    key_type = COUNTRY_POSTAL_CODE_KEY_TYPES.get(shipping_address.country.code, "any")
+    index = get_postal_code_rules_index(key_type)
+    key = POSTAL_CODE_KEY_FUNCTIONS[key_type](shipping_address.postal_code)
+    return [
+        method_id
+        for method_id in shipping_method_ids
+        if method_id in index and not index[method_id].is_applicable(key)
+    ]
+
+
 def filter_shipping_methods_by_postal_code_rules(shipping_methods, shipping_address):
     """Filter shipping methods for given address by postal code rules."""
-
-    excluded_methods_by_postal_code = []
-    for method in shipping_methods:
-        if not is_shipping_method_applicable_for_postal_code(shipping_address, method):
-            excluded_methods_by_postal_code.append(method.pk)
-    if excluded_methods_by_postal_code:
+    shipping_method_ids = shipping_methods.prefetch_related(None).values_list(
+        "pk", flat=True
+    )
+    if excluded_methods_by_postal_code := get_excluded_shipping_method_ids(
+        shipping_method_ids, shipping_address
+    ):
         return shipping_methods.exclude(pk__in=excluded_methods_by_postal_code)
     return shipping_methods
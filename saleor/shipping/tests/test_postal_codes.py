@@ -2,9 +2,14 @@ from unittest.mock import Mock, patch
 
 import pytest
 
+from ...account.models import Address
+from ...core.config_cache import invalidate_config_cache
 from .. import PostalCodeRuleInclusionType
+from ..models import ShippingMethod, ShippingMethodPostalCodeRule
 from ..postal_codes import (
     check_postal_code_in_range,
+    filter_shipping_methods_by_postal_code_rules,
+    get_excluded_shipping_method_ids,
     is_shipping_method_applicable_for_postal_code,
 )
 
@@ -122,3 +127,130 @@ def test_is_shipping_method_applicable_for_postal_code(
     assert (
         is_shipping_method_applicable_for_postal_code(Mock(), Mock()) is is_applicable
     )
+
+
+INCLUDE = PostalCodeRuleInclusionType.INCLUDE
+EXCLUDE = PostalCodeRuleInclusionType.EXCLUDE
+
+
+@pytest.mark.parametrize(
+    ("country", "code", "rules"),
+    [
+        ("GB", "BH3 2BC", [("BH2 1AA", "BH4 9ZZ", INCLUDE)]),
+        ("GB", "BH20 2BC", [("BH2 1AA", "BH4 9ZZ", INCLUDE)]),
+        ("GB", "BH16 7HF", [("BH16 7HA", None, EXCLUDE)]),
+        ("GB", "BH16 7HB", [("BH16 7HC", None, EXCLUDE)]),
+        ("GB", "BH16 7HB", [("BH16", "BH20", EXCLUDE)]),
+        ("GB", "BH16 7HB", [("BH16 7HA", "BH20", EXCLUDE)]),
+        ("GB", "invalid", [("BH16 7HA", "BH16 7HG", EXCLUDE)]),
+        (
+            "GB",
+            "BH16 7HF",
+            [
+                ("BH10 7HA", "BH12 7HG", INCLUDE),
+                ("BH11 7HA", "BH16 7HF", INCLUDE),
+            ],
+        ),
+        ("IM", "IM16 7HF", [("IM16 7HA", "IM16 7HG", EXCLUDE)]),
+        ("IE", "A65 2F0B", [("A65 2F0A", "A65 2F0C", INCLUDE)]),
+        ("IE", "A65 2F0B", [("A65 2F0C", "A65 2F0D", INCLUDE)]),
+        ("PL", "64-620", [("50-000", "65-000", EXCLUDE)]),
+        (
+            "PL",
+            "64-620",
+            [("63-200", "63-650", EXCLUDE), ("64-621", "64-650", EXCLUDE)],
+        ),
+        ("PL", "64-620", [("64-650", "64-200", INCLUDE)]),
+        ("PL", "", [("50-000", "65-000", INCLUDE)]),
+        (
+            "PL",
+            "64-620",
+            [("50-000", "65-000", INCLUDE), ("70-000", "75-000", EXCLUDE)],
+        ),
+    ],
+)
+def test_get_excluded_shipping_method_ids_matches_rules_check(
+    country, code, rules, shipping_method
+):
+    # given
+    for start, end, inclusion_type in rules:
+        shipping_method.postal_code_rules.create(
+            start=start, end=end, inclusion_type=inclusion_type
+        )
+    address = Address(country=country, postal_code=code)
+    method = ShippingMethod.objects.prefetch_related("postal_code_rules").get(
+        pk=shipping_method.pk
+    )
+
+    # when
+    excluded_ids = get_excluded_shipping_method_ids([method.pk], address)
+
+    # then
+    is_applicable = is_shipping_method_applicable_for_postal_code(address, method)
+    assert excluded_ids == ([] if is_applicable else [method.pk])
+
+
+def test_get_excluded_shipping_method_ids_skips_methods_without_rules(
+    shipping_method, address
+):
+    # when
+    excluded_ids = get_excluded_shipping_method_ids([shipping_method.pk], address)
+
+    # then
+    assert excluded_ids == []
+
+
+def test_get_excluded_shipping_method_ids_after_rule_change(shipping_method, address):
+    # given
+    get_excluded_shipping_method_ids([shipping_method.pk], address)
+
+    # when
+    shipping_method.postal_code_rules.create(
+        start="53-600", end="54-600", inclusion_type=EXCLUDE
+    )
+
+    # then
+    assert get_excluded_shipping_method_ids([shipping_method.pk], address) == [
+        shipping_method.pk
+    ]
+
+
+def test_filter_shipping_methods_by_postal_code_rules_with_many_rules(
+    shipping_method, other_shipping_method, address, django_assert_num_queries
+):
+    # given
+    ShippingMethodPostalCodeRule.objects.bulk_create(
+        [
+            ShippingMethodPostalCodeRule(
+                shipping_method=method,
+                start=f"{i // 100:02d}-{i % 100 * 10:03d}",
+                end=f"{i // 100:02d}-{i % 100 * 10 + 4:03d}",
+                inclusion_type=EXCLUDE,
+            )
+            for method, rules_range in (
+                (shipping_method, range(0, 10000, 2)),
+                (other_shipping_method, range(1, 10000, 2)),
+            )
+            for i in rules_range
+        ]
+    )
+    invalidate_config_cache()
+    shipping_methods = ShippingMethod.objects.filter(
+        pk__in=[shipping_method.pk, other_shipping_method.pk]
+    )
+    # 53-601 is covered by the rule of 53-600 to 53-604
+    filter_shipping_methods_by_postal_code_rules(shipping_methods, address)
+
+    # when
+    with django_assert_num_queries(1):
+        filtered_methods = filter_shipping_methods_by_postal_code_rules(
+            shipping_methods, address
+        )
+        excluded_ids = get_excluded_shipping_method_ids(
+            [shipping_method.pk, other_shipping_method.pk],
+            Address(country="PL", postal_code="53-605"),
+        )
+
+    # then
+    assert list(filtered_methods) == [other_shipping_method]
+    assert excluded_ids == []
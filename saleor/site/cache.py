@@ -0,0 +1,31 @@
+from collections.abc import Iterable
+
+from django.conf import settings
+from django.contrib.sites.models import Site
+
+from ..core.config_cache import get_configs
+
+
+def get_sites_by_id(
+    site_ids: Iterable[int],
+    database_connection_name: str = settings.DATABASE_CONNECTION_DEFAULT_NAME,
+) -> dict[int, Site]:
+    """Return the sites together with their settings."""
+    return get_configs(
+        "site:id",
+        site_ids,
+        lambda missing_ids: Site.objects.using(
+            settings.DATABASE_CONNECTION_DEFAULT_NAME
+        )
+        .select_related("settings")
+        .in_bulk(missing_ids),
+        database_connection_name,
+    )
+
+
+def get_site_by_id(
+    site_id: int,
+    database_connection_name: str = settings.DATABASE_CONNECTION_DEFAULT_NAME,
+) -> Site | None:
+    """Return the site together with its settings."""
+    return get_sites_by_id([site_id], database_connection_name).get(site_id)
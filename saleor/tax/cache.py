@@ -0,0 +1,69 @@
+from collections import defaultdict
+from collections.abc import Iterable
+
+from django.conf import settings
+
+from ..core.config_cache import get_configs
+from .models import TaxConfiguration, TaxConfigurationPerCountry
+
+
+def _fetch_tax_configurations_per_country(
+    tax_configuration_ids: list[int],
+) -> dict[int, list[TaxConfigurationPerCountry]]:
+    tax_configs_per_country: dict[int, list[TaxConfigurationPerCountry]] = defaultdict(
+        list
+    )
+    for tax_config_per_country in TaxConfigurationPerCountry.objects.using(
+        settings.DATABASE_CONNECTION_DEFAULT_NAME
+    ).filter(tax_configuration_id__in=tax_configuration_ids):
+        tax_configs_per_country[tax_config_per_country.tax_configuration_id].append(
+            tax_config_per_country
+        )
+    return {
+        tax_configuration_id: tax_configs_per_country[tax_configuration_id]
+        for tax_configuration_id in tax_configuration_ids
+    }
+
+
+def get_tax_configurations_by_channel_id(
+    channel_ids: Iterable[int],
+    database_connection_name: str = settings.DATABASE_CONNECTION_DEFAULT_NAME,
+) -> dict[int, TaxConfiguration]:
+    return get_configs(
+        "tax_configuration:channel",
+        channel_ids,
+        lambda missing_ids: TaxConfiguration.objects.using(
+            settings.DATABASE_CONNECTION_DEFAULT_NAME
+        ).in_bulk(missing_ids, field_name="channel_id"),
+        database_connection_name,
+    )
+
+
+def get_tax_configuration_by_channel_id(
+    channel_id: int,
+    database_connection_name: str = settings.DATABASE_CONNECTION_DEFAULT_NAME,
+) -> TaxConfiguration | None:
+    return get_tax_configurations_by_channel_id(
+        [channel_id], database_connection_name
+    ).get(channel_id)
+
+
+def get_tax_configurations_per_country(
+    tax_configuration_ids: Iterable[int],
+    database_connection_name: str = settings.DATABASE_CONNECTION_DEFAULT_NAME,
+) -> dict[int, list[TaxConfigurationPerCountry]]:
+    return get_configs(
+        "tax_configuration_per_country",
+        tax_configuration_ids,
+        _fetch_tax_configurations_per_country,
+        database_connection_name,
+    )
+
+
+def get_tax_configuration_per_country(
+    tax_configuration_id: int,
+    database_connection_name: str = settings.DATABASE_CONNECTION_DEFAULT_NAME,
+) -> list[TaxConfigurationPerCountry]:
+    return get_tax_configurations_per_country(
+        [tax_configuration_id], database_connection_name
+    )[tax_configuration_id]
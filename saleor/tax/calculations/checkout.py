@@ -2,7 +2,7 @@ from decimal import Decimal
 from typing import TYPE_CHECKING
 
 from django.conf import settings
-from prices import TaxedMoney
+from prices import Money, TaxedMoney
 
 from ...checkout import base_calculations
 from ...core.prices import quantize_price
@@ -38,6 +38,11 @@ def update_checkout_prices_with_flat_rates(
         default_country_rate_obj.rate if default_country_rate_obj else Decimal(0)
     )
     currency = checkout.currency
+    lines_total_prices = (
+        base_calculations.get_lines_total_prices_with_propagated_checkout_discount(
+            checkout_info, lines
+        )
+    )
 
     # Calculate checkout line totals.
     for line_info in lines:
@@ -50,12 +55,8 @@ def update_checkout_prices_with_flat_rates(
             country_code,
         )
 
-        line_total_price = _calculate_checkout_line_total(
-            checkout_info,
-            lines,
-            line_info,
-            tax_rate,
-            prices_entered_with_tax,
+        line_total_price = _apply_flat_rate_tax_on_line_total(
+            lines_total_prices[line.id], tax_rate, prices_entered_with_tax
         )
         line.total_price = line_total_price
         line.tax_rate = normalize_tax_rate_for_db(tax_rate)
@@ -111,7 +112,15 @@ def _calculate_checkout_line_total(
             checkout_line_info,
         )
     )
-    total_price = calculate_flat_rate_tax(
+    return _apply_flat_rate_tax_on_line_total(
+        total_price, tax_rate, prices_entered_with_tax
+    )
+
+
+def _apply_flat_rate_tax_on_line_total(
+    total_price: Money, tax_rate: Decimal, prices_entered_with_tax: bool
+) -> TaxedMoney:
+    total_price_taxed = calculate_flat_rate_tax(
         total_price, tax_rate, prices_entered_with_tax
     )
-    return quantize_price(total_price, total_price.currency)
+    return quantize_price(total_price_taxed, total_price_taxed.currency)
@@ -10,6 +10,7 @@ from prices import TaxedMoney
 from ..core.utils.country import get_active_country
 from ..tax.models import TaxClass, TaxClassCountryRate
 from . import TaxCalculationStrategy
+from .cache import get_tax_configuration_per_country
 
 if TYPE_CHECKING:
     from ..checkout.fetch import CheckoutInfo, CheckoutLineInfo
@@ -153,16 +154,15 @@ def get_tax_app_identifier_for_order(order: "Order"):
 
 def get_tax_configuration_for_checkout(
     checkout_info: "CheckoutInfo",
-    database_connection_name: str = settings.DATABASE_CONNECTION_DEFAULT_NAME,
 ) -> tuple["TaxConfiguration", Optional["TaxConfigurationPerCountry"]]:
     tax_configuration = checkout_info.tax_configuration
     country_code = get_checkout_active_country(checkout_info)
     country_tax_configuration = next(
         (
             tc
-            for tc in tax_configuration.country_exceptions.using(
-                database_connection_name
-            ).all()
+            for tc in get_tax_configuration_per_country(
+                tax_configuration.pk, checkout_info.database_connection_name
+            )
             if tc.country.code == country_code
         ),
         None,
@@ -189,44 +189,40 @@ def get_checkout_active_country(checkout_info: "CheckoutInfo") -> str:
 
 def get_charge_taxes_for_checkout(
     checkout_info: "CheckoutInfo",
-    database_connection_name: str = settings.DATABASE_CONNECTION_DEFAULT_NAME,
 ):
     """Get charge_taxes value for checkout."""
     tax_configuration, country_tax_configuration = get_tax_configuration_for_checkout(
-        checkout_info, database_connection_name=database_connection_name
+        checkout_info
     )
     return get_charge_taxes(tax_configuration, country_tax_configuration)
 
 
 def get_tax_calculation_strategy_for_checkout(
     checkout_info: "CheckoutInfo",
-    database_connection_name: str = settings.DATABASE_CONNECTION_DEFAULT_NAME,
 ):
     """Get tax_calculation_strategy value for checkout."""
     tax_configuration, country_tax_configuration = get_tax_configuration_for_checkout(
-        checkout_info, database_connection_name=database_connection_name
+        checkout_info
     )
     return get_tax_calculation_strategy(tax_configuration, country_tax_configuration)
 
 
 def get_tax_app_identifier_for_checkout(
     checkout_info: "CheckoutInfo",
-    database_connection_name: str = settings.DATABASE_CONNECTION_DEFAULT_NAME,
 ):
     """Get tax_app_id value for checkout."""
     tax_configuration, country_tax_configuration = get_tax_configuration_for_checkout(
-        checkout_info, database_connection_name=database_connection_name
+        checkout_info
     )
     return get_tax_app_id(tax_configuration, country_tax_configuration)
 
 
 def should_use_weighted_tax_for_shipping_for_checkout(
     checkout_info: "CheckoutInfo",
-    database_connection_name: str = settings.DATABASE_CONNECTION_DEFAULT_NAME,
 ) -> bool:
     """Get use_weighted_tax_for_shipping value for checkout."""
     tax_configuration, country_tax_configuration = get_tax_configuration_for_checkout(
-        checkout_info, database_connection_name=database_connection_name
+        checkout_info
     )
     return should_use_weighted_tax_for_shipping(
         tax_configuration, country_tax_configuration
@@ -275,9 +271,7 @@ def get_shipping_tax_rate_for_checkout(
     database_connection_name: str = settings.DATABASE_CONNECTION_DEFAULT_NAME,
 ) -> Decimal:
     should_use_weighted_tax_for_shipping = (
-        should_use_weighted_tax_for_shipping_for_checkout(
-            checkout_info, database_connection_name=database_connection_name
-        )
+        should_use_weighted_tax_for_shipping_for_checkout(checkout_info)
     )
     if should_use_weighted_tax_for_shipping:
         return _get_weighted_tax_rate_for_shipping(
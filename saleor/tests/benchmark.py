@@ -0,0 +1,193 @@
+"""Pytest plugin measuring the benchmark tests and comparing them with a baseline.
+
+Tests marked with `count_queries` are measured when `--benchmark-save` or
+`--benchmark-compare` is given. For each test the following is recorded, for the
+test call only (fixtures are excluded):
+
+- `query_count`: number of SQL queries executed on all database connections,
+- `sql_time`: total execution time of these queries in seconds,
+- `wall_time`: duration of the test call in seconds,
+- `peak_memory`: peak size of memory blocks allocated by Python, in bytes.
+
+Memory is traced with `tracemalloc`, which slows the test down, so wall times
+are only comparable with the ones measured by this plugin.
+
+Usage:
+    pytest -n 0 -m count_queries --benchmark-save=benchmarks.json
+    pytest -n 0 -m count_queries --benchmark-compare=benchmarks.json
+
+When comparing, a test fails when it runs more queries than in the baseline, or
+when any other measurement exceeds the baseline by more than
+`--benchmark-threshold` (relative, 0.25 by default).
+"""
+
+import json
+import time
+import tracemalloc
+from contextlib import ExitStack
+from dataclasses import asdict, dataclass
+from pathlib import Path
+
+import pytest
+
+BENCHMARK_MARKER = "count_queries"
+BENCHMARK_USER_PROPERTY = "benchmark"
+DEFAULT_THRESHOLD = 0.25
+
+# Differences smaller than these are treated as noise and never reported.
+MIN_TIME_DIFFERENCE = 0.005
+MIN_MEMORY_DIFFERENCE = 64 * 1024
+
+
+@dataclass
+class BenchmarkResult:
+    query_count: int
+    sql_time: float
+    wall_time: float
+    peak_memory: int
+
+
+def pytest_addoption(parser):
+    group = parser.getgroup("benchmark")
+    group.addoption(
+        "--benchmark-save",
+        action="store",
+        default=None,
+        metavar="PATH",
+        help="Save the measurements of the benchmark tests to the JSON file.",
+    )
+    group.addoption(
+        "--benchmark-compare",
+        action="store",
+        default=None,
+        metavar="PATH",
+        help="Fail the benchmark tests which regressed against the JSON baseline.",
+    )
+    group.addoption(
+        "--benchmark-threshold",
+        action="store",
+        type=float,
+        default=DEFAULT_THRESHOLD,
+        metavar="RATIO",
+        help=(
+            "Allowed relative increase of SQL time, wall time and peak memory "
+            f"against the baseline. Default: {DEFAULT_THRESHOLD}."
+        ),
+    )
+
+
+def pytest_configure(config):
+    if config.getoption("benchmark_save") or config.getoption("benchmark_compare"):
+        config.pluginmanager.register(BenchmarkRecorder(config), "saleor-benchmark")
+
+
+def load_results(path: Path) -> dict[str, dict]:
+    if not path.exists():
+        return {}
+    return json.loads(path.read_text())
+
+
+def get_regressions(
+    result: BenchmarkResult, baseline: BenchmarkResult, threshold: float
+) -> list[str]:
+    regressions = []
+    if result.query_count > baseline.query_count:
+        regressions.append(
+            f"query_count: {result.query_count} (baseline: {baseline.query_count})"
+        )
+    for field, min_difference in [
+        ("sql_time", MIN_TIME_DIFFERENCE),
+        ("wall_time", MIN_TIME_DIFFERENCE),
+        ("peak_memory", MIN_MEMORY_DIFFERENCE),
+    ]:
+        value = getattr(result, field)
+        baseline_value = getattr(baseline, field)
+        if (
+            value > baseline_value * (1 + threshold)
+            and value - baseline_value > min_difference
+        ):
+            regressions.append(f"{field}: {value:g} (baseline: {baseline_value:g})")
+    return regressions
+
+
+def measure_queries(stack: ExitStack) -> list:
+    from django.db import connections
+    from django.test.utils import CaptureQueriesContext
+
+    return [
+        stack.enter_context(CaptureQueriesContext(connections[alias]))
+        for alias in connections
+    ]
+
+
+class BenchmarkRecorder:
+    def __init__(self, config):
+        self.config = config
+        self.save_path = config.getoption("benchmark_save")
+        self.threshold = config.getoption("benchmark_threshold")
+        self.baseline = None
+        if baseline_path := config.getoption("benchmark_compare"):
+            self.baseline = load_results(Path(baseline_path))
+        self.results: dict[str, dict] = {}
+
+    @pytest.hookimpl(wrapper=True)
+    def pytest_runtest_call(self, item):
+        if not item.get_closest_marker(BENCHMARK_MARKER):
+            return (yield)
+
+        tracing_started = not tracemalloc.is_tracing()
+        if tracing_started:
+            tracemalloc.start()
+        tracemalloc.reset_peak()
+        try:
+            with ExitStack() as stack:
+                query_contexts = measure_queries(stack)
+                start = time.perf_counter()
+                outcome = yield
+                wall_time = time.perf_counter() - start
+            _, peak_memory = tracemalloc.get_traced_memory()
+        finally:
+            if tracing_started:
+                tracemalloc.stop()
+
+        queries = [query for context in query_contexts for query in context]
+        result = BenchmarkResult(
+            query_count=len(queries),
+            sql_time=sum(float(query["time"]) for query in queries),
+            wall_time=wall_time,
+            peak_memory=peak_memory,
+        )
+        item.user_properties.append((BENCHMARK_USER_PROPERTY, asdict(result)))
+
+        baseline = self.baseline.get(item.nodeid) if self.baseline else None
+        if baseline:
+            regressions = get_regressions(
+                result, BenchmarkResult(**baseline), self.threshold
+            )
+            if regressions:
+                pytest.fail(
+                    "Benchmark regressed against the baseline:\n"
+                    + "\n".join(regressions),
+                    pytrace=False,
+                )
+        return outcome
+
+    def pytest_runtest_logreport(self, report):
+        # Called on the controller for the reports of xdist workers as well, so
+        # the results of all workers are collected in one place.
+        if report.when != "call" or not report.passed:
+            return
+        for name, value in report.user_properties:
+            if name == BENCHMARK_USER_PROPERTY:
+                self.results[report.nodeid] = value
+
+    @pytest.hookimpl(trylast=True)
+    def pytest_sessionfinish(self, session):
+        if not self.save_path or hasattr(self.config, "workerinput"):
+            return
+        # Results of tests which were not run are kept, so the baseline can be
+        # updated with a subset of the benchmarks.
+        path = Path(self.save_path)
+        results = load_results(path)
+        results.update(self.results)
+        path.write_text(json.dumps(dict(sorted(results.items())), indent=2) + "\n")
@@ -15,6 +15,8 @@ from PIL import Image
 
 from ..account.models import Address, Group, StaffNotificationRecipient
 from ..core import JobStatus
+from ..core.config_cache import invalidate_config_cache
+from ..core.http_client import HTTPClientPool
 from ..core.models import EventDelivery, EventDeliveryAttempt, EventPayload
 from ..core.payments import PaymentInterface
 from ..core.telemetry import initialize_telemetry, meter, tracer
@@ -29,6 +31,7 @@ from ..discount.models import (
 )
 from ..payment.interface import AddressData
 from ..permission.enums import get_permissions
+from ..plugins.cache import invalidate_plugin_configs_cache
 from ..product.models import (
     CategoryTranslation,
     CollectionTranslation,
@@ -587,6 +590,22 @@ def private_media_setting(private_media_root, settings):
     return private_media_root
 
 
+@pytest.fixture(autouse=True)
+def clear_config_cache():
+    # Configuration cached in a previous test could come from a rolled back
+    # transaction.
+    invalidate_config_cache()
+    invalidate_plugin_configs_cache()
+
+
+@pytest.fixture(autouse=True)
+def clear_http_client_pool():
+    # Pooled sessions are created with the HTTP config of the moment, which
+    # tests are free to change.
+    yield
+    HTTPClientPool.clear()
+
+
 @pytest.fixture
 def description_json():
     return {
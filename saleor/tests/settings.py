@@ -41,6 +41,9 @@ PASSWORD_HASHERS = ["saleor.tests.dummy_password_hasher.DummyHasher"]
 
 OBSERVABILITY_ACTIVE = False
 OBSERVABILITY_REPORT_ALL_API_CALLS = False
+OBSERVABILITY_LOCAL_BUFFER_SIZE = 0
+
+THUMBNAIL_ASYNC_GENERATION = False
 
 PLUGINS = []
 
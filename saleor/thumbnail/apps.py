@@ -1,16 +1,32 @@
 from django.apps import AppConfig
-from django.db.models.signals import post_delete
+from django.db.models.signals import post_delete, post_save
 
 
 class ThumbnailAppConfig(AppConfig):
     name = "saleor.thumbnail"
 
     def ready(self):
+        from ..product.models import Category, Collection, ProductMedia
         from .models import Thumbnail
-        from .signals import delete_thumbnail_image
+        from .signals import create_thumbnails_for_image, delete_thumbnail_image
 
         post_delete.connect(
             delete_thumbnail_image,
             sender=Thumbnail,
             dispatch_uid="delete_thumbnail_image",
         )
+        post_save.connect(
+            create_thumbnails_for_image,
+            sender=Category,
+            dispatch_uid="create_category_thumbnails",
+        )
+        post_save.connect(
+            create_thumbnails_for_image,
+            sender=Collection,
+            dispatch_uid="create_collection_thumbnails",
+        )
+        post_save.connect(
+            create_thumbnails_for_image,
+            sender=ProductMedia,
+            dispatch_uid="create_product_media_thumbnails",
+        )
@@ -0,0 +1,181 @@
+import logging
+from collections.abc import Iterable
+from typing import NamedTuple
+
+from django.conf import settings
+from django.core.cache import cache
+
+from ..account.models import User
+from ..app.models import App, AppInstallation
+from ..core.db.connection import allow_writer
+from ..core.utils.events import call_event
+from ..plugins.manager import get_plugins_manager
+from ..product.models import Category, Collection, ProductMedia
+from . import THUMBNAIL_SIZES, ThumbnailFormat
+from .models import Thumbnail
+from .utils import ProcessedIconImage, ProcessedImage, prepare_thumbnail_file_name
+
+logger = logging.getLogger(__name__)
+
+# Time (sec) after which a thumbnail that is still being generated by another
+# worker, can be generated again.
+THUMBNAIL_GENERATION_LOCK_TIMEOUT = 60
+
+# Formats in which the thumbnails are generated in advance, `None` stands for
+# the format of the original image.
+PREGENERATED_THUMBNAIL_FORMATS: list[str | None] = [
+    None,
+    ThumbnailFormat.AVIF,
+    ThumbnailFormat.WEBP,
+]
+
+
+class ModelData(NamedTuple):
+    model: type[App | AppInstallation | Category | Collection | ProductMedia | User]
+    image_field: str
+    thumbnail_field: str
+
+
+ICON_TYPE_TO_MODEL_DATA_MAPPING = {
+    "App": ModelData(App, "brand_logo_default", "app"),
+    "AppInstallation": ModelData(
+        AppInstallation, "brand_logo_default", "app_installation"
+    ),
+}
+TYPE_TO_MODEL_DATA_MAPPING = {
+    "User": ModelData(User, "avatar", "user"),
+    "Category": ModelData(Category, "background_image", "category"),
+    "Collection": ModelData(Collection, "background_image", "collection"),
+    "ProductMedia": ModelData(ProductMedia, "image", "product_media"),
+    **ICON_TYPE_TO_MODEL_DATA_MAPPING,
+}
+UUID_IDENTIFIABLE_TYPES = ["User", "App", "AppInstallation"]
+
+# Types of which thumbnails are generated in advance, in the background.
+PREGENERATED_THUMBNAIL_TYPES = ["Category", "Collection", "ProductMedia"]
+
+
+def get_all_thumbnail_variants() -> list[tuple[int, str | None]]:
+    return [
+        (size, format)
+        for size in THUMBNAIL_SIZES
+        for format in PREGENERATED_THUMBNAIL_FORMATS
+    ]
+
+
+def get_thumbnail_instance_lookup(object_type: str, pk) -> dict:
+    """Return the lookup for filtering thumbnails of the given instance."""
+    model_data = TYPE_TO_MODEL_DATA_MAPPING[object_type]
+    if object_type in UUID_IDENTIFIABLE_TYPES:
+        return {model_data.thumbnail_field + "__uuid": pk}
+    return {model_data.thumbnail_field + "_id": pk}
+
+
+def get_thumbnail_instance(object_type: str, pk, database: str):
+    """Return the instance of the given type.
+
+    Raise `ObjectDoesNotExist` when the instance doesn't exist.
+    """
+    model = TYPE_TO_MODEL_DATA_MAPPING[object_type].model
+    if object_type in UUID_IDENTIFIABLE_TYPES:
+        return model.objects.using(database).get(uuid=pk)  # type: ignore[misc]
+    return model.objects.using(database).get(id=pk)
+
+
+def get_thumbnail_lock_key(object_type: str, pk, size: int, format: str | None):
+    return f"thumbnail:{object_type}:{pk}:{size}:{format or ThumbnailFormat.ORIGINAL}"
+
+
+def create_thumbnail(instance, object_type: str, size: int, format: str | None):
+    """Generate the thumbnail of the instance image and save it.
+
+    Raise `FileNotFoundError` when the image file is missing and `ValueError`
+    when the image is invalid.
+    """
+    return create_thumbnails(instance, object_type, [(size, format)])[0]
+
+
+def create_thumbnails(
+    instance, object_type: str, variants: Iterable[tuple[int, str | None]]
+) -> list[Thumbnail]:
+    """Generate the thumbnails of the instance image in the given sizes and formats.
+
+    The image is decoded once for all thumbnails, which are saved in a single
+    query.
+
+    Raise `FileNotFoundError` when the image file is missing and `ValueError`
+    when the image is invalid.
+    """
+    model_data = TYPE_TO_MODEL_DATA_MAPPING[object_type]
+    image = getattr(instance, model_data.image_field)
+    processed_image_class: type[ProcessedImage] = (
+        ProcessedIconImage
+        if object_type in ICON_TYPE_TO_MODEL_DATA_MAPPING
+        else ProcessedImage
+    )
+    thumbnails = []
+    for size, format, thumbnail_file, _ in processed_image_class.create_thumbnails(
+        image.name, variants
+    ):
+        thumbnail = Thumbnail(
+            size=size, format=format, **{model_data.thumbnail_field: instance}
+        )
+        thumbnail_file_name = prepare_thumbnail_file_name(image.name, size, format)
+        thumbnail.image.save(thumbnail_file_name, thumbnail_file, save=False)
+        thumbnails.append(thumbnail)
+
+    with allow_writer():
+        Thumbnail.objects.bulk_create(thumbnails)
+
+        manager = get_plugins_manager(allow_replica=False)
+        for thumbnail in thumbnails:
+            # set additional `instance` attribute, to easily get instance data
+            # for ThumbnailCreated subscription type
+            setattr(thumbnail, "instance", instance)
+            call_event(manager.thumbnail_created, thumbnail)
+    return thumbnails
+
+
+def create_missing_thumbnails(
+    object_type: str, pk, variants: Iterable[tuple[int, str | None]]
+) -> list[Thumbnail]:
+    """Generate the thumbnails in the given sizes and formats that don't exist yet.
+
+    Thumbnails which are being generated by another worker are skipped.
+    """
+    try:
+        instance = get_thumbnail_instance(
+            object_type, pk, settings.DATABASE_CONNECTION_DEFAULT_NAME
+        )
+    except TYPE_TO_MODEL_DATA_MAPPING[object_type].model.DoesNotExist:
+        return []
+    if not getattr(instance, TYPE_TO_MODEL_DATA_MAPPING[object_type].image_field):
+        return []
+
+    instance_lookup = get_thumbnail_instance_lookup(object_type, pk)
+    thumbnails = Thumbnail.objects.filter(**instance_lookup)
+    existing_variants = set(thumbnails.values_list("size", "format"))
+    lock_keys = {}
+    for size, format in variants:
+        if (size, format) in existing_variants or (size, format) in lock_keys:
+            continue
+        lock_key = get_thumbnail_lock_key(object_type, pk, size, format)
+        if cache.add(lock_key, True, timeout=THUMBNAIL_GENERATION_LOCK_TIMEOUT):
+            lock_keys[(size, format)] = lock_key
+    if not lock_keys:
+        return []
+
+    try:
+        # thumbnails could be created while waiting for the locks
+        existing_variants = set(thumbnails.values_list("size", "format"))
+        missing_variants = [
+            variant for variant in lock_keys if variant not in existing_variants
+        ]
+        if not missing_variants:
+            return []
+        return create_thumbnails(instance, object_type, missing_variants)
+    except (FileNotFoundError, ValueError) as error:
+        logger.info("Cannot create thumbnails for %s %s: %s", object_type, pk, error)
+        return []
+    finally:
+        cache.delete_many(list(lock_keys.values()))
@@ -0,0 +1,75 @@
+import os
+from concurrent.futures import ProcessPoolExecutor
+from itertools import repeat
+
+import django
+from django.core.management.base import BaseCommand
+from django.db import connections
+
+from ...generation import (
+    PREGENERATED_THUMBNAIL_TYPES,
+    TYPE_TO_MODEL_DATA_MAPPING,
+    create_missing_thumbnails,
+    get_all_thumbnail_variants,
+)
+
+
+def _create_thumbnails(object_type: str, pk) -> int:
+    return len(create_missing_thumbnails(object_type, pk, get_all_thumbnail_variants()))
+
+
+class Command(BaseCommand):
+    help = (
+        "Generate the missing thumbnails of product media, categories and collections "
+        "in all available sizes and formats."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--type",
+            dest="types",
+            action="append",
+            choices=PREGENERATED_THUMBNAIL_TYPES,
+            help="Generate thumbnails only for the given type. Can be repeated.",
+        )
+        parser.add_argument(
+            "--processes",
+            type=int,
+            default=os.cpu_count(),
+            help="Number of worker processes generating the thumbnails.",
+        )
+
+    def handle(self, *args, **options):
+        processes = options["processes"]
+        for object_type in options["types"] or PREGENERATED_THUMBNAIL_TYPES:
+            model_data = TYPE_TO_MODEL_DATA_MAPPING[object_type]
+            pks = list(
+                model_data.model.objects.filter(
+                    **{f"{model_data.image_field}__isnull": False}
+                )
+                .exclude(**{model_data.image_field: ""})
+                .order_by("pk")
+                .values_list("pk", flat=True)
+            )
+            self.stdout.write(f"Generating thumbnails for {len(pks)} {object_type}.")
+            if processes > 1:
+                created = self._create_in_processes(object_type, pks, processes)
+            else:
+                created = sum(_create_thumbnails(object_type, pk) for pk in pks)
+            self.stdout.write(f"Created {created} thumbnails for {object_type}.")
+
+    def _create_in_processes(self, object_type: str, pks: list, processes: int) -> int:
+        # Connections can't be shared with the child processes, each of them opens
+        # its own.
+        connections.close_all()
+        with ProcessPoolExecutor(
+            max_workers=processes, initializer=django.setup
+        ) as executor:
+            return sum(
+                executor.map(
+                    _create_thumbnails,
+                    repeat(object_type),
+                    pks,
+                    chunksize=max(1, len(pks) // (processes * 4)),
+                )
+            )
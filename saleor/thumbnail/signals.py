@@ -1,6 +1,25 @@
+from django.conf import settings
+from django.db import transaction
+
 from ..core.tasks import delete_from_storage_task
+from .generation import TYPE_TO_MODEL_DATA_MAPPING
+from .tasks import create_thumbnails_task
 
 
 def delete_thumbnail_image(sender, instance, **kwargs):
     if image := instance.image:
         delete_from_storage_task.delay(image.name)
+
+
+def create_thumbnails_for_image(sender, instance, update_fields=None, **kwargs):
+    """Schedule generation of the thumbnails when the instance image is saved."""
+    if not settings.THUMBNAIL_ASYNC_GENERATION:
+        return
+    object_type = sender.__name__
+    image_field = TYPE_TO_MODEL_DATA_MAPPING[object_type].image_field
+    if update_fields is not None and image_field not in update_fields:
+        return
+    if not getattr(instance, image_field):
+        return
+    pk = instance.pk
+    transaction.on_commit(lambda: create_thumbnails_task.delay(object_type, pk))
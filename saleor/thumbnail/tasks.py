@@ -0,0 +1,23 @@
+from django.conf import settings
+
+from ..celeryconf import app
+from ..core.db.connection import allow_writer
+from .generation import create_missing_thumbnails, get_all_thumbnail_variants
+
+
+@app.task(queue=settings.THUMBNAIL_CELERY_QUEUE_NAME)
+@allow_writer()
+def create_thumbnails_task(
+    object_type: str, pk, variants: list[tuple[int, str | None]] | None = None
+):
+    """Generate the missing thumbnails of the instance.
+
+    When `variants` (pairs of size and format) are not provided, the thumbnails
+    are generated in all available sizes and formats.
+    """
+    if variants is None:
+        variants = get_all_thumbnail_variants()
+    # Tuples are serialized as lists in the task arguments.
+    create_missing_thumbnails(
+        object_type, pk, [(size, image_format) for size, image_format in variants]
+    )
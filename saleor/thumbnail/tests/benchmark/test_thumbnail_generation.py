@@ -0,0 +1,71 @@
+import multiprocessing
+import resource
+import time
+from io import BytesIO
+
+import pytest
+from django.core.files import File
+from PIL import Image
+
+from ...generation import get_all_thumbnail_variants
+from ...utils import ProcessedImage
+
+# Tolerance of the peak memory comparison, which is sensitive to the allocator.
+PEAK_MEMORY_TOLERANCE = 1.1
+
+
+def _create_image_data(size=(2000, 1500)):
+    image = Image.effect_mandelbrot(size, (-2, -1.2, 1, 1.2), 100).convert("RGB")
+    image_file = BytesIO()
+    image.save(image_file, format="JPEG", quality=90)
+    return image_file.getvalue()
+
+
+def _create_thumbnails_one_by_one(image_data, variants):
+    for size, format in variants:
+        image_file = File(BytesIO(image_data), name="image.jpg")
+        ProcessedImage(image_file, size, format).create_thumbnail()
+
+
+def _create_thumbnails_in_batch(image_data, variants):
+    image_file = File(BytesIO(image_data), name="image.jpg")
+    ProcessedImage.create_thumbnails(image_file, variants)
+
+
+def _measure(func, image_data, variants):
+    """Return the CPU time and the peak memory growth (in kB) of the function."""
+    max_rss_before = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    start = time.process_time()
+    func(image_data, variants)
+    cpu_time = time.process_time() - start
+    max_rss_after = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return cpu_time, max_rss_after - max_rss_before
+
+
+def _measure_in_new_process(func, image_data, variants):
+    # each function is measured in a separate process, so the peak memory of
+    # one doesn't hide the peak memory of the other
+    with multiprocessing.get_context("fork").Pool(1) as pool:
+        return pool.apply(_measure, (func, image_data, variants))
+
+
+@pytest.mark.skipif(
+    "fork" not in multiprocessing.get_all_start_methods(),
+    reason="Measuring the peak memory requires forking the process.",
+)
+def test_create_thumbnails_in_batch_uses_less_resources():
+    # given
+    image_data = _create_image_data()
+    variants = get_all_thumbnail_variants()
+
+    # when
+    one_by_one_cpu_time, one_by_one_peak_memory = _measure_in_new_process(
+        _create_thumbnails_one_by_one, image_data, variants
+    )
+    batch_cpu_time, batch_peak_memory = _measure_in_new_process(
+        _create_thumbnails_in_batch, image_data, variants
+    )
+
+    # then
+    assert batch_cpu_time < one_by_one_cpu_time
+    assert batch_peak_memory <= one_by_one_peak_memory * PEAK_MEMORY_TOLERANCE
@@ -0,0 +1,184 @@
+from unittest.mock import patch
+
+from django.core.cache import cache
+from django.core.management import call_command
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+from .. import THUMBNAIL_SIZES, ThumbnailFormat
+from ..generation import (
+    PREGENERATED_THUMBNAIL_FORMATS,
+    create_missing_thumbnails,
+    create_thumbnails,
+    get_thumbnail_lock_key,
+)
+from ..models import Thumbnail
+
+
+def test_create_thumbnails_saves_thumbnails_in_single_query(
+    category_with_image, media_root
+):
+    # given
+    variants = [(32, None), (32, ThumbnailFormat.WEBP), (128, ThumbnailFormat.AVIF)]
+
+    # when
+    with CaptureQueriesContext(connection) as ctx:
+        thumbnails = create_thumbnails(category_with_image, "Category", variants)
+
+    # then
+    inserts = [
+        query
+        for query in ctx.captured_queries
+        if query["sql"].startswith('INSERT INTO "thumbnail_thumbnail"')
+    ]
+    assert len(inserts) == 1
+    assert all(thumbnail.pk for thumbnail in thumbnails)
+    assert [(thumbnail.size, thumbnail.format) for thumbnail in thumbnails] == [
+        (128, ThumbnailFormat.AVIF),
+        (32, None),
+        (32, ThumbnailFormat.WEBP),
+    ]
+    assert Thumbnail.objects.filter(category=category_with_image).count() == 3
+
+
+def test_create_missing_thumbnails(category_with_image):
+    # given
+    variants = [(64, None), (128, ThumbnailFormat.WEBP)]
+
+    # when
+    thumbnails = create_missing_thumbnails("Category", category_with_image.pk, variants)
+
+    # then
+    assert len(thumbnails) == 2
+    assert set(
+        Thumbnail.objects.filter(category=category_with_image).values_list(
+            "size", "format"
+        )
+    ) == set(variants)
+
+
+def test_create_missing_thumbnails_skips_existing_thumbnails(
+    category_with_image, image_list
+):
+    # given
+    Thumbnail.objects.create(category=category_with_image, size=64, image=image_list[0])
+
+    # when
+    thumbnails = create_missing_thumbnails(
+        "Category", category_with_image.pk, [(64, None), (128, None)]
+    )
+
+    # then
+    assert [thumbnail.size for thumbnail in thumbnails] == [128]
+    assert Thumbnail.objects.filter(category=category_with_image).count() == 2
+
+
+def test_create_missing_thumbnails_skips_thumbnails_being_generated(
+    category_with_image,
+):
+    # given
+    lock_key = get_thumbnail_lock_key("Category", category_with_image.pk, 64, None)
+    cache.add(lock_key, True)
+
+    # when
+    thumbnails = create_missing_thumbnails(
+        "Category", category_with_image.pk, [(64, None)]
+    )
+
+    # then
+    assert thumbnails == []
+    assert not Thumbnail.objects.exists()
+    cache.delete(lock_key)
+
+
+def test_create_missing_thumbnails_missing_image_file(product_with_image):
+    # given
+    product_media = product_with_image.media.first()
+    product_media.image.name = "invalid_image.jpg"
+    product_media.save(update_fields=["image"])
+
+    # when
+    thumbnails = create_missing_thumbnails(
+        "ProductMedia", product_media.pk, [(64, None), (128, None)]
+    )
+
+    # then
+    assert thumbnails == []
+
+
+@patch("saleor.thumbnail.signals.create_thumbnails_task.delay")
+def test_thumbnails_scheduled_when_image_saved(
+    mocked_task,
+    category,
+    image,
+    media_root,
+    settings,
+    django_capture_on_commit_callbacks,
+):
+    # given
+    settings.THUMBNAIL_ASYNC_GENERATION = True
+
+    # when
+    with django_capture_on_commit_callbacks(execute=True):
+        category.background_image = image
+        category.save(update_fields=["background_image"])
+
+    # then
+    mocked_task.assert_called_once_with("Category", category.pk)
+
+
+@patch("saleor.thumbnail.signals.create_thumbnails_task.delay")
+def test_thumbnails_not_scheduled_when_image_not_saved(
+    mocked_task, category_with_image, settings, django_capture_on_commit_callbacks
+):
+    # given
+    settings.THUMBNAIL_ASYNC_GENERATION = True
+
+    # when
+    with django_capture_on_commit_callbacks(execute=True):
+        category_with_image.name = "New name"
+        category_with_image.save(update_fields=["name"])
+
+    # then
+    mocked_task.assert_not_called()
+
+
+@patch("saleor.thumbnail.signals.create_thumbnails_task.delay")
+def test_thumbnails_not_scheduled_when_async_generation_disabled(
+    mocked_task,
+    category,
+    image,
+    media_root,
+    settings,
+    django_capture_on_commit_callbacks,
+):
+    # given
+    settings.THUMBNAIL_ASYNC_GENERATION = False
+
+    # when
+    with django_capture_on_commit_callbacks(execute=True):
+        category.background_image = image
+        category.save(update_fields=["background_image"])
+
+    # then
+    mocked_task.assert_not_called()
+
+
+def test_create_thumbnails_command(category_with_image, collection):
+    # when
+    call_command("create_thumbnails", processes=1)
+
+    # then
+    assert Thumbnail.objects.filter(category=category_with_image).count() == len(
+        THUMBNAIL_SIZES
+    ) * len(PREGENERATED_THUMBNAIL_FORMATS)
+    assert not Thumbnail.objects.filter(collection=collection).exists()
+
+
+def test_create_thumbnails_command_for_type(category_with_image, product_with_image):
+    # when
+    call_command("create_thumbnails", processes=1, types=["ProductMedia"])
+
+    # then
+    assert not Thumbnail.objects.filter(category=category_with_image).exists()
+    assert Thumbnail.objects.filter(product_media__product=product_with_image).exists()
@@ -1,9 +1,11 @@
+from io import BytesIO
 from unittest import mock
 from unittest.mock import MagicMock, patch
 
 import graphene
 import pytest
 from django.core.files import File
+from PIL import Image
 from PIL.JpegImagePlugin import JpegImageFile
 
 from .. import FILE_NAME_MAX_LENGTH, ThumbnailFormat
@@ -213,3 +215,49 @@ def test_get_filename_from_url_with_query_params_path(mock_token_hex):
 
     # then
     assert result == f"image_{token_hex}.jpg"
+
+
+def test_processed_image_create_thumbnails():
+    # given
+    image = Image.new("RGB", (400, 200))
+    image_file = BytesIO()
+    image.save(image_file, format="JPEG")
+    image_file.seek(0)
+    variants = [
+        (64, None),
+        (256, ThumbnailFormat.WEBP),
+        (64, ThumbnailFormat.AVIF),
+        (1024, None),
+    ]
+
+    # when
+    with patch(
+        "saleor.thumbnail.utils.Image.open", wraps=Image.open
+    ) as image_open_mock:
+        thumbnails = ProcessedImage.create_thumbnails(
+            File(image_file, name="image.jpg"), variants
+        )
+
+    # then
+    image_open_mock.assert_called_once()
+    result = {}
+    for size, format, thumbnail_file, thumbnail_format in thumbnails:
+        thumbnail = Image.open(thumbnail_file)
+        assert thumbnail.format == thumbnail_format
+        result[(size, format)] = (thumbnail.format, thumbnail.size)
+    assert result == {
+        (1024, None): ("JPEG", (400, 200)),
+        (256, ThumbnailFormat.WEBP): ("WEBP", (256, 128)),
+        (64, None): ("JPEG", (64, 32)),
+        (64, ThumbnailFormat.AVIF): ("AVIF", (64, 32)),
+    }
+
+
+def test_processed_image_create_thumbnails_no_variants(category_with_image):
+    # when
+    thumbnails = ProcessedImage.create_thumbnails(
+        category_with_image.background_image.name, []
+    )
+
+    # then
+    assert thumbnails == []
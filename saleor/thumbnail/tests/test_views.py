@@ -413,3 +413,71 @@ def test_handle_thumbnail_view_for_app_installation_logo_default_thumbnail_exist
     assert response.status_code == 302
     assert response.url == thumbnail.image.url
     assert Thumbnail.objects.count() == thumbnail_count
+
+
+@patch("saleor.thumbnail.views.create_thumbnails_task.delay")
+def test_handle_thumbnail_view_schedules_thumbnail_generation(
+    mocked_task, client, category_with_image, settings
+):
+    # given
+    settings.THUMBNAIL_ASYNC_GENERATION = True
+    size = 60
+    format = ThumbnailFormat.WEBP
+    category_id = graphene.Node.to_global_id("Category", category_with_image.id)
+
+    # when
+    response = client.get(f"/thumbnail/{category_id}/{size}/{format}/")
+
+    # then
+    assert response.status_code == 302
+    assert response.url == category_with_image.background_image.url
+    mocked_task.assert_called_once_with(
+        "Category", str(category_with_image.id), [(64, format)]
+    )
+    assert not Thumbnail.objects.exists()
+
+
+@patch("saleor.thumbnail.views.create_thumbnails_task.delay")
+def test_handle_thumbnail_view_returns_closest_existing_thumbnail(
+    mocked_task, client, category_with_image, image_list, media_root, settings
+):
+    # given
+    settings.THUMBNAIL_ASYNC_GENERATION = True
+    size = 256
+    thumbnail = Thumbnail.objects.create(
+        category=category_with_image, size=128, image=image_list[0]
+    )
+    Thumbnail.objects.create(
+        category=category_with_image, size=1024, image=image_list[1]
+    )
+    category_id = graphene.Node.to_global_id("Category", category_with_image.id)
+
+    # when
+    response = client.get(f"/thumbnail/{category_id}/{size}/")
+
+    # then
+    assert response.status_code == 302
+    assert response.url == thumbnail.image.url
+    mocked_task.assert_called_once_with(
+        "Category", str(category_with_image.id), [(size, None)]
+    )
+
+
+@patch("saleor.thumbnail.views.create_thumbnails_task.delay")
+def test_handle_thumbnail_view_does_not_schedule_pending_thumbnail_again(
+    mocked_task, client, product_with_image, settings
+):
+    # given
+    settings.THUMBNAIL_ASYNC_GENERATION = True
+    size = 512
+    product_media = product_with_image.media.first()
+    product_media_id = graphene.Node.to_global_id("ProductMedia", product_media.id)
+    client.get(f"/thumbnail/{product_media_id}/{size}/")
+
+    # when
+    response = client.get(f"/thumbnail/{product_media_id}/{size}/")
+
+    # then
+    assert response.status_code == 302
+    assert response.url == product_media.image.url
+    mocked_task.assert_called_once()
@@ -1,5 +1,7 @@
 import os
 import secrets
+from collections import defaultdict
+from collections.abc import Iterable
 from io import BytesIO
 from typing import TYPE_CHECKING, Optional
 from urllib.parse import urlparse
@@ -124,6 +126,50 @@ class ProcessedImage:
         )
         return image_file, thumbnail_format
 
+    @classmethod
+    def create_thumbnails(
+        cls,
+        image_source: str | File,
+        variants: Iterable[tuple[int, str | None]],
+        storage=default_storage,
+    ) -> list[tuple[int, str | None, BytesIO, str]]:
+        """Create the thumbnails in many sizes and formats from a single decode.
+
+        The image is retrieved and decoded once. The sizes are processed from the
+        largest to the smallest, each of them is downscaled from the previous one
+        instead of the original image, and encoded in all formats requested for
+        the size.
+
+        Return a list of 4-tuples: the size, the format, the thumbnail file and
+        the format in which the thumbnail was saved.
+        """
+        formats_by_size: dict[int, list[str | None]] = defaultdict(list)
+        for size, format in variants:
+            formats_by_size[size].append(format)
+        if not formats_by_size:
+            return []
+
+        sizes = sorted(formats_by_size, reverse=True)
+        source = cls(image_source, sizes[0], storage=storage)
+        image, image_format = source.retrieve_image()
+        image = source.apply_exif_orientation(image)
+
+        thumbnails = []
+        for size in sizes:
+            # the image is resized in place, so the next size is downscaled from
+            # the current one
+            image.thumbnail((size, size))
+            for format in formats_by_size[size]:
+                processed_image = cls(image_source, size, format, storage=storage)
+                thumbnail_image, save_kwargs = processed_image.preprocess_format(
+                    image, processed_image.format or image_format
+                )
+                image_file, thumbnail_format = processed_image.process_image(
+                    image=thumbnail_image, save_kwargs=save_kwargs
+                )
+                thumbnails.append((size, format, image_file, thumbnail_format))
+        return thumbnails
+
     def retrieve_image(self):
         """Return a PIL Image instance stored at `image_source`."""
         image = self.image_source
@@ -167,10 +213,11 @@ class ProcessedImage:
                     arguments, return an empty dict ({}).
 
         """
-        format = self.format or image_format
-        save_kwargs = {"format": format}
+        image = self.apply_exif_orientation(image)
+        return self.preprocess_format(image, self.format or image_format)
 
-        # Ensuring image is properly rotated
+    def apply_exif_orientation(self, image):
+        """Return the image rotated according to its EXIF orientation."""
         if hasattr(image, "_getexif"):
             try:
                 # validation of the exif data was added in separate PR:
@@ -191,6 +238,11 @@ class ProcessedImage:
                     image = image.transpose(Image.Transpose.ROTATE_270)
                 elif orientation == 8:
                     image = image.transpose(Image.Transpose.ROTATE_90)
+        return image
+
+    def preprocess_format(self, image, format):
+        """Call the pre-processor specific to the format in which the image is saved."""
+        save_kwargs = {"format": format}
 
         # Ensure any embedded ICC profile is preserved
         save_kwargs["icc_profile"] = image.info.get("icc_profile")
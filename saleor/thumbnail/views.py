@@ -1,7 +1,7 @@
 import logging
-from typing import NamedTuple
 
 from django.conf import settings
+from django.core.cache import cache
 from django.core.exceptions import ObjectDoesNotExist
 from django.http import (
     HttpResponseBadRequest,
@@ -10,47 +10,25 @@ from django.http import (
 )
 from graphql.error import GraphQLError
 
-from ..account.models import User
-from ..app.models import App, AppInstallation
-from ..core.db.connection import allow_writer
-from ..core.utils.events import call_event
 from ..graphql.core.utils import from_global_id_or_error
-from ..plugins.manager import get_plugins_manager
-from ..product.models import Category, Collection, ProductMedia
 from ..thumbnail.models import Thumbnail
 from . import ALLOWED_ICON_THUMBNAIL_FORMATS, ALLOWED_THUMBNAIL_FORMATS
-from .utils import (
-    ProcessedIconImage,
-    ProcessedImage,
-    get_thumbnail_size,
-    prepare_thumbnail_file_name,
+from .generation import (
+    ICON_TYPE_TO_MODEL_DATA_MAPPING,
+    PREGENERATED_THUMBNAIL_TYPES,
+    THUMBNAIL_GENERATION_LOCK_TIMEOUT,
+    TYPE_TO_MODEL_DATA_MAPPING,
+    create_thumbnail,
+    get_thumbnail_instance,
+    get_thumbnail_instance_lookup,
+    get_thumbnail_lock_key,
 )
+from .tasks import create_thumbnails_task
+from .utils import get_thumbnail_size
 
 logger = logging.getLogger(__name__)
 
 
-class ModelData(NamedTuple):
-    model: type[App | AppInstallation | Category | Collection | ProductMedia | User]
-    image_field: str
-    thumbnail_field: str
-
-
-ICON_TYPE_TO_MODEL_DATA_MAPPING = {
-    "App": ModelData(App, "brand_logo_default", "app"),
-    "AppInstallation": ModelData(
-        AppInstallation, "brand_logo_default", "app_installation"
-    ),
-}
-TYPE_TO_MODEL_DATA_MAPPING = {
-    "User": ModelData(User, "avatar", "user"),
-    "Category": ModelData(Category, "background_image", "category"),
-    "Collection": ModelData(Collection, "background_image", "collection"),
-    "ProductMedia": ModelData(ProductMedia, "image", "product_media"),
-    **ICON_TYPE_TO_MODEL_DATA_MAPPING,
-}
-UUID_IDENTIFIABLE_TYPES = ["User", "App", "AppInstallation"]
-
-
 def handle_thumbnail(request, instance_id: str, size: str, format: str | None = None):
     """Create and return thumbnail for given instance in provided size and format.
 
@@ -81,27 +59,18 @@ def handle_thumbnail(request, instance_id: str, size: str, format: str | None =
 
     # return the thumbnail if it's already exist
     model_data = TYPE_TO_MODEL_DATA_MAPPING[object_type]
-    if object_type in UUID_IDENTIFIABLE_TYPES:
-        instance_id_lookup = model_data.thumbnail_field + "__uuid"
-    else:
-        instance_id_lookup = model_data.thumbnail_field + "_id"
-
+    instance_lookup = get_thumbnail_instance_lookup(object_type, pk)
     if (
         thumbnail := Thumbnail.objects.using(settings.DATABASE_CONNECTION_REPLICA_NAME)
-        .filter(format=format, size=size_px, **{instance_id_lookup: pk})
+        .filter(format=format, size=size_px, **instance_lookup)
         .first()
     ):
         return HttpResponseRedirect(thumbnail.image.url)
 
     try:
-        if object_type in UUID_IDENTIFIABLE_TYPES:
-            instance = model_data.model.objects.using(
-                settings.DATABASE_CONNECTION_REPLICA_NAME
-            ).get(uuid=pk)  # type: ignore[misc]
-        else:
-            instance = model_data.model.objects.using(
-                settings.DATABASE_CONNECTION_REPLICA_NAME
-            ).get(id=pk)
+        instance = get_thumbnail_instance(
+            object_type, pk, settings.DATABASE_CONNECTION_REPLICA_NAME
+        )
     except ObjectDoesNotExist:
         return HttpResponseNotFound("Instance with the given id cannot be found.")
 
@@ -109,15 +78,15 @@ def handle_thumbnail(request, instance_id: str, size: str, format: str | None =
     if not bool(image):
         return HttpResponseNotFound("There is no image for provided instance.")
 
+    if (
+        settings.THUMBNAIL_ASYNC_GENERATION
+        and object_type in PREGENERATED_THUMBNAIL_TYPES
+    ):
+        return handle_pending_thumbnail(object_type, pk, image, size_px, format)
+
     # prepare thumbnail
-    if object_type in ICON_TYPE_TO_MODEL_DATA_MAPPING:
-        processed_image: ProcessedImage = ProcessedIconImage(
-            image.name, size_px, format
-        )
-    else:
-        processed_image = ProcessedImage(image.name, size_px, format)
     try:
-        thumbnail_file, _ = processed_image.create_thumbnail()
+        thumbnail = create_thumbnail(instance, object_type, size_px, format)
     except FileNotFoundError as error:
         logger.info(str(error))
         return HttpResponseNotFound("Cannot found image file.")
@@ -125,20 +94,30 @@ def handle_thumbnail(request, instance_id: str, size: str, format: str | None =
         logger.info(str(error))
         return HttpResponseBadRequest("Invalid image.")
 
-    thumbnail_file_name = prepare_thumbnail_file_name(image.name, size_px, format)
+    return HttpResponseRedirect(thumbnail.image.url)
 
-    # save image thumbnail
-    with allow_writer():
-        thumbnail = Thumbnail(
-            size=size_px, format=format, **{model_data.thumbnail_field: instance}
-        )
-        thumbnail.image.save(thumbnail_file_name, thumbnail_file)
-        thumbnail.save()
 
-        # set additional `instance` attribute, to easily get instance data
-        # for ThumbnailCreated subscription type
-        setattr(thumbnail, "instance", instance)
-        manager = get_plugins_manager(allow_replica=False)
-        call_event(manager.thumbnail_created, thumbnail)
+def handle_pending_thumbnail(
+    object_type: str, pk, image, size: int, format: str | None
+):
+    """Schedule generation of the thumbnail and redirect to a temporary image.
 
-    return HttpResponseRedirect(thumbnail.image.url)
+    The closest existing size of the thumbnail in the requested format is returned,
+    or the original image when none exists yet.
+    """
+    lock_key = get_thumbnail_lock_key(object_type, pk, size, format)
+    # the task is not scheduled again while the thumbnail is being generated
+    if cache.add(
+        f"{lock_key}:scheduled", True, timeout=THUMBNAIL_GENERATION_LOCK_TIMEOUT
+    ):
+        create_thumbnails_task.delay(object_type, pk, [(size, format)])
+
+    thumbnails = Thumbnail.objects.using(
+        settings.DATABASE_CONNECTION_REPLICA_NAME
+    ).filter(format=format, **get_thumbnail_instance_lookup(object_type, pk))
+    # prefer bigger thumbnails when two sizes are equally close
+    if thumbnail := min(
+        thumbnails, key=lambda t: (abs(t.size - size), -t.size), default=None
+    ):
+        return HttpResponseRedirect(thumbnail.image.url)
+    return HttpResponseRedirect(image.url)
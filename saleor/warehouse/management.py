@@ -1,6 +1,7 @@
 import math
 from collections import defaultdict
 from collections.abc import Iterable
+from functools import partial
 from typing import TYPE_CHECKING, Any, NamedTuple, cast
 from uuid import UUID
 
@@ -90,11 +91,14 @@ def allocate_stocks(
 ):
     """Allocate stocks for given `order_lines` in given country.
 
-    Function lock for update all stocks and allocations for variants in
-    given country and order by pk. Next, generate the dictionary
-    ({"stock_pk": "quantity_allocated"}) with actual allocated quantity for stocks.
-    Iterate by stocks and allocate as many items as needed or available in stock
-    for order line, until allocated all required quantity for the order line.
+    Function lock for update all stocks for variants in given country, in a single
+    query ordered by pk to avoid deadlocks. Next, generate the dictionary
+    ({"stock_pk": "quantity_available"}) with the quantity available in the stocks,
+    taking into account the existing allocations and the reservations.
+    Iterate by lines and allocate as many items as needed or available in stocks,
+    until allocated all required quantity for the order line. The allocations of
+    all lines are computed in memory and saved with bulk queries, to keep the
+    stocks locked as shortly as possible.
     If there is less quantity in stocks then rise InsufficientStock exception.
     """
     # allocation only applied to order lines with variants with track inventory
@@ -122,9 +126,10 @@ def allocate_stocks(
     stocks = list(
         stock_select_for_update_for_existing_qs(stocks)
         .filter(**filter_lookup)
-        .values("id", "product_variant", "pk", "quantity", "warehouse_id")
+        .values("product_variant", "pk", "quantity", "warehouse_id")
     )
-    stocks_id = (stock.pop("id") for stock in stocks)
+    stocks_id = [stock["pk"] for stock in stocks]
+    quantity_for_stocks = {stock["pk"]: stock["quantity"] for stock in stocks}
 
     quantity_reservation_for_stocks: dict = _prepare_stock_to_reserved_quantity_map(
         checkout_lines, check_reservations, stocks_id
@@ -157,6 +162,13 @@ def allocate_stocks(
         variant = stock_data.pop("product_variant")
         variant_to_stocks[variant].append(StockData(**stock_data))
 
+    quantity_available_for_stocks = {
+        stock_id: quantity
+        - quantity_allocation_for_stocks[stock_id]
+        - quantity_reservation_for_stocks[stock_id]
+        for stock_id, quantity in quantity_for_stocks.items()
+    }
+
     insufficient_stock: list[InsufficientStockData] = []
     allocations: list[Allocation] = []
     for line_info in order_lines_info:
@@ -165,8 +177,7 @@ def allocate_stocks(
         insufficient_stock, allocation_items = _create_allocations(
             line_info,
             stock_allocations,
-            quantity_allocation_for_stocks,
-            quantity_reservation_for_stocks,
+            quantity_available_for_stocks,
             insufficient_stock,
         )
         allocations.extend(allocation_items)
@@ -177,28 +188,34 @@ def allocate_stocks(
     if allocations:
         Allocation.objects.bulk_create(allocations)
 
-        stocks_to_update_map = {alloc.stock_id: alloc.stock for alloc in allocations}
         quantity_from_allocations: dict[int, int] = defaultdict(int)
-
         for alloc in allocations:
             quantity_from_allocations[alloc.stock_id] += alloc.quantity_allocated
 
-        for stock_id, quantity in quantity_from_allocations.items():
-            stock = stocks_to_update_map[stock_id]
-            stock.quantity_allocated = F("quantity_allocated") + quantity
-
-        Stock.objects.bulk_update(stocks_to_update_map.values(), ["quantity_allocated"])
+        Stock.objects.bulk_update(
+            [
+                Stock(
+                    pk=stock_id, quantity_allocated=F("quantity_allocated") + quantity
+                )
+                for stock_id, quantity in quantity_from_allocations.items()
+            ],
+            ["quantity_allocated"],
+        )
 
-        for allocation in allocations:
-            allocated_stock = (
-                Allocation.objects.filter(stock_id=allocation.stock_id).aggregate(
-                    Sum("quantity_allocated")
-                )["quantity_allocated__sum"]
-                or 0
-            )
-            if not max(allocation.stock.quantity - allocated_stock, 0):
+        out_of_stock_ids = [
+            stock_id
+            for stock_id, quantity in quantity_from_allocations.items()
+            if quantity_for_stocks[stock_id]
+            - quantity_allocation_for_stocks[stock_id]
+            - quantity
+            <= 0
+        ]
+        if out_of_stock_ids:
+            for stock in Stock.objects.filter(pk__in=out_of_stock_ids).select_related(
+                "product_variant__product"
+            ):
                 transaction.on_commit(
-                    lambda: manager.product_variant_out_of_stock(allocation.stock)
+                    partial(manager.product_variant_out_of_stock, stock)
                 )
 
 
@@ -278,20 +295,15 @@ def sort_stocks(
 def _create_allocations(
     line_info: "OrderLineInfo",
     stocks: list[StockData],
-    stocks_allocations: dict,
-    stocks_reservations: dict,
+    stocks_quantity_available: dict[int, int],
     insufficient_stock: list[InsufficientStockData],
 ) -> tuple[list[InsufficientStockData], list[Any]]:
     quantity = line_info.quantity
     quantity_allocated = 0
     allocations = []
     for stock_data in stocks:
-        quantity_available_in_stock = stock_data.quantity
-        quantity_available_in_stock -= stocks_allocations.get(stock_data.pk, 0)
-        quantity_available_in_stock -= stocks_reservations.get(stock_data.pk, 0)
-
         quantity_to_allocate = min(
-            (quantity - quantity_allocated), quantity_available_in_stock
+            (quantity - quantity_allocated), stocks_quantity_available[stock_data.pk]
         )
         if quantity_to_allocate > 0:
             allocations.append(
@@ -304,7 +316,7 @@ def _create_allocations(
 
             quantity_allocated += quantity_to_allocate
             if quantity_allocated == quantity:
-                return insufficient_stock, allocations
+                break
 
     if not quantity_allocated == quantity:
         insufficient_stock.append(
@@ -315,7 +327,7 @@ def _create_allocations(
             )
         )
         return insufficient_stock, []
-    return [], allocations
+    return insufficient_stock, allocations
 
 
 def deallocate_stock(order_lines_data: list["OrderLineInfo"], manager: PluginsManager):
@@ -0,0 +1,38 @@
+import pytest
+
+from ....order.fetch import OrderLineInfo
+from ....plugins.manager import get_plugins_manager
+from ...management import allocate_stocks
+from ...models import Allocation
+
+COUNTRY_CODE = "US"
+
+
+@pytest.mark.django_db
+@pytest.mark.count_queries(autouse=False)
+@pytest.mark.parametrize("lines_count", [1, 10, 100])
+def test_allocate_stocks_for_many_lines(
+    lines_count,
+    order_with_many_lines_for_benchmarks,
+    channel_USD,
+    django_assert_num_queries,
+    count_queries,
+):
+    # given
+    order = order_with_many_lines_for_benchmarks
+    lines = list(order.lines.select_related("variant").order_by("pk")[:lines_count])
+    lines_info = [
+        OrderLineInfo(line=line, variant=line.variant, quantity=line.quantity)
+        for line in lines
+    ]
+    manager = get_plugins_manager(allow_replica=False)
+    allocations_count = Allocation.objects.count()
+
+    # when
+    # stocks stay locked for the whole call, the number of queries doesn't
+    # depend on the number of lines
+    with django_assert_num_queries(6):
+        allocate_stocks(lines_info, COUNTRY_CODE, channel_USD, manager)
+
+    # then
+    assert Allocation.objects.count() == allocations_count + lines_count
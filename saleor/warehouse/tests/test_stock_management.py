@@ -475,6 +475,91 @@ def test_allocate_stock_insufficient_stocks_for_multiple_lines(
     ).exists()
 
 
+def test_allocate_stock_with_reservations_and_allocations(
+    order_line,
+    order_line_with_allocation_in_many_stocks,
+    checkout_line_with_one_reservation,
+    channel_USD,
+):
+    # given
+    variant = order_line_with_allocation_in_many_stocks.variant
+    stocks = variant.stocks.all()
+    # 2 items are available in stocks, after subtracting the allocations and
+    # the reservations
+    line_data = OrderLineInfo(line=order_line, variant=variant, quantity=3)
+
+    # when
+    with pytest.raises(InsufficientStock):
+        allocate_stocks(
+            [line_data],
+            COUNTRY_CODE,
+            channel_USD,
+            manager=get_plugins_manager(allow_replica=False),
+            check_reservations=True,
+        )
+
+    # then
+    assert not Allocation.objects.filter(
+        order_line=order_line, stock__in=stocks
+    ).exists()
+
+
+@mock.patch("saleor.plugins.manager.PluginsManager.product_variant_out_of_stock")
+def test_allocate_stocks_out_of_stock_webhook_triggered(
+    product_variant_out_of_stock_webhook_mock,
+    order_line,
+    stock,
+    channel_USD,
+    django_capture_on_commit_callbacks,
+):
+    # given
+    stock.quantity = 50
+    stock.save(update_fields=["quantity"])
+
+    line_data = OrderLineInfo(line=order_line, variant=order_line.variant, quantity=50)
+
+    # when
+    with django_capture_on_commit_callbacks(execute=True):
+        allocate_stocks(
+            [line_data],
+            COUNTRY_CODE,
+            channel_USD,
+            manager=get_plugins_manager(allow_replica=False),
+        )
+
+    # then
+    product_variant_out_of_stock_webhook_mock.assert_called_once_with(stock)
+    stock.refresh_from_db()
+    assert stock.quantity_allocated == 50
+
+
+@mock.patch("saleor.plugins.manager.PluginsManager.product_variant_out_of_stock")
+def test_allocate_stocks_out_of_stock_webhook_not_triggered(
+    product_variant_out_of_stock_webhook_mock,
+    order_line,
+    stock,
+    channel_USD,
+    django_capture_on_commit_callbacks,
+):
+    # given
+    stock.quantity = 100
+    stock.save(update_fields=["quantity"])
+
+    line_data = OrderLineInfo(line=order_line, variant=order_line.variant, quantity=50)
+
+    # when
+    with django_capture_on_commit_callbacks(execute=True):
+        allocate_stocks(
+            [line_data],
+            COUNTRY_CODE,
+            channel_USD,
+            manager=get_plugins_manager(allow_replica=False),
+        )
+
+    # then
+    product_variant_out_of_stock_webhook_mock.assert_not_called()
+
+
 def test_deallocate_stock(allocation):
     stock = allocation.stock
     stock.quantity = 100
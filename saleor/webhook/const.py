@@ -4,6 +4,10 @@ SYNC_WEBHOOK_FAILURE_CACHE_TTL: int = 1  # 1 second
 SYNC_WEBHOOK_FAILURE_SENTINEL = (
     "WEBHOOK_FAILURE"  # Arbitrary value to indicate webhook failure in cache
 )
+# Concurrent requests for the same not cached response wait for the one which holds
+# the lock and sends the webhook, before falling back to sending their own request.
+SYNC_WEBHOOK_LOCK_WAIT_TIMEOUT: float = 5
+SYNC_WEBHOOK_LOCK_POLL_INTERVAL: float = 0.1
 APP_ID_PREFIX = "app"
 
 MAX_FILTERABLE_CHANNEL_SLUGS_LIMIT = 500
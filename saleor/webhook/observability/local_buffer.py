@@ -0,0 +1,125 @@
+"""Per-process buffer of the observability events.
+
+Reporting an event on the request path only appends its payload to a bounded
+buffer kept in the process memory. A background thread pushes the buffered
+payloads to the broker in one round trip, once the batch size is buffered or the
+flush interval passed. When the buffer is full, the oldest events are dropped.
+"""
+
+import atexit
+import logging
+import os
+import threading
+from collections import defaultdict, deque
+
+from django.conf import settings
+
+from ...core.telemetry import meter
+from .buffers import KEY_TYPE, get_buffer
+from .metrics import (
+    METRIC_OBSERVABILITY_FLUSH_DURATION,
+    record_buffer_depth_change,
+    record_dropped_events,
+)
+
+logger = logging.getLogger(__name__)
+
+
+class LocalBuffer:
+    def __init__(self, max_size: int, batch_size: int, flush_interval: float):
+        self.max_size = max_size
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self._events: deque[tuple[KEY_TYPE, bytes]] = deque()
+        self._lock = threading.Lock()
+        self._flush_requested = threading.Event()
+        self._thread: threading.Thread | None = None
+
+    def put_event(self, key: KEY_TYPE, payload: bytes) -> int:
+        """Buffer the event and return the number of dropped events."""
+        with self._lock:
+            dropped = 1 if len(self._events) >= self.max_size else 0
+            if dropped:
+                self._events.popleft()
+            self._events.append((key, payload))
+            size = len(self._events)
+        if dropped:
+            record_dropped_events(dropped)
+        else:
+            record_buffer_depth_change(1)
+        if size >= self.batch_size:
+            self._flush_requested.set()
+        return dropped
+
+    def size(self) -> int:
+        return len(self._events)
+
+    def flush(self):
+        with self._lock:
+            events = list(self._events)
+            self._events.clear()
+        if not events:
+            return
+        record_buffer_depth_change(-len(events))
+        with meter.record_duration(METRIC_OBSERVABILITY_FLUSH_DURATION):
+            events_dict: defaultdict[KEY_TYPE, list[bytes]] = defaultdict(list)
+            for key, payload in events:
+                events_dict[key].append(payload)
+            try:
+                buffer = get_buffer(next(iter(events_dict)))
+                dropped = sum(buffer.put_multi_key_events(events_dict).values())
+            except Exception:
+                logger.exception("Observability events dropped.")
+                return
+        if dropped:
+            logger.warning("Observability buffer full, %s event(s) dropped.", dropped)
+            record_dropped_events(dropped)
+
+    def start(self):
+        self._thread = threading.Thread(
+            target=self._run, name="observability-buffer", daemon=True
+        )
+        self._thread.start()
+        atexit.register(self.flush)
+
+    def _run(self):
+        while True:
+            self._flush_requested.wait(self.flush_interval)
+            self._flush_requested.clear()
+            try:
+                self.flush()
+            except Exception:
+                logger.exception("Could not flush observability events.")
+
+
+_local_buffer: LocalBuffer | None = None
+_local_buffer_lock = threading.Lock()
+
+
+def get_local_buffer() -> LocalBuffer:
+    global _local_buffer
+    if _local_buffer is None:
+        with _local_buffer_lock:
+            if _local_buffer is None:
+                local_buffer = LocalBuffer(
+                    settings.OBSERVABILITY_LOCAL_BUFFER_SIZE,
+                    settings.OBSERVABILITY_BUFFER_BATCH_SIZE,
+                    settings.OBSERVABILITY_LOCAL_BUFFER_FLUSH_INTERVAL.total_seconds(),
+                )
+                local_buffer.start()
+                _local_buffer = local_buffer
+    return _local_buffer
+
+
+def _reset_local_buffer():
+    # Threads are not copied to the forked processes, so each child starts
+    # its own buffer; the events buffered before the fork are flushed by the parent,
+    # so the child must not flush them at exit.
+    global _local_buffer, _local_buffer_lock
+    if _local_buffer is not None:
+        atexit.unregister(_local_buffer.flush)
+    _local_buffer = None
+    _local_buffer_lock = threading.Lock()
+
+
+os.register_at_fork(after_in_child=_reset_local_buffer)
@@ -0,0 +1,39 @@
+from ...core.telemetry import (
+    DEFAULT_DURATION_BUCKETS,
+    MetricType,
+    Scope,
+    Unit,
+    meter,
+)
+
+# Initialize metrics
+METRIC_OBSERVABILITY_BUFFER_DEPTH = meter.create_metric(
+    "saleor.observability.buffer.depth",
+    scope=Scope.SERVICE,
+    type=MetricType.UP_DOWN_COUNTER,
+    unit=Unit.EVENT,
+    description="Number of observability events waiting in the process buffer.",
+)
+METRIC_OBSERVABILITY_FLUSH_DURATION = meter.create_metric(
+    "saleor.observability.buffer.flush.duration",
+    scope=Scope.SERVICE,
+    type=MetricType.HISTOGRAM,
+    unit=Unit.SECOND,
+    description="Duration of flushing the process buffer to the broker.",
+    bucket_boundaries=DEFAULT_DURATION_BUCKETS,
+)
+METRIC_OBSERVABILITY_DROPPED_EVENTS = meter.create_metric(
+    "saleor.observability.buffer.dropped",
+    scope=Scope.SERVICE,
+    type=MetricType.COUNTER,
+    unit=Unit.EVENT,
+    description="Number of observability events dropped because of a full buffer.",
+)
+
+
+def record_buffer_depth_change(amount: int) -> None:
+    meter.record(METRIC_OBSERVABILITY_BUFFER_DEPTH, amount, Unit.EVENT)
+
+
+def record_dropped_events(amount: int) -> None:
+    meter.record(METRIC_OBSERVABILITY_DROPPED_EVENTS, amount, Unit.EVENT)
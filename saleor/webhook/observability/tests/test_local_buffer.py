@@ -0,0 +1,157 @@
+from unittest.mock import patch
+
+import pytest
+
+from .. import local_buffer as local_buffer_module
+from ..exceptions import ApiCallTruncationError
+from ..local_buffer import LocalBuffer, _reset_local_buffer
+from ..utils import put_event
+from .conftest import BATCH_SIZE, KEY
+
+LOCAL_MAX_SIZE = 3
+
+
+@pytest.fixture
+def patch_get_buffer(buffer):
+    with patch(
+        "saleor.webhook.observability.local_buffer.get_buffer", return_value=buffer
+    ) as get_buffer:
+        yield get_buffer
+
+
+@pytest.fixture
+def local_buffer():
+    return LocalBuffer(LOCAL_MAX_SIZE, BATCH_SIZE, flush_interval=1)
+
+
+def test_local_buffer_flush(patch_get_buffer, buffer, local_buffer):
+    # given
+    for i in range(LOCAL_MAX_SIZE):
+        local_buffer.put_event(KEY, f"event-data-{i}".encode())
+
+    # when
+    local_buffer.flush()
+
+    # then
+    assert local_buffer.size() == 0
+    assert buffer.pop_events() == [
+        f"event-data-{i}".encode() for i in range(LOCAL_MAX_SIZE)
+    ]
+
+
+def test_local_buffer_drops_oldest_events_when_full(
+    patch_get_buffer, buffer, local_buffer
+):
+    # given
+    events_count = LOCAL_MAX_SIZE + 2
+    dropped = [
+        local_buffer.put_event(KEY, f"event-data-{i}".encode())
+        for i in range(events_count)
+    ]
+
+    # when
+    local_buffer.flush()
+
+    # then
+    assert sum(dropped) == 2
+    assert buffer.pop_events() == [
+        f"event-data-{i}".encode() for i in range(2, events_count)
+    ]
+
+
+def test_local_buffer_requests_flush_on_batch_size(local_buffer):
+    # given
+    local_buffer.max_size = BATCH_SIZE
+    for i in range(BATCH_SIZE - 1):
+        local_buffer.put_event(KEY, f"event-data-{i}".encode())
+    assert not local_buffer._flush_requested.is_set()
+
+    # when
+    local_buffer.put_event(KEY, b"event-data")
+
+    # then
+    assert local_buffer._flush_requested.is_set()
+
+
+def test_local_buffer_flush_catch_broker_exceptions(patch_get_buffer, local_buffer):
+    # given
+    patch_get_buffer.side_effect = Exception("Connection error")
+    local_buffer.put_event(KEY, b"event-data")
+
+    # when
+    local_buffer.flush()
+
+    # then
+    assert local_buffer.size() == 0
+
+
+@patch("saleor.webhook.observability.utils.get_local_buffer")
+def test_put_event_uses_local_buffer(
+    mock_get_local_buffer, patch_get_buffer, buffer, local_buffer, settings
+):
+    # given
+    settings.OBSERVABILITY_LOCAL_BUFFER_SIZE = LOCAL_MAX_SIZE
+    mock_get_local_buffer.return_value = local_buffer
+
+    # when
+    put_event(lambda: b"event-data")
+
+    # then
+    assert local_buffer.size() == 1
+    assert buffer.size() == 0
+
+
+@pytest.mark.parametrize(
+    "error",
+    [
+        Exception("Unknown error"),
+        ApiCallTruncationError("operation_name", 100, 102, extra_kwarg="extra"),
+    ],
+)
+@patch("saleor.webhook.observability.utils.get_local_buffer")
+def test_put_event_skips_failed_payloads(
+    mock_get_local_buffer, local_buffer, settings, error
+):
+    # given
+    settings.OBSERVABILITY_LOCAL_BUFFER_SIZE = LOCAL_MAX_SIZE
+    mock_get_local_buffer.return_value = local_buffer
+
+    def error_source():
+        raise error
+
+    # when
+    put_event(error_source)
+
+    # then
+    assert local_buffer.size() == 0
+
+
+@patch("saleor.webhook.observability.utils.get_local_buffer")
+def test_put_event_generates_payload_before_buffering(
+    mock_get_local_buffer, patch_get_buffer, buffer, local_buffer, settings
+):
+    # given
+    settings.OBSERVABILITY_LOCAL_BUFFER_SIZE = LOCAL_MAX_SIZE
+    mock_get_local_buffer.return_value = local_buffer
+    response = {"status": 200}
+    put_event(lambda: f"status-{response['status']}".encode())
+
+    # when
+    response["status"] = 500
+    local_buffer.flush()
+
+    # then
+    assert buffer.pop_events() == [b"status-200"]
+
+
+@patch("saleor.webhook.observability.local_buffer.atexit")
+def test_reset_local_buffer_in_forked_process(mock_atexit, local_buffer, monkeypatch):
+    # given
+    monkeypatch.setattr(local_buffer_module, "_local_buffer", local_buffer)
+
+    # when
+    _reset_local_buffer()
+
+    # then
+    mock_atexit.unregister.assert_called_once_with(local_buffer.flush)
+    assert local_buffer_module._local_buffer is None
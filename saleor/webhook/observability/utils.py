@@ -20,6 +20,7 @@ from ..event_types import WebhookEventAsyncType
 from ..utils import get_webhooks_for_event
 from .buffers import get_buffer
 from .exceptions import TruncationError
+from .local_buffer import get_local_buffer
 from .payloads import generate_api_call_payload, generate_event_delivery_attempt_payload
 from .tracing import otel_trace
 
@@ -93,11 +94,23 @@ def task_next_retry_date(retry_error: "Retry") -> datetime.datetime | None:
 def put_event(generate_payload: Callable[[], bytes]):
     try:
         payload = generate_payload()
+    except TruncationError as err:
+        logger.warning("Observability event dropped. %s", err, extra=err.extra)
+        return
+    except Exception:
+        logger.exception("Observability event dropped.")
+        return
+    if settings.OBSERVABILITY_LOCAL_BUFFER_SIZE:
+        # The payload is generated here, as the request, response and delivery
+        # attempt can change or be deleted before the buffer is flushed. It's
+        # pushed to the broker by the flushing thread of the local buffer.
+        with otel_trace("put_event", "local_buffer"):
+            get_local_buffer().put_event(get_buffer_name(), payload)
+        return
+    try:
         with otel_trace("put_event", "buffer"):
             if get_buffer(get_buffer_name()).put_event(payload):
                 logger.warning("Observability buffer full, event dropped.")
-    except TruncationError as err:
-        logger.warning("Observability event dropped. %s", err, extra=err.extra)
     except Exception:
         logger.exception("Observability event dropped.")
 
@@ -0,0 +1,85 @@
+import pytest
+from django.db import connections
+from django.test.utils import CaptureQueriesContext
+
+from ......product.models import Product, ProductVariant
+from ......webhook.event_types import WebhookEventAsyncType
+from ......webhook.models import Webhook
+from ...transport import create_deliveries_for_multiple_subscription_objects
+
+PRODUCTS_COUNT = 1000
+
+PRODUCT_UPDATED_SUBSCRIPTION_QUERY = """
+    subscription {
+        event {
+            ... on ProductUpdated {
+                product {
+                    id
+                    name
+                    category {
+                        name
+                    }
+                    productType {
+                        name
+                    }
+                    variants {
+                        id
+                        sku
+                    }
+                }
+            }
+        }
+    }
+"""
+
+
+@pytest.fixture
+def products_for_bulk_event(product_type, category):
+    products = Product.objects.bulk_create(
+        [
+            Product(
+                name=f"Product {index}",
+                slug=f"product-bulk-event-{index}",
+                product_type=product_type,
+                category=category,
+            )
+            for index in range(PRODUCTS_COUNT)
+        ]
+    )
+    ProductVariant.objects.bulk_create(
+        [
+            ProductVariant(product=product, sku=f"bulk-event-{product.pk}")
+            for product in products
+        ]
+    )
+    return products
+
+
+@pytest.mark.django_db
+@pytest.mark.count_queries(autouse=False)
+def test_create_deliveries_for_bulk_event(
+    products_for_bulk_event, webhook_app, count_queries
+):
+    # given
+    event_type = WebhookEventAsyncType.PRODUCT_UPDATED
+    webhooks = []
+    for index in range(2):
+        webhook = Webhook.objects.create(
+            name=f"Webhook {index}",
+            app=webhook_app,
+            subscription_query=PRODUCT_UPDATED_SUBSCRIPTION_QUERY,
+        )
+        webhook.events.create(event_type=event_type)
+        webhooks.append(webhook)
+
+    # when
+    with CaptureQueriesContext(connections["default"]) as ctx:
+        deliveries = create_deliveries_for_multiple_subscription_objects(
+            event_type, products_for_bulk_event, webhooks
+        )
+
+    # then
+    assert len(deliveries) == PRODUCTS_COUNT * len(webhooks)
+    # the data of all products is loaded in batches, the deliveries are saved
+    # in chunks
+    assert len(ctx.captured_queries) < PRODUCTS_COUNT / 5
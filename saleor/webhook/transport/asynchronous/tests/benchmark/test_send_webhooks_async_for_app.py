@@ -0,0 +1,79 @@
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from unittest.mock import patch
+
+import pytest
+
+from ......core.models import EventDelivery
+from ...transport import send_webhooks_async_for_app
+
+DELIVERIES_COUNT = 20
+STUB_SERVER_LATENCY = 0.05
+
+
+class StubWebhookHandler(BaseHTTPRequestHandler):
+    # keeps the connections alive
+    protocol_version = "HTTP/1.1"
+
+    def do_POST(self):
+        self.rfile.read(int(self.headers["Content-Length"]))
+        time.sleep(STUB_SERVER_LATENCY)
+        self.send_response(200)
+        self.send_header("Content-Length", "0")
+        self.end_headers()
+
+    def log_message(self, format, *args):
+        pass
+
+
+@pytest.fixture
+def stub_webhook_server():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), StubWebhookHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_port}/"
+    server.shutdown()
+    server.server_close()
+
+
+@pytest.mark.django_db
+@pytest.mark.count_queries(autouse=False)
+@pytest.mark.parametrize("concurrency", [1, 5, 20])
+@patch(
+    "saleor.webhook.transport.asynchronous.transport.send_webhooks_async_for_app.apply_async"
+)
+def test_send_webhooks_async_for_app_throughput(
+    mock_send_webhooks_async_for_app_apply_async,
+    concurrency,
+    stub_webhook_server,
+    event_delivery,
+    settings,
+    record_property,
+    count_queries,
+):
+    # given
+    settings.WEBHOOK_ASYNC_CONCURRENCY = concurrency
+    webhook = event_delivery.webhook
+    webhook.target_url = stub_webhook_server
+    webhook.save(update_fields=["target_url"])
+    EventDelivery.objects.bulk_create(
+        [
+            EventDelivery(
+                event_type=event_delivery.event_type,
+                payload=event_delivery.payload,
+                webhook=webhook,
+            )
+            for _ in range(DELIVERIES_COUNT - 1)
+        ]
+    )
+
+    # when
+    start = time.monotonic()
+    send_webhooks_async_for_app(app_id=webhook.app_id)
+    duration = time.monotonic() - start
+
+    # then
+    record_property("deliveries_per_second", DELIVERIES_COUNT / duration)
+    # deliveries are cleared once sent successfully
+    assert not EventDelivery.objects.exists()
@@ -4,7 +4,9 @@ from unittest import mock
 import graphene
 from django.test import override_settings
 
-from .....graphql.webhook.subscription_payload import generate_payload_from_subscription
+from .....graphql.webhook.subscription_payload import (
+    generate_payload_promise_from_subscription,
+)
 from .....webhook.event_types import WebhookEventAsyncType
 from .....webhook.models import Webhook
 from ..transport import (
@@ -25,6 +27,19 @@ SUBSCRIPTION_QUERY = """
     }
 """
 
+SUBSCRIPTION_QUERY_WITH_ID = """
+    subscription {
+        event {
+            ... on ProductVariantUpdated {
+                productVariant {
+                    id
+                    name
+                }
+            }
+        }
+    }
+"""
+
 
 @override_settings(ENABLE_LIMITING_WEBHOOKS_FOR_IDENTICAL_PAYLOADS=True)
 def test_create_deliveries_different_pre_save_payloads(webhook_app, variant):
@@ -115,11 +130,11 @@ def test_create_deliveries_no_payload_changes_limiting_disabled(webhook_app, var
 
 @override_settings(ENABLE_LIMITING_WEBHOOKS_FOR_IDENTICAL_PAYLOADS=True)
 @mock.patch(
-    "saleor.webhook.transport.asynchronous.transport.generate_payload_from_subscription",
-    wraps=generate_payload_from_subscription,
+    "saleor.graphql.webhook.subscription_payload.generate_payload_promise_from_subscription",
+    wraps=generate_payload_promise_from_subscription,
 )
 def test_create_deliveries_reuse_request_for_webhooks(
-    mock_generate_payload_from_subscription, webhook_app, variant
+    mock_generate_payload_promise_from_subscription, webhook_app, variant
 ):
     # given
     event_type = WebhookEventAsyncType.PRODUCT_VARIANT_UPDATED
@@ -133,7 +148,7 @@ def test_create_deliveries_reuse_request_for_webhooks(
     webhook_2 = Webhook.objects.create(
         name="Webhook 2",
         app=webhook_app,
-        subscription_query=SUBSCRIPTION_QUERY,
+        subscription_query=SUBSCRIPTION_QUERY_WITH_ID,
     )
     webhook_2.events.create(event_type=event_type)
 
@@ -153,14 +168,91 @@ def test_create_deliveries_reuse_request_for_webhooks(
 
     # then
     assert len(event_deliveries) == 2
-    assert mock_generate_payload_from_subscription.call_count == 2
+    assert mock_generate_payload_promise_from_subscription.call_count == 2
 
-    request_1 = mock_generate_payload_from_subscription.call_args_list[0][1]["request"]
-    request_2 = mock_generate_payload_from_subscription.call_args_list[1][1]["request"]
+    call_args_list = mock_generate_payload_promise_from_subscription.call_args_list
+    request_1 = call_args_list[0][1]["request"]
+    request_2 = call_args_list[1][1]["request"]
     assert request_1 is request_2
     assert request_1.dataloaders is request_2.dataloaders
 
 
+@mock.patch(
+    "saleor.graphql.webhook.subscription_payload.generate_payload_promise_from_subscription",
+    wraps=generate_payload_promise_from_subscription,
+)
+def test_create_deliveries_share_payload_for_identical_subscription_queries(
+    mock_generate_payload_promise_from_subscription, webhook_app, variant
+):
+    # given
+    event_type = WebhookEventAsyncType.PRODUCT_VARIANT_UPDATED
+    webhook_1 = Webhook.objects.create(
+        name="Webhook 1",
+        app=webhook_app,
+        subscription_query=SUBSCRIPTION_QUERY,
+    )
+    webhook_1.events.create(event_type=event_type)
+
+    # the same query, formatted differently
+    webhook_2 = Webhook.objects.create(
+        name="Webhook 2",
+        app=webhook_app,
+        subscription_query=" ".join(SUBSCRIPTION_QUERY.split()),
+    )
+    webhook_2.events.create(event_type=event_type)
+
+    # when
+    event_deliveries = create_deliveries_for_subscriptions(
+        event_type=event_type,
+        subscribable_object=variant,
+        webhooks=[webhook_1, webhook_2],
+    )
+
+    # then
+    assert len(event_deliveries) == 2
+    assert {delivery.webhook for delivery in event_deliveries} == {
+        webhook_1,
+        webhook_2,
+    }
+    assert mock_generate_payload_promise_from_subscription.call_count == 1
+    assert event_deliveries[0].payload_id == event_deliveries[1].payload_id
+    assert json.loads(event_deliveries[0].payload.get_payload()) == {
+        "productVariant": {"name": variant.name}
+    }
+
+
+def test_create_deliveries_do_not_share_payload_between_apps(
+    webhook_app, app, permission_manage_products, variant
+):
+    # given
+    app.permissions.add(permission_manage_products)
+    event_type = WebhookEventAsyncType.PRODUCT_VARIANT_UPDATED
+    webhook_1 = Webhook.objects.create(
+        name="Webhook 1",
+        app=webhook_app,
+        subscription_query=SUBSCRIPTION_QUERY,
+    )
+    webhook_1.events.create(event_type=event_type)
+
+    webhook_2 = Webhook.objects.create(
+        name="Webhook 2",
+        app=app,
+        subscription_query=SUBSCRIPTION_QUERY,
+    )
+    webhook_2.events.create(event_type=event_type)
+
+    # when
+    event_deliveries = create_deliveries_for_subscriptions(
+        event_type=event_type,
+        subscribable_object=variant,
+        webhooks=[webhook_1, webhook_2],
+    )
+
+    # then
+    assert len(event_deliveries) == 2
+    assert event_deliveries[0].payload_id != event_deliveries[1].payload_id
+
+
 def test_create_deliveries_for_multiple_subscription_objects(
     subscription_product_updated_webhook, product_list
 ):
@@ -1,6 +1,12 @@
+import threading
 from unittest.mock import ANY, patch
 
-from .....core.models import EventDelivery, EventDeliveryAttempt, EventDeliveryStatus
+from .....core.models import (
+    EventDelivery,
+    EventDeliveryAttempt,
+    EventDeliveryStatus,
+    EventPayload,
+)
 from ..transport import (
     WebhookResponse,
     send_webhooks_async_for_app,
@@ -173,6 +179,98 @@ def test_send_multiple_webhooks_async_for_app(
     assert not EventDelivery.objects.exists()
 
 
+@patch(
+    "saleor.webhook.transport.asynchronous.transport.send_webhook_using_scheme_method"
+)
+@patch(
+    "saleor.webhook.transport.asynchronous.transport.send_webhooks_async_for_app.apply_async"
+)
+def test_send_multiple_webhooks_async_for_app_concurrently(
+    mock_send_webhooks_async_for_app_apply_async,
+    mock_send_webhook_using_scheme_method,
+    app,
+    event_deliveries,
+    settings,
+):
+    # given
+    settings.WEBHOOK_ASYNC_CONCURRENCY = 3
+    # All requests have to be in progress at the same time to pass the barrier.
+    barrier = threading.Barrier(3, timeout=5)
+    responses = iter(
+        [
+            WebhookResponse(content="", status=EventDeliveryStatus.FAILED),
+            WebhookResponse(content="", status=EventDeliveryStatus.SUCCESS),
+            WebhookResponse(content="", status=EventDeliveryStatus.SUCCESS),
+        ]
+    )
+    lock = threading.Lock()
+
+    def send_webhook(*args, **kwargs):
+        with lock:
+            response = next(responses)
+        barrier.wait()
+        return response
+
+    mock_send_webhook_using_scheme_method.side_effect = send_webhook
+
+    # when
+    send_webhooks_async_for_app(app_id=app.id)
+
+    # then
+    assert mock_send_webhook_using_scheme_method.call_count == 3
+    deliveries = EventDelivery.objects.all()
+    assert len(deliveries) == 1
+    assert deliveries[0].status == EventDeliveryStatus.PENDING
+    assert (
+        EventDeliveryAttempt.objects.filter(status=EventDeliveryStatus.FAILED).count()
+        == 1
+    )
+    mock_send_webhooks_async_for_app_apply_async.assert_called_once_with(
+        kwargs={"app_id": app.id, "telemetry_context": ANY},
+    )
+
+
+@patch(
+    "saleor.webhook.transport.asynchronous.transport.send_webhook_using_scheme_method"
+)
+@patch(
+    "saleor.webhook.transport.asynchronous.transport.send_webhooks_async_for_app.apply_async"
+)
+def test_send_webhooks_async_for_app_concurrently_no_payload(
+    mock_send_webhooks_async_for_app_apply_async,
+    mock_send_webhook_using_scheme_method,
+    app,
+    event_delivery,
+    event_payload,
+    settings,
+):
+    # given
+    settings.WEBHOOK_ASYNC_CONCURRENCY = 3
+    EventDelivery.objects.create(
+        event_type=event_delivery.event_type,
+        payload=event_payload,
+        webhook=event_delivery.webhook,
+    )
+    event_delivery.payload = None
+    event_delivery.save(update_fields=["payload"])
+    mock_send_webhook_using_scheme_method.return_value = WebhookResponse(
+        content="", status=EventDeliveryStatus.SUCCESS
+    )
+
+    # when
+    send_webhooks_async_for_app(app_id=app.id)
+
+    # then
+    mock_send_webhook_using_scheme_method.assert_called_once()
+    deliveries = EventDelivery.objects.all()
+    assert len(deliveries) == 1
+    assert deliveries[0].pk == event_delivery.pk
+    assert deliveries[0].status == EventDeliveryStatus.PENDING
+    assert EventDeliveryAttempt.objects.filter(
+        delivery=event_delivery, status=EventDeliveryStatus.FAILED
+    ).exists()
+
+
 @patch(
     "saleor.webhook.transport.asynchronous.transport.send_webhook_using_scheme_method"
 )
@@ -214,3 +312,53 @@ def test_send_webhooks_async_for_app_last_retry_failed(
     mock_send_webhooks_async_for_app_apply_async.assert_called_once_with(
         kwargs={"app_id": app.id, "telemetry_context": ANY},
     )
+
+
+@patch(
+    "saleor.webhook.transport.asynchronous.transport.send_webhook_using_scheme_method"
+)
+@patch(
+    "saleor.webhook.transport.asynchronous.transport.send_webhooks_async_for_app.apply_async"
+)
+def test_send_webhooks_async_for_app_payload_decode_error(
+    mock_send_webhooks_async_for_app_apply_async,
+    mock_send_webhook_using_scheme_method,
+    app,
+    event_delivery,
+):
+    # given
+    other_delivery = EventDelivery.objects.create(
+        event_type=event_delivery.event_type,
+        payload=EventPayload.objects.create(payload="{}"),
+        webhook=event_delivery.webhook,
+    )
+    get_payload = EventPayload.get_payload
+
+    def get_payload_with_decode_error(payload):
+        if payload.pk == event_delivery.payload_id:
+            raise UnicodeDecodeError("utf-8", b"\xff", 0, 1, "invalid start byte")
+        return get_payload(payload)
+
+    mock_send_webhook_using_scheme_method.return_value = WebhookResponse(
+        content="", status=EventDeliveryStatus.SUCCESS
+    )
+
+    # when
+    with patch.object(
+        EventPayload,
+        "get_payload",
+        autospec=True,
+        side_effect=get_payload_with_decode_error,
+    ):
+        send_webhooks_async_for_app(app_id=app.id)
+
+    # then
+    mock_send_webhook_using_scheme_method.assert_called_once()
+    deliveries = EventDelivery.objects.all()
+    assert len(deliveries) == 1
+    assert deliveries[0].pk == event_delivery.pk
+    assert deliveries[0].status == EventDeliveryStatus.PENDING
+    assert not EventDelivery.objects.filter(pk=other_delivery.pk).exists()
+    assert EventDeliveryAttempt.objects.filter(
+        delivery=event_delivery, status=EventDeliveryStatus.FAILED
+    ).exists()
@@ -3,7 +3,9 @@ import json
 import logging
 from collections import defaultdict
 from collections.abc import Callable, Sequence
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import asdict, dataclass
+from functools import partial
 from typing import TYPE_CHECKING, Any
 from urllib.parse import urlparse
 
@@ -26,10 +28,9 @@ from ....core.telemetry import (
 from ....core.tracing import webhooks_otel_trace
 from ....core.utils import get_domain
 from ....core.utils.url import sanitize_url_for_logging
-from ....graphql.core.dataloaders import DataLoader
 from ....graphql.webhook.subscription_payload import (
-    generate_payload_from_subscription,
     generate_payload_promise_from_subscription,
+    generate_payloads_from_subscription,
     get_pre_save_payload_key,
     initialize_request,
 )
@@ -115,37 +116,25 @@ def create_deliveries_for_multiple_subscription_objects(
     event_deliveries = []
     event_deliveries_for_bulk_update = []
 
-    for subscribable_object in subscribable_objects:
-        # Dataloaders are shared between calls to generate_payload_from_subscription to
-        # reuse their cache. This avoids unnecessary DB queries when different webhooks
-        # need to resolve the same data.
-        dataloaders: dict[str, type[DataLoader]] = {}
-
-        request = initialize_request(
-            requestor,
-            event_type in WebhookEventSyncType.ALL,
-            event_type=event_type,
-            allow_replica=allow_replica,
-            request_time=request_time,
-            dataloaders=dataloaders,
-        )
-
-        for webhook in webhooks:
-            data = generate_payload_from_subscription(
-                event_type=event_type,
-                subscribable_object=subscribable_object,
-                subscription_query=webhook.subscription_query,
-                request=request,
-                app=webhook.app,
+    payloads = generate_payloads_from_subscription(
+        event_type,
+        subscribable_objects,
+        webhooks,
+        requestor=requestor,
+        sync_event=event_type in WebhookEventSyncType.ALL,
+        allow_replica=allow_replica,
+        request_time=request_time,
+    )
+    for subscribable_object, webhooks_group, data in payloads:
+        if not data:
+            logger.info(
+                "No payload was generated with subscription for event: %s",
+                event_type,
             )
+            continue
 
-            if not data:
-                logger.info(
-                    "No payload was generated with subscription for event: %s",
-                    event_type,
-                )
-                continue
-
+        webhooks_to_deliver = []
+        for webhook in webhooks_group:
             if (
                 settings.ENABLE_LIMITING_WEBHOOKS_FOR_IDENTICAL_PAYLOADS
                 and pre_save_payloads
@@ -160,11 +149,17 @@ def create_deliveries_for_multiple_subscription_objects(
                         sanitize_url_for_logging(webhook.target_url),
                     )
                     continue
+            webhooks_to_deliver.append(webhook)
 
-            payload_data = json.dumps({**data})
-            event_payloads_data.append(payload_data)
-            event_payload = EventPayload()
-            event_payloads.append(event_payload)
+        if not webhooks_to_deliver:
+            continue
+
+        # Webhooks with the same subscription query share the payload.
+        payload_data = json.dumps({**data})
+        event_payloads_data.append(payload_data)
+        event_payload = EventPayload()
+        event_payloads.append(event_payload)
+        for webhook in webhooks_to_deliver:
             event_delivery = EventDelivery(
                 status=EventDeliveryStatus.PENDING,
                 event_type=event_type,
@@ -173,21 +168,21 @@ def create_deliveries_for_multiple_subscription_objects(
             )
             event_deliveries_for_bulk_update.append(event_delivery)
 
-            if len(event_deliveries_for_bulk_update) > MAX_WEBHOOK_EVENTS_IN_DB_BULK:
-                with allow_writer():
-                    # Use transaction to ensure EventPayload and EventDelivery are created together, preventing inconsistent DB state.
-                    with transaction.atomic():
-                        EventPayload.objects.bulk_create_with_payload_files(
-                            event_payloads, event_payloads_data
-                        )
-                        event_deliveries.extend(
-                            EventDelivery.objects.bulk_create(
-                                event_deliveries_for_bulk_update
-                            )
+        if len(event_deliveries_for_bulk_update) > MAX_WEBHOOK_EVENTS_IN_DB_BULK:
+            with allow_writer():
+                # Use transaction to ensure EventPayload and EventDelivery are created together, preventing inconsistent DB state.
+                with transaction.atomic():
+                    EventPayload.objects.bulk_create_with_payload_files(
+                        event_payloads, event_payloads_data
+                    )
+                    event_deliveries.extend(
+                        EventDelivery.objects.bulk_create(
+                            event_deliveries_for_bulk_update
                         )
-                event_payloads = []
-                event_payloads_data = []
-                event_deliveries_for_bulk_update = []
+                    )
+            event_payloads = []
+            event_payloads_data = []
+            event_deliveries_for_bulk_update = []
 
     with allow_writer():
         # Use transaction to ensure EventPayload and EventDelivery are created together, preventing inconsistent DB state.
@@ -693,6 +688,24 @@ def send_webhooks_async_for_app(
     failed_deliveries_attempts = []
     successful_deliveries = []
 
+    send_webhook = partial(
+        _send_webhook_for_delivery, domain=domain, telemetry_context=telemetry_context
+    )
+    responses: dict[int, Callable[[], tuple[int, WebhookResponse]]] = {}
+    concurrency = min(settings.WEBHOOK_ASYNC_CONCURRENCY, len(deliveries))
+    if concurrency > 1:
+        # Only the payloads are loaded and the requests are sent from the pool,
+        # the deliveries are processed here, in the order of their creation, once
+        # all of them are sent.
+        with ThreadPoolExecutor(max_workers=concurrency) as executor:
+            for delivery_id, delivery_with_count in deliveries.items():
+                responses[delivery_id] = executor.submit(
+                    send_webhook, delivery_with_count.delivery
+                ).result
+    else:
+        for delivery_id, delivery_with_count in deliveries.items():
+            responses[delivery_id] = partial(send_webhook, delivery_with_count.delivery)
+
     for delivery_id, delivery_with_count in deliveries.items():
         delivery = delivery_with_count.delivery
         attempt_count = delivery_with_count.count
@@ -701,32 +714,11 @@ def send_webhooks_async_for_app(
         webhook = delivery.webhook
 
         try:
-            if not delivery.payload:
-                raise ValueError(f"Event delivery id: {delivery_id} has no payload.")
-            data = delivery.payload.get_payload()
-            # Convert payload to bytes if it's not already.
-            data = data if isinstance(data, bytes) else data.encode("utf-8")
-            # Count payload size in bytes.
-            payload_size = len(data)
-
+            payload_size, response = responses[delivery_id]()
             if attempt_count == 0:
                 record_first_delivery_attempt_delay(
                     delivery.created_at, delivery.event_type, webhook.app
                 )
-            with webhooks_otel_trace(
-                delivery.event_type,
-                payload_size,
-                webhook.app,
-                span_links=telemetry_context.links,
-            ):
-                response = send_webhook_using_scheme_method(
-                    webhook.target_url,
-                    domain,
-                    webhook.secret_key,
-                    delivery.event_type,
-                    data,
-                    webhook.custom_headers,
-                )
 
             record_external_request(
                 delivery.event_type,
@@ -771,6 +763,47 @@ def send_webhooks_async_for_app(
     )
 
 
+def _get_delivery_payload(delivery: EventDelivery) -> bytes:
+    if not delivery.payload:
+        raise ValueError(f"Event delivery id: {delivery.id} has no payload.")
+    try:
+        data = delivery.payload.get_payload()
+    except OSError as e:
+        raise ValueError(
+            f"Event delivery id: {delivery.id} payload could not be read."
+        ) from e
+    # Convert payload to bytes if it's not already.
+    return data if isinstance(data, bytes) else data.encode("utf-8")
+
+
+def _send_webhook_for_delivery(
+    delivery: EventDelivery,
+    domain: str,
+    telemetry_context: TelemetryTaskContext,
+) -> tuple[int, WebhookResponse]:
+    """Send the delivery payload and return its size in bytes and the response.
+
+    Raise ValueError when the payload can't be loaded, failing only the delivery.
+    """
+    data = _get_delivery_payload(delivery)
+    webhook = delivery.webhook
+    with webhooks_otel_trace(
+        delivery.event_type,
+        len(data),
+        webhook.app,
+        span_links=telemetry_context.links,
+    ):
+        response = send_webhook_using_scheme_method(
+            webhook.target_url,
+            domain,
+            webhook.secret_key,
+            delivery.event_type,
+            data,
+            webhook.custom_headers,
+        )
+    return len(data), response
+
+
 def send_observability_events(webhooks: list[WebhookData], events: list[bytes]):
     event_type = WebhookEventAsyncType.OBSERVABILITY
     for webhook in webhooks:
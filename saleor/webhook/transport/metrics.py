@@ -59,6 +59,21 @@ METRIC_EXTERNAL_REQUEST_BODY_SIZE = meter.create_metric(
     bucket_boundaries=BODY_SIZE_BUCKETS,
 )
 
+METRIC_EXTERNAL_REQUEST_POOL_LOOKUP_COUNT = meter.create_metric(
+    "saleor.external_request.pool.lookup_count",
+    scope=Scope.SERVICE,
+    type=MetricType.COUNTER,
+    unit=Unit.REQUEST,
+    description="Number of webhook requests by the HTTP client pool hit or miss.",
+)
+METRIC_EXTERNAL_REQUEST_CONNECTION_COUNT = meter.create_metric(
+    "saleor.external_request.connection_count",
+    scope=Scope.SERVICE,
+    type=MetricType.COUNTER,
+    unit=Unit.REQUEST,
+    description="Number of webhook requests by new or reused connection.",
+)
+
 METRIC_EXTERNAL_REQUEST_FIRST_ATTEMPT_DELAY = meter.create_metric(
     "saleor.external_request.async.first_attempt_delay",
     scope=Scope.CORE,
@@ -97,6 +112,37 @@ def record_external_request(
         Unit.SECOND,
         attributes=attributes,
     )
+    if webhook_response.pool_hit is not None:
+        record_external_request_pool_usage(target_url, webhook_response, sync)
+
+
+def record_external_request_pool_usage(
+    target_url: str, webhook_response: WebhookResponse, sync: bool
+) -> None:
+    attributes = {
+        server_attributes.SERVER_ADDRESS: urlparse(target_url).hostname or "",
+        saleor_attributes.SALEOR_WEBHOOK_EXECUTION_MODE: "sync" if sync else "async",
+    }
+    meter.record(
+        METRIC_EXTERNAL_REQUEST_POOL_LOOKUP_COUNT,
+        1,
+        Unit.REQUEST,
+        attributes={
+            **attributes,
+            saleor_attributes.SALEOR_HTTP_POOL_HIT: bool(webhook_response.pool_hit),
+        },
+    )
+    meter.record(
+        METRIC_EXTERNAL_REQUEST_CONNECTION_COUNT,
+        1,
+        Unit.REQUEST,
+        attributes={
+            **attributes,
+            saleor_attributes.SALEOR_HTTP_CONNECTION_REUSED: bool(
+                webhook_response.connection_reused
+            ),
+        },
+    )
 
 
 def record_first_delivery_attempt_delay(
@@ -4,6 +4,7 @@ from collections import defaultdict
 from collections.abc import Callable
 from typing import Any, Union
 
+from django.conf import settings
 from django.db.models import QuerySet
 from pydantic import ValidationError
 
@@ -102,6 +103,7 @@ def get_excluded_shipping_methods_or_fetch(
             subscribable_object=subscribable_object,
             request_timeout=WEBHOOK_SYNC_TIMEOUT,
             cache_timeout=CACHE_EXCLUDED_SHIPPING_TIME,
+            stale_cache_timeout=settings.SHIPPING_WEBHOOK_STALE_RESPONSE_TTL,
             requestor=requestor,
             pregenerated_subscription_payload=pregenerated_subscription_payload,
         )
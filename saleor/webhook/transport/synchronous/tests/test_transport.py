@@ -8,8 +8,10 @@ from .....core.telemetry import set_global_attributes
 from .....tests.utils import get_metric_data_point
 from ...metrics import (
     METRIC_EXTERNAL_REQUEST_BODY_SIZE,
+    METRIC_EXTERNAL_REQUEST_CONNECTION_COUNT,
     METRIC_EXTERNAL_REQUEST_COUNT,
     METRIC_EXTERNAL_REQUEST_DURATION,
+    METRIC_EXTERNAL_REQUEST_POOL_LOOKUP_COUNT,
 )
 from ...utils import WebhookResponse
 from ..transport import _send_webhook_request_sync
@@ -122,6 +124,46 @@ def test_send_webhook_request_sync_record_external_request(
     assert external_request_content_length.sum == payload_size
 
 
+@patch("saleor.webhook.transport.synchronous.transport.send_webhook_using_http")
+def test_send_webhook_request_sync_record_external_request_pool_usage(
+    mock_send_webhook_using_http,
+    webhook_response,
+    event_delivery_payload_in_database,
+    get_test_metrics_data,
+):
+    # given
+    webhook_response.content = "{}"
+    webhook_response.pool_hit = True
+    webhook_response.connection_reused = False
+    mock_send_webhook_using_http.return_value = webhook_response
+
+    # when
+    _send_webhook_request_sync(event_delivery_payload_in_database)
+
+    # then
+    attributes = {
+        "server.address": "www.example.com",
+        "saleor.webhook.execution_mode": "sync",
+    }
+    metrics_data = get_test_metrics_data()
+    pool_lookup_count = get_metric_data_point(
+        metrics_data, METRIC_EXTERNAL_REQUEST_POOL_LOOKUP_COUNT
+    )
+    assert pool_lookup_count.value == 1
+    assert pool_lookup_count.attributes == {
+        **attributes,
+        "saleor.http.pool.hit": True,
+    }
+    connection_count = get_metric_data_point(
+        metrics_data, METRIC_EXTERNAL_REQUEST_CONNECTION_COUNT
+    )
+    assert connection_count.value == 1
+    assert connection_count.attributes == {
+        **attributes,
+        "saleor.http.connection.reused": False,
+    }
+
+
 @patch("saleor.webhook.transport.synchronous.transport.send_webhook_using_http")
 def test_send_webhook_request_sync_record_external_request_when_delivery_attempt_failed(
     mock_send_webhook_using_http,
@@ -0,0 +1,139 @@
+from unittest.mock import patch
+
+import pytest
+from django.core.cache import cache
+
+from .... import const
+from ....event_types import WebhookEventSyncType
+from ...utils import generate_cache_key_for_webhook
+from ..transport import trigger_webhook_sync_if_not_cached
+
+EVENT_TYPE = WebhookEventSyncType.SHIPPING_LIST_METHODS_FOR_CHECKOUT
+CACHE_DATA = {"checkout": "123"}
+
+
+@pytest.fixture
+def cache_key(webhook):
+    cache_key = generate_cache_key_for_webhook(
+        CACHE_DATA, webhook.target_url, EVENT_TYPE, webhook.app_id
+    )
+    yield cache_key
+    cache.delete_many([cache_key, f"{cache_key}:lock", f"{cache_key}:stale"])
+
+
+def _trigger(webhook, **kwargs):
+    return trigger_webhook_sync_if_not_cached(
+        EVENT_TYPE, "{}", webhook, CACHE_DATA, allow_replica=False, **kwargs
+    )
+
+
+@patch("saleor.webhook.transport.synchronous.transport.trigger_webhook_sync")
+def test_trigger_webhook_sync_if_not_cached_releases_lock(
+    mocked_trigger_webhook_sync, webhook, cache_key
+):
+    # given
+    response_data = {"methods": []}
+    mocked_trigger_webhook_sync.return_value = response_data
+
+    # when
+    result = _trigger(webhook)
+
+    # then
+    assert result == response_data
+    mocked_trigger_webhook_sync.assert_called_once()
+    assert cache.get(cache_key) == response_data
+    assert cache.get(f"{cache_key}:lock") is None
+    assert cache.get(f"{cache_key}:stale") is None
+
+
+@patch("saleor.webhook.transport.synchronous.transport.time.sleep")
+@patch("saleor.webhook.transport.synchronous.transport.trigger_webhook_sync")
+def test_trigger_webhook_sync_if_not_cached_waits_for_lock_holder(
+    mocked_trigger_webhook_sync, mocked_sleep, webhook, cache_key
+):
+    # given
+    response_data = {"methods": []}
+    cache.add(f"{cache_key}:lock", True)
+    mocked_sleep.side_effect = lambda _: cache.set(cache_key, response_data)
+
+    # when
+    result = _trigger(webhook)
+
+    # then
+    assert result == response_data
+    mocked_trigger_webhook_sync.assert_not_called()
+    mocked_sleep.assert_called_once_with(const.SYNC_WEBHOOK_LOCK_POLL_INTERVAL)
+
+
+@patch("saleor.webhook.transport.synchronous.transport.time.sleep")
+@patch("saleor.webhook.transport.synchronous.transport.trigger_webhook_sync")
+def test_trigger_webhook_sync_if_not_cached_lock_holder_failed(
+    mocked_trigger_webhook_sync, mocked_sleep, webhook, cache_key
+):
+    # given
+    cache.add(f"{cache_key}:lock", True)
+    mocked_sleep.side_effect = lambda _: cache.set(
+        cache_key, const.SYNC_WEBHOOK_FAILURE_SENTINEL
+    )
+
+    # when
+    result = _trigger(webhook)
+
+    # then
+    assert result is None
+    mocked_trigger_webhook_sync.assert_not_called()
+
+
+@patch("saleor.webhook.transport.synchronous.transport.time.sleep")
+@patch("saleor.webhook.transport.synchronous.transport.trigger_webhook_sync")
+def test_trigger_webhook_sync_if_not_cached_lock_wait_timeout(
+    mocked_trigger_webhook_sync, mocked_sleep, webhook, cache_key, monkeypatch
+):
+    # given
+    monkeypatch.setattr(const, "SYNC_WEBHOOK_LOCK_WAIT_TIMEOUT", 0)
+    response_data = {"methods": []}
+    mocked_trigger_webhook_sync.return_value = response_data
+    cache.add(f"{cache_key}:lock", True)
+
+    # when
+    result = _trigger(webhook)
+
+    # then
+    assert result == response_data
+    mocked_trigger_webhook_sync.assert_called_once()
+    # the lock is still owned by the other request
+    assert cache.get(f"{cache_key}:lock") is True
+
+
+@patch("saleor.webhook.transport.synchronous.transport.trigger_webhook_sync")
+def test_trigger_webhook_sync_if_not_cached_stores_stale_response(
+    mocked_trigger_webhook_sync, webhook, cache_key
+):
+    # given
+    response_data = {"methods": []}
+    mocked_trigger_webhook_sync.return_value = response_data
+
+    # when
+    _trigger(webhook, stale_cache_timeout=60)
+
+    # then
+    assert cache.get(f"{cache_key}:stale") == response_data
+
+
+@patch("saleor.webhook.transport.synchronous.transport.time.sleep")
+@patch("saleor.webhook.transport.synchronous.transport.trigger_webhook_sync")
+def test_trigger_webhook_sync_if_not_cached_returns_stale_response_during_refresh(
+    mocked_trigger_webhook_sync, mocked_sleep, webhook, cache_key
+):
+    # given
+    stale_response_data = {"methods": ["stale"]}
+    cache.set(f"{cache_key}:stale", stale_response_data)
+    cache.add(f"{cache_key}:lock", True)
+
+    # when
+    result = _trigger(webhook, stale_cache_timeout=60)
+
+    # then
+    assert result == stale_response_data
+    mocked_trigger_webhook_sync.assert_not_called()
+    mocked_sleep.assert_not_called()
@@ -1,5 +1,7 @@
 import json
 import logging
+import math
+import time
 from collections.abc import Callable
 from json import JSONDecodeError
 from typing import TYPE_CHECKING, Any, TypeVar
@@ -200,6 +202,36 @@ def send_webhook_request_sync(
     return response_data if response.status == EventDeliveryStatus.SUCCESS else None
 
 
+def _get_lock_timeout(request_timeout) -> int:
+    timeout = request_timeout or settings.WEBHOOK_SYNC_TIMEOUT
+    if isinstance(timeout, tuple):
+        timeout = sum(timeout)
+    return math.ceil(timeout)
+
+
+def _wait_for_cached_response(cache_key: str, wait_timeout: float):
+    deadline = time.monotonic() + wait_timeout
+    while time.monotonic() < deadline:
+        time.sleep(const.SYNC_WEBHOOK_LOCK_POLL_INTERVAL)
+        response_data = cache.get(cache_key)
+        if response_data is not None:
+            return response_data
+    return None
+
+
+def _get_response_of_lock_holder(cache_key: str, stale_cache_timeout: int | None):
+    """Return the response fetched by the call which holds the lock.
+
+    Return `None` when the holder didn't store the response in time, in which case
+    the request is sent regardless of the lock.
+    """
+    if stale_cache_timeout:
+        stale_response_data = cache.get(f"{cache_key}:stale")
+        if stale_response_data is not None:
+            return stale_response_data
+    return _wait_for_cached_response(cache_key, const.SYNC_WEBHOOK_LOCK_WAIT_TIMEOUT)
+
+
 def trigger_webhook_sync_if_not_cached(
     event_type: str,
     payload: str,
@@ -212,17 +244,32 @@ def trigger_webhook_sync_if_not_cached(
     request=None,
     requestor=None,
     pregenerated_subscription_payload: dict | None = None,
+    stale_cache_timeout: int | None = None,
 ) -> dict | None:
     """Get response for synchronous webhook.
 
     - Send a synchronous webhook request if cache is expired.
     - Fetch response from cache if it is still valid.
+
+    Concurrent calls for the same expired response are coalesced: only the call
+    which acquires the lock sends the request, the others wait for its response for
+    up to `SYNC_WEBHOOK_LOCK_WAIT_TIMEOUT` seconds. When `stale_cache_timeout` is
+    provided, the last response is kept for that long after it expires and is
+    returned to the waiting calls right away.
     """
 
     cache_key = generate_cache_key_for_webhook(
         cache_data, webhook.target_url, event_type, webhook.app_id
     )
+    lock_key = f"{cache_key}:lock"
+    lock_acquired = False
     response_data = cache.get(cache_key)
+    if response_data is None:
+        lock_acquired = cache.add(
+            lock_key, True, timeout=_get_lock_timeout(request_timeout)
+        )
+        if not lock_acquired:
+            response_data = _get_response_of_lock_holder(cache_key, stale_cache_timeout)
     if response_data == const.SYNC_WEBHOOK_FAILURE_SENTINEL:
         # Prevent sending webhook if the previous one failed recently.
         logger.warning(
@@ -231,7 +278,10 @@ def trigger_webhook_sync_if_not_cached(
             event_type,
         )
         return None
-    if response_data is None:
+    if response_data is not None:
+        return response_data
+
+    try:
         response_data = trigger_webhook_sync(
             event_type,
             payload,
@@ -243,18 +293,24 @@ def trigger_webhook_sync_if_not_cached(
             requestor=requestor,
             pregenerated_subscription_payload=pregenerated_subscription_payload,
         )
+        cache_timeout = cache_timeout or const.WEBHOOK_CACHE_DEFAULT_TTL
         if response_data is not None:
-            cache.set(
-                cache_key,
-                response_data,
-                timeout=cache_timeout or const.WEBHOOK_CACHE_DEFAULT_TTL,
-            )
+            cache.set(cache_key, response_data, timeout=cache_timeout)
+            if stale_cache_timeout:
+                cache.set(
+                    f"{cache_key}:stale",
+                    response_data,
+                    timeout=cache_timeout + stale_cache_timeout,
+                )
         else:
             cache.set(
                 cache_key,
                 const.SYNC_WEBHOOK_FAILURE_SENTINEL,
                 timeout=const.SYNC_WEBHOOK_FAILURE_CACHE_TTL,
             )
+    finally:
+        if lock_acquired:
+            cache.delete(lock_key)
     return response_data
 
 
@@ -27,7 +27,7 @@ from requests_hardened.ip_filter import InvalidIPAddress
 from ...app.headers import AppHeaders, DeprecatedAppHeaders
 from ...app.models import App
 from ...core.db.connection import allow_writer
-from ...core.http_client import HTTPClient
+from ...core.http_client import HTTPClientPool
 from ...core.models import (
     EventDelivery,
     EventDeliveryAttempt,
@@ -75,6 +75,9 @@ class WebhookResponse:
     response_status_code: int | None = None
     status: str = EventDeliveryStatus.SUCCESS
     duration: float = 0.0
+    # set for HTTP requests sent by the pooled client
+    pool_hit: bool | None = None
+    connection_reused: bool | None = None
 
 
 class RequestorModelName:
@@ -168,7 +171,7 @@ def send_webhook_using_http(
         headers.update(custom_headers)
 
     try:
-        response = HTTPClient.send_request(
+        response, pool_info = HTTPClientPool.request(
             "POST",
             target_url,
             data=message,
@@ -208,6 +211,8 @@ def send_webhook_using_http(
             if 200 <= response.status_code < 300
             else EventDeliveryStatus.FAILED
         ),
+        pool_hit=pool_info.pool_hit,
+        connection_reused=pool_info.connection_reused,
     )
 
 